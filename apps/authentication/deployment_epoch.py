@@ -0,0 +1,109 @@
+"""
+Cluster-wide deployment epoch for ``ServerRestartSessionInvalidateMiddleware``.
+
+Authenticated sessions are stamped with the current epoch, and a session stamped
+with an older epoch is logged out. The epoch only changes when someone runs
+``manage.py bump_deployment_epoch`` (deploy scripts, incident response). Before
+this, the stamp was a per-process ``SERVER_BOOT_ID``, so with more than one worker
+or node, every request that landed on another process logged the user out.
+
+- The value is a counter in the single ``DeploymentEpoch`` row, so every process
+  and node agrees on it, whatever the cache backend.
+- Reads go process memory (``DEPLOYMENT_EPOCH_TTL`` seconds), then the shared cache
+  (``CACHE_TTL_SECONDS``), then the database. A bump overwrites the cached value, so
+  with a shared cache it is seen everywhere within the memory TTL; with a
+  per-process cache (LocMem) within ``CACHE_TTL_SECONDS``.
+- Because the counter only grows, a worker that has not seen a bump yet simply
+  finds sessions stamped newer than its own value and leaves them alone; nobody is
+  logged out twice.
+"""
+from __future__ import annotations
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from apps.authentication.models import DeploymentEpoch
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "auth:deployment_epoch"
+SESSION_KEY = "deploy_epoch"
+CACHE_TTL_SECONDS = 300
+_ROW_ID = 1
+
+_lock = threading.Lock()
+_local_value = 0
+_local_expires = 0.0
+
+
+def _ttl() -> float:
+    return float(getattr(settings, "DEPLOYMENT_EPOCH_TTL", 10))
+
+
+def _load() -> int:
+    try:
+        value = cache.get(CACHE_KEY)
+    except Exception:
+        value = None
+    if value is None:
+        row, _ = DeploymentEpoch.objects.get_or_create(pk=_ROW_ID)
+        value = row.value
+        try:
+            cache.set(CACHE_KEY, value, timeout=CACHE_TTL_SECONDS)
+        except Exception:
+            pass
+    return int(value)
+
+
+def current() -> int:
+    """The cluster's epoch (0 when it cannot be read: nothing is enforced then)."""
+    global _local_value, _local_expires
+    now = time.monotonic()
+    if now < _local_expires:
+        return _local_value
+    try:
+        value = _load()
+    except Exception:
+        logger.exception("Could not read the deployment epoch")
+        value = _local_value  # keep the last known value; 0 disables enforcement
+    with _lock:
+        _local_value, _local_expires = value, now + _ttl()
+    return value
+
+
+def bump() -> int:
+    """Advance the epoch (logs out every session stamped before); returns the new value."""
+    global _local_expires
+    with transaction.atomic():
+        DeploymentEpoch.objects.get_or_create(pk=_ROW_ID)
+        DeploymentEpoch.objects.filter(pk=_ROW_ID).update(value=F("value") + 1)
+        value = DeploymentEpoch.objects.values_list("value", flat=True).get(pk=_ROW_ID)
+
+    def _publish():
+        try:
+            cache.set(CACHE_KEY, value, timeout=CACHE_TTL_SECONDS)
+        except Exception:
+            logger.exception("Failed to publish deployment epoch %s", value)
+
+    transaction.on_commit(_publish)
+    with _lock:
+        _local_expires = 0.0
+    return value
+
+
+def is_stale(stamp) -> bool:
+    """True when a session ``stamp`` predates the current epoch."""
+    if not isinstance(stamp, int):
+        return False  # unstamped (or pre-epoch SERVER_BOOT_ID era) sessions get stamped
+    epoch = current()
+    return bool(epoch) and stamp < epoch
+
+
+def needs_stamp(stamp) -> bool:
+    epoch = current()
+    return bool(epoch) and (not isinstance(stamp, int) or stamp < epoch)
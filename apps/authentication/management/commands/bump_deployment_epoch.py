@@ -0,0 +1,25 @@
+from __future__ import annotations
+from django.core.management.base import BaseCommand
+
+from apps.authentication import deployment_epoch
+
+
+class Command(BaseCommand):
+    help = (
+        "Advance the cluster-wide deployment epoch: every authenticated session stamped "
+        "before it is logged out on its next request (all workers and nodes)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--show",
+            action="store_true",
+            help="Only print the current epoch.",
+        )
+
+    def handle(self, *args, **options):
+        if options.get("show"):
+            self.stdout.write(f"Deployment epoch: {deployment_epoch.current()}")
+            return
+        value = deployment_epoch.bump()
+        self.stdout.write(self.style.SUCCESS(f"Deployment epoch bumped to {value}; older sessions will be logged out."))
@@ -0,0 +1,69 @@
+from __future__ import annotations
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+
+from apps.authentication import deployment_epoch
+from apps.authentication.session_store import TOUCH_KEY, SessionStore
+
+# Keys the session machinery writes on its own. A session holding nothing else
+# belongs to nobody; anything more (a login, a portal client, a password reset
+# in progress) is kept.
+BOOKKEEPING_KEYS = frozenset({TOUCH_KEY, deployment_epoch.SESSION_KEY, "server_boot_id"})
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete stored sessions that hold no state beyond session bookkeeping, "
+        "e.g. the ones the public portal used to create for every anonymous visitor. "
+        "Dry-run by default."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--apply",
+            action="store_true",
+            help="Persist changes. Without this flag, the command only counts orphan sessions.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Sessions read and deleted per batch (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        if str(getattr(settings, "SESSION_BACKEND", "db")).lower() == "cache":
+            self.stdout.write(self.style.WARNING("SESSION_BACKEND=cache: sessions are not stored in the database."))
+            return
+        apply = bool(options.get("apply"))
+        batch_size = max(1, int(options.get("batch_size") or 1000))
+        store = SessionStore()
+        cache_prefix = getattr(SessionStore, "cache_key_prefix", None)  # cached_db only
+        session_cache = caches[settings.SESSION_CACHE_ALIAS] if cache_prefix else None
+
+        scanned = orphans = deleted = 0
+        last_key = ""
+        while True:
+            # Keyset pages, each fully read before its DELETE (no DELETE while a cursor is open on SQLite).
+            rows = list(
+                Session.objects.filter(session_key__gt=last_key)
+                .order_by("session_key")
+                .values_list("session_key", "session_data")[:batch_size]
+            )
+            if not rows:
+                break
+            last_key = rows[-1][0]
+            scanned += len(rows)
+            # Undecodable data comes back empty: an orphan too.
+            keys = [key for key, data in rows if set(store.decode(data)) <= BOOKKEEPING_KEYS]
+            orphans += len(keys)
+            if apply and keys:
+                n, _ = Session.objects.filter(session_key__in=keys).delete()
+                deleted += n
+                if session_cache is not None:
+                    session_cache.delete_many([cache_prefix + k for k in keys])
+
+        self.stdout.write(self.style.NOTICE(f"Sessions scanned: {scanned}, anonymous: {orphans}"))
+        self.stdout.write(self.style.SUCCESS(f"Deleted: {deleted}, Dry-run: {not apply}"))
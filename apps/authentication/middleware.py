@@ -1,50 +1,53 @@
-from django.conf import settings
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.contrib.auth import logout
 from django.http import HttpResponseRedirect
+from django.utils.deprecation import MiddlewareMixin
 
-class ServerRestartSessionInvalidateMiddleware:
+from apps.authentication import deployment_epoch
+
+class ServerRestartSessionInvalidateMiddleware(MiddlewareMixin):
     """
-    Middleware that invalidates authenticated sessions created before the current
-    server (process) start. This forces users (including admin) to re-login after
-    a server restart/reload.
+    Middleware that invalidates authenticated sessions issued before the current
+    deployment epoch, forcing users (including admin) to re-login after an
+    intentional invalidation (``manage.py bump_deployment_epoch``).
 
     How it works:
-    - A unique settings.SERVER_BOOT_ID is generated on each server process start.
+    - apps.authentication.deployment_epoch holds one cluster-wide counter, shared by
+      every worker and node (database row, read through the cache).
     - For every request:
-      * If user is authenticated and request.session['server_boot_id'] does not
-        match the current SERVER_BOOT_ID, we log the user out.
-      * After processing the request, if the user is authenticated, we stamp the
-        current SERVER_BOOT_ID into the session.
+      * If user is authenticated and request.session['deploy_epoch'] is older
+        than the current epoch, we log the user out.
+      * After processing the request, if the user is authenticated and the
+        session is unstamped or older, we stamp the current epoch into the session.
 
     Notes:
     - Only touches authentication/session behavior. No templates or routing changes.
     - Works with the default Django auth system and DB-backed sessions.
+    - A worker that has not seen a bump yet never logs out (or re-stamps) sessions
+      stamped with the newer epoch, so requests may move freely between workers.
+    - Request/response hooks (MiddlewareMixin) so async views stay async; the
+      session/user reads run in the hooks' sync_to_async call.
     """
 
-    def __init__(self, get_response):
-        self.get_response = get_response
-        # Boot identifier set in settings on import (server start)
-        self.current_boot_id = getattr(settings, "SERVER_BOOT_ID", None)
-
-    def __call__(self, request):
-        # If the session was issued before this process started, invalidate it
+    def process_request(self, request):
+        # If the session was issued before the current epoch, invalidate it
         if request.user.is_authenticated:
-            session_boot_id = request.session.get("server_boot_id")
-            # Only invalidate when a boot id is present and mismatched.
-            # On first authenticated request (no stamp yet), do NOT force logout;
-            # we will stamp the current boot id after the response.
-            if session_boot_id is not None and session_boot_id != self.current_boot_id:
+            # Unstamped sessions (first authenticated request, or stamped with the
+            # old per-process server_boot_id) are NOT logged out; we stamp them
+            # after the response.
+            if deployment_epoch.is_stale(request.session.get(deployment_epoch.SESSION_KEY)):
                 # Flush auth state to force re-login
                 logout(request)
                 # Do not redirect here; allow normal flow. Protected views will
                 # redirect to LOGIN_URL via @login_required as usual.
+        return None
 
-        response = self.get_response(request)
-
-        # After response, stamp boot id for fresh authenticated sessions
+    def process_response(self, request, response):
+        # After response, stamp the epoch for fresh authenticated sessions
         if request.user.is_authenticated:
-            if request.session.get("server_boot_id") != self.current_boot_id:
-                request.session["server_boot_id"] = self.current_boot_id
+            if deployment_epoch.needs_stamp(request.session.get(deployment_epoch.SESSION_KEY)):
+                request.session[deployment_epoch.SESSION_KEY] = deployment_epoch.current()
+                request.session.pop("server_boot_id", None)
 
         return response
 
@@ -60,12 +63,28 @@ class AdminLoginNextParamMiddleware:
 
     This middleware is non-invasive: it only touches GET requests to '/admin/login/'
     when 'next' is missing. All other routes and flows remain unchanged.
+    Sync and async (no I/O).
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        redirect = self._redirect(request)
+        if self.async_mode:
+            return self.__acall__(request, redirect)
+        return redirect or self.get_response(request)
+
+    async def __acall__(self, request, redirect):
+        return redirect or await self.get_response(request)
+
+    def _redirect(self, request):
         try:
             # Normalize path with trailing slash as Django admin uses it
             if request.method == "GET":
@@ -75,5 +94,4 @@ class AdminLoginNextParamMiddleware:
         except Exception:
             # Be defensive: never break the request flow due to this safety net
             pass
-
-        return self.get_response(request)
+        return None
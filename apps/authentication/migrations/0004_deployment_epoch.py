@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0003_superadmin_unique_true_superadmin'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeploymentEpoch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.PositiveIntegerField(default=1)),
+                ('bumped_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
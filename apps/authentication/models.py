@@ -46,3 +46,12 @@ class AdminProfile(models.Model):
 
     def __str__(self) -> str:
         return f"AdminProfile: {self.user.username}"
+
+
+class DeploymentEpoch(models.Model):
+    """Cluster-wide session epoch (a single row); see apps.authentication.deployment_epoch."""
+    value = models.PositiveIntegerField(default=1)
+    bumped_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"DeploymentEpoch: {self.value}"
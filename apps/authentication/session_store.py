@@ -0,0 +1,75 @@
+"""
+Session engine with write coalescing and lazy expiry touch.
+
+Configured via ``SESSION_ENGINE = "apps.authentication.session_store"``; the storage
+underneath is chosen by ``settings.SESSION_BACKEND``:
+
+- ``db``         Django's database store (one SELECT per request, as before)
+- ``cached_db``  reads from the shared cache, writes through to the database
+- ``cache``      cache only; use with Redis, never with a per-process LocMem cache
+
+On top of the chosen store:
+
+- Saves are skipped when the session data is byte-for-byte what was loaded, so
+  re-assigning an unchanged value (boot id stamp, table config, ...) costs nothing.
+- Without ``SESSION_SAVE_EVERY_REQUEST`` an active session would still expire
+  ``SESSION_COOKIE_AGE`` after its last change. Instead a ``_touched`` timestamp is
+  refreshed when it is older than ``SESSION_TOUCH_INTERVAL``, so a busy session is
+  written at most once per interval.
+"""
+from __future__ import annotations
+import json
+import time
+from importlib import import_module
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+TOUCH_KEY = "_touched"
+
+_BACKENDS = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "cache": "django.contrib.sessions.backends.cache",
+}
+
+
+def _base_store():
+    name = str(getattr(settings, "SESSION_BACKEND", "db")).lower()
+    return import_module(_BACKENDS.get(name, _BACKENDS["db"])).SessionStore
+
+
+def _touch_interval() -> int:
+    return int(getattr(settings, "SESSION_TOUCH_INTERVAL", 3600))
+
+
+def _digest(data: Dict[str, Any]) -> str:
+    return json.dumps(data, sort_keys=True, default=str)
+
+
+class SessionStore(_base_store()):
+    _loaded_digest: Optional[str] = None
+
+    def load(self):
+        data = super().load()
+        if data:
+            now = int(time.time())
+            if now - int(data.get(TOUCH_KEY) or 0) >= _touch_interval():
+                # Digest taken before the touch, so the save below goes through.
+                self._loaded_digest = _digest(data)
+                data[TOUCH_KEY] = now
+                self.modified = True
+                return data
+        self._loaded_digest = _digest(data)
+        return data
+
+    def save(self, must_create=False):
+        if (
+            not must_create
+            and self.session_key is not None
+            and self._loaded_digest is not None
+            and _digest(self._get_session(no_load=True)) == self._loaded_digest
+        ):
+            return
+        super().save(must_create=must_create)
+        self._loaded_digest = _digest(self._get_session(no_load=True))
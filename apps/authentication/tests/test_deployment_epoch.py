@@ -0,0 +1,58 @@
+import io
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.authentication import deployment_epoch
+from apps.authentication.models import DeploymentEpoch
+
+
+@override_settings(DEPLOYMENT_EPOCH_TTL=0)
+class DeploymentEpochTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_superuser("adminuser", "admin@example.com", "StrongPass!234")
+        self.url = reverse("dashboard:clients")
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_bump_is_shared_through_db_and_cache(self):
+        self.assertEqual(deployment_epoch.current(), 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(deployment_epoch.bump(), 2)
+        self.assertEqual(DeploymentEpoch.objects.get().value, 2)
+        self.assertEqual(cache.get(deployment_epoch.CACHE_KEY), 2)
+        cache.clear()  # another node with a cold cache reads the row
+        self.assertEqual(deployment_epoch.current(), 2)
+
+    def test_session_survives_until_bumped(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.assertEqual(self.client.session[deployment_epoch.SESSION_KEY], 1)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("bump_deployment_epoch", stdout=io.StringIO())
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+
+    def test_worker_behind_a_bump_keeps_newer_sessions(self):
+        self.client.force_login(self.user)
+        session = self.client.session
+        session[deployment_epoch.SESSION_KEY] = 5
+        session["server_boot_id"] = "legacy"
+        session.save()
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.assertEqual(self.client.session[deployment_epoch.SESSION_KEY], 5)
+
+    def test_legacy_boot_id_sessions_are_restamped(self):
+        self.client.force_login(self.user)
+        session = self.client.session
+        session["server_boot_id"] = "2f1c..."
+        session.save()
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.assertEqual(self.client.session[deployment_epoch.SESSION_KEY], 1)
+        self.assertNotIn("server_boot_id", self.client.session)
@@ -0,0 +1,46 @@
+import time
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from apps.authentication import session_store
+from apps.authentication.session_store import SessionStore
+
+
+class SessionStoreTests(TestCase):
+    def _stored(self, **data):
+        s = SessionStore()
+        for k, v in data.items():
+            s[k] = v
+        s[session_store.TOUCH_KEY] = int(time.time())
+        s.save()
+        return s.session_key
+
+    def test_unchanged_data_is_not_written(self):
+        key = self._stored(server_boot_id="abc")
+        s = SessionStore(key)
+        s["server_boot_id"] = "abc"  # same value: marks modified, but nothing changed
+        with mock.patch("django.contrib.sessions.backends.db.SessionStore.save") as base_save:
+            s.save()
+        base_save.assert_not_called()
+
+    def test_changed_data_is_written(self):
+        key = self._stored(server_boot_id="abc")
+        s = SessionStore(key)
+        s["server_boot_id"] = "def"
+        s.save()
+        self.assertEqual(SessionStore(key)["server_boot_id"], "def")
+
+    @override_settings(SESSION_TOUCH_INTERVAL=60)
+    def test_touch_only_after_interval(self):
+        key = self._stored(client_id="c1")
+        s = SessionStore(key)
+        s.get("client_id")
+        self.assertFalse(s.modified)
+
+        with mock.patch.object(session_store.time, "time", return_value=time.time() + 120):
+            s = SessionStore(key)
+            s.get("client_id")
+            self.assertTrue(s.modified)
+            s.save()
+        self.assertGreater(SessionStore(key)[session_store.TOUCH_KEY], int(time.time()) + 100)
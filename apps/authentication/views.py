@@ -26,24 +26,7 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-# Optional: Redis-backed rate limiting (enabled only if REDIS_URL present)
-try:
-    from ratelimit.decorators import ratelimit as _ratelimit
-except Exception:  # pragma: no cover - package may be absent in some envs
-    _ratelimit = None  # type: ignore
-
-def safe_ratelimit(*args, **kwargs):
-    """Return a ratelimit decorator when Redis cache is configured, else no-op.
-
-    This ensures we do not change behavior in environments without REDIS_URL.
-    """
-    if getattr(settings, "REDIS_CACHE_URL", "") and _ratelimit is not None:
-        return _ratelimit(*args, **kwargs)
-    # No-op decorator
-    def _no_op(view_func):
-        return view_func
-    return _no_op
-
+from apps.dashboard.services import rate_limit_service
 from .forms import SignupForm, LoginForm
 from .models import SuperAdmin, AdminProfile
 from .constants import SOCIAL_LINK_KEYS
@@ -69,7 +52,7 @@ def _rate_limited(request: HttpRequest, key: str) -> bool:
 
 @ensure_csrf_cookie
 @csrf_protect
-@safe_ratelimit(key="ip", rate="10/m", block=True)
+@rate_limit_service.limit("10/m")
 @require_http_methods(["GET", "POST"])
 def signup_view(request: HttpRequest):
     # Allow signup only if no SuperAdmin exists
@@ -101,7 +84,7 @@ def signup_view(request: HttpRequest):
 
 @ensure_csrf_cookie
 @csrf_protect
-@safe_ratelimit(key="ip", rate="20/m", block=True)
+@rate_limit_service.limit("20/m")
 @require_http_methods(["GET", "POST"])
 def login_view(request: HttpRequest):
     if request.method == "GET":
@@ -401,8 +384,9 @@ def _store_otp(user: User, purpose: str = "password_reset", attempts: int = 5, t
     cache = _get_cache()
     key = _otp_key(user.id, purpose)
     payload = {"code": _gen_code(6), "attempts_left": attempts, "created_at": int(time.time())}
-    # Set TTL directly on key
+    # Set TTL directly on key; a new code starts with a fresh attempt counter
     cache.set(key, json.dumps(payload), timeout=ttl)
+    cache.delete(key + ":attempts")
     return payload
 
 def _verify_otp(user: User, submitted_code: str, purpose: str = "password_reset") -> tuple[bool, str]:
@@ -417,19 +401,19 @@ def _verify_otp(user: User, submitted_code: str, purpose: str = "password_reset"
         cache.delete(key)
         return False, "expired"
     code = str(data.get("code") or "")
-    attempts_left = int(data.get("attempts_left") or 0)
-    if attempts_left <= 0:
+    # Count the attempt atomically before comparing, so parallel guesses cannot
+    # all read the same remaining budget.
+    used = rate_limit_service.incr(key + ":attempts", timeout=600, cache=cache)
+    if used > int(data.get("attempts_left") or 0):
         cache.delete(key)
         return False, "locked"
     # constant-time compare
     if hmac.compare_digest(code, str(submitted_code or "")):
-        cache.delete(key)  # single-use
-        return True, "ok"
-    # wrong code: decrement atomically by rewriting
-    data["attempts_left"] = attempts_left - 1
-    # Preserve remaining TTL by reading and re-setting with a short TTL if unknown; safest: 300s fallback
-    # Many cache backends don't expose TTL; we use a conservative fallback
-    cache.set(key, json.dumps(data), timeout=300)
+        # single-use: only the request that actually removes the code succeeds
+        if cache.delete(key):
+            cache.delete(key + ":attempts")
+            return True, "ok"
+        return False, "expired"
     return False, "invalid"
 
 def _rate_key(prefix: str, ident: str) -> str:
@@ -452,27 +436,30 @@ def _apply_progressive_backoff(cache, base_key: str, count: int) -> None:
     if duration:
         cache.set(base_key + ":lock", "1", timeout=duration)
 
-def _ratelimit_otp_request(request: HttpRequest, user: User | None) -> None:
-    """Increment counters and possibly set lockout keys. Always return without raising.
-    We will respond with generic success regardless to avoid oracle leaks.
+def _ratelimit_otp_request(request: HttpRequest, user: User | None) -> bool:
+    """Increment counters and possibly set lockout keys. Never raises.
+
+    Returns True while the IP or user is locked out; the caller then skips issuing
+    an OTP but still responds with a generic success to avoid oracle leaks.
     """
-    cache = _get_cache()
-    ip = request.META.get("REMOTE_ADDR") or "unknown"
-    now = int(time.time())
-    # 1) IP-based (5 req/hour)
-    ip_key = _rate_key("ratelimit:ip", ip) + ":otp_request"
-    count_ip = int(cache.get(ip_key) or 0) + 1
-    cache.set(ip_key, str(count_ip), timeout=3600)
-    _apply_progressive_backoff(cache, ip_key, count_ip)
-    # 2) User-based (3 req/hour)
-    if user:
-        ukey = _rate_key("ratelimit:user", str(user.id)) + ":otp_request"
-        count_u = int(cache.get(ukey) or 0) + 1
-        cache.set(ukey, str(count_u), timeout=3600)
-        _apply_progressive_backoff(cache, ukey, count_u)
-    # Note: We do not block here; the verify endpoint will still work with valid OTP if delivered.
+    try:
+        cache = _get_cache()
+        keys = [_rate_key("ratelimit:ip", rate_limit_service.client_ip(request)) + ":otp_request"]
+        if user:
+            keys.append(_rate_key("ratelimit:user", str(user.id)) + ":otp_request")
+        locked = False
+        for base_key in keys:
+            locked = locked or _under_lock(cache, base_key + ":lock")
+            # Atomic incr: concurrent requests can no longer overwrite each other's count.
+            count = rate_limit_service.incr(base_key, timeout=3600, cache=cache)
+            _apply_progressive_backoff(cache, base_key, count)
+        return locked
+    except Exception:
+        logger.exception("OTP request rate limiting failed")
+        return False
 
 
+@rate_limit_service.limit("10/h")
 @ensure_csrf_cookie
 @csrf_protect
 @require_http_methods(["POST"])  # JSON-only response
@@ -482,8 +469,8 @@ def superadmin_password_reset_request(request: HttpRequest) -> JsonResponse:
     """
     user = _get_superadmin_user()
     # Rate-limit counters regardless of identifier correctness
-    _ratelimit_otp_request(request, user)
-    if not user:
+    locked = _ratelimit_otp_request(request, user)
+    if not user or locked:
         return JsonResponse({"ok": True})
 
     # Store OTP (even if email is missing, we still behave generically)
@@ -518,6 +505,7 @@ def superadmin_password_reset_request(request: HttpRequest) -> JsonResponse:
     return JsonResponse({"ok": True})
 
 
+@rate_limit_service.limit("10/m")
 @ensure_csrf_cookie
 @csrf_protect
 @require_http_methods(["POST"])  # JSON-only response
@@ -535,6 +523,7 @@ def superadmin_password_reset_verify_otp(request: HttpRequest) -> JsonResponse:
     return JsonResponse({"ok": True, "verified": False})
 
 
+@rate_limit_service.limit("10/m")
 @ensure_csrf_cookie
 @csrf_protect
 @require_http_methods(["POST"])  # JSON-only response
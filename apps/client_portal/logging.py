@@ -1,9 +1,11 @@
 """
 Client Portal activity logging utilities.
 
-- Centralizes creation of ActivityLog entries for client-facing events
+- Centralizes creation of ActivityLog entries for client-facing events (queued
+  through the write-behind audit pipeline, see apps.dashboard.services.audit_service)
 - Redacts PII in row_details to avoid leaking raw phone/email
 - Broadcasts over Channels 'notifications' group to drive live updates on the dashboard
+  (after commit, off the request thread; see apps.dashboard.services.broadcast_service)
 
 Safe in development without Redis when settings.USE_INMEMORY_CHANNEL_LAYER is True.
 """
@@ -15,12 +17,9 @@ from django.utils import timezone
 
 def _safe_imports():
     """Lazy imports to avoid circular deps at import time."""
-    from asgiref.sync import async_to_sync  # type: ignore
-    from channels.layers import get_channel_layer  # type: ignore
-    from apps.dashboard.models import ActivityLog  # type: ignore
-    from django.contrib.auth.models import User  # type: ignore
+    from apps.dashboard.services import actor_service, audit_service, broadcast_service  # type: ignore
 
-    return async_to_sync, get_channel_layer, ActivityLog, User
+    return broadcast_service, audit_service, actor_service
 
 
 def _redact(value: Optional[str], kind: str) -> str:
@@ -57,7 +56,7 @@ def log_client_activity(action: str, *, client: Any = None, details: Optional[Di
     - Redact PII
     """
     try:
-        async_to_sync, get_channel_layer, ActivityLog, User = _safe_imports()
+        broadcast_service, audit_service, actor_service = _safe_imports()
         row_details: Dict[str, Any] = {}
         if details:
             # Shallow copy to avoid mutating caller data
@@ -82,16 +81,13 @@ def log_client_activity(action: str, *, client: Any = None, details: Optional[Di
         except Exception:
             rid = 0
 
-        # Choose a fallback admin_user since ActivityLog.admin_user is non-nullable
-        # Prefer a superuser; otherwise any user; as last resort, the earliest user
-        admin_user = None
-        try:
-            admin_user = User.objects.filter(is_superuser=True).order_by("id").first() or User.objects.order_by("id").first()
-        except Exception:
-            admin_user = None
+        # Choose a fallback admin_user since ActivityLog.admin_user is non-nullable.
+        # Portal visitors are not auth users, so this is the cached fallback actor
+        # (superuser, else the earliest user); no query once warm.
+        admin_user = actor_service.fallback_actor_id()
 
         if admin_user is not None:
-            ActivityLog.objects.create(
+            audit_service.record(
                 table_name="Client",
                 action=action,
                 row_id=rid,
@@ -114,22 +110,20 @@ def log_client_activity(action: str, *, client: Any = None, details: Optional[Di
             if is_portal and is_login_or_signup:
                 # Do not broadcast to bell notifications
                 return
-            layer = get_channel_layer()
-            if layer:
-                async_to_sync(layer.group_send)(
-                    "notifications",
-                    {
-                        "type": "notify",
-                        "payload": {
-                            "table_name": "Client",
-                            "action": action,
-                            "row_id": getattr(client, "client_id", None),
-                            "row_details": row_details,
-                            "admin_user": "portal",
-                            "timestamp": timezone.now().isoformat(),
-                        },
+            broadcast_service.send(
+                "notifications",
+                {
+                    "type": "notify",
+                    "payload": {
+                        "table_name": "Client",
+                        "action": action,
+                        "row_id": getattr(client, "client_id", None),
+                        "row_details": row_details,
+                        "admin_user": "portal",
+                        "timestamp": timezone.now().isoformat(),
                     },
-                )
+                },
+            )
         except Exception:
             # Non-fatal if Channels is not configured
             pass
@@ -0,0 +1,30 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from . import visitor
+
+
+class VisitorCookieMiddleware:
+    """
+    Set the signed anonymous visitor cookie when a portal view minted an id.
+
+    Views ask apps.client_portal.visitor for the visitor identity; this only writes
+    the cookie back, so pages that never look at the visitor send no Set-Cookie.
+    Sync and async (no I/O).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return visitor.set_cookie(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return visitor.set_cookie(request, await self.get_response(request))
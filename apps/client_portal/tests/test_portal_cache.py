@@ -0,0 +1,111 @@
+from __future__ import annotations
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.dashboard.models import Table3, Table5
+from apps.dashboard.services import fragment_cache_service
+
+
+class PortalCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Table3.objects.create(name="Asha", city="Pune", phone="9876543210")
+        Table3.objects.create(name="Ravi", city="Goa", phone="9876543211")
+        Table5.objects.create(name="Asha", city="Pune", phone="9876543210")
+
+    def _artist_queries(self, params):
+        url = reverse("client_portal:browse_artists")
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(url, params)
+        self.assertEqual(resp.status_code, 200)
+        return resp, [q["sql"] for q in ctx.captured_queries if Table3._meta.db_table in q["sql"]]
+
+    def test_browse_artists_cached_by_normalized_params(self):
+        resp, queries = self._artist_queries({"service": "asha"})
+        self.assertTrue(queries)
+        self.assertEqual([a["name"] for a in resp.context["page_obj"].object_list], ["Asha"])
+        # The service filter is a subquery, not a materialized list of names.
+        self.assertTrue(any(Table5._meta.db_table in sql for sql in queries))
+
+        resp, queries = self._artist_queries({"service": "  ASHA ", "page": "1"})
+        self.assertEqual(queries, [])
+        self.assertEqual(resp.context["page_obj"].paginator.count, 1)
+        self.assertContains(resp, "Asha")
+
+    def test_query_uses_the_normalized_values_of_the_key(self):
+        Table3.objects.create(name="Sita  Devi", city="Pune", phone="9876543212")
+        Table3.objects.create(name="Sita Devi", city="Pune", phone="9876543213")
+        names = []
+        for q in ("sita  devi", "Sita Devi"):  # same key; whichever fills the cache, same answer
+            cache.clear()
+            resp, queries = self._artist_queries({"q": q})
+            self.assertTrue(queries)
+            names.append([a["name"] for a in resp.context["page_obj"].object_list])
+        self.assertEqual(names[0], names[1])
+
+    def test_table_writes_invalidate(self):
+        self._artist_queries({})
+        with self.captureOnCommitCallbacks(execute=True):
+            Table3.objects.create(name="Meera", city="Pune", phone="9876543212")
+        resp, queries = self._artist_queries({})
+        self.assertTrue(queries)
+        self.assertEqual(resp.context["page_obj"].paginator.count, 3)
+
+        self._artist_queries({"service": "asha"})
+        with self.captureOnCommitCallbacks(execute=True):
+            Table5.objects.filter(name="Asha").delete()
+        resp, _ = self._artist_queries({"service": "asha"})
+        self.assertEqual(resp.context["page_obj"].paginator.count, 0)
+
+    def test_stale_value_served_while_another_request_rebuilds(self):
+        key = fragment_cache_service.make_key("t", n=1)
+        self.assertEqual(fragment_cache_service.get_or_build(key, lambda: "old", ["table:3"]), "old")
+        with self.captureOnCommitCallbacks(execute=True):
+            Table3.objects.create(name="Meera", city="Pune", phone="9876543212")
+
+        cache.add(key + fragment_cache_service.LOCK_SUFFIX, 1)
+        self.assertEqual(fragment_cache_service.get_or_build(key, lambda: "new", ["table:3"]), "old")
+        cache.delete(key + fragment_cache_service.LOCK_SUFFIX)
+        self.assertEqual(fragment_cache_service.get_or_build(key, lambda: "new", ["table:3"]), "new")
+        self.assertEqual(fragment_cache_service.get_or_build(key, lambda: "newer", ["table:3"]), "new")
+
+    def test_cold_miss_builds_once_under_concurrency(self):
+        key = fragment_cache_service.make_key("t", n=2)
+        builds, results = [], []
+        start = threading.Barrier(8)
+
+        def build():
+            builds.append(1)
+            time.sleep(0.2)
+            return "value"
+
+        def worker():
+            start.wait()
+            results.append(fragment_cache_service.get_or_build(key, build, ["table:3"]))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual((len(builds), results), (1, ["value"] * 8))
+
+    def test_cold_miss_builds_without_storing_when_the_lock_holder_stalls(self):
+        key = fragment_cache_service.make_key("t", n=3)
+        cache.add(key + fragment_cache_service.LOCK_SUFFIX, 1)
+        with mock.patch.object(fragment_cache_service, "MISS_WAIT_SECONDS", 0.1):
+            self.assertEqual(fragment_cache_service.get_or_build(key, lambda: "mine", ["table:3"]), "mine")
+        self.assertIsNone(cache.get(key))
+
+    def test_disabled(self):
+        with self.settings(PORTAL_CACHE_TTL=0):
+            self._artist_queries({})
+            _, queries = self._artist_queries({})
+        self.assertTrue(queries)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+import io
+
+from django.conf import settings
+from django.core import signing
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.authentication.session_store import SessionStore
+from apps.client_portal import visitor
+from apps.dashboard.models import Table6
+
+LEGACY_KEY = "a" * 32
+
+
+class VisitorIdentityTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_anonymous_pages_write_no_sessions(self):
+        for name in ("home", "customer_dashboard", "artist_application_status"):
+            self.client.get(reverse(f"client_portal:{name}"))
+        self.assertEqual(Session.objects.count(), 0)
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, self.client.cookies)
+
+    def test_cookie_is_minted_once_and_keys_lookups(self):
+        url = reverse("client_portal:artist_application_status")
+        resp = self.client.get(url)
+        self.assertEqual(resp.context["status"], "not_applied")
+        cookie = resp.cookies[visitor.cookie_name()]
+        self.assertTrue(cookie["httponly"])
+
+        vid = visitor.visitor_id(resp.wsgi_request)
+        Table6.objects.create(name=f"anon-{vid}", city="Pune", phone="9876543210")
+        resp = self.client.get(url)
+        self.assertEqual(resp.context["status"], "pending")
+        self.assertNotIn(visitor.cookie_name(), resp.cookies)  # nothing new to set
+
+    def test_tampered_cookie_gets_a_new_id(self):
+        Table6.objects.create(name=f"anon-{'b' * 32}", city="Pune", phone="9876543210")
+        self.client.cookies[visitor.cookie_name()] = "b" * 32  # unsigned
+        resp = self.client.get(reverse("client_portal:artist_application_status"))
+        self.assertEqual(resp.context["status"], "not_applied")
+        self.assertIn(visitor.cookie_name(), resp.cookies)
+
+    def test_legacy_session_key_is_adopted(self):
+        Table6.objects.create(name=f"anon-{LEGACY_KEY}", city="Pune", phone="9876543210")
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = LEGACY_KEY
+        resp = self.client.get(reverse("client_portal:artist_application_status"))
+        self.assertEqual(resp.context["status"], "pending")
+        self.client.cookies.pop(settings.SESSION_COOKIE_NAME)
+        resp = self.client.get(reverse("client_portal:artist_application_status"))
+        self.assertEqual(resp.context["status"], "pending")
+
+    def test_signed_in_session_key_is_never_copied_into_the_cookie(self):
+        session = SessionStore()
+        session["client_id"] = "c"
+        session.create()
+        Table6.objects.create(name=f"anon-{session.session_key}", city="Pune", phone="9876543210")
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+        resp = self.client.get(reverse("client_portal:artist_application_status"))
+        self.assertEqual(resp.context["status"], "not_applied")
+        self.assertNotEqual(visitor.visitor_id(resp.wsgi_request), session.session_key)
+
+        # A cookie that already carries the live key (adopted before) is replaced too.
+        self.client.cookies[visitor.cookie_name()] = signing.get_cookie_signer(
+            salt=visitor.cookie_name() + visitor.SALT
+        ).sign(session.session_key)
+        resp = self.client.get(reverse("client_portal:artist_application_status"))
+        self.assertNotEqual(visitor.visitor_id(resp.wsgi_request), session.session_key)
+        self.assertIn(visitor.cookie_name(), resp.cookies)
+
+    def test_purge_anonymous_sessions(self):
+        kept = ({"_auth_user_id": "1"}, {"client_id": "c"}, {"_touched": 1, "pwd_reset_superadmin_ok": True})
+        for data in ({}, {"_touched": 1, "deploy_epoch": 2}) + kept:
+            s = SessionStore()
+            s.update(data)
+            s.create()
+        out = io.StringIO()
+        call_command("purge_anonymous_sessions", stdout=out)
+        self.assertIn("anonymous: 2", out.getvalue())
+        self.assertEqual(Session.objects.count(), 5)
+
+        call_command("purge_anonymous_sessions", "--apply", "--batch-size", "2", stdout=io.StringIO())
+        self.assertEqual(Session.objects.count(), 3)
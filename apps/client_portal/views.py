@@ -35,7 +35,7 @@ def _enforce_single_session(request: HttpRequest, client: dm.Client) -> None:
             except Exception:
                 pass
         if current_key and old_key != current_key:
-            dm.Client.objects.filter(pk=client.pk).update(active_session_key=current_key)  # Added: atomic DB update
+            client_session_service.set_active_session_key(client.pk, current_key)  # DB update + cached key
     except Exception:
         pass
 
@@ -45,27 +45,15 @@ def _honeypot_log(request: HttpRequest) -> None:
 
     Notes:
     - Logs only IP and path (no PII).
-    - Throttled via the default cache to at most 3 entries per IP per minute.
+    - Throttled through rate_limit_service to at most 3 entries per IP per minute.
     - Never raises; never alters normal flow for legitimate users.
     """
     try:
-        # Extract a best-effort client IP without storing PII beyond IP (no headers recorded).
-        ip = (request.META.get("HTTP_X_FORWARDED_FOR", "").split(",")[0] or request.META.get("REMOTE_ADDR") or "?")  # Added
+        ip = rate_limit_service.client_ip(request)  # no other headers recorded
         path = request.path  # Added: endpoint path only (no query/body to avoid PII)
-        cache = caches["default"]  # Added: use default cache for throttling
-        # Build a throttle key scoped by minute window and IP.  # Added
-        window = timezone.now().strftime("%Y%m%d%H%M")  # Added: current minute bucket
-        key = f"hp_log:{ip}:{window}"  # Added
-        try:
-            count = int(cache.get(key) or 0)  # Added
-        except Exception:
-            count = 0  # Added
-        if count < 3:  # Added: log at most 3 entries per IP per minute
+        # Atomic per-IP counter; log at most 3 entries per IP per minute.
+        if rate_limit_service.hit("honeypot_log", ip, "3/m").allowed:
             logging.getLogger("security.honeypot").warning("Honeypot hit: ip=%s path=%s", ip, path)  # Added
-            try:
-                cache.set(key, count + 1, timeout=70)  # Added: ~1 minute window
-            except Exception:
-                pass  # Added: never raise from logging
     except Exception:
         # Never allow logging to break request flow.  # Added
         pass
@@ -101,55 +89,42 @@ def _password_policy_ok(pw: str) -> bool:
 from django.shortcuts import render, redirect
 from django.http import HttpRequest, HttpResponse, Http404, JsonResponse
 from django.db import transaction
+from django.db.models import Exists, OuterRef
 from django.contrib.auth.models import AnonymousUser
-from django.core.paginator import Paginator
+from django.core.paginator import Page, Paginator
 from django.utils import timezone
 from apps.dashboard import models as dm
-from apps.settings_app.models import AppSettings
+from apps.dashboard.services import client_session_service, etag_service, fragment_cache_service, password_service
+from apps.dashboard.services import rate_limit_service
+from apps.settings_app.services import settings_service
 from django.conf import settings
 from django.contrib import messages
-from django.contrib.auth.hashers import make_password, check_password
 from django.core import signing
 from django.views.decorators.http import require_POST
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.db.utils import IntegrityError
 from django.urls import reverse
-from asgiref.sync import async_to_sync
+from asgiref.sync import async_to_sync, sync_to_async
 from channels.layers import get_channel_layer
 from .logging import log_client_activity  # centralized client activity logging (redacts PII, broadcasts)
+from . import visitor  # signed-cookie identity for anonymous visitors
 from types import SimpleNamespace
 import logging  # Added: for conservative security logging of honeypot hits
-from django.core.cache import caches  # Added: lightweight per-IP throttle for honeypot logs
 from importlib import import_module  # Added: to access session store backend generically
-try:  # optional: production-only per-IP rate limiting
-    from ratelimit.decorators import ratelimit as rl_decorator  # type: ignore
-except Exception:  # safe no-op fallback if not installed
-    def rl_decorator(*args, **kwargs):
-        def _wrap(f):
-            return f
-        return _wrap
 
 # Public Client Portal (no authentication). Uses existing dashboard tables.
 # SOC: templates render-only; all logic lives here.
 
 
 def _records_per_page() -> int:
-    """Read preferred page size from AppSettings, falling back to a safe default."""
-    try:
-        s = AppSettings.objects.order_by("-updated_at").first()
-        if s and int(s.records_per_page) > 0:
-            return int(s.records_per_page)
-    except Exception:
-        pass
-    return 20
+    """Preferred page size from the cached AppSettings snapshot, falling back to a safe default."""
+    return settings_service.records_per_page(20)
 
 
 def _visitor_fp(request: HttpRequest) -> str:
-    """Anonymous visitor fingerprint for non-auth pages (derived from session key)."""
+    """Anonymous visitor fingerprint for non-auth pages (signed visitor cookie, no session)."""
     try:
-        if not request.session.session_key:
-            request.session.save()
-        return f"anon-{request.session.session_key}"
+        return visitor.fingerprint(request)
     except Exception:
         return "anon-unknown"
 
@@ -157,18 +132,24 @@ def _visitor_fp(request: HttpRequest) -> str:
 def portal_home(request: HttpRequest) -> HttpResponse:
     """Public landing page for the client portal (no authentication)."""
     fp = _visitor_fp(request)
-    has_application = dm.Table6.objects.filter(name=fp).exists()
-    is_verified_artist = dm.Table3.objects.filter(name=fp).exists()
-    return render(request, "client_portal/home.html", {
-        "has_application": has_application,
-        "is_verified_artist": is_verified_artist,
-    })
+    if visitor.is_fresh(request):
+        # First visit: nothing can be stored under a just-minted id yet.
+        return render(request, "client_portal/home.html", {"has_application": False, "is_verified_artist": False})
+    flags = fragment_cache_service.get_or_build(
+        fragment_cache_service.make_key("portal_home", fp=fp),
+        lambda: {
+            "has_application": dm.Table6.objects.filter(name=fp).exists(),
+            "is_verified_artist": dm.Table3.objects.filter(name=fp).exists(),
+        },
+        [etag_service.table(3), etag_service.table(6)],
+    )
+    return render(request, "client_portal/home.html", flags)
 
 
 def customer_dashboard(request: HttpRequest) -> HttpResponse:
     """Public customer dashboard showing recent bookings for the fingerprint."""
     fp = _visitor_fp(request)
-    recent = dm.Table9.objects.filter(name=fp).order_by("-created_at")[:10]
+    recent = [] if visitor.is_fresh(request) else dm.Table9.objects.filter(name=fp).order_by("-created_at")[:10]
     return render(request, "client_portal/customer_dashboard.html", {"recent_bookings": recent})
 
 
@@ -177,19 +158,39 @@ def browse_artists(request: HttpRequest) -> HttpResponse:
     q = (request.GET.get("q") or "").strip()
     city = (request.GET.get("city") or "").strip()
     svc = (request.GET.get("service") or "").strip()
-    qs = dm.Table3.objects.all().order_by("name")
+    per_page = _records_per_page()
+    # The rows are built from exactly the values in the key, so one key never caches two answers.
+    params = {
+        "q": fragment_cache_service.normalize(q),
+        "city": fragment_cache_service.normalize(city),
+        "service": fragment_cache_service.normalize(svc),
+        "page": fragment_cache_service.normalize(request.GET.get("page") or 1),
+    }
+    key = fragment_cache_service.make_key("browse_artists", per_page=per_page, **params)
+    data = fragment_cache_service.get_or_build(
+        key,
+        lambda: _artists_page(params["q"], params["city"], params["service"], params["page"], per_page),
+        [etag_service.table(3), etag_service.table(5)],
+    )
+    # Rebuild the page around the cached rows; the template only needs counts and numbers.
+    page_obj = Page(data["rows"], data["number"], Paginator(range(data["count"]), per_page))
+    return render(request, "client_portal/browse_artists.html", {
+        "page_obj": page_obj, "q": q, "city": city, "service": svc
+    })
+
+
+def _artists_page(q: str, city: str, svc: str, page, per_page: int) -> dict:
+    """One page of the artist directory as plain data for the fragment cache."""
+    qs = dm.Table3.objects.order_by("name")
     if q:
         qs = qs.filter(name__icontains=q)
     if city:
         qs = qs.filter(city__icontains=city)
     if svc:
-        svc_names = dm.Table5.objects.filter(name__icontains=svc).values_list("name", flat=True)
-        qs = qs.filter(name__in=list(svc_names))
-    paginator = Paginator(qs, _records_per_page())
-    page_obj = paginator.get_page(request.GET.get("page") or 1)
-    return render(request, "client_portal/browse_artists.html", {
-        "page_obj": page_obj, "q": q, "city": city, "service": svc
-    })
+        # One semi-join on the artist <-> service link, whatever the number of matching services.
+        qs = qs.filter(Exists(dm.Table5.objects.filter(artist=OuterRef("pk"), name__icontains=svc)))
+    page_obj = Paginator(qs.values("unique_id", "name", "city", "phone"), per_page).get_page(page)
+    return {"count": page_obj.paginator.count, "number": page_obj.number, "rows": list(page_obj.object_list)}
 
 
 @transaction.atomic
@@ -343,6 +344,7 @@ def artist_apply(request: HttpRequest) -> HttpResponse:
             client = _current_client(request)
             if client and getattr(client, "allow_reapply", False):
                 dm.Client.objects.filter(pk=client.pk).update(allow_reapply=False)
+                etag_service.bump_on_commit(etag_service.CLIENTS)
         except Exception:
             pass
         # Certificates (multiple)
@@ -373,7 +375,9 @@ def artist_apply(request: HttpRequest) -> HttpResponse:
 def artist_application_status(request: HttpRequest) -> HttpResponse:
     """Public status view keyed by visitor fingerprint (legacy heuristic)."""
     fp = _visitor_fp(request)
-    if dm.Table3.objects.filter(name=fp).exists():
+    if visitor.is_fresh(request):
+        status = "not_applied"
+    elif dm.Table3.objects.filter(name=fp).exists():
         status = "approved"
     elif dm.Table6.objects.filter(name=fp).exists():
         status = "pending"
@@ -382,16 +386,17 @@ def artist_application_status(request: HttpRequest) -> HttpResponse:
     return render(request, "client_portal/artist_application_status.html", {"status": status})
 
 
-def client_api_can_apply(request: HttpRequest) -> JsonResponse:
+async def client_api_can_apply(request: HttpRequest) -> JsonResponse:
     """API: Return whether the current client may submit a new artist application.
 
-    Auth required (client session). Returns { ok, can_apply }.
+    Auth required (client session). Returns { ok, can_apply }. The policy check is
+    one atomic block of lookups, so it runs in a single sync_to_async call.
     """
     _require_client_auth_enabled()
-    cid = request.session.get("client_id")
+    cid = await _session_get(request, "client_id")
     if not cid:
         return JsonResponse({"ok": False, "error": "Unauthorized"}, status=401)
-    return JsonResponse({"ok": True, "can_apply": bool(_can_current_client_apply(request))})
+    return JsonResponse({"ok": True, "can_apply": bool(await sync_to_async(_can_current_client_apply)(request))})
 
 
 def artist_dashboard(request: HttpRequest) -> HttpResponse:
@@ -425,6 +430,11 @@ def _require_client_auth_enabled():
         raise Http404()
 
 
+async def _session_get(request: HttpRequest, key: str, default=None):
+    """``request.session.get`` for async views: the first read may load the session from the DB."""
+    return await sync_to_async(request.session.get)(key, default)
+
+
 def _current_client(request: HttpRequest):
     """Return the current logged-in Client instance from session, if any."""
     cid = request.session.get("client_id")
@@ -486,18 +496,40 @@ def _authenticate_client(identifier: str, password: str):
         client = dm.Client.objects.filter(email=ident.lower()).first()
     else:
         client = dm.Client.objects.filter(phone=ident).first()
-    if client and check_password(password, client.password) and client.status == "Active":
+    if client and password_service.check(password, client.password, _password_upgrader(client)) and client.status == "Active":
         return client
     return None
 
 
+def _password_upgrader(client):
+    """Store a re-hashed password after a successful login (newer hasher/work factor)."""
+    def store(encoded: str) -> None:
+        client.password = encoded
+        client.save(update_fields=["password"])
+    return store
+
+
+HASHING_BUSY_MESSAGE = "Too many sign-ins right now. Please try again in a few seconds."
+
+
+def _hashing_busy_response(request: HttpRequest) -> HttpResponse:
+    """503 + Retry-After when the password hashing queue is full; HTML callers get a message."""
+    if request.headers.get("X-Requested-With") != "XMLHttpRequest":
+        messages.error(request, HASHING_BUSY_MESSAGE)
+        response = redirect("client_portal:client_auth")
+    else:
+        response = JsonResponse({"ok": False, "error": HASHING_BUSY_MESSAGE}, status=503)
+        response["Retry-After"] = "5"
+    return response
+
+
 def _create_client(full_name: str, phone: str, email: str | None, password: str, location: str | None):
     """Shared client creation with safe hashing and unified logging."""
     client = dm.Client.objects.create(
         full_name=full_name,
         phone=phone,
         email=(email.lower() if email else None),
-        password=make_password(password),
+        password=password_service.make(password),
         location=location,
         status="Active",
     )
@@ -512,7 +544,7 @@ def _create_client(full_name: str, phone: str, email: str | None, password: str,
     return client
 
 
-@rl_decorator(key="ip", rate="5/m", block=True)
+@rate_limit_service.limit("5/m")  # per IP, enforced by RateLimitMiddleware before any DB work
 def client_signup(request: HttpRequest) -> HttpResponse:
     """Page endpoint: create a client account (POST) and auto-login on success.
 
@@ -549,6 +581,9 @@ def client_signup(request: HttpRequest) -> HttpResponse:
                     _finalize_client_login(request, client)  # auto-login after signup
                     messages.success(request, "Account created and you are now logged in.")
                     return redirect("client_portal:customer_dashboard")
+                except password_service.PasswordHashingBusy:
+                    messages.error(request, HASHING_BUSY_MESSAGE)
+                    return render(request, "client_portal/client_signup.html", status=503)
                 except IntegrityError:
                     messages.error(request, "Could not create account. Phone or email may already exist.")
                 except Exception:
@@ -556,7 +591,7 @@ def client_signup(request: HttpRequest) -> HttpResponse:
     return render(request, "client_portal/client_signup.html")
 
 
-@rl_decorator(key="ip", rate="5/m", block=True)
+@rate_limit_service.limit("5/m")  # per IP, enforced by RateLimitMiddleware before any DB work
 def client_login(request: HttpRequest) -> HttpResponse:
     """Page endpoint: authenticate an existing client and establish a session."""
     _require_client_auth_enabled()
@@ -570,7 +605,11 @@ def client_login(request: HttpRequest) -> HttpResponse:
             return redirect("client_portal:client_auth")  # silent redirect; no session changes
         identifier = (request.POST.get("identifier") or "").strip()
         password = (request.POST.get("password") or "").strip()
-        client = _authenticate_client(identifier, password)
+        try:
+            client = _authenticate_client(identifier, password)
+        except password_service.PasswordHashingBusy:
+            messages.error(request, HASHING_BUSY_MESSAGE)
+            return render(request, "client_portal/client_login.html", status=503)
         if client:
             _finalize_client_login(request, client)
             return redirect("client_portal:customer_dashboard")
@@ -617,7 +656,7 @@ def client_profile(request: HttpRequest) -> HttpResponse:
     return render(request, "client_portal/client_profile.html", ctx)
 
 
-def client_api_profile(request: HttpRequest) -> JsonResponse:
+async def client_api_profile(request: HttpRequest) -> JsonResponse:
     """API: return the logged-in client's profile (PII redacted) as JSON.
 
     Notes:
@@ -625,11 +664,11 @@ def client_api_profile(request: HttpRequest) -> JsonResponse:
     - Read-only. Safe for AJAX fetch to hydrate the profile page without reloads.
     """
     _require_client_auth_enabled()  # Added: enforce feature flag
-    cid = request.session.get("client_id")  # Added: read session
+    cid = await _session_get(request, "client_id")  # Added: read session
     if not cid:  # Added: unauthenticated
         return JsonResponse({"ok": False, "error": "Unauthorized"}, status=401)  # Added
     try:
-        client = dm.Client.objects.get(client_id=cid)  # Added: fetch client
+        client = await dm.Client.objects.aget(client_id=cid)  # Added: fetch client
     except dm.Client.DoesNotExist:
         return JsonResponse({"ok": False, "error": "Unauthorized"}, status=401)  # Added
 
@@ -678,7 +717,7 @@ def client_logout(request: HttpRequest) -> HttpResponse:
         # Added: clear active_session_key in DB for this client (best-effort)
         try:
             if client:
-                dm.Client.objects.filter(pk=client.pk).update(active_session_key=None)  # Added
+                client_session_service.set_active_session_key(client.pk, None)
         except Exception:
             pass
         # Fully clear and regenerate session
@@ -731,7 +770,11 @@ def client_reset_password(request: HttpRequest, token: str) -> HttpResponse:
         elif not _password_policy_ok(new_pw):
             messages.error(request, "Password must be at least 8 characters and include letters, numbers, and a special character.")
         else:
-            client.password = make_password(new_pw)
+            try:
+                client.password = password_service.make(new_pw)
+            except password_service.PasswordHashingBusy:
+                messages.error(request, HASHING_BUSY_MESSAGE)
+                return render(request, "client_portal/client_reset_password.html", status=503)
             client.save(update_fields=["password"])
             dm.ClientLog.objects.create(client=client, action="PASSWORD_RESET")
             try:
@@ -757,7 +800,7 @@ def client_auth(request: HttpRequest) -> HttpResponse:
 
 
 @require_POST
-@rl_decorator(key="ip", rate="5/m", block=True)
+@rate_limit_service.limit("5/m")  # per IP, enforced by RateLimitMiddleware before any DB work
 def client_api_login(request: HttpRequest) -> JsonResponse:
     """API endpoint: authenticate a client and respond with JSON + redirect URL."""
     _require_client_auth_enabled()
@@ -777,7 +820,10 @@ def client_api_login(request: HttpRequest) -> JsonResponse:
             messages.error(request, "Missing credentials.")  # Added
             return redirect("client_portal:client_auth")  # Added
         return JsonResponse({"ok": False, "error": "Missing credentials."}, status=400)
-    client = _authenticate_client(identifier, password)
+    try:
+        client = _authenticate_client(identifier, password)
+    except password_service.PasswordHashingBusy:
+        return _hashing_busy_response(request)
     if client:
         _finalize_client_login(request, client)
         is_ajax = (request.headers.get("X-Requested-With") == "XMLHttpRequest")  # Added
@@ -793,7 +839,7 @@ def client_api_login(request: HttpRequest) -> JsonResponse:
 
 
 @require_POST
-@rl_decorator(key="ip", rate="5/m", block=True)
+@rate_limit_service.limit("5/m")  # per IP, enforced by RateLimitMiddleware before any DB work
 def client_api_signup(request: HttpRequest) -> JsonResponse:
     """API endpoint: create a client and auto-login; respond with JSON redirect."""
     _require_client_auth_enabled()
@@ -846,6 +892,8 @@ def client_api_signup(request: HttpRequest) -> JsonResponse:
             messages.success(request, "Account created and you are now logged in.")  # Added
             return redirect("client_portal:customer_dashboard")  # Added
         return JsonResponse({"ok": True, "redirect": reverse("client_portal:customer_dashboard"), "message": "Account created and you are now logged in."})
+    except password_service.PasswordHashingBusy:
+        return _hashing_busy_response(request)
     except IntegrityError:
         # Added: non-AJAX fallback on integrity error
         is_ajax = (request.headers.get("X-Requested-With") == "XMLHttpRequest")  # Added
@@ -0,0 +1,104 @@
+"""
+Stateless identity for anonymous portal visitors.
+
+The public pages key visitor-scoped lookups (``Table6``/``Table3``/``Table9`` rows
+named ``anon-<id>``) on a random id carried in a signed cookie (``VISITOR_COOKIE_NAME``),
+not on a session key. Before, ``_visitor_fp`` saved an empty session to mint one,
+so every crawler hit and first visit wrote a ``django_session`` row; anonymous
+traffic now causes no session reads or writes at all.
+
+- ``visitor_id(request)`` returns the id from the cookie, or mints one. A visitor who
+  still carries an anonymous session cookie from before keeps that session key as
+  their id, so rows already named ``anon-<session key>`` stay theirs. The key of a
+  signed-in session (admin or portal client) is never adopted: the visitor cookie
+  is signed, not encrypted, and outlives the session, so it must not carry a live
+  session key. Such visitors get a fresh id.
+- ``is_fresh(request)`` is True for an id minted on this request: nothing can be
+  stored under it yet, so callers may skip their lookups.
+- ``VisitorCookieMiddleware`` (apps.client_portal.middleware) sets the cookie on the
+  response when an id was minted or adopted.
+
+Orphan sessions minted the old way are removed by ``manage.py purge_anonymous_sessions``.
+"""
+from __future__ import annotations
+import re
+import secrets
+from importlib import import_module
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.http import HttpRequest, HttpResponse
+
+SALT = "client_portal.visitor"
+_ID = re.compile(r"^[a-z0-9]{32}$")  # token_hex(16) and Django session keys alike
+_ATTR = "_portal_visitor"  # (id, needs cookie, fresh)
+SIGNED_IN_KEYS = (SESSION_KEY, "client_id")  # an admin or a portal client is logged in
+
+
+def cookie_name() -> str:
+    return getattr(settings, "VISITOR_COOKIE_NAME", "flodo_vid")
+
+
+def _session_cookie(request: HttpRequest) -> str:
+    return request.COOKIES.get(settings.SESSION_COOKIE_NAME) or ""
+
+
+def _signed_in(request: HttpRequest, key: str) -> bool:
+    """Whether session ``key`` belongs to a logged-in admin or portal client (one session read)."""
+    session = getattr(request, "session", None)
+    if session is None or session.session_key != key:
+        session = import_module(settings.SESSION_ENGINE).SessionStore(key)
+    try:
+        return any(k in session for k in SIGNED_IN_KEYS)
+    except Exception:
+        return True  # unknown: do not risk copying a live key
+
+
+def _legacy_id(request: HttpRequest) -> Optional[str]:
+    key = _session_cookie(request)
+    if not _ID.match(key) or _signed_in(request, key):
+        return None
+    return key
+
+
+def _resolve(request: HttpRequest):
+    state = getattr(request, _ATTR, None)
+    if state is None:
+        vid = request.get_signed_cookie(cookie_name(), default=None, salt=SALT)
+        if vid and _ID.match(vid) and not (vid == _session_cookie(request) and _signed_in(request, vid)):
+            state = (vid, False, False)
+        else:
+            legacy = _legacy_id(request)
+            state = (legacy, True, False) if legacy else (secrets.token_hex(16), True, True)
+        setattr(request, _ATTR, state)
+    return state
+
+
+def visitor_id(request: HttpRequest) -> str:
+    return _resolve(request)[0]
+
+
+def fingerprint(request: HttpRequest) -> str:
+    """``anon-<visitor id>``: the name visitor-scoped portal rows are stored under."""
+    return f"anon-{visitor_id(request)}"
+
+
+def is_fresh(request: HttpRequest) -> bool:
+    return _resolve(request)[2]
+
+
+def set_cookie(request: HttpRequest, response: HttpResponse) -> HttpResponse:
+    """Persist an id minted (or adopted) during ``request``; no-op otherwise."""
+    state = getattr(request, _ATTR, None)
+    if state and state[1]:
+        response.set_signed_cookie(
+            cookie_name(),
+            state[0],
+            salt=SALT,
+            max_age=int(getattr(settings, "VISITOR_COOKIE_AGE", 365 * 24 * 3600)),
+            secure=bool(getattr(settings, "SESSION_COOKIE_SECURE", False)),
+            httponly=True,
+            samesite="Lax",
+        )
+    return response
@@ -6,6 +6,7 @@ from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from django.utils.http import http_date, parse_http_date
 from .models import ActivityLog
+from .services import etag_service
 from .serializers import ActivityLogSerializer
 
 
@@ -26,15 +27,6 @@ class ActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ["-timestamp"]
 
     # ---------------------- ETag helpers ----------------------
-    def _etag_for_list(self) -> Optional[str]:
-        try:
-            latest = self.get_queryset().order_by("-timestamp").values_list("timestamp", flat=True).first()
-            count = self.get_queryset().count()
-            base = f"{latest.isoformat() if latest else 'none'}:{count}"
-            return hashlib.sha256(base.encode()).hexdigest()
-        except Exception:
-            return None
-
     def _etag_for_object(self, obj: ActivityLog) -> Optional[str]:
         try:
             base = f"{obj.id}:{obj.timestamp.isoformat()}"
@@ -43,30 +35,13 @@ class ActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
             return None
 
     def list(self, request, *args, **kwargs):
-        etag = self._etag_for_list()
-        # Compute Last-Modified from latest timestamp
-        latest_ts = self.get_queryset().order_by("-timestamp").values_list("timestamp", flat=True).first()
-        last_modified_header = http_date(latest_ts.timestamp()) if latest_ts else None
-        # If-Modified-Since handling
-        ims = request.headers.get("If-Modified-Since")
-        if latest_ts and ims:
-            try:
-                ims_seconds = parse_http_date(ims)
-                ims_dt = datetime.fromtimestamp(ims_seconds, tz=timezone.utc)
-                if latest_ts <= ims_dt and etag and request.headers.get("If-None-Match") == etag:
-                    return Response(status=status.HTTP_304_NOT_MODIFIED)
-                if latest_ts <= ims_dt and not etag:
-                    return Response(status=status.HTTP_304_NOT_MODIFIED)
-            except Exception:
-                pass
-        inm = request.headers.get("If-None-Match")
-        if etag and inm == etag:
-            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        # Validators come from the cached logs change counter: a matching conditional
+        # GET is answered without touching the database.
+        etag, last_modified = etag_service.validators(request, [etag_service.LOGS])
+        if etag_service.not_modified(request, etag, last_modified) is not None:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
         response = super().list(request, *args, **kwargs)
-        if etag:
-            response["ETag"] = etag
-        if last_modified_header:
-            response["Last-Modified"] = last_modified_header
+        etag_service.stamp(response, etag, last_modified)
         # short-lived cache hints for clients/proxies
         response["Cache-Control"] = "public, max-age=15, must-revalidate"
         return response
@@ -8,7 +8,18 @@ class DashboardConfig(AppConfig):
     verbose_name = "Dashboard"
 
     def ready(self):
-        # Import signals only if explicitly enabled to avoid duplicate logging.
-        # Views already create one ActivityLog per CRUD operation.
+        # Always connect the User receivers that invalidate the cached fallback actor,
+        # the Client receivers that drop cached active session keys, and the
+        # Table1..Table10 receivers that keep the overview counts and the
+        # search index current, publish row push events and bump the list ETag counters,
+        # plus the Table3/Table5 receivers that keep the artist <-> service links derived
+        # and the connection_created hook that feeds the per-request query budgets.
+        from .services import (  # noqa: F401
+            actor_service, artist_link_service, client_session_service, etag_service, event_service,
+            query_budget_service, search_service, stats_service,
+        )
+        # Import signals only if explicitly enabled. Views that audit their own
+        # writes suppress the receivers (audit_service.suppress_signal_audit), so
+        # enabling them never produces duplicate ActivityLog rows.
         if getattr(settings, "ENABLE_ACTIVITYLOG_SIGNALS", False):
             from . import signals  # noqa: F401
@@ -3,36 +3,103 @@ from __future__ import annotations
 import json
 from typing import Any, Dict
 
+from asgiref.sync import sync_to_async
+from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
+from apps.dashboard.services import event_service
+
 
 class NotificationsConsumer(AsyncJsonWebsocketConsumer):
     """
-    Authenticated users subscribe to the shared 'notifications' group to receive
-    real-time ActivityLog events. This consumer is additive; no changes to
-    existing HTTP endpoints or business logic.
+    Topic-based push channel (see ``event_service`` for topics and envelopes).
+
+    - Dashboard users join ``notifications`` and ``admin:<user id>`` on connect and
+      may add ``applications``, ``table:<n>`` (or, as super-admins, ``client:<id>``).
+    - Portal clients (session ``client_id``) join only ``client:<client id>``.
+
+    Clients send ``{"action": "subscribe"|"unsubscribe", "topics": [...]}`` and get
+    ``{"type": "subscribed", "topics": [...]}`` back with the topics now joined.
+    Disallowed topics are dropped silently. On connect the client receives
+    ``{"type": "hello", "seq": <latest>}`` for ``/dashboard/api/events/`` replay.
+
+    Two message shapes are forwarded: legacy ``{"type": "activity_log", "data": {...}}``
+    broadcasts from views and sequenced ``event_service`` envelopes. Either may
+    arrive wrapped in a ``notify.batch`` from ``broadcast_service``.
     """
 
     group_name: str = "notifications"
 
     async def connect(self):
-        user = self.scope.get("user")
-        if not user or not user.is_authenticated:
-            await self.close()
-            return
-        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        self.user = self.scope.get("user")
+        self.client_id = None
+        self.topics: set[str] = set()
+        if not (self.user and self.user.is_authenticated):
+            self.user = None
+            self.client_id = await self._session_client_id()
+            if not self.client_id:
+                await self.close()
+                return
         await self.accept()
+        if self.user is not None:
+            await self._join([self.group_name, f"admin:{self.user.pk}"])
+            await self.send_json({"type": "hello", "seq": await sync_to_async(event_service.current_seq)()})
+            await sync_to_async(event_service.presence_changed)(self.user, True)
+        else:
+            await self._join([f"client:{self.client_id}"])
 
     async def disconnect(self, code):
+        for topic in list(getattr(self, "topics", ())):
+            try:
+                await self.channel_layer.group_discard(event_service.group_for(topic), self.channel_name)
+            except Exception:
+                # Best-effort cleanup
+                pass
         try:
-            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+            if getattr(self, "user", None) is not None:
+                await sync_to_async(event_service.presence_changed)(self.user, False)
         except Exception:
-            # Best-effort cleanup
             pass
 
-    async def receive(self, text_data: str | None = None, bytes_data: bytes | None = None):
-        # This channel is server-push only; ignore any client messages.
-        return
+    async def receive_json(self, content: Any, **kwargs):
+        if not isinstance(content, dict):
+            return
+        action = content.get("action")
+        topics = content.get("topics") or []
+        if action not in ("subscribe", "unsubscribe") or not isinstance(topics, list):
+            return
+        topics = [str(t).lower() for t in topics[: event_service.MAX_TOPICS_PER_SOCKET]]
+        if action == "subscribe":
+            await self._join(topics)
+        else:
+            await self._leave(topics)
+        await self.send_json({"type": "subscribed", "topics": sorted(self.topics)})
+
+    async def _join(self, topics):
+        for topic in topics:
+            if topic in self.topics or len(self.topics) >= event_service.MAX_TOPICS_PER_SOCKET:
+                continue
+            if not event_service.can_subscribe(topic, user=self.user, client_id=self.client_id):
+                continue
+            await self.channel_layer.group_add(event_service.group_for(topic), self.channel_name)
+            self.topics.add(topic)
+
+    async def _leave(self, topics):
+        for topic in topics:
+            # The socket's own default topics stay joined.
+            if topic not in self.topics or topic in (self.group_name, f"admin:{getattr(self.user, 'pk', '')}"):
+                continue
+            await self.channel_layer.group_discard(event_service.group_for(topic), self.channel_name)
+            self.topics.discard(topic)
+
+    @database_sync_to_async
+    def _session_client_id(self):
+        try:
+            session = self.scope.get("session")
+            cid = session.get("client_id") if session is not None else None
+            return str(cid).lower() if cid else None
+        except Exception:
+            return None
 
     async def notify(self, event: Dict[str, Any]):
         """Receive a broadcast from channel layer and forward to the client."""
@@ -46,3 +113,20 @@ class NotificationsConsumer(AsyncJsonWebsocketConsumer):
         except Exception:
             # Silently ignore serialization errors to keep WS robust
             pass
+
+    async def notify_event(self, event: Dict[str, Any]):
+        """Forward a sequenced ``event_service`` envelope unchanged."""
+        try:
+            await self.send(text_data=json.dumps(event.get("event"), default=str))
+        except Exception:
+            pass
+
+    async def notify_batch(self, event: Dict[str, Any]):
+        """Unpack a coalesced ``broadcast_service`` batch and forward each message in order."""
+        for message in event.get("messages") or []:
+            if not isinstance(message, dict):
+                continue
+            if message.get("type") == "notify.event":
+                await self.notify_event(message)
+            else:
+                await self.notify(message)
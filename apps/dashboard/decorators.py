@@ -0,0 +1,64 @@
+"""
+View decorators that accept both sync and ``async def`` views.
+
+Django 4.2's ``login_required`` and ``require_http_methods`` only wrap sync views,
+and ``request.user`` is a lazy object whose first evaluation queries the database,
+which async code may not do directly. Sync views get the stock decorators; async
+views get equivalents that load the user through ``sync_to_async``.
+"""
+from __future__ import annotations
+import functools
+from urllib.parse import urlparse
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.auth import REDIRECT_FIELD_NAME
+from django.contrib.auth import decorators as auth_decorators
+from django.contrib.auth.views import redirect_to_login
+from django.http import HttpResponseNotAllowed
+from django.shortcuts import resolve_url
+from django.utils.log import log_response
+from django.views.decorators import http as http_decorators
+
+
+async def is_authenticated(request) -> bool:
+    """Evaluate ``request.user`` off the event loop; later attribute reads are free."""
+    return await sync_to_async(lambda: bool(request.user.is_authenticated))()
+
+
+def login_required(view):
+    """``django.contrib.auth.decorators.login_required`` for sync or async views."""
+    if not iscoroutinefunction(view):
+        return auth_decorators.login_required(view)
+
+    @functools.wraps(view)
+    async def wrapped(request, *args, **kwargs):
+        if await is_authenticated(request):
+            return await view(request, *args, **kwargs)
+        path = request.build_absolute_uri()
+        login_url = resolve_url(settings.LOGIN_URL)
+        login_scheme, login_netloc = urlparse(login_url)[:2]
+        current_scheme, current_netloc = urlparse(path)[:2]
+        if (not login_scheme or login_scheme == current_scheme) and (not login_netloc or login_netloc == current_netloc):
+            path = request.get_full_path()
+        return redirect_to_login(path, login_url, REDIRECT_FIELD_NAME)
+    return wrapped
+
+
+def require_http_methods(methods):
+    """``django.views.decorators.http.require_http_methods`` for sync or async views."""
+    def decorator(view):
+        if not iscoroutinefunction(view):
+            return http_decorators.require_http_methods(methods)(view)
+
+        @functools.wraps(view)
+        async def wrapped(request, *args, **kwargs):
+            if request.method not in methods:
+                response = HttpResponseNotAllowed(methods)
+                log_response(
+                    "Method Not Allowed (%s): %s", request.method, request.path, response=response, request=request,
+                )
+                return response
+            return await view(request, *args, **kwargs)
+        return wrapped
+    return decorator
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.dashboard.services import log_archive_service
+
+
+class Command(BaseCommand):
+    help = (
+        "Move ActivityLog/ClientLog rows older than their retention window into gzip NDJSON "
+        "files under LOG_ARCHIVE_DIR (one per month) and remove them from the database. On "
+        "PostgreSQL also pre-creates upcoming monthly partitions. Schedule daily (cron/Celery beat)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--kind", choices=[*log_archive_service.KINDS, "all"], default="all")
+        parser.add_argument("--days", type=int, default=None, help="Override the retention window in days.")
+        parser.add_argument("--months-ahead", type=int, default=3, help="Monthly partitions to keep ready.")
+        parser.add_argument("--dry-run", action="store_true", help="Report what would be archived; change nothing.")
+
+    def handle(self, *args, **options):
+        kinds = list(log_archive_service.KINDS) if options["kind"] == "all" else [options["kind"]]
+        if options["days"] is not None and options["days"] <= 0:
+            raise CommandError("--days must be positive.")
+        if not options["dry_run"]:
+            for name in log_archive_service.ensure_partitions(options["months_ahead"]):
+                self.stdout.write(f"Created partition {name}")
+        for kind in kinds:
+            before = log_archive_service.cutoff(kind, days=options["days"])
+            if before is None:
+                self.stdout.write(f"{kind}: retention disabled")
+                continue
+            summary = log_archive_service.archive(kind, before=before, dry_run=options["dry_run"])
+            for month in summary["months"]:
+                self.stdout.write(f"{kind} {month['month']}: {month['rows']} row(s)")
+            verb = "would be archived" if options["dry_run"] else "archived"
+            self.stdout.write(self.style.SUCCESS(f"{kind}: {summary['rows']} row(s) {verb} (before {summary['before']})."))
@@ -0,0 +1,89 @@
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from apps.dashboard.services import password_service
+
+
+def _probe_work() -> None:
+    # Roughly what a light JSON request costs in Python (~1 ms).
+    sum(i * i for i in range(20000))
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate a login storm: --concurrency request threads each verify a password through "
+        "password_service, once per pool size in --workers (0 = inline). Reports logins/s, login "
+        "latency, fast-failed logins and the latency of a light request running alongside."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=60, help="Password checks per run (default: 60).")
+        parser.add_argument("--concurrency", type=int, default=16, help="Simulated request threads (default: 16).")
+        parser.add_argument(
+            "--workers", type=int, nargs="*", default=[0, 2], help="Pool sizes to compare (default: 0 2)."
+        )
+        parser.add_argument(
+            "--max-pending", type=int, default=0,
+            help="PASSWORD_HASH_MAX_PENDING for the runs (default: unlimited, to measure throughput).",
+        )
+
+    def handle(self, *args, **options):
+        logins = max(1, options["logins"])
+        concurrency = max(1, options["concurrency"])
+        max_pending = options["max_pending"] or logins + 1
+        encoded = password_service.make("Storm-pass-123!")
+        self.stdout.write(
+            f"{'workers':>7} {'logins/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'busy':>5} {'probe p95 ms':>13}"
+        )
+        for workers in options["workers"]:
+            with override_settings(PASSWORD_HASH_WORKERS=workers, PASSWORD_HASH_MAX_PENDING=max_pending):
+                if workers:
+                    password_service.check("warm-up", encoded)  # start the pool outside the timing
+                row = self._run(encoded, logins, concurrency)
+            password_service.shutdown()
+            self.stdout.write(
+                f"{workers:>7} {row['rps']:>9.1f} {row['p50']:>8.0f} {row['p95']:>8.0f} "
+                f"{row['busy']:>5} {row['probe_p95']:>13.1f}"
+            )
+
+    def _run(self, encoded, logins, concurrency):
+        stop = threading.Event()
+        probes = []
+
+        def probe():
+            while not stop.is_set():
+                start = time.perf_counter()
+                _probe_work()
+                probes.append(time.perf_counter() - start)
+                time.sleep(0.01)
+
+        def login(_):
+            start = time.perf_counter()
+            try:
+                password_service.check("Storm-pass-123!", encoded)
+            except password_service.PasswordHashingBusy:
+                return None
+            return time.perf_counter() - start
+
+        prober = threading.Thread(target=probe, daemon=True)
+        prober.start()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(login, range(logins)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        prober.join()
+        done = sorted(r for r in results if r is not None)
+        probes.sort()
+        return {
+            "rps": len(done) / elapsed,
+            "p50": statistics.median(done) * 1000 if done else 0,
+            "p95": done[max(0, int(len(done) * 0.95) - 1)] * 1000 if done else 0,
+            "busy": len(results) - len(done),
+            "probe_p95": probes[max(0, int(len(probes) * 0.95) - 1)] * 1000 if probes else 0,
+        }
@@ -0,0 +1,66 @@
+import json
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.dashboard.services import actor_service, import_service
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk import / upsert rows (name, city, phone; optional unique_id) into Table2..Table10 "
+        "from CSV, JSON Lines or NDJSON. Rows are validated like the CRUD API and written in "
+        "batched transactions with one ActivityLog entry per batch. Use '-' to read stdin."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("table_id", type=int, help="Target table (2-10).")
+        parser.add_argument("path", help="Input file, or '-' for stdin.")
+        parser.add_argument("--format", choices=import_service.FORMATS, help="Defaults to the file extension.")
+        parser.add_argument("--batch-size", type=int, default=None, help="Rows per transaction (IMPORT_BATCH_SIZE).")
+        parser.add_argument("--user", help="Username recorded as the actor (default: the fallback admin).")
+        parser.add_argument("--dry-run", action="store_true", help="Validate only; write nothing.")
+
+    def handle(self, *args, **options):
+        table_id = options["table_id"]
+        if table_id not in import_service.TABLE_IDS:
+            raise CommandError("table_id must be between 2 and 10.")
+        path = options["path"]
+        fmt = options["format"] or import_service.guess_format(path)
+        if fmt is None:
+            raise CommandError("Cannot infer the format from the file name; pass --format.")
+
+        if options["user"]:
+            try:
+                user = get_user_model().objects.get(username=options["user"])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f"Unknown user: {options['user']}")
+        else:
+            user = actor_service.fallback_actor_id()
+            if user is None:
+                raise CommandError("No users exist to record as the actor; pass --user.")
+
+        stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+        try:
+            result = import_service.run_import(
+                table_id, import_service.iter_records(stream, fmt), user=user,
+                batch_size=options["batch_size"], dry_run=options["dry_run"],
+            )
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+
+        for err in result.errors:
+            self.stderr.write(f"line {err['line']}: {err['error']}")
+        if result.error:
+            self.stderr.write(self.style.ERROR(f"{result.error} (stopped reading; rows before it were imported)"))
+        summary = result.as_dict()
+        summary.pop("errors")
+        self.stdout.write(json.dumps(summary))
+        style = self.style.SUCCESS if not (result.failed or result.error) else self.style.WARNING
+        verb = "Validated" if options["dry_run"] else "Imported"
+        self.stdout.write(style(
+            f"{verb} {result.created + result.updated} of {result.total} rows "
+            f"({result.created} new, {result.updated} updated, {result.failed} failed)."
+        ))
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from apps.dashboard.services import artist_link_service
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfill dashboard_artist_service.artist from name matches against verified artists "
+        "(the oldest artist with the same name wins). Reports stale links; dry-run by default."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--apply",
+            action="store_true",
+            help="Persist changes. Without this flag, the command only counts stale links.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows relinked per UPDATE (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        stale = artist_link_service.stale_links().count()
+        self.stdout.write(self.style.NOTICE(f"Services with a stale artist link: {stale}"))
+        if not stale or not options.get("apply"):
+            self.stdout.write(self.style.SUCCESS(f"Updated: 0, Dry-run: {not options.get('apply')}"))
+            return
+        updated = 0
+        for n in artist_link_service.relink_stale(max(1, int(options.get("batch_size") or 1000))):
+            updated += n
+            self.stdout.write(f"Relinked {updated}/{stale}")
+        self.stdout.write(self.style.SUCCESS(f"Updated: {updated}, Dry-run: False"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.dashboard.services import export_job_service
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete export jobs past their EXPORT_JOB_TTL (and failed ones older than it) together "
+        "with their files. Schedule periodically (cron/Celery beat)."
+    )
+
+    def handle(self, *args, **options):
+        removed = export_job_service.purge_expired()
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} export job(s)."))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.dashboard.services import search_service
+
+
+class Command(BaseCommand):
+    help = (
+        "Repopulate the SQLite FTS5 search tables from their source tables. Run after "
+        "bulk loads (bulk_create/QuerySet.update bypass the save receivers). No-op on "
+        "PostgreSQL, where the trigram indexes are maintained by the database."
+    )
+
+    def handle(self, *args, **options):
+        backend = search_service.backend()
+        if backend != "fts5":
+            self.stdout.write(f"Search backend is '{backend}'; nothing to rebuild.")
+            return
+        count = search_service.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Search index rebuilt ({count} rows)."))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.dashboard.services import stats_service
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the cached overview counts (Table1..Table10, ActivityLog and Client) in one query "
+        "and overwrite the shared-cache snapshot. Schedule periodically (cron/Celery beat) "
+        "to correct drift from bulk writes."
+    )
+
+    def handle(self, *args, **options):
+        counts = stats_service.reconcile()
+        for key in stats_service.ALL_KEYS:
+            self.stdout.write(f"{key}: {counts.get(key, 0)}")
+        self.stdout.write(self.style.SUCCESS("Stats snapshot reconciled."))
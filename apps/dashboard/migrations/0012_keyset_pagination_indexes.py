@@ -0,0 +1,61 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0011_activitylog_timestamp_default'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['timestamp', 'id'], name='dashboard_a_timesta_39042e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['created_at', 'client_id'], name='dashboard_c_created_8fa7c4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='table1',
+            index=models.Index(fields=['created_at', 'unique_id'], name='dashboard_a_created_b5339f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='table10',
+            index=models.Index(fields=['created_at', 'unique_id'], name='dashboard_m_created_25b6a1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='table2',
+            index=models.Index(fields=['created_at', 'unique_id'], name='dashboard_u_created_e6b431_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='table3',
+            index=models.Index(fields=['created_at', 'unique_id'], name='dashboard_v_created_0f51de_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='table4',
+            index=models.Index(fields=['created_at', 'unique_id'], name='dashboard_p_created_719a29_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='table5',
+            index=models.Index(fields=['created_at', 'unique_id'], name='dashboard_a_created_6e096d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='table6',
+            index=models.Index(fields=['created_at', 'unique_id'], name='dashboard_a_created_170408_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='table7',
+            index=models.Index(fields=['created_at', 'unique_id'], name='dashboard_a_created_462887_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='table8',
+            index=models.Index(fields=['created_at', 'unique_id'], name='dashboard_a_created_aedd86_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='table9',
+            index=models.Index(fields=['created_at', 'unique_id'], name='dashboard_b_created_3a7c82_idx'),
+        ),
+    ]
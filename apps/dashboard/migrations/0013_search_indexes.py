@@ -0,0 +1,74 @@
+"""
+Search indexes for the live table search (see apps/dashboard/services/search_service.py).
+
+SQLite: one FTS5 trigram table per searchable table, populated from existing rows.
+PostgreSQL: pg_trgm GIN indexes on UPPER(col::text), the expression icontains uses.
+Other backends: no-op. SQLite builds without FTS5/trigram (< 3.34) are skipped and
+search falls back to icontains.
+"""
+from django.db import migrations
+
+SEARCH_COLUMNS = {
+    "dashboard_admin": ("name", "city", "phone"),
+    "dashboard_user": ("name", "city", "phone"),
+    "dashboard_verified_artist": ("name", "city", "phone"),
+    "dashboard_payment": ("name", "city", "phone"),
+    "dashboard_artist_service": ("name", "city", "phone"),
+    "dashboard_artist_application": ("name", "city", "phone", "email"),
+    "dashboard_artist_availability": ("name", "city", "phone"),
+    "dashboard_artist_calendar": ("name", "city", "phone"),
+    "dashboard_booking": ("name", "city", "phone"),
+    "dashboard_message": ("name", "city", "phone"),
+    "dashboard_client": ("full_name", "phone", "email", "location"),
+}
+
+
+def forwards(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    qn = schema_editor.quote_name
+    if vendor == "sqlite":
+        with schema_editor.connection.cursor() as cur:
+            try:
+                cur.execute("CREATE VIRTUAL TABLE temp.search_probe USING fts5(x, tokenize='trigram')")
+                cur.execute("DROP TABLE temp.search_probe")
+            except Exception:
+                return
+        for table, cols in SEARCH_COLUMNS.items():
+            col_list = ", ".join(qn(c) for c in cols)
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {qn(table + '_fts')} "
+                f"USING fts5({col_list}, tokenize='trigram')"
+            )
+            schema_editor.execute(
+                f"INSERT INTO {qn(table + '_fts')} (rowid, {col_list}) "
+                f"SELECT rowid, {col_list} FROM {qn(table)}"
+            )
+    elif vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for table, cols in SEARCH_COLUMNS.items():
+            for col in cols:
+                schema_editor.execute(
+                    f"CREATE INDEX IF NOT EXISTS {qn(table + '_' + col + '_trgm')} "
+                    f"ON {qn(table)} USING gin ((UPPER({qn(col)}::text)) gin_trgm_ops)"
+                )
+
+
+def backwards(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    qn = schema_editor.quote_name
+    for table, cols in SEARCH_COLUMNS.items():
+        if vendor == "sqlite":
+            schema_editor.execute(f"DROP TABLE IF EXISTS {qn(table + '_fts')}")
+        elif vendor == "postgresql":
+            for col in cols:
+                schema_editor.execute(f"DROP INDEX IF EXISTS {qn(table + '_' + col + '_trgm')}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("dashboard", "0012_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,144 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:41
+
+"""
+Composite indexes for the log filters (table/admin/client/action + time) and, on
+PostgreSQL 11+, monthly range partitioning of the two log tables on "timestamp".
+
+Partitioned tables need the partition key in the primary key, so the database
+key becomes (pk, "timestamp"); the pk column stays unique through its sequence or
+UUID default, and Django keeps addressing rows by it. A DEFAULT partition catches
+rows outside the pre-created months; ``manage.py archive_logs`` keeps creating
+upcoming months and drops whole archived months (see
+apps/dashboard/services/log_archive_service.py). Other backends only get the indexes.
+"""
+import datetime
+
+from django.db import migrations, models
+
+PARTITIONED = {
+    "dashboard_activitylog": "id",
+    "dashboard_client_log": "log_id",
+}
+MONTHS_AHEAD = 3
+
+
+def _month(d):
+    return datetime.date(d.year, d.month, 1)
+
+
+def _next_month(d):
+    return datetime.date(d.year + (d.month == 12), d.month % 12 + 1, 1)
+
+
+def _partition(cur, qn, table, pk):
+    old = f"{table}_unpartitioned"
+    cur.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass", [table])
+    if cur.fetchone():
+        return
+    cur.execute(
+        "SELECT indexname, indexdef FROM pg_indexes WHERE schemaname = current_schema() AND tablename = %s",
+        [table],
+    )
+    indexes = cur.fetchall()
+    cur.execute(
+        "SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = %s::regclass AND contype IN ('p', 'f')",
+        [table],
+    )
+    constraints = cur.fetchall()
+    cur.execute(
+        "SELECT attidentity FROM pg_attribute WHERE attrelid = %s::regclass AND attname = %s",
+        [table, pk],
+    )
+    identity = (cur.fetchone() or [""])[0] in ("a", "d")
+    cur.execute("SELECT pg_get_serial_sequence(%s, %s)", [table, pk])
+    serial_seq = None if identity else cur.fetchone()[0]
+    cur.execute(f'SELECT MIN("timestamp") FROM {qn(table)}')
+    first = cur.fetchone()[0]
+
+    cur.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(old)}")
+    for name, kind, _ in constraints:
+        cur.execute(f"ALTER TABLE {qn(old)} DROP CONSTRAINT {qn(name)}")
+    pk_names = {name for name, kind, _ in constraints if kind == "p"}
+    for name, _ in indexes:
+        if name not in pk_names:
+            cur.execute(f"DROP INDEX IF EXISTS {qn(name)}")
+    if identity:
+        cur.execute(f"ALTER TABLE {qn(old)} ALTER COLUMN {qn(pk)} DROP IDENTITY")
+
+    cur.execute(
+        f"CREATE TABLE {qn(table)} (LIKE {qn(old)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        f'PARTITION BY RANGE ("timestamp")'
+    )
+    cur.execute(f'ALTER TABLE {qn(table)} ADD PRIMARY KEY ({qn(pk)}, "timestamp")')
+    cur.execute(f"CREATE TABLE {qn(table + '_default')} PARTITION OF {qn(table)} DEFAULT")
+    month = _month(first or datetime.date.today())
+    last = _month(datetime.date.today())
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+    while month <= last:
+        nxt = _next_month(month)
+        cur.execute(
+            f"CREATE TABLE {qn(f'{table}_p{month:%Y%m}')} PARTITION OF {qn(table)} "
+            f"FOR VALUES FROM (%s) TO (%s)",
+            [month.isoformat(), nxt.isoformat()],
+        )
+        month = nxt
+
+    cur.execute(f"INSERT INTO {qn(table)} SELECT * FROM {qn(old)}")
+    if identity:
+        seq = f"{table}_{pk}_seq"
+        cur.execute(f"CREATE SEQUENCE {qn(seq)} OWNED BY {qn(table)}.{qn(pk)}")
+        cur.execute(f"ALTER TABLE {qn(table)} ALTER COLUMN {qn(pk)} SET DEFAULT nextval(%s::regclass)", [seq])
+        cur.execute(f"SELECT setval(%s, COALESCE((SELECT MAX({qn(pk)}) FROM {qn(table)}), 0) + 1, false)", [seq])
+    elif serial_seq:
+        cur.execute(f"ALTER SEQUENCE {serial_seq} OWNED BY {qn(table)}.{qn(pk)}")
+    cur.execute(f"DROP TABLE {qn(old)}")
+
+    for name, indexdef in indexes:
+        if name not in pk_names:
+            cur.execute(indexdef)  # captured before the rename, so it already targets the new parent
+    for name, kind, definition in constraints:
+        if kind == "f":
+            cur.execute(f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {definition}")
+
+
+def partition_logs(apps, schema_editor):
+    conn = schema_editor.connection
+    if conn.vendor != "postgresql" or conn.pg_version < 110000:
+        return
+    with conn.cursor() as cur:
+        for table, pk in PARTITIONED.items():
+            _partition(cur, schema_editor.quote_name, table, pk)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0014_export_job'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='clientlog',
+            name='dashboard_c_action_c01c86_idx',
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['table_name', 'timestamp'], name='dashboard_a_table_n_3fa8ca_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['admin_user', 'timestamp'], name='dashboard_a_admin_u_b07117_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientlog',
+            index=models.Index(fields=['action', 'timestamp'], name='dashboard_c_action_35d194_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientlog',
+            index=models.Index(fields=['client', 'timestamp'], name='dashboard_c_client__0cf3f8_idx'),
+        ),
+        # Partitioned tables stay partitioned on reverse; the indexes above are undone as usual.
+        migrations.RunPython(partition_logs, migrations.RunPython.noop),
+    ]
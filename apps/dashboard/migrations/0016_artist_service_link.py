@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def link_by_name(apps, schema_editor):
+    # Same derivation as artist_link_service.relink(): one UPDATE over the table.
+    Table3 = apps.get_model("dashboard", "Table3")
+    Table5 = apps.get_model("dashboard", "Table5")
+    first_match = Table3.objects.filter(name=models.OuterRef("name")).order_by("unique_id").values("pk")[:1]
+    Table5.objects.update(artist_id=models.Subquery(first_match))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0015_log_indexes_and_partitioning'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='table5',
+            name='artist',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='services', to='dashboard.table3'),
+        ),
+        migrations.AddIndex(
+            model_name='table5',
+            index=models.Index(fields=['artist', 'name'], name='dashboard_a_artist__55f10c_idx'),
+        ),
+        migrations.RunPython(link_by_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,54 @@
+"""
+Key the client search index on the UUID primary key (see search_service).
+
+dashboard_client has no INTEGER PRIMARY KEY, so its implicit rowid, which 0013 used
+to link FTS rows to clients, may be renumbered by VACUUM. The FTS table is rebuilt
+with an UNINDEXED source_pk column holding client_id. SQLite only, and only when
+0013 created the FTS tables.
+"""
+from django.db import migrations
+
+TABLE = "dashboard_client"
+FTS = TABLE + "_fts"
+COLUMNS = ("full_name", "phone", "email", "location")
+
+
+def _has_fts(schema_editor) -> bool:
+    if schema_editor.connection.vendor != "sqlite":
+        return False
+    return FTS in schema_editor.connection.introspection.table_names()
+
+
+def _recreate(schema_editor, keyed: bool):
+    qn = schema_editor.quote_name
+    col_list = ", ".join(qn(c) for c in COLUMNS)
+    key = qn("source_pk") if keyed else "rowid"
+    schema_editor.execute(f"DROP TABLE {qn(FTS)}")
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE {qn(FTS)} "
+        f"USING fts5({key + ' UNINDEXED, ' if keyed else ''}{col_list}, tokenize='trigram')"
+    )
+    schema_editor.execute(
+        f"INSERT INTO {qn(FTS)} ({key}, {col_list}) "
+        f"SELECT {qn('client_id') if keyed else 'rowid'}, {col_list} FROM {qn(TABLE)}"
+    )
+
+
+def forwards(apps, schema_editor):
+    if _has_fts(schema_editor):
+        _recreate(schema_editor, keyed=True)
+
+
+def backwards(apps, schema_editor):
+    if _has_fts(schema_editor):
+        _recreate(schema_editor, keyed=False)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("dashboard", "0016_artist_service_link"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.core.validators import FileExtensionValidator
 from django.conf import settings
 import uuid
@@ -37,26 +38,40 @@ class Table1(BaseTable):
     # Set physical database table name to descriptive, stable identifier  # added
     class Meta:  # added
         db_table = "dashboard_admin"  # added: was dashboard_table1
+        indexes = [models.Index(fields=["created_at", "unique_id"])]  # keyset pagination order
 
 
 class Table2(BaseTable):
     class Meta:  # added
         db_table = "dashboard_user"  # added: was dashboard_table2
+        indexes = [models.Index(fields=["created_at", "unique_id"])]  # keyset pagination order
 
 
 class Table3(BaseTable):
     class Meta:  # added
         db_table = "dashboard_verified_artist"  # added: was dashboard_table3
+        indexes = [models.Index(fields=["created_at", "unique_id"])]  # keyset pagination order
 
 
 class Table4(BaseTable):
     class Meta:  # added
         db_table = "dashboard_payment"  # added: was dashboard_table4
+        indexes = [models.Index(fields=["created_at", "unique_id"])]  # keyset pagination order
 
 
 class Table5(BaseTable):
+    # Verified artist offering this service, derived from the name match
+    # (apps/dashboard/services/artist_link_service.py). Indexed together with name below.
+    artist = models.ForeignKey(
+        Table3, null=True, blank=True, on_delete=models.SET_NULL, related_name="services", db_index=False,
+    )
+
     class Meta:  # added
         db_table = "dashboard_artist_service"  # added: was dashboard_table5
+        indexes = [
+            models.Index(fields=["created_at", "unique_id"]),  # keyset pagination order
+            models.Index(fields=["artist", "name"]),  # portal service filter (EXISTS per artist)
+        ]
 
 
 def validate_file_size(value):
@@ -110,6 +125,7 @@ class Table6(BaseTable):
     supporting_details = models.JSONField(null=True, blank=True)
     class Meta:  # added
         db_table = "dashboard_artist_application"  # added: was dashboard_table6
+        indexes = [models.Index(fields=["created_at", "unique_id"])]  # keyset pagination order
 
 
  
@@ -143,11 +159,13 @@ class ArtistApplicationCertificate(models.Model):
 class Table7(BaseTable):
     class Meta:  # added
         db_table = "dashboard_artist_availability"  # added: was dashboard_table7
+        indexes = [models.Index(fields=["created_at", "unique_id"])]  # keyset pagination order
 
 
 class Table8(BaseTable):
     class Meta:  # added
         db_table = "dashboard_artist_calendar"  # added: was dashboard_table8
+        indexes = [models.Index(fields=["created_at", "unique_id"])]  # keyset pagination order
 
 
 class Table9(BaseTable):
@@ -156,6 +174,7 @@ class Table9(BaseTable):
 
     class Meta:  # added
         db_table = "dashboard_booking"  # added: was dashboard_table9
+        indexes = [models.Index(fields=["created_at", "unique_id"])]  # keyset pagination order
 
 
 class Table10(BaseTable):
@@ -164,6 +183,7 @@ class Table10(BaseTable):
 
     class Meta:  # added
         db_table = "dashboard_message"  # added: was dashboard_table10
+        indexes = [models.Index(fields=["created_at", "unique_id"])]  # keyset pagination order
 
 
 class ActivityLog(models.Model):
@@ -171,11 +191,18 @@ class ActivityLog(models.Model):
     action = models.CharField(max_length=10)  # CREATE, UPDATE, DELETE
     row_id = models.IntegerField()
     row_details = models.JSONField()
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Event time is captured when the change is recorded, not when the write-behind
+    # pipeline flushes it (see services/audit_service.py).
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     admin_user = models.ForeignKey(User, on_delete=models.CASCADE)
 
     class Meta:
         ordering = ["-timestamp"]
+        indexes = [
+            models.Index(fields=["timestamp", "id"]),  # keyset pagination order
+            models.Index(fields=["table_name", "timestamp"]),  # logs_table chips / admin filter
+            models.Index(fields=["admin_user", "timestamp"]),  # per-admin history
+        ]
 
     def __str__(self) -> str:
         return f"{self.table_name} {self.action} #{self.row_id} by {self.admin_user_id}"
@@ -212,6 +239,7 @@ class Client(models.Model):
         indexes = [
             models.Index(fields=["phone"]),
             models.Index(fields=["email"]),
+            models.Index(fields=["created_at", "client_id"]),  # keyset pagination order
         ]
 
     def __str__(self) -> str:
@@ -238,8 +266,9 @@ class ClientLog(models.Model):
     class Meta:
         db_table = "dashboard_client_log"
         indexes = [
-            models.Index(fields=["action"]),
+            models.Index(fields=["action", "timestamp"]),
             models.Index(fields=["timestamp"]),
+            models.Index(fields=["client", "timestamp"]),  # per-client history
         ]
 
     def __str__(self) -> str:
@@ -247,3 +276,49 @@ class ClientLog(models.Model):
 
 
 # End of client-related additive changes
+
+
+def export_storage():
+    """Storage for export job files: ``settings.EXPORT_STORAGE`` (dotted class path) or the default."""
+    from django.core.files.storage import default_storage
+    from django.utils.module_loading import import_string
+
+    path = getattr(settings, "EXPORT_STORAGE", "")
+    return import_string(path)() if path else default_storage
+
+
+class ExportJob(models.Model):
+    """A background table export (see services/export_job_service.py)."""
+    STATUS_CHOICES = (
+        ("queued", "Queued"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    )
+    job_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    table_id = models.PositiveSmallIntegerField()
+    fmt = models.CharField(max_length=16)
+    params = models.JSONField(default=dict, blank=True)  # ExportSpec.as_params()
+    fingerprint = models.CharField(max_length=64)  # identical exports share an artifact
+    status = models.CharField(max_length=8, choices=STATUS_CHOICES, default="queued")
+    total_rows = models.PositiveIntegerField(null=True, blank=True)
+    rows_written = models.PositiveIntegerField(default=0)
+    file = models.FileField(upload_to="exports/", storage=export_storage, max_length=255, blank=True)
+    filename = models.CharField(max_length=100, blank=True)
+    content_type = models.CharField(max_length=100, blank=True)
+    size = models.BigIntegerField(null=True, blank=True)
+    etag = models.CharField(max_length=64, blank=True)
+    error = models.TextField(blank=True)
+    created_by = models.ForeignKey(User, null=True, blank=True, on_delete=models.SET_NULL, related_name="+")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "dashboard_export_job"
+        ordering = ["-created_at"]
+        indexes = [models.Index(fields=["fingerprint", "status", "expires_at"])]
+
+    def __str__(self) -> str:
+        return f"ExportJob {self.job_id} table{self.table_id}.{self.fmt} ({self.status})"
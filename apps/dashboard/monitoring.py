@@ -1,11 +1,11 @@
 from functools import wraps
 import time
 import logging
-from django.db import connection
 from django.conf import settings
 import cProfile
 import pstats
 import io
+from apps.dashboard.services import query_budget_service
 
 logger = logging.getLogger('performance')
 
@@ -14,25 +14,25 @@ def performance_monitor(view_func):
     def wrapper(request, *args, **kwargs):
         # Start timing and query count
         start_time = time.time()
-        start_queries = len(connection.queries)
         
         # Profile the view
         profiler = cProfile.Profile()
         profiler.enable()
         
         # Execute view
-        response = view_func(request, *args, **kwargs)
+        # Counted via query_budget_service: connection.queries is empty unless DEBUG=True
+        with query_budget_service.track() as query_stats:
+            response = view_func(request, *args, **kwargs)
         
         # Stop profiling
         profiler.disable()
         
         # Calculate metrics
         end_time = time.time()
-        end_queries = len(connection.queries)
         
         # Log performance data
         duration = end_time - start_time
-        num_queries = end_queries - start_queries
+        num_queries = query_stats.count
         
         # Get profiling stats
         s = io.StringIO()
@@ -45,6 +45,7 @@ def performance_monitor(view_func):
             'method': request.method,
             'duration': duration,
             'num_queries': num_queries,
+            'db_time': query_stats.duration,
             'user': request.user.username if request.user.is_authenticated else 'anonymous',
             'profile': s.getvalue()
         })
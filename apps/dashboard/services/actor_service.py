@@ -0,0 +1,134 @@
+"""
+Actor resolution for ActivityLog rows written outside a view.
+
+- ``CurrentActorMiddleware`` publishes ``request.user`` in a context variable so
+  post_save/post_delete receivers can attribute changes to the real user.
+- When no authenticated user is in scope (portal traffic, shell, workers) the
+  fallback actor is used: the superuser, else the earliest user. Its id is cached
+  in process and in the shared cache, and invalidated by ``User`` deletes and by
+  saves that can change the choice (a superuser saved, or the cached actor
+  itself). Saves limited to other fields, such as the ``last_login`` update on
+  every sign-in, keep the cache.
+
+Both paths cost zero queries per logged event once warm.
+"""
+from __future__ import annotations
+import contextvars
+import threading
+import time
+from typing import Any, Optional
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+User = get_user_model()
+
+FALLBACK_CACHE_KEY = "actor:fallback_user_id"
+# Bounds staleness in other processes after a User change (they only see the
+# shared-cache delete once their local copy expires).
+LOCAL_TTL_SECONDS = 300
+
+_current_actor: contextvars.ContextVar[Any] = contextvars.ContextVar("current_actor", default=None)
+
+_lock = threading.Lock()
+_local_fallback: Optional[int] = None
+_local_expires_at: float = 0.0
+
+
+# -------- Request-scoped actor --------
+
+def set_current_actor(user: Any) -> contextvars.Token:
+    return _current_actor.set(user)
+
+
+def reset_current_actor(token: contextvars.Token) -> None:
+    _current_actor.reset(token)
+
+
+def current_actor_id() -> Optional[int]:
+    """Id of the authenticated user for the current request, if any."""
+    user = _current_actor.get()
+    try:
+        if user is not None and user.is_authenticated:
+            return user.pk
+    except Exception:
+        pass
+    return None
+
+
+# -------- Fallback actor --------
+
+def fallback_actor_id() -> Optional[int]:
+    """Superuser id (or earliest user id) used when no request user is available."""
+    global _local_fallback, _local_expires_at
+    now = time.monotonic()
+    with _lock:
+        if _local_fallback is not None and now < _local_expires_at:
+            return _local_fallback
+    uid = None
+    try:
+        uid = cache.get(FALLBACK_CACHE_KEY)
+    except Exception:
+        uid = None
+    if uid is None:
+        try:
+            uid = (
+                User.objects.filter(is_superuser=True).order_by("id").values_list("id", flat=True).first()
+                or User.objects.order_by("id").values_list("id", flat=True).first()
+            )
+        except Exception:
+            return None
+        if uid is None:
+            # No users yet: do not cache the miss so the first signup is picked up.
+            return None
+        try:
+            cache.set(FALLBACK_CACHE_KEY, uid, timeout=None)
+        except Exception:
+            pass
+    with _lock:
+        _local_fallback = int(uid)
+        _local_expires_at = now + LOCAL_TTL_SECONDS
+    return _local_fallback
+
+
+def invalidate_fallback_actor() -> None:
+    global _local_fallback, _local_expires_at
+    with _lock:
+        _local_fallback = None
+        _local_expires_at = 0.0
+    try:
+        cache.delete(FALLBACK_CACHE_KEY)
+    except Exception:
+        pass
+
+
+def resolve_actor_id() -> Optional[int]:
+    """Current request user if authenticated, otherwise the cached fallback actor."""
+    return current_actor_id() or fallback_actor_id()
+
+
+def _cached_fallback_id() -> Optional[int]:
+    with _lock:
+        if _local_fallback is not None:
+            return _local_fallback
+    try:
+        return cache.get(FALLBACK_CACHE_KEY)
+    except Exception:
+        return None
+
+
+@receiver(post_save, sender=User, dispatch_uid="actor_service_user_saved")
+def _on_user_saved(sender, instance, update_fields=None, **_kwargs):
+    if update_fields is not None and "is_superuser" not in update_fields:
+        return
+    # The choice depends only on is_superuser and id order: a user who is not a
+    # superuser now and is not the cached actor cannot change it.
+    if instance.is_superuser or instance.pk == _cached_fallback_id():
+        invalidate_fallback_actor()
+
+
+@receiver(post_delete, sender=User, dispatch_uid="actor_service_user_deleted")
+def _on_user_deleted(sender, instance, **_kwargs):
+    invalidate_fallback_actor()
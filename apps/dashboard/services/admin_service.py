@@ -2,10 +2,10 @@ from __future__ import annotations
 from typing import Tuple, Optional
 import re
 from django.utils import timezone
-from django.contrib.auth.hashers import make_password
 from django.db import transaction
 
 from apps.dashboard import models
+from apps.dashboard.services import password_service
 
 
 # -------- Validation & Helpers --------
@@ -82,7 +82,7 @@ def create_admin(*, name: str, city: str, phone: str, role: str, password: str,
         raise ValueError("An admin with the same details already exists.")
 
     user_name = generate_unique_username(name, phone)
-    password_hash = make_password(password) if password else ""
+    password_hash = password_service.make(password) if password else ""
 
     obj = models.Table1.objects.create(
         name=name,
@@ -120,7 +120,7 @@ def update_admin(*, obj: models.Table1, name: str, city: str, phone: str, role:
 
     password_changed = False
     if password:
-        obj.password_hash = make_password(password)
+        obj.password_hash = password_service.make(password)
         password_changed = True
 
     obj.save()
@@ -0,0 +1,95 @@
+"""
+The artist <-> service relation (``Table5.artist`` -> ``Table3``).
+
+Services have always been tied to artists by name: the portal's service filter
+matched ``Table5.name`` against ``Table3.name``. That match is now stored as a
+foreign key, so the filter is one ``EXISTS`` semi-join probing the
+``(artist, name)`` index instead of a second query feeding an unbounded ``IN``
+list. The link stays derived from the name: a service belongs to the oldest
+verified artist of the same name, or to none.
+
+Keeping it current:
+
+- ``Table5`` saves resolve their own link (one indexed lookup);
+- ``Table3`` saves and deletes relink the services with the artist's old and new
+  name in one ``UPDATE``;
+- bulk imports into either table call ``relink()`` once at the end;
+- ``manage.py link_artist_services`` audits and repairs the whole table (the
+  0016 migration ran the same derivation once).
+"""
+from __future__ import annotations
+import logging
+from typing import Iterator, List, Optional
+
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from apps.dashboard import models
+from apps.dashboard.services import etag_service
+
+logger = logging.getLogger(__name__)
+
+
+def _first_match():
+    return models.Table3.objects.filter(name=OuterRef("name")).order_by("unique_id").values("pk")[:1]
+
+
+def match(name: str) -> Optional[int]:
+    """Primary key of the artist a service called ``name`` belongs to."""
+    if not name:
+        return None
+    return models.Table3.objects.filter(name=name).order_by("unique_id").values_list("pk", flat=True).first()
+
+
+def stale_links():
+    """Services whose stored link differs from the one their name derives."""
+    derived = models.Table5.objects.annotate(derived=Subquery(_first_match()))
+    return derived.filter(
+        Q(artist__isnull=True, derived__isnull=False)
+        | Q(artist__isnull=False, derived__isnull=True)
+        | (Q(artist__isnull=False, derived__isnull=False) & ~Q(artist_id=F("derived")))
+    )
+
+
+def relink(condition: Optional[Q] = None) -> int:
+    """Re-derive the link of the services matching ``condition`` (all when ``None``)
+    in one ``UPDATE``; returns the number of rows written."""
+    qs = models.Table5.objects.all()
+    if condition is not None:
+        qs = qs.filter(condition)
+    updated = qs.update(artist_id=Subquery(_first_match()))
+    if updated:
+        etag_service.bump_on_commit(etag_service.table(5))
+    return updated
+
+
+def relink_stale(batch_size: int = 1000) -> Iterator[int]:
+    """Repair stale links ``batch_size`` rows at a time, yielding each batch's count."""
+    while True:
+        ids: List[int] = list(stale_links().order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            return
+        yield relink(Q(pk__in=ids))
+
+
+# -------- Receivers --------
+
+def _on_service_saving(sender, instance, raw=False, **_kwargs):
+    if raw:
+        return
+    try:
+        instance.artist_id = match(instance.name)
+    except Exception:
+        logger.exception("Could not resolve the artist of service %s", instance.pk)
+
+
+def _on_artist_changed(sender, instance, **_kwargs):
+    try:
+        relink(Q(name=instance.name) | Q(artist_id=instance.pk))
+    except Exception:
+        logger.exception("Could not relink the services of artist %s", instance.pk)
+
+
+pre_save.connect(_on_service_saving, sender=models.Table5, dispatch_uid="artist_link_service_saving")
+post_save.connect(_on_artist_changed, sender=models.Table3, dispatch_uid="artist_link_service_artist_saved")
+post_delete.connect(_on_artist_changed, sender=models.Table3, dispatch_uid="artist_link_service_artist_deleted")
@@ -0,0 +1,301 @@
+"""
+Write-behind ActivityLog pipeline.
+
+Views, signal receivers and portal logging call ``record()`` instead of
+``ActivityLog.objects.create``. Events are released only after the surrounding
+transaction commits (rolled-back writes are never audited) and then written
+according to ``settings.ACTIVITYLOG_WRITE_MODE``:
+
+- "sync":     insert right after commit (one insert per mutation)
+- "buffered": collect in a process buffer, flushed with one ``bulk_create`` when
+              ``ACTIVITYLOG_BUFFER_SIZE`` events are queued or
+              ``ACTIVITYLOG_FLUSH_INTERVAL`` seconds have passed
+- "celery":   same buffer, but each flushed batch is handed to the
+              ``apps.dashboard.tasks.write_activity_logs`` task
+
+The buffer is flushed at interpreter exit; call ``flush()`` explicitly from
+worker shutdown hooks or management commands. Each written row is then pushed to
+connected dashboards as a ``log`` event (see ``event_service``).
+"""
+from __future__ import annotations
+import atexit
+import contextvars
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.dashboard import models
+from apps.dashboard.services import etag_service, event_service, stats_service
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_buffer: List[Dict[str, Any]] = []
+_timer: Optional[threading.Timer] = None
+
+# True while a view writes its own audit rows; post_save/post_delete receivers
+# check this so one mutation never produces two ActivityLog rows.
+_signals_suppressed: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "activitylog_signals_suppressed", default=False
+)
+
+
+# -------- Settings --------
+
+def _mode() -> str:
+    mode = str(getattr(settings, "ACTIVITYLOG_WRITE_MODE", "sync") or "sync").strip().lower()
+    return mode if mode in ("sync", "buffered", "celery") else "sync"
+
+
+def _buffer_size() -> int:
+    return max(1, int(getattr(settings, "ACTIVITYLOG_BUFFER_SIZE", 200) or 200))
+
+
+def _flush_interval() -> float:
+    return max(0.1, float(getattr(settings, "ACTIVITYLOG_FLUSH_INTERVAL", 2.0) or 2.0))
+
+
+# -------- Signal de-duplication --------
+
+@contextmanager
+def suppress_signal_audit():
+    """Mark the enclosed block (or decorated view) as writing its own audit rows.
+
+    A generator-based context manager: every entry (including every call of a
+    decorated view) gets its own generator, so the reset token never leaks
+    between concurrent requests.
+    """
+    token = _signals_suppressed.set(True)
+    try:
+        yield
+    finally:
+        _signals_suppressed.reset(token)
+
+
+def signal_audit_suppressed() -> bool:
+    return _signals_suppressed.get()
+
+
+# -------- Public API --------
+
+def record(*, table_name: str, action: str, row_id: Any, row_details: Optional[dict], admin_user: Any) -> None:
+    """Queue one ActivityLog event; it is released when the current transaction commits.
+
+    ``admin_user`` may be a User instance or a user id. Events without an actor are
+    dropped because ``ActivityLog.admin_user`` is non-nullable. Never raises.
+    """
+    try:
+        admin_user_id = getattr(admin_user, "pk", admin_user)
+        if admin_user_id is None:
+            return
+        event = {
+            "table_name": str(table_name)[:50],
+            "action": str(action)[:10],
+            "row_id": _coerce_row_id(row_id),
+            "row_details": _json_safe(row_details),
+            "admin_user_id": int(admin_user_id),
+            "timestamp": timezone.now(),
+        }
+        transaction.on_commit(lambda: _dispatch(event))
+    except Exception:
+        logger.exception("Failed to queue ActivityLog event")
+
+
+def record_many(events: List[Dict[str, Any]], *, admin_user: Any) -> None:
+    """Queue several events (``table_name``/``action``/``row_id``/``row_details`` dicts)
+    by one actor; released together after commit, so sync mode writes them with a
+    single ``bulk_create``. Never raises."""
+    try:
+        admin_user_id = getattr(admin_user, "pk", admin_user)
+        if admin_user_id is None or not events:
+            return
+        now = timezone.now()
+        batch = [{
+            "table_name": str(e.get("table_name"))[:50],
+            "action": str(e.get("action"))[:10],
+            "row_id": _coerce_row_id(e.get("row_id")),
+            "row_details": _json_safe(e.get("row_details")),
+            "admin_user_id": int(admin_user_id),
+            "timestamp": now,
+        } for e in events]
+        transaction.on_commit(lambda: _dispatch_many(batch))
+    except Exception:
+        logger.exception("Failed to queue %d ActivityLog events", len(events or []))
+
+
+def flush() -> int:
+    """Write every buffered event now. Returns the number of events handed off."""
+    global _timer
+    with _lock:
+        events = list(_buffer)
+        _buffer.clear()
+        if _timer is not None:
+            _timer.cancel()
+            _timer = None
+    if not events:
+        return 0
+    if _mode() == "celery":
+        try:
+            from apps.dashboard.tasks import write_activity_logs
+
+            if write_activity_logs is not None:
+                write_activity_logs.delay(serialize_events(events))
+                return len(events)
+        except Exception:
+            logger.exception("Celery hand-off failed; writing ActivityLog batch inline")
+    write_events(events)
+    return len(events)
+
+
+def pending() -> int:
+    with _lock:
+        return len(_buffer)
+
+
+def write_events(events: List[Dict[str, Any]]) -> None:
+    """Insert a batch of events with a single ``bulk_create``."""
+    if not events:
+        return
+    try:
+        # Savepoint: a batch that fails part-way leaves nothing behind for the row-by-row retry to duplicate.
+        with transaction.atomic():
+            rows = models.ActivityLog.objects.bulk_create(
+                [models.ActivityLog(**e) for e in events],
+                batch_size=_buffer_size(),
+            )
+        stats_service.adjust(stats_service.LOGS_KEY, len(events))
+        etag_service.bump_on_commit(etag_service.LOGS)
+        _publish(rows)
+        return
+    except Exception:
+        logger.exception("Bulk write of %d ActivityLog rows failed; retrying row by row", len(events))
+    # One bad row (e.g. a since-deleted actor) must not drop the rest of the batch.
+    rows = []
+    for e in events:
+        try:
+            with transaction.atomic():
+                rows.append(models.ActivityLog.objects.create(**e))
+        except Exception:
+            logger.warning("Dropping ActivityLog event %s %s #%s", e.get("table_name"), e.get("action"), e.get("row_id"))
+    stats_service.adjust(stats_service.LOGS_KEY, len(rows))
+    if rows:
+        etag_service.bump_on_commit(etag_service.LOGS)
+    _publish(rows)
+
+
+def _publish(rows: List[models.ActivityLog]) -> None:
+    """Push written rows as ``log`` events; sent once they are readable via get_logs."""
+    for r in rows:
+        event_service.publish("log", {
+            "id": r.pk,
+            "table_name": r.table_name,
+            "action": r.action,
+            "row_id": r.row_id,
+            "row_details": r.row_details,
+            "admin_user_id": r.admin_user_id,
+            "timestamp": r.timestamp.isoformat(),
+        })
+
+
+def serialize_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """JSON-safe copy of events for queue transport."""
+    out = []
+    for e in events:
+        d = dict(e)
+        if isinstance(d.get("timestamp"), datetime):
+            d["timestamp"] = d["timestamp"].isoformat()
+        out.append(d)
+    return out
+
+
+def deserialize_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    out = []
+    for e in events or []:
+        d = dict(e)
+        ts = d.get("timestamp")
+        if isinstance(ts, str):
+            try:
+                d["timestamp"] = datetime.fromisoformat(ts)
+            except ValueError:
+                d["timestamp"] = timezone.now()
+        out.append(d)
+    return out
+
+
+# -------- Internals --------
+
+def _json_safe(details: Optional[dict]) -> dict:
+    """Coerce row details to plain JSON now, so a bad value cannot fail a whole batch later."""
+    if details is None:
+        return {}
+    try:
+        return json.loads(json.dumps(details, cls=DjangoJSONEncoder))
+    except (TypeError, ValueError):
+        return json.loads(json.dumps(details, default=str))
+
+
+def _coerce_row_id(row_id: Any) -> int:
+    """ActivityLog.row_id is an IntegerField; fold UUID keys into the signed 32-bit range."""
+    if hasattr(row_id, "int"):
+        return int(row_id.int % 2147483647)
+    try:
+        return int(row_id or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _dispatch(event: Dict[str, Any]) -> None:
+    if _mode() == "sync":
+        write_events([event])
+        return
+    with _lock:
+        _buffer.append(event)
+        full = len(_buffer) >= _buffer_size()
+        if not full:
+            _ensure_timer()
+    if full:
+        flush()
+
+
+def _dispatch_many(events: List[Dict[str, Any]]) -> None:
+    if _mode() == "sync":
+        write_events(events)
+        return
+    with _lock:
+        _buffer.extend(events)
+        full = len(_buffer) >= _buffer_size()
+        if not full:
+            _ensure_timer()
+    if full:
+        flush()
+
+
+def _ensure_timer() -> None:
+    """Start the age-based flush timer (caller holds ``_lock``)."""
+    global _timer
+    if _timer is None:
+        _timer = threading.Timer(_flush_interval(), _timed_flush)
+        _timer.daemon = True
+        _timer.start()
+
+
+def _timed_flush() -> None:
+    global _timer
+    try:
+        with _lock:
+            _timer = None
+        flush()
+    finally:
+        # The timer thread owns its own DB connection; release it.
+        connection.close()
+
+
+atexit.register(flush)
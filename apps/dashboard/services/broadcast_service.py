@@ -0,0 +1,157 @@
+"""
+Channel-layer broadcasts without blocking the request thread.
+
+``send(group, message)`` replaces inline ``async_to_sync(layer.group_send)(...)``:
+
+- the message is released only when the surrounding transaction commits, so
+  rolled-back writes are never announced;
+- in "background" mode committed messages go onto a process queue drained by one
+  daemon sender thread. Messages that arrive within ``BROADCAST_COALESCE_MS`` are
+  grouped per channel-layer group and sent as a single ``notify.batch`` message,
+  which ``NotificationsConsumer`` unpacks. Request latency no longer includes a
+  Redis round trip;
+- "sync" mode sends right after commit from the calling thread. It is the default
+  with the in-memory channel layer, whose queues belong to the server's event loop
+  and must not be fed from another thread.
+
+Payloads are made JSON-safe (UUIDs, datetimes) before queueing so one bad value
+cannot poison a batch. ``send`` never raises.
+
+``enqueue(group, message, prepare=...)`` takes an optional hook that finishes the
+message where it is sent (the sender thread in background mode): ``event_service``
+numbers and stores its envelopes there, so those cache round trips stay off the
+request thread too.
+"""
+from __future__ import annotations
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+BATCH_TYPE = "notify.batch"
+
+Prepare = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+_queue: "queue.Queue[Tuple[str, Dict[str, Any], Optional[Prepare]]]" = queue.Queue()
+_sender: Optional[threading.Thread] = None
+_sender_lock = threading.Lock()
+
+
+def _mode() -> str:
+    return str(getattr(settings, "BROADCAST_MODE", "background")).lower()
+
+
+def _coalesce_seconds() -> float:
+    return max(0.0, float(getattr(settings, "BROADCAST_COALESCE_MS", 50)) / 1000.0)
+
+
+def _max_batch() -> int:
+    return max(1, int(getattr(settings, "BROADCAST_MAX_BATCH", 100)))
+
+
+# -------- Public API --------
+
+def send(group: str, message: Dict[str, Any]) -> None:
+    """Broadcast ``message`` to ``group`` once the current transaction commits."""
+    try:
+        safe = json.loads(json.dumps(message, cls=DjangoJSONEncoder, default=str))
+        transaction.on_commit(lambda: enqueue(group, safe))
+    except Exception:
+        logger.exception("Failed to queue broadcast to %s", group)
+
+
+def enqueue(group: str, message: Dict[str, Any], prepare: Optional[Prepare] = None) -> None:
+    """Hand an already-committed message to the sender (or send it now in sync mode).
+
+    ``prepare(message)``, if given, runs just before sending and returns the message
+    to send (``None`` drops it).
+    """
+    if _mode() == "sync":
+        message = _prepared(group, message, prepare)
+        if message is not None:
+            _send_batch(group, [message])
+        return
+    _queue.put((group, message, prepare))
+    _ensure_sender()
+
+
+def flush(timeout: float = 2.0) -> None:
+    """Block until queued messages are sent (tests, shutdown hooks)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and _queue.unfinished_tasks:
+        time.sleep(0.01)
+
+
+# -------- Sender --------
+
+def _ensure_sender() -> None:
+    global _sender
+    if _sender is not None and _sender.is_alive():
+        return
+    with _sender_lock:
+        if _sender is None or not _sender.is_alive():
+            _sender = threading.Thread(target=_run, name="broadcast-sender", daemon=True)
+            _sender.start()
+
+
+def _run() -> None:
+    while True:
+        first = _queue.get()
+        items = [first]
+        # Linger briefly so bursts from one request (or several) share one send per group.
+        deadline = time.monotonic() + _coalesce_seconds()
+        while len(items) < _max_batch():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                items.append(_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            by_group: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+            for group, message, prepare in items:
+                message = _prepared(group, message, prepare)
+                if message is not None:
+                    by_group.setdefault(group, []).append(message)
+            for group, messages in by_group.items():
+                _send_batch(group, messages)
+        finally:
+            for _ in items:
+                _queue.task_done()
+
+
+def _prepared(group: str, message: Dict[str, Any], prepare: Optional[Prepare]) -> Optional[Dict[str, Any]]:
+    if prepare is None:
+        return message
+    try:
+        return prepare(message)
+    except Exception:
+        logger.exception("Preparing a broadcast to %s failed", group)
+        return None
+
+
+def _send_batch(group: str, messages: List[Dict[str, Any]]) -> None:
+    try:
+        layer = get_channel_layer()
+        if not layer:
+            return
+        payload = messages[0] if len(messages) == 1 else {"type": BATCH_TYPE, "messages": messages}
+        async_to_sync(layer.group_send)(group, payload)
+    except Exception:
+        logger.exception("Broadcast of %d message(s) to %s failed", len(messages), group)
+
+
+atexit.register(flush)
@@ -0,0 +1,78 @@
+"""
+Cached ``Client.active_session_key`` for single-session enforcement.
+
+``OneSessionPerUserMiddleware`` checks the key on every portal request; it now reads
+it from the shared cache and only falls back to the database on a miss. The portal
+login/logout paths write through ``set_active_session_key`` (database and cache in
+one step), and ``Client`` save/delete drop the cached value so admin edits and
+deletions take effect on the next request.
+"""
+from __future__ import annotations
+import logging
+from typing import Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.dashboard.models import Client
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "client:session:"
+CACHE_TTL_SECONDS = 3600
+_NONE = ""  # cached "no active key" (None cannot be told apart from a miss)
+
+
+def _cache_key(client_id) -> str:
+    return f"{CACHE_PREFIX}{str(client_id).lower()}"
+
+
+def active_session_key(client_id) -> Optional[str]:
+    """Stored active session key; raises ``Client.DoesNotExist`` for unknown clients."""
+    key = _cache_key(client_id)
+    try:
+        cached = cache.get(key)
+    except Exception:
+        cached = None
+    if cached is not None:
+        return cached or None
+    value = Client.objects.filter(client_id=client_id).values_list("active_session_key", flat=True).first()
+    if value is None and not Client.objects.filter(client_id=client_id).exists():
+        raise Client.DoesNotExist
+    try:
+        cache.set(key, value or _NONE, timeout=CACHE_TTL_SECONDS)
+    except Exception:
+        pass
+    return value or None
+
+
+def set_active_session_key(client_id, session_key: Optional[str]) -> None:
+    """Persist the client's active session key and refresh the cached copy."""
+    Client.objects.filter(client_id=client_id).update(active_session_key=session_key)
+    key = _cache_key(client_id)
+
+    def _store():
+        try:
+            cache.set(key, session_key or _NONE, timeout=CACHE_TTL_SECONDS)
+        except Exception:
+            logger.exception("Failed to cache active session key for client %s", client_id)
+
+    # Drop now so no reader keeps the old key; store the new one once it is committed.
+    invalidate(client_id)
+    transaction.on_commit(_store)
+
+
+def invalidate(client_id) -> None:
+    try:
+        cache.delete(_cache_key(client_id))
+    except Exception:
+        pass
+
+
+@receiver(post_save, sender=Client, dispatch_uid="client_session_service_saved")
+@receiver(post_delete, sender=Client, dispatch_uid="client_session_service_deleted")
+def _on_client_changed(sender, instance, **_kwargs):
+    invalidate(instance.client_id)
+    transaction.on_commit(lambda: invalidate(instance.client_id))
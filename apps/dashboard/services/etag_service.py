@@ -0,0 +1,185 @@
+"""
+Change counters behind the ETag/Last-Modified headers of the polling JSON lists.
+
+Each resource (``logs``, ``clients``, ``table:<n>``) has a monotonic counter and a
+changed-at stamp in the shared cache. Writers bump it after commit: the row
+receivers below, ``event_service.publish_rows`` for bulk changes,
+``audit_service.write_events`` for the logs, and ``bump_on_commit`` at the few
+``update()`` call sites. A list view derives its ETag from those counters plus the
+request path, user and any extra inputs (e.g. the page size setting), so a
+conditional GET that matches is answered with 304 from two cache reads, before
+any query runs.
+
+A cold cache starts counters at the current time in milliseconds, so a new counter
+never repeats a value an old ETag was built from.
+"""
+from __future__ import annotations
+import functools
+import hashlib
+import logging
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from apps.dashboard import models
+
+logger = logging.getLogger(__name__)
+
+VERSION_PREFIX = "etag:version:"
+CHANGED_PREFIX = "etag:changed:"
+LOGS = "logs"
+CLIENTS = "clients"
+
+
+def table(table_id: int) -> str:
+    return f"table:{int(table_id)}"
+
+
+def bump(resource: str) -> None:
+    """Advance ``resource``'s counter now. Never raises."""
+    key = f"{VERSION_PREFIX}{resource}"
+    try:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, _seed(), timeout=None)
+            cache.incr(key)
+        cache.set(f"{CHANGED_PREFIX}{resource}", int(time.time()), timeout=None)
+    except Exception:
+        logger.exception("Failed to bump change counter %s", resource)
+
+
+def bump_on_commit(resource: str) -> None:
+    """Bump once the surrounding transaction commits (immediately outside one), so no
+    reader can tag pre-commit data with the new version."""
+    try:
+        transaction.on_commit(lambda: bump(resource))
+    except Exception:
+        logger.exception("Failed to queue change counter bump for %s", resource)
+
+
+def _seed() -> int:
+    return int(time.time() * 1000)
+
+
+def versions(resources: Iterable[str]) -> Tuple[Dict[str, int], Optional[int]]:
+    """``({resource: counter}, latest changed-at)`` in one cache round trip; seeds missing ones."""
+    resources = list(resources)
+    keys = [f"{VERSION_PREFIX}{r}" for r in resources] + [f"{CHANGED_PREFIX}{r}" for r in resources]
+    try:
+        found = cache.get_many(keys)
+    except Exception:
+        found = {}
+    result: Dict[str, int] = {}
+    changed = []
+    for r in resources:
+        value = found.get(f"{VERSION_PREFIX}{r}")
+        if value is None:
+            seed = _seed()
+            try:
+                cache.add(f"{VERSION_PREFIX}{r}", seed, timeout=None)
+                cache.add(f"{CHANGED_PREFIX}{r}", int(time.time()), timeout=None)
+                value = cache.get(f"{VERSION_PREFIX}{r}", seed)
+            except Exception:
+                value = seed
+        result[r] = int(value)
+        changed_at = found.get(f"{CHANGED_PREFIX}{r}")
+        if changed_at is not None:
+            changed.append(int(changed_at))
+    return result, max(changed) if changed else None
+
+
+def validators(request, resources: Iterable[str], *extra: Any) -> Tuple[str, Optional[int]]:
+    """``(etag, last_modified)`` for a list response built from ``resources``."""
+    counters, changed = versions(resources)
+    user_id = getattr(getattr(request, "user", None), "pk", None)
+    basis = "|".join([
+        ",".join(f"{r}={v}" for r, v in sorted(counters.items())),
+        request.get_full_path(),
+        str(user_id),
+        *(str(x) for x in extra),
+    ])
+    return 'W/"%s"' % hashlib.sha1(basis.encode("utf-8")).hexdigest(), changed
+
+
+def not_modified(request, etag: str, last_modified: Optional[int]):
+    """A 304 response when the request's validators still match, else ``None``."""
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def stamp(response, etag: str, last_modified: Optional[int]):
+    """Attach the validators to a fresh 200 response."""
+    if response.status_code == 200:
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def conditional(resources, *extra):
+    """View decorator: answer matching conditional GETs with 304 and stamp 200s.
+
+    ``resources`` is a list of resource names or ``f(request, *args, **kwargs)``
+    returning one; ``extra`` values (or zero-argument callables) are other inputs
+    the response depends on. Apply it below ``login_required``. Async views get an
+    async wrapper that computes the validators in one ``sync_to_async`` call.
+    """
+    def evaluate(request, args, kwargs):
+        names = resources(request, *args, **kwargs) if callable(resources) else resources
+        return validators(request, names, *(x() if callable(x) else x for x in extra))
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @functools.wraps(view)
+            async def awrapped(request, *args, **kwargs):
+                if request.method not in ("GET", "HEAD"):
+                    return await view(request, *args, **kwargs)
+                etag, last_modified = await sync_to_async(evaluate)(request, args, kwargs)
+                cached = not_modified(request, etag, last_modified)
+                if cached is not None:
+                    return cached
+                return stamp(await view(request, *args, **kwargs), etag, last_modified)
+            return awrapped
+
+        @functools.wraps(view)
+        def wrapped(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return view(request, *args, **kwargs)
+            etag, last_modified = evaluate(request, args, kwargs)
+            cached = not_modified(request, etag, last_modified)
+            if cached is not None:
+                return cached
+            return stamp(view(request, *args, **kwargs), etag, last_modified)
+        return wrapped
+    return decorator
+
+
+# -------- Receivers --------
+
+def _on_table_changed(sender, **_kwargs):
+    bump_on_commit(table(sender.__name__[5:]))
+
+
+def _on_client_changed(sender, **_kwargs):
+    bump_on_commit(CLIENTS)
+
+
+def _on_user_deleted(sender, **_kwargs):
+    # Deleting a user cascades to their ActivityLog rows.
+    bump_on_commit(LOGS)
+
+
+for _tid in range(1, 11):
+    _Model = getattr(models, f"Table{_tid}")
+    post_save.connect(_on_table_changed, sender=_Model, dispatch_uid=f"etag_service_saved_{_tid}")
+    post_delete.connect(_on_table_changed, sender=_Model, dispatch_uid=f"etag_service_deleted_{_tid}")
+post_save.connect(_on_client_changed, sender=models.Client, dispatch_uid="etag_service_client_saved")
+post_delete.connect(_on_client_changed, sender=models.Client, dispatch_uid="etag_service_client_deleted")
+post_delete.connect(_on_user_deleted, sender=User, dispatch_uid="etag_service_user_deleted")
@@ -0,0 +1,238 @@
+"""
+Typed, sequenced push events for the admin UI over ``/ws/notifications/``.
+
+Every event is an envelope ``{"type", "topic", "seq", "ts", "data"}``:
+
+- ``log``            an ActivityLog row was written            topic ``notifications``
+- ``presence``       a user's first socket opened / last closed topic ``notifications``
+- ``row``            a Table<n> row was created/updated/deleted topic ``table:<n>``
+                     (bulk changes carry ``row_ids`` instead of ``row_id``)
+- ``pending_count``  pending artist applications after a change topic ``applications``
+
+Each topic maps to one channel-layer group, so an event only reaches sockets that
+subscribed to it (see ``NotificationsConsumer``). Dashboard users may join
+``notifications``, ``applications``, ``table:<n>``, their own ``admin:<user id>``
+and, as super-admins, any ``client:<id>``. Portal clients are confined to their
+own ``client:<client id>``.
+
+Events are published after the surrounding transaction commits. The broadcast
+sender thread numbers them from a shared counter and keeps them for
+``EVENTS_RETENTION_SECONDS`` (off the request thread), so a reconnecting client
+can ask ``/dashboard/api/events/?since=<seq>&topics=...`` for exactly what it
+missed. When the gap is larger than ``EVENTS_RESYNC_MAX`` (or entries expired) the
+endpoint reports ``complete: false`` and the client reloads its views instead.
+"""
+from __future__ import annotations
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from apps.dashboard import models
+from apps.dashboard.services import broadcast_service, etag_service
+
+logger = logging.getLogger(__name__)
+
+GROUP = "notifications"
+MAX_TOPICS_PER_SOCKET = 32
+_TOPIC_RE = re.compile(r"^(notifications|applications|table:(?:[1-9]|10)|admin:\d+|client:[0-9a-f-]{32,36})$")
+SEQ_KEY = "events:seq"
+EVENT_PREFIX = "events:item:"
+PRESENCE_PREFIX = "events:presence:"
+PENDING_STATUSES = ("pending", "under_review")
+
+
+def _retention() -> int:
+    return int(getattr(settings, "EVENTS_RETENTION_SECONDS", 600))
+
+
+def _resync_max() -> int:
+    return int(getattr(settings, "EVENTS_RESYNC_MAX", 500))
+
+
+# -------- Topics --------
+
+def group_for(topic: str) -> str:
+    """Channel-layer group for a topic (group names may not contain ``:``)."""
+    return topic.replace(":", ".")
+
+
+def topic_for(kind: str, data: Dict[str, Any]) -> str:
+    if kind == "row":
+        return f"table:{data.get('table_id')}"
+    if kind == "pending_count":
+        return "applications"
+    return GROUP
+
+
+def can_subscribe(topic: str, *, user=None, client_id: Optional[str] = None) -> bool:
+    """Whether a socket owned by ``user`` (dashboard) or ``client_id`` (portal) may join ``topic``."""
+    topic = str(topic or "").lower()
+    if not _TOPIC_RE.match(topic):
+        return False
+    if user is not None and getattr(user, "is_authenticated", False):
+        if topic.startswith("admin:"):
+            return topic == f"admin:{user.pk}"
+        if topic.startswith("client:"):
+            return bool(getattr(user, "is_superuser", False))
+        return True
+    return client_id is not None and topic == f"client:{str(client_id).lower()}"
+
+
+def subscribable_topics(user) -> List[str]:
+    """Every topic a dashboard ``user`` may join; ``client:*`` stands for all client topics."""
+    if user is None or not getattr(user, "is_authenticated", False):
+        return []
+    topics = [GROUP, "applications", *(f"table:{n}" for n in range(1, 11)), f"admin:{user.pk}"]
+    if getattr(user, "is_superuser", False):
+        topics.append("client:*")
+    return topics
+
+
+def _topic_matcher(topics: Iterable[str]):
+    exact = {t for t in topics if not t.endswith(":*")}
+    prefixes = tuple(t[:-1] for t in topics if t.endswith(":*"))
+    return lambda topic: topic in exact or (bool(prefixes) and str(topic).startswith(prefixes))
+
+
+# -------- Sequence and replay buffer --------
+
+def current_seq() -> int:
+    try:
+        return int(cache.get(SEQ_KEY) or 0)
+    except Exception:
+        return 0
+
+
+def _next_seq() -> int:
+    try:
+        return int(cache.incr(SEQ_KEY))
+    except ValueError:
+        cache.add(SEQ_KEY, 0, timeout=None)
+        return int(cache.incr(SEQ_KEY))
+
+
+def events_since(since: int, topics: Optional[Iterable[str]] = None) -> Tuple[List[Dict[str, Any]], int, bool]:
+    """Return ``(events, latest_seq, complete)`` after ``since``, limited to ``topics`` if given
+    (a ``prefix:*`` entry matches every topic under that prefix)."""
+    latest = current_seq()
+    since = max(0, int(since))
+    if since >= latest:
+        return [], latest, True
+    if latest - since > _resync_max():
+        return [], latest, False
+    keys = [f"{EVENT_PREFIX}{n}" for n in range(since + 1, latest + 1)]
+    try:
+        found = cache.get_many(keys)
+    except Exception:
+        found = {}
+    events = [found[k] for k in keys if k in found]
+    complete = len(events) == len(keys)
+    if topics is not None:
+        matches = _topic_matcher(list(topics))
+        events = [e for e in events if matches(e.get("topic"))]
+    return events, latest, complete
+
+
+# -------- Publishing --------
+
+def publish(kind: str, data: Dict[str, Any], topic: Optional[str] = None) -> None:
+    """Send one event to its topic after the current transaction commits. Never raises."""
+    try:
+        transaction.on_commit(lambda: _deliver(kind, data, topic))
+    except Exception:
+        logger.exception("Failed to queue %s event", kind)
+
+
+def _deliver(kind: str, data: Dict[str, Any], topic: Optional[str] = None) -> None:
+    try:
+        topic = topic or topic_for(kind, data)
+        envelope = {"type": kind, "topic": topic, "seq": None, "ts": timezone.now().isoformat(), "data": data}
+        # Already after commit: hand straight to the sender, which numbers and stores the envelope.
+        broadcast_service.enqueue(group_for(topic), {"type": "notify.event", "event": envelope}, prepare=_sequence)
+    except Exception:
+        logger.exception("Failed to deliver %s event", kind)
+
+
+def _sequence(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Number an envelope and keep it for replay (runs on the broadcast sender thread)."""
+    envelope = message["event"]
+    envelope["seq"] = _next_seq()
+    cache.set(f"{EVENT_PREFIX}{envelope['seq']}", envelope, timeout=_retention())
+    return message
+
+
+def pending_application_count() -> int:
+    return models.Table6.objects.filter(application_status__in=PENDING_STATUSES).count()
+
+
+# -------- Presence --------
+
+def presence_changed(user, online: bool) -> None:
+    """Track open sockets per user; publish only on the first connect / last disconnect."""
+    key = f"{PRESENCE_PREFIX}{user.pk}"
+    try:
+        if online:
+            cache.add(key, 0, timeout=None)
+            count = cache.incr(key)
+            edge = count == 1
+        else:
+            count = cache.decr(key)
+            edge = count <= 0
+            if edge:
+                cache.delete(key)
+    except ValueError:
+        edge = True
+    except Exception:
+        logger.exception("Failed to track presence for user %s", user.pk)
+        return
+    if edge:
+        publish("presence", {"user_id": user.pk, "username": user.get_username(), "online": online})
+
+
+# -------- Row receivers --------
+
+def _on_saved(sender, instance, created, raw=False, **_kwargs):
+    if raw:
+        return
+    _row_event(sender, instance, "CREATE" if created else "UPDATE")
+
+
+def _on_deleted(sender, instance, **_kwargs):
+    _row_event(sender, instance, "DELETE")
+
+
+def _row_event(sender, instance, action: str) -> None:
+    table_id = int(sender.__name__[5:])
+    publish("row", {"table_id": table_id, "action": action, "row_id": instance.pk})
+    if sender is models.Table6:
+        # Count after commit so the badge reflects the committed state.
+        transaction.on_commit(_publish_pending_count)
+
+
+def publish_rows(table_id: int, action: str, row_ids: List[Any]) -> None:
+    """One ``row`` event for a bulk change (``bulk_create``/``update()`` skip the receivers)."""
+    if not row_ids:
+        return
+    etag_service.bump_on_commit(etag_service.table(table_id))
+    publish("row", {"table_id": int(table_id), "action": action, "row_ids": list(row_ids)})
+    if int(table_id) == 6:
+        transaction.on_commit(_publish_pending_count)
+
+
+def _publish_pending_count() -> None:
+    try:
+        _deliver("pending_count", {"count": pending_application_count()})
+    except Exception:
+        logger.exception("Failed to publish pending count")
+
+
+for _tid in range(1, 11):
+    _Model = getattr(models, f"Table{_tid}")
+    post_save.connect(_on_saved, sender=_Model, dispatch_uid=f"event_service_saved_{_tid}")
+    post_delete.connect(_on_deleted, sender=_Model, dispatch_uid=f"event_service_deleted_{_tid}")
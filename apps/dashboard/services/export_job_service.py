@@ -0,0 +1,282 @@
+"""
+Background export jobs (``ExportJob``) with resumable downloads.
+
+``submit(spec, user)`` records a job and runs it after commit, so a large export
+no longer holds a request worker and its connection for the whole stream:
+
+- ``EXPORT_JOB_MODE``  ``sync`` (inline), ``thread`` (daemon thread) or ``celery``
+  (``dashboard.run_export_job``; falls back to a thread when Celery is unavailable)
+- the file is written chunk by chunk through ``export_service.iter_export`` into
+  ``EXPORT_STORAGE`` (default storage, i.e. ``MEDIA_ROOT/exports/``); progress is
+  stored on the job and pushed as ``export_job`` events on the owner's
+  ``admin:<id>`` topic, ending with ``done`` or ``failed``
+- the sha256 of the file is kept as its ETag; ``parse_range`` backs the
+  ``Range``/``If-Range`` handling of the download view
+
+An identical export (same table, format and ``ExportSpec.as_params()``) submitted
+by the same user while a job is queued/running, or within ``EXPORT_JOB_TTL``
+seconds of one finishing, reuses that job instead of querying again. Jobs are
+only visible to their owner, and to superusers (``visible_to``). ``purge_expired`` deletes
+expired jobs and their files (``manage.py purge_export_jobs``).
+"""
+from __future__ import annotations
+import datetime
+import hashlib
+import json
+import logging
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.files import File
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from apps.dashboard.models import ExportJob
+from apps.dashboard.services import event_service, export_service
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running")
+PROGRESS_INTERVAL = 1.0  # seconds between progress writes/events
+_COPY_BLOCK = 64 * 1024
+
+
+class RangeNotSatisfiable(ValueError):
+    """The ``Range`` header does not overlap the file (HTTP 416)."""
+
+
+def _mode() -> str:
+    mode = str(getattr(settings, "EXPORT_JOB_MODE", "thread")).lower()
+    return mode if mode in ("sync", "thread", "celery") else "thread"
+
+
+def _ttl() -> int:
+    return int(getattr(settings, "EXPORT_JOB_TTL", 3600))
+
+
+def fingerprint(spec: export_service.ExportSpec) -> str:
+    key = {"table_id": spec.table_id, "fmt": spec.fmt, **spec.as_params()}
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def spec_for(job: ExportJob) -> export_service.ExportSpec:
+    return export_service.parse_spec(job.table_id, job.fmt, job.params or {})
+
+
+# -------- Submit --------
+
+def submit(spec: export_service.ExportSpec, user) -> Tuple[ExportJob, bool]:
+    """Return ``(job, reused)``: a matching active or unexpired job, or a newly queued one."""
+    fp = fingerprint(spec)
+    owner = user if getattr(user, "pk", None) else None
+    existing = _reusable(fp, owner)
+    if existing is not None:
+        return existing, True
+    job = ExportJob.objects.create(
+        table_id=spec.table_id,
+        fmt=spec.fmt,
+        params=spec.as_params(),
+        fingerprint=fp,
+        filename=spec.filename,
+        content_type=spec.content_type,
+        created_by=owner,
+    )
+    transaction.on_commit(lambda: _dispatch(job.pk))
+    return job, False
+
+
+def visible_to(user):
+    """Jobs ``user`` may look at and download: their own, or all of them for a superuser."""
+    if getattr(user, "is_superuser", False):
+        return ExportJob.objects.all()
+    if not getattr(user, "pk", None):
+        return ExportJob.objects.none()
+    return ExportJob.objects.filter(created_by=user)
+
+
+def _reusable(fp: str, owner) -> Optional[ExportJob]:
+    now = timezone.now()
+    jobs = ExportJob.objects.filter(fingerprint=fp, status__in=(*ACTIVE_STATUSES, "done"))
+    jobs = jobs.filter(created_by=owner) if owner is not None else jobs.filter(created_by__isnull=True)
+    for job in jobs[:5]:
+        if job.status in ACTIVE_STATUSES:
+            # A job whose worker died would stay "running"; stop waiting on it after the TTL.
+            if job.created_at > now - datetime.timedelta(seconds=_ttl()):
+                return job
+            continue
+        if job.expires_at and job.expires_at > now and job.file and file_exists(job):
+            return job
+    return None
+
+
+def file_exists(job: ExportJob) -> bool:
+    try:
+        return job.file.storage.exists(job.file.name)
+    except Exception:
+        return False
+
+
+def _dispatch(job_id) -> None:
+    mode = _mode()
+    if mode == "sync":
+        run(job_id)
+        return
+    if mode == "celery":
+        try:
+            from apps.dashboard.tasks import run_export_job
+
+            if run_export_job is not None:
+                run_export_job.delay(str(job_id))
+                return
+        except Exception:
+            logger.exception("Celery hand-off failed; running export job %s in a thread", job_id)
+    threading.Thread(target=_run_in_thread, args=(job_id,), name=f"export-{job_id}", daemon=True).start()
+
+
+def _run_in_thread(job_id) -> None:
+    try:
+        run(job_id)
+    finally:
+        close_old_connections()
+
+
+# -------- Run --------
+
+def run(job_id) -> Optional[ExportJob]:
+    """Build the export file for a queued job. Safe to call twice: only one caller claims it."""
+    claimed = ExportJob.objects.filter(pk=job_id, status="queued").update(status="running", started_at=timezone.now())
+    if not claimed:
+        return None
+    job = ExportJob.objects.get(pk=job_id)
+    try:
+        spec = spec_for(job)
+        job.total_rows = export_service.queryset(spec).count()
+        ExportJob.objects.filter(pk=job.pk).update(total_rows=job.total_rows)
+        _notify(job)
+        _write(job, spec)
+    except Exception as e:
+        logger.exception("Export job %s failed", job_id)
+        job.status = "failed"
+        job.error = str(e)[:1000]
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "error", "finished_at"])
+        _notify(job)
+        return job
+    _notify(job)
+    return job
+
+
+def _write(job: ExportJob, spec: export_service.ExportSpec) -> None:
+    digest = hashlib.sha256()
+    state = {"rows": 0, "at": time.monotonic()}
+
+    def progress(rows: int) -> None:
+        state["rows"] += rows
+        now = time.monotonic()
+        if now - state["at"] >= PROGRESS_INTERVAL:
+            state["at"] = now
+            job.rows_written = state["rows"]
+            ExportJob.objects.filter(pk=job.pk).update(rows_written=job.rows_written)
+            _notify(job)
+
+    with tempfile.TemporaryFile() as tmp:
+        for part in export_service.iter_export(spec, progress=progress):
+            digest.update(part)
+            tmp.write(part)
+        size = tmp.tell()
+        tmp.seek(0)
+        job.file.save(f"{job.pk}/{spec.filename}", File(tmp), save=False)
+    job.rows_written = state["rows"]
+    job.size = size
+    job.etag = digest.hexdigest()
+    job.status = "done"
+    job.finished_at = timezone.now()
+    job.expires_at = job.finished_at + datetime.timedelta(seconds=_ttl())
+    job.save(update_fields=["file", "rows_written", "size", "etag", "status", "finished_at", "expires_at"])
+
+
+def _notify(job: ExportJob) -> None:
+    if job.created_by_id is None:
+        return
+    event_service.publish("export_job", as_dict(job), topic=f"admin:{job.created_by_id}")
+
+
+def as_dict(job: ExportJob) -> Dict[str, Any]:
+    return {
+        "job_id": str(job.pk),
+        "table_id": job.table_id,
+        "fmt": job.fmt,
+        "params": job.params,
+        "status": job.status,
+        "total_rows": job.total_rows,
+        "rows_written": job.rows_written,
+        "filename": job.filename,
+        "size": job.size,
+        "etag": job.etag,
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "expires_at": job.expires_at.isoformat() if job.expires_at else None,
+    }
+
+
+# -------- Download --------
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """``(start, end)`` inclusive for a single ``bytes=`` range; ``None`` means send the
+    whole file (no/unsupported header). Raises ``RangeNotSatisfiable``."""
+    header = (header or "").strip()
+    if size <= 0 or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[6:].strip().partition("-")
+    try:
+        start = int(first) if first else None
+        end = int(last) if last else None
+    except ValueError:
+        return None
+    if start is None:
+        if not end:  # "bytes=-0" or "bytes=-"
+            raise RangeNotSatisfiable(header)
+        return max(0, size - end), size - 1
+    if end is None:
+        end = size - 1
+    if start >= size or end < start:
+        raise RangeNotSatisfiable(header)
+    return start, min(end, size - 1)
+
+
+def iter_file(job: ExportJob, start: int = 0, length: Optional[int] = None):
+    """Yield ``length`` bytes of the job's file from ``start`` (to the end when ``None``)."""
+    remaining = (job.size or 0) - start if length is None else length
+    with job.file.storage.open(job.file.name, "rb") as fh:
+        fh.seek(start)
+        while remaining > 0:
+            block = fh.read(min(_COPY_BLOCK, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            yield block
+
+
+# -------- Housekeeping --------
+
+def purge_expired(now=None) -> int:
+    """Delete expired/failed jobs older than the TTL and their files. Returns jobs removed."""
+    now = now or timezone.now()
+    stale = ExportJob.objects.filter(expires_at__lte=now) | ExportJob.objects.filter(
+        status="failed", created_at__lte=now - datetime.timedelta(seconds=_ttl()),
+    )
+    removed = 0
+    for job in stale.only("pk", "file"):
+        if job.file:
+            try:
+                job.file.storage.delete(job.file.name)
+            except Exception:
+                logger.exception("Failed to delete export file %s", job.file.name)
+        job.delete()
+        removed += 1
+    return removed
+
@@ -0,0 +1,372 @@
+"""
+Streaming table exports (``/settings/export/<fmt>/<table id>/``).
+
+An export is described by an ``ExportSpec`` parsed from the query string:
+
+- ``columns``    comma-separated column list, validated against the model's concrete
+                 fields (default: unique_id, name, city, phone, created_at, updated_at)
+- ``q``          the live-search filter of ``get_table_data`` (name/city/phone, or
+                 ``unique_id`` when numeric)
+- ``date_from`` / ``date_to``  ``created_at`` range, ISO dates or datetimes; a bare
+                 ``date_to`` includes that whole day
+- ``compress``   ``gzip`` or ``zstd``, applied on the fly
+
+Formats: ``csv``, ``json`` (one array), ``ndjson`` (one object per line), ``parquet``
+and ``arrow`` (Arrow IPC stream). Parquet/Arrow need ``pyarrow`` and zstd needs
+``zstandard``; both are optional and report ``ExportUnavailable`` when missing.
+Parquet applies ``compress`` as its internal column codec instead of wrapping the file.
+
+Rows are read with ``values_list(...).iterator()`` and serialized a chunk
+(``EXPORT_CHUNK_SIZE`` rows) at a time, so memory stays flat however large the table.
+"""
+from __future__ import annotations
+import csv
+import datetime
+import io
+import json
+import zlib
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from apps.dashboard import models
+from apps.dashboard.services import search_service
+
+try:  # optional: faster JSON encoding
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+try:  # optional: Parquet / Arrow output
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - depends on environment
+    pyarrow = None
+
+try:  # optional: zstd compression
+    import zstandard
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
+
+FORMATS = ("csv", "json", "ndjson", "parquet", "arrow")
+COMPRESSIONS = ("gzip", "zstd")
+TABLE_IDS = tuple(range(1, 11))
+DEFAULT_COLUMNS = ("unique_id", "name", "city", "phone", "created_at", "updated_at")
+EXCLUDED_COLUMNS = ("password_hash",)  # never leaves the server
+
+_CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "json": "application/json; charset=utf-8",
+    "ndjson": "application/x-ndjson; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+_COMPRESSED = {"gzip": ("gz", "application/gzip"), "zstd": ("zst", "application/zstd")}
+
+
+class ExportError(ValueError):
+    """The export request is invalid (HTTP 400)."""
+
+
+class ExportUnavailable(ExportError):
+    """The requested format or compression needs a library that is not installed (HTTP 501)."""
+
+
+def _chunk_size() -> int:
+    return max(1, int(getattr(settings, "EXPORT_CHUNK_SIZE", 2000)))
+
+
+# -------- Spec --------
+
+@dataclass(frozen=True)
+class ExportSpec:
+    table_id: int
+    fmt: str
+    columns: Tuple[str, ...] = DEFAULT_COLUMNS
+    q: str = ""
+    date_from: Optional[datetime.datetime] = None
+    date_to: Optional[datetime.datetime] = None  # exclusive
+    compress: str = ""
+
+    def as_params(self) -> dict:
+        """Query parameters that ``parse_spec`` turns back into this spec."""
+        return {
+            "columns": ",".join(self.columns),
+            "q": self.q,
+            "date_from": self.date_from.isoformat() if self.date_from else "",
+            "date_to": self.date_to.isoformat() if self.date_to else "",
+            "compress": self.compress,
+        }
+
+    @property
+    def model(self):
+        return getattr(models, f"Table{self.table_id}")
+
+    @property
+    def filename(self) -> str:
+        name = f"table{self.table_id}.{self.fmt}"
+        if self.compress and self.fmt != "parquet":
+            name += "." + _COMPRESSED[self.compress][0]
+        return name
+
+    @property
+    def content_type(self) -> str:
+        if self.compress and self.fmt != "parquet":
+            return _COMPRESSED[self.compress][1]
+        return _CONTENT_TYPES[self.fmt]
+
+
+def parse_spec(table_id: int, fmt: str, params: Mapping[str, Any]) -> ExportSpec:
+    """Build and validate an ``ExportSpec`` from request parameters."""
+    if table_id not in TABLE_IDS:
+        raise ExportError("Invalid table id.")
+    fmt = str(fmt or "").lower()
+    if fmt not in FORMATS:
+        raise ExportError("Unsupported format.")
+    if fmt in ("parquet", "arrow") and pyarrow is None:
+        raise ExportUnavailable(f"{fmt} export requires pyarrow.")
+    compress = str(params.get("compress") or "").lower()
+    if compress and compress not in COMPRESSIONS:
+        raise ExportError("Unsupported compression.")
+    if compress == "zstd" and zstandard is None and fmt != "parquet":
+        raise ExportUnavailable("zstd compression requires zstandard.")
+    Model = getattr(models, f"Table{table_id}")
+    return ExportSpec(
+        table_id=table_id,
+        fmt=fmt,
+        columns=resolve_columns(Model, params.get("columns")),
+        q=str(params.get("q") or "").strip(),
+        date_from=_parse_bound(params.get("date_from"), "date_from", end=False),
+        date_to=_parse_bound(params.get("date_to"), "date_to", end=True),
+        compress=compress,
+    )
+
+
+def exportable_columns(Model) -> List[str]:
+    return [f.attname for f in Model._meta.concrete_fields if f.attname not in EXCLUDED_COLUMNS]
+
+
+def resolve_columns(Model, raw: Any) -> Tuple[str, ...]:
+    if not raw:
+        return DEFAULT_COLUMNS
+    names = raw if isinstance(raw, (list, tuple)) else str(raw).split(",")
+    allowed = set(exportable_columns(Model))
+    columns: List[str] = []
+    for name in (str(n).strip() for n in names):
+        if not name:
+            continue
+        if name not in allowed:
+            raise ExportError(f"Unknown column: {name}")
+        if name not in columns:
+            columns.append(name)
+    return tuple(columns) or DEFAULT_COLUMNS
+
+
+def _parse_bound(raw: Any, label: str, *, end: bool) -> Optional[datetime.datetime]:
+    raw = str(raw or "").strip()
+    if not raw:
+        return None
+    try:
+        # Bare dates first: parse_datetime would also accept them, as midnight.
+        day = parse_date(raw)
+        if day is not None:
+            if end:
+                day += datetime.timedelta(days=1)
+            value = datetime.datetime.combine(day, datetime.time.min)
+        else:
+            value = parse_datetime(raw)
+            if value is None:
+                raise ValueError
+    except ValueError:
+        raise ExportError(f"Invalid {label}; use YYYY-MM-DD or an ISO datetime.")
+    if settings.USE_TZ and timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def queryset(spec: ExportSpec) -> QuerySet:
+    Model = spec.model
+    qs = Model.objects.all()
+    if spec.q:
+        # Same matching as the table view's live search.
+        cond = search_service.search_q(Model, spec.q, ("name", "city", "phone"))
+        if spec.q.isdigit():
+            cond = cond | Q(unique_id=int(spec.q))
+        qs = qs.filter(cond)
+    if spec.date_from is not None:
+        qs = qs.filter(created_at__gte=spec.date_from)
+    if spec.date_to is not None:
+        qs = qs.filter(created_at__lt=spec.date_to)
+    return qs.order_by("unique_id")
+
+
+# -------- Streaming --------
+
+def iter_export(spec: ExportSpec, chunk_size: Optional[int] = None,
+                progress: Optional[Callable[[int], None]] = None) -> Iterator[bytes]:
+    """Yield the encoded (and compressed) export of ``spec`` chunk by chunk.
+    ``progress`` is called with the row count of each chunk as it is read."""
+    size = chunk_size or _chunk_size()
+    rows = queryset(spec).values_list(*spec.columns).iterator(chunk_size=size)
+    chunks = _chunks(rows, size, progress)
+    body = _ENCODERS[spec.fmt](spec, chunks)
+    if spec.compress and spec.fmt != "parquet":
+        body = _compressed(body, spec.compress)
+    return (part for part in body if part)
+
+
+def _chunks(rows: Iterable[Tuple], size: int, progress=None) -> Iterator[List[Tuple]]:
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        if progress is not None:
+            progress(len(chunk))
+        yield chunk
+
+
+def _encode_csv(spec: ExportSpec, chunks: Iterator[List[Tuple]]) -> Iterator[bytes]:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(spec.columns)
+    yield buf.getvalue().encode("utf-8")
+    for chunk in chunks:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerows(chunk)
+        yield buf.getvalue().encode("utf-8")
+
+
+def _dumps_objects(columns: Sequence[str], chunk: List[Tuple]) -> List[bytes]:
+    objs = [dict(zip(columns, row)) for row in chunk]
+    if orjson is not None:
+        # Passthrough keeps datetimes as str(value), matching the stdlib path below.
+        opts = orjson.OPT_PASSTHROUGH_DATETIME
+        return [orjson.dumps(o, default=str, option=opts) for o in objs]
+    return [json.dumps(o, default=str).encode("utf-8") for o in objs]
+
+
+def _encode_json(spec: ExportSpec, chunks: Iterator[List[Tuple]]) -> Iterator[bytes]:
+    yield b"["
+    first = True
+    for chunk in chunks:
+        part = b",".join(_dumps_objects(spec.columns, chunk))
+        yield part if first else b"," + part
+        first = False
+    yield b"]"
+
+
+def _encode_ndjson(spec: ExportSpec, chunks: Iterator[List[Tuple]]) -> Iterator[bytes]:
+    for chunk in chunks:
+        yield b"\n".join(_dumps_objects(spec.columns, chunk)) + b"\n"
+
+
+# -------- Columnar (pyarrow) --------
+
+class _Sink(io.RawIOBase):
+    """Write-only file object that hands written bytes back to the generator."""
+
+    def __init__(self):
+        super().__init__()
+        self._parts: List[bytes] = []
+        self._pos = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        data = bytes(b)
+        self._parts.append(data)
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def drain(self) -> bytes:
+        data, self._parts = b"".join(self._parts), []
+        return data
+
+
+def _arrow_type(field):
+    target = getattr(field, "target_field", None) or field
+    kind = target.get_internal_type()
+    if kind in ("AutoField", "BigAutoField", "SmallAutoField", "IntegerField", "BigIntegerField",
+                "SmallIntegerField", "PositiveIntegerField", "PositiveBigIntegerField",
+                "PositiveSmallIntegerField"):
+        return pyarrow.int64()
+    if kind == "BooleanField":
+        return pyarrow.bool_()
+    if kind == "FloatField":
+        return pyarrow.float64()
+    if kind == "DateTimeField":
+        return pyarrow.timestamp("us", tz="UTC")
+    if kind == "DateField":
+        return pyarrow.date32()
+    return pyarrow.string()
+
+
+def _arrow_schema(spec: ExportSpec):
+    fields = {f.attname: f for f in spec.model._meta.concrete_fields}
+    return pyarrow.schema([(c, _arrow_type(fields[c])) for c in spec.columns])
+
+
+def _record_batch(schema, chunk: List[Tuple]):
+    arrays = []
+    for i, field in enumerate(schema):
+        values = [row[i] for row in chunk]
+        if pyarrow.types.is_string(field.type):
+            values = [v if v is None or isinstance(v, str) else str(v) for v in values]
+        arrays.append(pyarrow.array(values, type=field.type))
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _encode_columnar(spec: ExportSpec, chunks: Iterator[List[Tuple]]) -> Iterator[bytes]:
+    schema = _arrow_schema(spec)
+    sink = _Sink()
+    if spec.fmt == "parquet":
+        writer = pyarrow.parquet.ParquetWriter(sink, schema, compression=spec.compress or "snappy")
+        write = writer.write_batch
+    else:
+        writer = pyarrow.ipc.new_stream(sink, schema)
+        write = writer.write_batch
+    try:
+        yield sink.drain()
+        for chunk in chunks:
+            write(_record_batch(schema, chunk))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+_ENCODERS = {
+    "csv": _encode_csv,
+    "json": _encode_json,
+    "ndjson": _encode_ndjson,
+    "parquet": _encode_columnar,
+    "arrow": _encode_columnar,
+}
+
+
+# -------- Compression --------
+
+def _compressor(kind: str):
+    if kind == "gzip":
+        return zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    return zstandard.ZstdCompressor().compressobj()
+
+
+def _compressed(parts: Iterable[bytes], kind: str) -> Iterator[bytes]:
+    comp = _compressor(kind)
+    for part in parts:
+        if part:
+            yield comp.compress(part)
+    yield comp.flush()
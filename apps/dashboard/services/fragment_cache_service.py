@@ -0,0 +1,128 @@
+"""
+Tagged fragment cache with stale-while-revalidate for the public portal pages.
+
+``get_or_build(key, build, tags)`` caches what ``build()`` returns together with
+the change counters of its ``tags``, which are ``etag_service`` resources such as
+``table:3``. Writers already bump those counters after commit (the row receivers
+in etag_service, ``event_service.publish_rows`` for bulk changes), so a write
+makes every entry tagged with its table stale without knowing the entries' keys.
+
+Only data is cached, never rendered pages: the templates still add the per-visitor
+navigation and CSRF token. Keys come from ``make_key`` over normalized inputs so
+``?q=Asha`` and ``?q= asha `` share an entry; ``build`` must then query with those
+same normalized values, or two requests sharing a key could need different rows.
+
+A stale entry (a tag moved, or older than ``PORTAL_CACHE_TTL``) is kept for another
+``PORTAL_CACHE_STALE`` seconds. Of the requests that find it stale, only the one
+that wins the short rebuild lock runs ``build``; the others keep serving the stale
+value until the new one is stored, so an invalidation under load costs one query
+instead of one per concurrent request. A cold miss (after a deploy or an eviction)
+takes the same lock; with nothing stale to serve, the losers poll the cache for up
+to ``MISS_WAIT_SECONDS`` and, if the winner has not stored the entry by then, build
+for themselves without storing. ``PORTAL_CACHE_TTL=0`` disables caching.
+"""
+from __future__ import annotations
+import hashlib
+import logging
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.dashboard.services import etag_service
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "fragment:"
+LOCK_SUFFIX = ":rebuild"
+LOCK_SECONDS = 30
+MISS_WAIT_SECONDS = 2.0
+MISS_POLL_SECONDS = 0.05
+
+
+def normalize(value: Any) -> str:
+    """Case- and whitespace-insensitive form of a query parameter."""
+    return " ".join(str(value or "").split()).lower()
+
+
+def make_key(namespace: str, **params: Any) -> str:
+    basis = "&".join(f"{name}={params[name]}" for name in sorted(params))
+    return f"{KEY_PREFIX}{namespace}:{hashlib.sha1(basis.encode('utf-8')).hexdigest()}"
+
+
+def get_or_build(
+    key: str,
+    build: Callable[[], Any],
+    tags: Iterable[str],
+    *,
+    ttl: Optional[int] = None,
+    stale: Optional[int] = None,
+) -> Any:
+    """The cached value for ``key``, rebuilt when missing or stale (see module docstring).
+
+    Cache errors degrade to calling ``build`` directly.
+    """
+    ttl = int(getattr(settings, "PORTAL_CACHE_TTL", 60)) if ttl is None else ttl
+    stale = int(getattr(settings, "PORTAL_CACHE_STALE", 300)) if stale is None else stale
+    if ttl <= 0:
+        return build()
+    # Read the counters before building: a write that lands mid-build leaves the
+    # stored entry tagged with the older counter, so the next read rebuilds it.
+    current, _ = etag_service.versions(tags)
+    try:
+        entry = cache.get(key)
+    except Exception:
+        logger.exception("Fragment cache read failed for %s", key)
+        entry = None
+
+    if entry is not None and entry.get("tags") == current and time.time() < entry.get("fresh_until", 0):
+        return entry["value"]
+    lock = f"{key}{LOCK_SUFFIX}"
+    if not _claim(lock):
+        if entry is not None:
+            return entry["value"]
+        entry = _wait_for(key)
+        return entry["value"] if entry is not None else build()
+    try:
+        value = build()
+        _store(key, value, current, ttl, stale)
+        return value
+    finally:
+        _release(lock)
+
+
+def _claim(lock: str) -> bool:
+    try:
+        return bool(cache.add(lock, 1, timeout=LOCK_SECONDS))
+    except Exception:
+        return True
+
+
+def _wait_for(key: str) -> Optional[dict]:
+    """Poll for the entry another request is building; ``None`` if it does not appear in time."""
+    deadline = time.monotonic() + MISS_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(MISS_POLL_SECONDS)
+        try:
+            entry = cache.get(key)
+        except Exception:
+            return None
+        if entry is not None:
+            return entry
+    return None
+
+
+def _release(lock: str) -> None:
+    try:
+        cache.delete(lock)
+    except Exception:
+        pass
+
+
+def _store(key: str, value: Any, tags, ttl: int, stale: int) -> None:
+    entry = {"value": value, "tags": tags, "fresh_until": time.time() + ttl}
+    try:
+        cache.set(key, entry, timeout=ttl + max(0, stale))
+    except Exception:
+        logger.exception("Fragment cache write failed for %s", key)
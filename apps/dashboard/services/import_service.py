@@ -0,0 +1,264 @@
+"""
+Bulk import / upsert of rows into the generic tables (Table2..Table10).
+
+Input is streamed record by record from CSV (header row), JSON Lines or NDJSON
+(one object per line), so file size does not bound memory. Records carry ``name``,
+``city`` and ``phone``; a record with ``unique_id`` (or ``id``) updates that row
+when it exists and is created otherwise.
+
+Rows are validated like ``table_crud_api`` (``admin_service.validate_payload``).
+Valid rows are written in batches of ``IMPORT_BATCH_SIZE``, each in its own
+transaction with one ``bulk_create`` and one ``bulk_update``. Per batch:
+
+- one aggregated ActivityLog row (action ``IMPORT``) instead of one per row;
+- one ``row`` push event for the table, and an ``import_progress`` event on the
+  importing user's ``admin:<id>`` topic of the notifications socket.
+
+A failed batch is rolled back and reported, and the import carries on with the
+next batch. Input that stops being readable part-way (bad encoding, broken CSV
+quoting) ends the import: rows read before it are still written, and the result
+carries ``error`` alongside the counts of what landed. The overview counts are adjusted per batch. The SQLite search index
+is rebuilt once at the end, because the bulk writes bypass the save receivers;
+so are the artist <-> service links for imports into Table3 or Table5.
+"""
+from __future__ import annotations
+import codecs
+import csv
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.dashboard import models
+from apps.dashboard.services import (
+    admin_service, artist_link_service, audit_service, event_service, search_service, stats_service,
+)
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("csv", "jsonl", "ndjson")
+TABLE_IDS = tuple(range(2, 11))  # Table1 (admins) goes through the Admin Management endpoints
+FIELDS = ("name", "city", "phone")
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportFormatError(ValueError):
+    """The input cannot be parsed in the requested format."""
+
+
+@dataclass
+class ImportResult:
+    table_id: int
+    total: int = 0
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    batches: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None  # the input could not be read to the end
+
+    def add_error(self, line: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": error})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "table_id": self.table_id,
+            "total": self.total,
+            "created": self.created,
+            "updated": self.updated,
+            "failed": self.failed,
+            "batches": self.batches,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+            "error": self.error,
+        }
+
+
+def _batch_size() -> int:
+    return max(1, int(getattr(settings, "IMPORT_BATCH_SIZE", 1000)))
+
+
+def guess_format(filename: str = "", content_type: str = "") -> Optional[str]:
+    name = (filename or "").lower()
+    for ext, fmt in ((".csv", "csv"), (".jsonl", "jsonl"), (".ndjson", "ndjson")):
+        if name.endswith(ext):
+            return fmt
+    ct = (content_type or "").lower()
+    if "csv" in ct:
+        return "csv"
+    if "ndjson" in ct or "jsonl" in ct or "json-seq" in ct:
+        return "ndjson"
+    return None
+
+
+# -------- Parsing --------
+
+def iter_records(stream, fmt: str) -> Iterator[Tuple[int, Any]]:
+    """Yield ``(line number, record)`` from a binary or text stream. Unparseable lines
+    are yielded as ``(line, ImportFormatError)`` so they are reported, not fatal."""
+    if fmt not in FORMATS:
+        raise ImportFormatError(f"Unsupported format: {fmt}")
+    text = _text_lines(stream)
+    if fmt == "csv":
+        reader = csv.DictReader(text)
+        if not reader.fieldnames:
+            return
+        for rec in reader:
+            yield reader.line_num, rec
+        return
+    for n, line in enumerate(text, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            rec = json.loads(line)
+        except ValueError:
+            yield n, ImportFormatError("Invalid JSON")
+            continue
+        yield n, rec if isinstance(rec, dict) else ImportFormatError("Expected a JSON object")
+
+
+def _text_lines(stream) -> Iterable[str]:
+    # utf-8-sig strips the BOM spreadsheet exports tend to add.
+    return codecs.iterdecode(_lines(stream), "utf-8-sig")
+
+
+def _lines(stream) -> Iterator[bytes]:
+    for line in stream:
+        yield line if isinstance(line, bytes) else line.encode("utf-8")
+
+
+def _clean(rec: Dict[str, Any]) -> Tuple[Optional[int], Dict[str, str]]:
+    values = {f: str(rec.get(f) if rec.get(f) is not None else "").strip() for f in FIELDS}
+    raw_id = rec.get("unique_id", rec.get("id"))
+    if raw_id in (None, ""):
+        return None, values
+    try:
+        return int(raw_id), values
+    except (TypeError, ValueError):
+        raise ValueError("unique_id must be an integer")
+
+
+# -------- Import --------
+
+def run_import(table_id: int, records: Iterable[Tuple[int, Any]], *, user, batch_size: Optional[int] = None,
+               dry_run: bool = False) -> ImportResult:
+    """Validate and upsert ``records`` into ``Table<table_id>`` in batches."""
+    if table_id not in TABLE_IDS:
+        raise ValueError("Invalid table id.")
+    Model = getattr(models, f"Table{table_id}")
+    size = batch_size or _batch_size()
+    result = ImportResult(table_id=table_id)
+    batch: List[Tuple[int, Optional[int], Dict[str, str]]] = []
+
+    try:
+        for line, rec in records:
+            result.total += 1
+            if isinstance(rec, Exception):
+                result.add_error(line, str(rec))
+                continue
+            try:
+                pk, values = _clean(rec)
+            except ValueError as e:
+                result.add_error(line, str(e))
+                continue
+            ok, err = admin_service.validate_payload(values["name"], values["city"], values["phone"])
+            if not ok:
+                result.add_error(line, err)
+                continue
+            batch.append((line, pk, values))
+            if len(batch) >= size:
+                _write_batch(Model, table_id, batch, result, user, dry_run)
+                batch = []
+    except (UnicodeDecodeError, csv.Error) as e:
+        # Earlier batches are committed already; keep what was read and report where it stopped.
+        result.error = f"Could not read file: {e}"
+    if batch:
+        _write_batch(Model, table_id, batch, result, user, dry_run)
+
+    if not dry_run and (result.created or result.updated):
+        try:
+            search_service.rebuild(Model)
+        except Exception:
+            logger.exception("Search index rebuild after import into Table%s failed", table_id)
+        if table_id in (3, 5):
+            try:
+                artist_link_service.relink()
+            except Exception:
+                logger.exception("Relinking artist services after import into Table%s failed", table_id)
+    _progress(table_id, result, user, done=True)
+    return result
+
+
+def _write_batch(Model, table_id: int, batch, result: ImportResult, user, dry_run: bool) -> None:
+    result.batches += 1
+    try:
+        with transaction.atomic():
+            ids = [pk for _, pk, _ in batch if pk is not None]
+            existing = Model.objects.in_bulk(ids) if ids else {}
+            now = timezone.now()
+            to_update: Dict[int, Any] = {}
+            to_create = []
+            for _, pk, values in batch:
+                obj = existing.get(pk) if pk is not None else None
+                if obj is None:
+                    to_create.append(Model(**values))
+                else:
+                    for f, v in values.items():
+                        setattr(obj, f, v)
+                    obj.updated_at = now  # bulk_update does not apply auto_now
+                    to_update[obj.pk] = obj  # a repeated id keeps its last values
+            if dry_run:
+                result.created += len(to_create)
+                result.updated += len(to_update)
+                transaction.set_rollback(True)
+                return
+            created = Model.objects.bulk_create(to_create)
+            if to_update:
+                Model.objects.bulk_update(list(to_update.values()), [*FIELDS, "updated_at"])
+            result.created += len(created)
+            result.updated += len(to_update)
+
+            first_line, last_line = batch[0][0], batch[-1][0]
+            audit_service.record(
+                table_name=_label(Model),
+                action="IMPORT",
+                row_id=0,
+                row_details={
+                    "batch": result.batches,
+                    "lines": [first_line, last_line],
+                    "created": len(created),
+                    "updated": len(to_update),
+                },
+                admin_user=user,
+            )
+            stats_service.adjust_on_commit(table_id, len(created))
+            event_service.publish_rows(
+                table_id, "IMPORT", [o.pk for o in created if o.pk is not None] + list(to_update),
+            )
+    except Exception as e:
+        logger.exception("Import batch %s into Table%s failed", result.batches, table_id)
+        for line, _, _ in batch:
+            result.add_error(line, f"Batch {result.batches} rolled back: {e}")
+        return
+    _progress(table_id, result, user)
+
+
+def _label(Model) -> str:
+    # Same label the CRUD views log under (dashboard_artist_service -> "Artist Service").
+    return re.sub(r"^dashboard_", "", Model._meta.db_table).replace("_", " ").title()
+
+
+def _progress(table_id: int, result: ImportResult, user, done: bool = False) -> None:
+    user_id = getattr(user, "pk", user)
+    if user_id is None:
+        return
+    data = {"done": done, **{k: v for k, v in result.as_dict().items() if k != "errors"}}
+    event_service.publish("import_progress", data, topic=f"admin:{user_id}")
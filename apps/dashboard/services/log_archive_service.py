@@ -0,0 +1,273 @@
+"""
+Retention and archival for the append-only logs (``ActivityLog``, ``ClientLog``).
+
+Rows older than the retention window (``ACTIVITYLOG_RETENTION_DAYS`` /
+``CLIENTLOG_RETENTION_DAYS``; 0 keeps everything) are moved, one calendar month
+(UTC) at a time, into gzip-compressed NDJSON files under
+``LOG_ARCHIVE_DIR/<kind>/<YYYY-MM>.ndjson.gz`` and then removed from the database.
+Archiving the same month again appends another gzip member to its file.
+
+On PostgreSQL the log tables are range-partitioned by month (migration 0015): a
+month that is archived completely is detached and dropped instead of deleted row
+by row, and ``ensure_partitions`` pre-creates upcoming months. Elsewhere the rows
+are deleted with one ``DELETE`` per month.
+
+``search_archives`` is the on-demand read path for archived months
+(``/dashboard/api/logs/archive/``). Run everything via ``manage.py archive_logs``.
+"""
+from __future__ import annotations
+import collections
+import datetime
+import gzip
+import itertools
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+
+from apps.dashboard import models
+from apps.dashboard.services import etag_service, stats_service
+
+logger = logging.getLogger(__name__)
+
+UTC = datetime.timezone.utc
+MAX_SEARCH_RESULTS = 500
+
+
+@dataclass(frozen=True)
+class LogKind:
+    model: Any
+    fields: Tuple[str, ...]
+    retention_setting: str
+    default_retention_days: int
+
+
+KINDS: Dict[str, LogKind] = {
+    "activity": LogKind(
+        models.ActivityLog,
+        ("id", "table_name", "action", "row_id", "row_details", "timestamp", "admin_user_id", "admin_user__username"),
+        "ACTIVITYLOG_RETENTION_DAYS",
+        180,
+    ),
+    "client": LogKind(
+        models.ClientLog,
+        ("log_id", "client_id", "action", "performed_by_id", "details", "timestamp"),
+        "CLIENTLOG_RETENTION_DAYS",
+        365,
+    ),
+}
+
+
+def _kind(kind: str) -> LogKind:
+    try:
+        return KINDS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown log kind: {kind}")
+
+
+def retention_days(kind: str) -> int:
+    spec = _kind(kind)
+    return max(0, int(getattr(settings, spec.retention_setting, spec.default_retention_days)))
+
+
+def cutoff(kind: str, *, days: Optional[int] = None, now: Optional[datetime.datetime] = None):
+    """Oldest timestamp kept for ``kind``, or ``None`` when retention is disabled."""
+    days = retention_days(kind) if days is None else days
+    if days <= 0:
+        return None
+    return (now or datetime.datetime.now(UTC)) - datetime.timedelta(days=days)
+
+
+def archive_dir() -> Path:
+    return Path(getattr(settings, "LOG_ARCHIVE_DIR", Path(settings.BASE_DIR) / "archive"))
+
+
+def archive_path(kind: str, month: datetime.datetime) -> Path:
+    return archive_dir() / kind / f"{month:%Y-%m}.ndjson.gz"
+
+
+def _month_start(ts: datetime.datetime) -> datetime.datetime:
+    ts = ts.astimezone(UTC)
+    return datetime.datetime(ts.year, ts.month, 1, tzinfo=UTC)
+
+
+def _next_month(month: datetime.datetime) -> datetime.datetime:
+    return month.replace(year=month.year + (month.month == 12), month=month.month % 12 + 1)
+
+
+def _partition_name(table: str, month: datetime.datetime) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+# -------- Archive --------
+
+def archive(kind: str, *, before: Optional[datetime.datetime] = None, dry_run: bool = False) -> Dict[str, Any]:
+    """Move rows older than ``before`` (default: the retention cutoff) into monthly archive files."""
+    spec = _kind(kind)
+    before = before or cutoff(kind)
+    summary: Dict[str, Any] = {"kind": kind, "before": before.isoformat() if before else None, "rows": 0, "months": []}
+    if before is None:
+        return summary
+    old = spec.model.objects.filter(timestamp__lt=before)
+    first = old.order_by("timestamp").values_list("timestamp", flat=True).first()
+    if first is None:
+        return summary
+
+    month = _month_start(first)
+    while month < before:
+        end = _next_month(month)
+        rows = old.filter(timestamp__gte=month, timestamp__lt=min(end, before))
+        if dry_run:
+            n = rows.count()
+        else:
+            n = _archive_month(kind, spec, rows, month, whole=end <= before)
+        if n:
+            summary["rows"] += n
+            summary["months"].append({"month": f"{month:%Y-%m}", "rows": n})
+        month = end
+    if summary["rows"] and not dry_run and spec.model is models.ActivityLog:
+        stats_service.adjust(stats_service.LOGS_KEY, -summary["rows"])
+        etag_service.bump(etag_service.LOGS)
+    return summary
+
+
+def _archive_month(kind: str, spec: LogKind, rows, month: datetime.datetime, *, whole: bool) -> int:
+    records = rows.order_by("timestamp").values(*spec.fields).iterator(chunk_size=2000)
+    first = next(records, None)
+    if first is None:
+        return 0
+    path = archive_path(kind, month)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    # Appending a new gzip member keeps earlier runs for the same month readable.
+    with gzip.open(path, "at", encoding="utf-8") as fh:
+        for row in itertools.chain([first], records):
+            fh.write(json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(",", ":")))
+            fh.write("\n")
+            written += 1
+    table = spec.model._meta.db_table
+    with transaction.atomic():
+        if whole:
+            _drop_partition(table, month)
+        # Without partitions (or for rows that fell into DEFAULT) this is one DELETE:
+        # the log models have no receivers or dependents to collect.
+        rows.delete()
+    return written
+
+
+# -------- Partitions (PostgreSQL) --------
+
+def _is_partitioned(cur, table: str) -> bool:
+    cur.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass", [table])
+    return cur.fetchone() is not None
+
+
+def _drop_partition(table: str, month: datetime.datetime) -> bool:
+    if connection.vendor != "postgresql":
+        return False
+    name = _partition_name(table, month)
+    qn = connection.ops.quote_name
+    with connection.cursor() as cur:
+        cur.execute("SELECT to_regclass(%s)", [name])
+        if cur.fetchone()[0] is None:
+            return False
+        cur.execute(f"ALTER TABLE {qn(table)} DETACH PARTITION {qn(name)}")
+        cur.execute(f"DROP TABLE {qn(name)}")
+    return True
+
+
+def ensure_partitions(months_ahead: int = 3, now: Optional[datetime.datetime] = None) -> List[str]:
+    """Create the monthly partitions from this month to ``months_ahead`` ahead. PostgreSQL only."""
+    if connection.vendor != "postgresql":
+        return []
+    created: List[str] = []
+    qn = connection.ops.quote_name
+    for spec in KINDS.values():
+        table = spec.model._meta.db_table
+        month = _month_start(now or datetime.datetime.now(UTC))
+        with connection.cursor() as cur:
+            if not _is_partitioned(cur, table):
+                continue
+            for _ in range(months_ahead + 1):
+                end = _next_month(month)
+                name = _partition_name(table, month)
+                cur.execute("SELECT to_regclass(%s)", [name])
+                if cur.fetchone()[0] is None:
+                    try:
+                        with transaction.atomic():
+                            cur.execute(
+                                f"CREATE TABLE {qn(name)} PARTITION OF {qn(table)} FOR VALUES FROM (%s) TO (%s)",
+                                [month, end],
+                            )
+                        created.append(name)
+                    except Exception:
+                        # Rows for this month already landed in the DEFAULT partition.
+                        logger.exception("Could not create log partition %s", name)
+                month = end
+    return created
+
+
+# -------- Read path --------
+
+def archived_months(kind: str) -> List[str]:
+    _kind(kind)
+    folder = archive_dir() / kind
+    if not folder.is_dir():
+        return []
+    return sorted(p.name[:7] for p in folder.glob("*.ndjson.gz"))
+
+
+def search_archives(
+    kind: str,
+    *,
+    q: str = "",
+    table_name: str = "",
+    action: str = "",
+    date_from: Optional[datetime.date] = None,
+    date_to: Optional[datetime.date] = None,
+    limit: int = 100,
+) -> List[Dict[str, Any]]:
+    """Newest-first archived rows matching the filters; ``q`` is a case-insensitive substring
+    of the whole record. Reads only the months overlapping ``date_from``..``date_to``."""
+    limit = max(1, min(int(limit), MAX_SEARCH_RESULTS))
+    needle = q.strip().lower()
+    results: List[Dict[str, Any]] = []
+    for label in reversed(archived_months(kind)):
+        if date_from and label < f"{date_from:%Y-%m}":
+            break
+        if date_to and label > f"{date_to:%Y-%m}":
+            continue
+        # Files are oldest-first; keep the newest matches of this month.
+        newest = collections.deque(maxlen=limit - len(results))
+        for record in _read(archive_dir() / kind / f"{label}.ndjson.gz", needle):
+            if table_name and record.get("table_name") != table_name:
+                continue
+            if action and record.get("action") != action:
+                continue
+            day = str(record.get("timestamp", ""))[:10]
+            if (date_from and day < date_from.isoformat()) or (date_to and day > date_to.isoformat()):
+                continue
+            newest.append(record)
+        results.extend(reversed(newest))
+        if len(results) >= limit:
+            break
+    return results
+
+
+def _read(path: Path, needle: str) -> Iterator[Dict[str, Any]]:
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            for line in fh:
+                if needle and needle not in line.lower():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+    except (OSError, EOFError):
+        logger.exception("Unreadable log archive %s", path)
@@ -0,0 +1,221 @@
+"""
+Bulk moderation of artist applications (Table6).
+
+``bulk_moderate(action, ids, user)`` applies ``approve``, ``reject`` or
+``allow_reapply`` to many applications in one transaction:
+
+- the targeted rows are locked with a single ``SELECT ... FOR UPDATE``;
+- status changes are one ``UPDATE`` per action; approvals copy into Verified Artist
+  (Table3) with one ``bulk_create`` for names not already present, and services
+  of those names are linked to the new artists with one ``UPDATE``;
+- audit rows are queued with ``audit_service.record_many`` (one ``bulk_create``);
+- dashboards get one coalesced ``notify`` broadcast plus one ``row`` event per
+  table touched, instead of one message per application.
+
+Every requested id gets an outcome: ``approved``/``rejected``/``reapply_allowed``
+when changed, ``unchanged`` when already in the target state, ``not_rejected``
+(allow_reapply on a non-rejected row) or ``not_found``.
+
+``bulk_create`` and ``update()`` bypass the model receivers, so the overview
+counts, the search index, the artist/service links and push events are
+maintained here explicitly.
+The single-row views keep their own code path.
+"""
+from __future__ import annotations
+import logging
+from collections import Counter
+from typing import Any, Dict, Iterable, List
+
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from apps.dashboard import models
+from apps.dashboard.services import (
+    artist_link_service, audit_service, broadcast_service, etag_service, event_service, search_service,
+    stats_service,
+)
+
+logger = logging.getLogger(__name__)
+
+ACTIONS = ("approve", "reject", "allow_reapply")
+MAX_BULK = 500
+APP_TABLE = "Artist Application"
+CLIENT_TABLE = "Client"
+_LOCK_FIELDS = ("unique_id", "name", "city", "phone", "email", "application_status", "approved")
+
+
+def filtered_ids(*, status: str = "", city: str = "", q: str = "", limit: int = MAX_BULK) -> List[int]:
+    """Ids matching the artist applications page filters (status/city/q), newest first."""
+    qs: QuerySet = models.Table6.objects.all()
+    if status:
+        qs = qs.filter(application_status=status)
+    if city:
+        qs = qs.filter(search_service.search_q(models.Table6, city, ("city",)))
+    if q:
+        qs = qs.filter(search_service.search_q(models.Table6, q, ("name", "email", "phone")))
+    return list(qs.order_by("-created_at", "-unique_id").values_list("unique_id", flat=True)[:limit])
+
+
+@transaction.atomic
+def bulk_moderate(action: str, ids: Iterable[Any], user) -> Dict[str, Any]:
+    """Apply ``action`` to the applications in ``ids``; returns per-row outcomes and a summary."""
+    if action not in ACTIONS:
+        raise ValueError(f"Unknown action: {action}")
+    ids = list(ids)
+    if len(ids) > MAX_BULK:
+        raise ValueError(f"At most {MAX_BULK} applications per request")
+    wanted: List[int] = []
+    seen = set()
+    for raw in ids:
+        try:
+            pk = int(raw)
+        except (TypeError, ValueError):
+            continue
+        if pk not in seen:
+            seen.add(pk)
+            wanted.append(pk)
+
+    apps = {
+        a.pk: a
+        for a in models.Table6.objects.select_for_update().filter(pk__in=wanted).only(*_LOCK_FIELDS)
+    }
+    outcomes: Dict[int, str] = {pk: "not_found" for pk in wanted if pk not in apps}
+
+    if action == "approve":
+        _approve(apps, outcomes, user)
+    elif action == "reject":
+        _reject(apps, outcomes, user)
+    else:
+        _allow_reapply(apps, outcomes, user)
+
+    results = [{"id": pk, "outcome": outcomes[pk]} for pk in wanted]
+    return {"action": action, "results": results, "summary": dict(Counter(outcomes.values()))}
+
+
+def _approve(apps: Dict[int, models.Table6], outcomes: Dict[int, str], user) -> None:
+    changed = [a for a in apps.values() if a.application_status != "approved" or not a.approved]
+    for a in apps.values():
+        outcomes[a.pk] = "unchanged"
+    if not changed:
+        return
+    now = timezone.now()
+    models.Table6.objects.filter(pk__in=[a.pk for a in changed]).update(
+        approved=True, application_status="approved", approval_admin=user, approved_at=now, updated_at=now,
+    )
+    for a in changed:
+        outcomes[a.pk] = "approved"
+
+    # Copy into Verified Artist (Table3) once per name, like the single-row view.
+    # Table3.name is not unique, so existing names are filtered here rather than
+    # relying on ignore_conflicts.
+    seen = set(models.Table3.objects.filter(name__in={a.name for a in changed}).values_list("name", flat=True))
+    new_rows = []
+    for a in changed:
+        if a.name not in seen:
+            seen.add(a.name)
+            new_rows.append(models.Table3(name=a.name, city=a.city, phone=a.phone))
+    created = models.Table3.objects.bulk_create(new_rows) if new_rows else []
+    _index(created)
+    if created:
+        artist_link_service.relink(Q(name__in=[r.name for r in created]))
+        stats_service.adjust_on_commit(3, len(created))
+        event_service.publish_rows(3, "CREATE", [r.pk for r in created if r.pk is not None])
+
+    audit_service.record_many([{
+        "table_name": APP_TABLE,
+        "action": "UPDATE",
+        "row_id": a.pk,
+        "row_details": {"status": "approved", "approved": True, "name": a.name, "city": a.city, "phone": a.phone},
+    } for a in changed], admin_user=user)
+    _announce("BULK_APPROVE", changed, user)
+
+
+def _reject(apps: Dict[int, models.Table6], outcomes: Dict[int, str], user) -> None:
+    changed = [a for a in apps.values() if a.application_status != "rejected"]
+    for a in apps.values():
+        outcomes[a.pk] = "unchanged"
+    if not changed:
+        return
+    models.Table6.objects.filter(pk__in=[a.pk for a in changed]).update(
+        approved=False, application_status="rejected", approval_admin=user, updated_at=timezone.now(),
+    )
+    for a in changed:
+        outcomes[a.pk] = "rejected"
+    audit_service.record_many([{
+        "table_name": APP_TABLE,
+        "action": "UPDATE",
+        "row_id": a.pk,
+        "row_details": {"status": "rejected", "approved": False, "name": a.name},
+    } for a in changed], admin_user=user)
+    _announce("BULK_REJECT", changed, user)
+
+
+def _allow_reapply(apps: Dict[int, models.Table6], outcomes: Dict[int, str], user) -> None:
+    rejected = []
+    for a in apps.values():
+        if str(a.application_status).lower() == "rejected":
+            rejected.append(a)
+            outcomes[a.pk] = "unchanged"
+        else:
+            outcomes[a.pk] = "not_rejected"
+    phones = {a.phone for a in rejected if a.phone}
+    emails = {a.email for a in rejected if a.email}
+    if not phones and not emails:
+        return
+    cond = Q(phone__in=phones) | Q(email__in=emails)
+    clients = list(
+        models.Client.objects.select_for_update().filter(cond, allow_reapply=False)
+        .only("client_id", "full_name", "phone", "email")
+    )
+    if not clients:
+        return
+    models.Client.objects.filter(pk__in=[c.pk for c in clients]).update(allow_reapply=True, updated_at=timezone.now())
+    etag_service.bump_on_commit(etag_service.CLIENTS)
+    by_phone = {c.phone for c in clients}
+    by_email = {c.email for c in clients if c.email}
+    for a in rejected:
+        if (a.phone and a.phone in by_phone) or (a.email and a.email in by_email):
+            outcomes[a.pk] = "reapply_allowed"
+
+    audit_service.record_many([{
+        "table_name": CLIENT_TABLE,
+        "action": "UPDATE",
+        "row_id": c.pk,
+        "row_details": {"allow_reapply": True, "full_name": c.full_name, "phone": c.phone},
+    } for c in clients], admin_user=user)
+    now = timezone.now().isoformat()
+    for c in clients:
+        # Each client only listens on its own group; the sender coalesces these per group.
+        broadcast_service.send(
+            event_service.group_for(f"client:{c.client_id}"),
+            {"type": "notify", "payload": {
+                "event": "reapply_toggle", "client_id": str(c.client_id), "allow": True, "timestamp": now,
+            }},
+        )
+
+
+def _announce(action: str, changed: List[models.Table6], user) -> None:
+    ids = [a.pk for a in changed]
+    event_service.publish_rows(6, "UPDATE", ids)
+    broadcast_service.send(
+        "notifications",
+        {"type": "notify", "payload": {
+            "table_name": APP_TABLE,
+            "action": action,
+            "row_ids": ids,
+            "count": len(ids),
+            "admin_user": getattr(user, "username", None),
+            "timestamp": timezone.now().isoformat(),
+        }},
+    )
+
+
+def _index(rows: List[models.Table3]) -> None:
+    if not rows or search_service.backend() != "fts5":
+        return
+    for r in rows:
+        try:
+            search_service.index_instance(r)
+        except Exception:
+            logger.exception("Failed to index Verified Artist %s for search", r.pk)
@@ -0,0 +1,203 @@
+"""
+Keyset (cursor) pagination for the dashboard list APIs.
+
+Opt-in alternative to ``Paginator``: a page is selected with a range predicate on
+``(order_field, pk)`` instead of OFFSET, and no ``COUNT(*)`` is run unless asked
+for. Cost per page stays flat however deep the caller scrolls, provided the pair is
+indexed (see the ``keyset pagination order`` indexes in ``models.py``).
+
+Rows are always returned newest first. Cursors are opaque URL-safe tokens wrapping
+the boundary row's ``(order value, pk)`` and a direction; clients pass them back
+verbatim as ``?cursor=``. An empty ``cursor=`` selects the first page.
+
+Totals: ``count=exact`` runs ``COUNT(*)``; ``count=estimate`` returns the cached
+overview count (``stats_service``) when the query is unfiltered and omits it
+otherwise; no ``count`` omits the total.
+
+``aoffset_page`` / ``akeyset_page`` serve the ``async def`` list views: the offset
+page is fetched with the async ORM (``acount`` plus one async slice), while the
+keyset page runs the sync implementation in one ``sync_to_async`` call.
+"""
+from __future__ import annotations
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.core.paginator import Paginator
+from django.db.models import Q, QuerySet
+from django.http import HttpRequest
+from django.utils.dateparse import parse_datetime
+
+from apps.dashboard.services import stats_service
+
+NEXT = "n"
+PREV = "p"
+MAX_PER_PAGE = 200
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+@dataclass
+class KeysetPage:
+    object_list: List[Any]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    total: Optional[int] = None
+    total_estimated: bool = False
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_cursor is not None
+
+    def envelope(self, results: list) -> dict:
+        """JSON body shared by every cursor-mode endpoint."""
+        out = {
+            "success": True,
+            "results": results,
+            "next_cursor": self.next_cursor,
+            "prev_cursor": self.prev_cursor,
+            "has_next": self.has_next,
+            "has_prev": self.has_prev,
+        }
+        if self.total is not None:
+            out["total"] = self.total
+            out["total_estimated"] = self.total_estimated
+        return out
+
+
+# -------- Cursor tokens --------
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (int, str)) or value is None:
+        return value
+    return str(value)  # UUID and friends
+
+
+def encode_cursor(order_value: Any, pk: Any, direction: str) -> str:
+    raw = json.dumps([_dump(order_value), _dump(pk), direction], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str):
+    """Return ``(order_value, pk, direction)``; raises ``InvalidCursor`` on tampering."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        order_value, pk, direction = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+    except Exception:
+        raise InvalidCursor("Invalid cursor.")
+    if direction not in (NEXT, PREV):
+        raise InvalidCursor("Invalid cursor.")
+    if isinstance(order_value, str):
+        parsed = parse_datetime(order_value)
+        if parsed is not None:
+            order_value = parsed
+    return order_value, pk, direction
+
+
+# -------- Paging --------
+
+def is_cursor_request(request: HttpRequest) -> bool:
+    return "cursor" in request.GET
+
+
+def keyset_page(
+    qs: QuerySet,
+    *,
+    order_field: str,
+    cursor: Optional[str],
+    per_page: int,
+    count: Optional[str] = None,
+    stats_key: Any = None,
+    filtered: bool = False,
+) -> KeysetPage:
+    """Fetch one page of ``qs`` ordered by ``(-order_field, -pk)``.
+
+    ``stats_key`` names the ``stats_service`` counter backing ``count=estimate``;
+    ``filtered`` tells it the queryset is narrower than the whole table.
+    """
+    per_page = max(1, min(int(per_page), MAX_PER_PAGE))
+    pk_name = qs.model._meta.pk.name
+    base = qs
+
+    direction = NEXT
+    if cursor:
+        value, pk, direction = decode_cursor(cursor)
+        if direction == NEXT:
+            qs = qs.filter(Q(**{f"{order_field}__lt": value}) | Q(**{order_field: value, f"{pk_name}__lt": pk}))
+        else:
+            qs = qs.filter(Q(**{f"{order_field}__gt": value}) | Q(**{order_field: value, f"{pk_name}__gt": pk}))
+
+    if direction == NEXT:
+        rows = list(qs.order_by(f"-{order_field}", f"-{pk_name}")[: per_page + 1])
+        more = len(rows) > per_page
+        rows = rows[:per_page]
+        has_next, has_prev = more, bool(cursor)
+    else:
+        rows = list(qs.order_by(order_field, pk_name)[: per_page + 1])
+        more = len(rows) > per_page
+        rows = list(reversed(rows[:per_page]))
+        has_next, has_prev = True, more
+
+    page = KeysetPage(object_list=rows)
+    if rows:
+        first, last = rows[0], rows[-1]
+        if has_next:
+            page.next_cursor = encode_cursor(getattr(last, order_field), last.pk, NEXT)
+        if has_prev:
+            page.prev_cursor = encode_cursor(getattr(first, order_field), first.pk, PREV)
+
+    if count == "exact":
+        page.total = base.count()
+    elif count == "estimate" and stats_key is not None and not filtered:
+        try:
+            page.total = stats_service.get_counts().get(stats_key)
+            page.total_estimated = page.total is not None
+        except Exception:
+            page.total = None
+    return page
+
+
+# -------- Async --------
+
+@dataclass
+class OffsetPage:
+    object_list: List[Any]
+    number: int
+    num_pages: int
+    total: int
+
+    def envelope(self, results: list) -> dict:
+        """Same body as the ``Paginator`` branch of the list endpoints."""
+        return {
+            "success": True,
+            "results": results,
+            "page": self.number,
+            "num_pages": self.num_pages,
+            "total": self.total,
+        }
+
+
+async def aoffset_page(qs: QuerySet, per_page: int, page: Any) -> OffsetPage:
+    """``Paginator(qs, per_page).get_page(page)`` on the async ORM."""
+    total = await qs.acount()
+    # Paginator over a range applies the usual page-number rules (invalid -> 1, past the end -> last).
+    paginator = Paginator(range(total), per_page)
+    number = paginator.get_page(page).number
+    start = (number - 1) * paginator.per_page
+    rows = [obj async for obj in qs[start:start + paginator.per_page]]
+    return OffsetPage(object_list=rows, number=number, num_pages=paginator.num_pages, total=total)
+
+
+async def akeyset_page(qs: QuerySet, **kwargs) -> KeysetPage:
+    return await sync_to_async(keyset_page)(qs, **kwargs)
@@ -0,0 +1,195 @@
+"""
+Password hashing off the request thread, with a bounded queue.
+
+``make`` and ``check`` are drop-in replacements for Django's ``make_password`` and
+``check_password`` for the client and admin (``Table1``) password columns. The
+hashing itself (PBKDF2 by default: hundreds of milliseconds of CPU) runs in a
+small process pool, so a login storm (e.g. everybody signing in again after a
+deploy logged them out) is capped at ``PASSWORD_HASH_WORKERS`` cores instead of
+occupying every request worker:
+
+- ``PASSWORD_HASH_WORKERS``      pool processes; 0 hashes inline in the caller
+- ``PASSWORD_HASH_MAX_PENDING``  hashes running or queued at once (per process);
+  beyond that ``PasswordHashingBusy`` is raised immediately so the view can answer
+  503 instead of queueing the request behind the storm
+- ``PASSWORD_HASH_TIMEOUT``      seconds to wait for a queued hash before giving up
+  (also ``PasswordHashingBusy``)
+
+Only the hasher, password and salt cross the process boundary; settings are
+resolved in the caller. ``check`` upgrades hashes made with an older hasher or
+work factor: after a successful check it re-hashes with the preferred hasher and
+hands the new value to ``on_upgrade``. An upgrade that fails (busy, timeout) is
+skipped; the next login tries again.
+"""
+from __future__ import annotations
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, identify_hasher, is_password_usable, make_password
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHashingBusy(RuntimeError):
+    """Too many hashes in flight (or the queue wait timed out); retry later (HTTP 503)."""
+
+
+def _workers() -> int:
+    return max(0, int(getattr(settings, "PASSWORD_HASH_WORKERS", 0) or 0))
+
+
+def _max_pending() -> int:
+    default = max(1, _workers()) * 8
+    return max(1, int(getattr(settings, "PASSWORD_HASH_MAX_PENDING", default) or default))
+
+
+def _timeout() -> float:
+    return float(getattr(settings, "PASSWORD_HASH_TIMEOUT", 10) or 10)
+
+
+# -------- Pool --------
+
+_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_size = 0
+_in_flight = 0
+
+
+def _context():
+    # Never fork the (threaded) server process itself.
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _executor(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_size
+    with _lock:
+        if _pool is None or _pool_size != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=_context())
+            _pool_size = workers
+        return _pool
+
+
+def _discard(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown() -> None:
+    """Stop the pool (tests, benchmarks). The next hash starts a new one."""
+    global _pool
+    with _lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def in_flight() -> int:
+    return _in_flight
+
+
+def _encode(hasher, password: str, salt: str) -> str:
+    return hasher.encode(password, salt)
+
+
+def _verify(hasher, password: str, encoded: str) -> bool:
+    return hasher.verify(password, encoded)
+
+
+def _harden(hasher, password: str, encoded: str) -> bool:
+    hasher.harden_runtime(password, encoded)
+    return False
+
+
+def _release(_future=None) -> None:
+    global _in_flight
+    with _lock:
+        _in_flight -= 1
+
+
+def _run(fn, *args):
+    """Run ``fn(*args)`` in the pool (or inline), within the in-flight limit.
+
+    A pooled hash holds its slot until the worker finishes it, not until the caller
+    stops waiting: a hash that timed out is still using a pool process.
+    """
+    global _in_flight
+    with _lock:
+        if _in_flight >= _max_pending():
+            raise PasswordHashingBusy("password hashing queue is full")
+        _in_flight += 1
+    owned = True  # False once the future's done callback owns the slot
+    try:
+        workers = _workers()
+        if not workers:
+            return fn(*args)
+        pool = _executor(workers)
+        try:
+            future = pool.submit(fn, *args)
+            future.add_done_callback(_release)
+            owned = False
+            return future.result(timeout=_timeout())
+        except FutureTimeout:
+            future.cancel()
+            raise PasswordHashingBusy("password hashing timed out in the queue")
+        except BrokenProcessPool:
+            # A worker died (OOM kill, ...): start over next time, hash this one here.
+            logger.exception("Password hashing pool broke; hashing inline")
+            _discard(pool)
+            if not owned:
+                with _lock:
+                    _in_flight += 1
+                owned = True
+            return fn(*args)
+    finally:
+        if owned:
+            _release()
+
+
+# -------- API --------
+
+def make(password: Optional[str]) -> str:
+    """``make_password(password)`` computed in the pool."""
+    if password is None:
+        return make_password(None)  # unusable marker, no hashing
+    hasher = get_hasher("default")
+    return _run(_encode, hasher, password, hasher.salt())
+
+
+def check(password: Optional[str], encoded: Optional[str], on_upgrade: Optional[Callable[[str], None]] = None) -> bool:
+    """``check_password(password, encoded)`` computed in the pool.
+
+    When the password is correct but ``encoded`` uses another hasher or an older
+    work factor, ``on_upgrade`` is called with the re-hashed value to store.
+    """
+    if password is None or not is_password_usable(encoded):
+        return False
+    preferred = get_hasher("default")
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False
+    hasher_changed = hasher.algorithm != preferred.algorithm
+    must_update = hasher_changed or preferred.must_update(encoded)
+    is_correct = _run(_verify, hasher, password, encoded)
+    if not is_correct and not hasher_changed and must_update:
+        # Same timing gap closing as django.contrib.auth.hashers.check_password.
+        _run(_harden, hasher, password, encoded)
+    if is_correct and must_update and on_upgrade is not None:
+        try:
+            on_upgrade(make(password))
+        except PasswordHashingBusy:
+            pass
+        except Exception:
+            logger.exception("Password hash upgrade failed")
+    return is_correct
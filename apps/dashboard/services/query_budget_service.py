@@ -0,0 +1,268 @@
+"""
+Per-request query accounting, N+1 detection and query budgets.
+
+``track()`` (used by ``QueryBudgetMiddleware`` and ``monitoring.performance_monitor``)
+collects a ``QueryStats`` for the code it wraps. Statements reach it through one
+``execute_wrapper`` installed on every database connection as it is created, so it
+works with ``DEBUG=False``, unlike ``connection.queries``. The active stats live in
+a context variable, which follows async views into the ``sync_to_async`` threads
+that run their queries. ``QueryStats`` counts statements and DB time and groups
+the SQL by shape: whitespace collapsed, literals and ``IN (...)`` lists folded, so a
+per-row lookup loop shows up as one shape repeated N times.
+
+After each request ``finish`` compares the count with the view's budget
+(``QUERY_BUDGETS`` by URL name, else ``QUERY_BUDGET_DEFAULT``; 0 = none) and the most
+repeated shape with ``QUERY_REPEAT_THRESHOLD``. Breaches are logged as one JSON line
+on the ``performance.queries`` logger, and the middleware reports them in the
+``X-Query-Budget`` response header.
+
+Per-view counters are aggregated in process and flushed to the shared cache at most
+every ``QUERY_METRICS_FLUSH_INTERVAL`` seconds (a handful of ``incr`` calls), so all
+workers report through ``render_metrics()`` (``/metrics``, Prometheus text format).
+The set of views is a registry of numbered slots: the first worker to ``add`` a
+view's marker key takes the next slot from an ``incr`` counter, so concurrent
+flushes never overwrite each other's views.
+"""
+from __future__ import annotations
+import collections
+import contextlib
+import contextvars
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger("performance.queries")
+
+CACHE_PREFIX = "qmetrics:"
+VIEW_MARKER_PREFIX = f"{CACHE_PREFIX}view:"  # + view name: the view has a slot
+VIEW_SLOT_PREFIX = f"{CACHE_PREFIX}views:"  # + slot number -> view name
+VIEW_SLOTS_KEY = f"{CACHE_PREFIX}views:count"
+COUNTERS = (
+    # name, help
+    ("requests", "Requests handled."),
+    ("queries", "SQL statements executed."),
+    ("db_microseconds", "Time spent in SQL statements, in microseconds."),
+    ("budget_exceeded", "Requests over their query budget."),
+    ("repeated_queries", "Requests that repeated one SQL shape at least QUERY_REPEAT_THRESHOLD times."),
+)
+
+_WS = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\(\s*(?:%s|\?|[-\d.]+|'[^']*')(?:\s*,\s*(?:%s|\?|[-\d.]+|'[^']*'))*\s*\)")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w\"])-?\d+(?:\.\d+)?\b")
+
+
+def shape(sql: str) -> str:
+    """The statement with literals and value lists folded, for grouping repeats."""
+    s = _WS.sub(" ", sql or "").strip()
+    s = _STRING.sub("?", s)
+    s = _NUMBER.sub("?", s)
+    return _IN_LIST.sub("(...)", s)
+
+
+class QueryStats:
+    """Statements recorded while a ``track()`` block was active."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: collections.Counter = collections.Counter()
+
+    def record(self, sql: str, duration: float) -> None:
+        self.duration += duration
+        self.count += 1
+        self.shapes[shape(sql)] += 1
+
+    def most_repeated(self) -> Tuple[Optional[str], int]:
+        if not self.shapes:
+            return None, 0
+        return self.shapes.most_common(1)[0]
+
+
+_active: contextvars.ContextVar = contextvars.ContextVar("query_budget_stats", default=())
+
+
+@contextlib.contextmanager
+def track():
+    """Collect the statements run inside the block (nested blocks each see them)."""
+    stats = QueryStats()
+    token = _active.set(_active.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+def _execute(execute, sql, params, many, context):
+    active = _active.get()
+    if not active:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - start
+        for stats in active:
+            stats.record(sql, elapsed)
+
+
+def install(connection=None, **_kwargs) -> None:
+    """Add the statement hook to ``connection`` (``connection_created`` receiver)."""
+    if connection is not None and _execute not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_execute)
+
+
+connection_created.connect(install, dispatch_uid="query_budget_service_install")
+for _conn in connections.all(initialized_only=True):
+    install(_conn)
+
+
+def budget_for(view_name: str) -> int:
+    budgets = getattr(settings, "QUERY_BUDGETS", {}) or {}
+    if view_name in budgets:
+        return int(budgets[view_name])
+    return int(getattr(settings, "QUERY_BUDGET_DEFAULT", 0) or 0)
+
+
+def repeat_threshold() -> int:
+    return int(getattr(settings, "QUERY_REPEAT_THRESHOLD", 0) or 0)
+
+
+def finish(request, stats: QueryStats, status: int = 200) -> Dict[str, Any]:
+    """Evaluate ``stats`` for the finished ``request``, log breaches and count metrics.
+
+    Returns ``{"view", "queries", "db_ms", "budget", "exceeded", "repeated", "repeated_sql"}``.
+    """
+    match = getattr(request, "resolver_match", None)
+    view = (getattr(match, "view_name", None) or "unresolved") if match is not None else "unresolved"
+    budget = budget_for(view)
+    threshold = repeat_threshold()
+    repeated_sql, repeated = stats.most_repeated()
+    result = {
+        "view": view,
+        "queries": stats.count,
+        "db_ms": round(stats.duration * 1000, 2),
+        "budget": budget,
+        "exceeded": bool(budget) and stats.count > budget,
+        "repeated": repeated if threshold and repeated >= threshold else 0,
+        "repeated_sql": repeated_sql if threshold and repeated >= threshold else None,
+    }
+    if result["exceeded"] or result["repeated"]:
+        try:
+            logger.warning(json.dumps({
+                "event": "query_budget",
+                "method": request.method,
+                "path": request.path,
+                "status": status,
+                **result,
+            }))
+        except Exception:
+            pass
+    _count(view, result, stats)
+    return result
+
+
+def header_value(result: Dict[str, Any]) -> str:
+    parts = ["exceeded" if result["exceeded"] else "ok", f"queries={result['queries']}"]
+    if result["budget"]:
+        parts.append(f"budget={result['budget']}")
+    if result["repeated"]:
+        parts.append(f"repeated={result['repeated']}")
+    return "; ".join(parts)
+
+
+# -------- Metrics --------
+
+_lock = threading.Lock()
+_pending: Dict[Tuple[str, str], int] = collections.defaultdict(int)
+_known_views: set = set()
+_last_flush = time.monotonic()
+
+
+def _count(view: str, result: Dict[str, Any], stats: QueryStats) -> None:
+    global _last_flush
+    with _lock:
+        _pending[("requests", view)] += 1
+        _pending[("queries", view)] += stats.count
+        _pending[("db_microseconds", view)] += int(stats.duration * 1_000_000)
+        if result["exceeded"]:
+            _pending[("budget_exceeded", view)] += 1
+        if result["repeated"]:
+            _pending[("repeated_queries", view)] += 1
+        interval = float(getattr(settings, "QUERY_METRICS_FLUSH_INTERVAL", 10) or 0)
+        if time.monotonic() - _last_flush < interval:
+            return
+        _last_flush = time.monotonic()
+        batch = dict(_pending)
+        _pending.clear()
+    flush(batch)
+
+
+def flush(batch: Optional[Dict[Tuple[str, str], int]] = None) -> None:
+    """Add the pending (or given) counters to the shared cache. Never raises."""
+    if batch is None:
+        with _lock:
+            batch = dict(_pending)
+            _pending.clear()
+    if not batch:
+        return
+    try:
+        for view in {view for _, view in batch} - _known_views:
+            _register(view)
+            _known_views.add(view)
+        for (name, view), value in batch.items():
+            if value:
+                _add(f"{CACHE_PREFIX}{name}:{view}", value)
+    except Exception:
+        logger.exception("Failed to flush query metrics")
+
+
+def _add(key: str, value: int) -> int:
+    try:
+        return int(cache.incr(key, value))
+    except ValueError:
+        if cache.add(key, value, timeout=None):
+            return value
+        return int(cache.incr(key, value))
+
+
+def _register(view: str) -> None:
+    """Give ``view`` a slot in the shared registry unless some worker already did."""
+    if cache.add(f"{VIEW_MARKER_PREFIX}{view}", 1, timeout=None):
+        cache.set(f"{VIEW_SLOT_PREFIX}{_add(VIEW_SLOTS_KEY, 1)}", view, timeout=None)
+
+
+def snapshot() -> Dict[str, Dict[str, int]]:
+    """``{counter: {view: value}}`` from the shared cache."""
+    slots = int(cache.get(VIEW_SLOTS_KEY) or 0)
+    found_views = cache.get_many([f"{VIEW_SLOT_PREFIX}{n}" for n in range(1, slots + 1)]) if slots else {}
+    views: List[str] = sorted(set(found_views.values()))
+    keys = [f"{CACHE_PREFIX}{name}:{view}" for name, _ in COUNTERS for view in views]
+    found = cache.get_many(keys) if keys else {}
+    return {
+        name: {view: int(found.get(f"{CACHE_PREFIX}{name}:{view}") or 0) for view in views}
+        for name, _ in COUNTERS
+    }
+
+
+def render_metrics() -> str:
+    """Prometheus text exposition of ``snapshot()`` after flushing this process."""
+    flush()
+    lines: List[str] = []
+    data = snapshot()
+    for name, help_text in COUNTERS:
+        metric = f"flodo_{name}_total"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} counter")
+        for view, value in sorted(data[name].items()):
+            label = view.replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'{metric}{{view="{label}"}} {value}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,261 @@
+"""
+Request rate limiting on the shared cache, with atomic counters.
+
+``limit(rate)`` decorates a view (``"5/m"``, ``"10/h"``, ``"60/30s"``; per client IP
+by default). The decorator only records the rule on the view; ``RateLimitMiddleware``
+(near the top of ``MIDDLEWARE``) resolves the URL and enforces it before the
+session, auth and one-session middlewares run, so a rejected request costs no
+database query and no password hash. Without the middleware the decorator
+enforces the rule itself. Rejections are ``429`` with ``Retry-After``, JSON
+``{"ok": false, "error": ...}`` for AJAX/JSON callers.
+
+Counting, per ``hit(scope, ident, rate)``:
+
+- Redis (``django.core.cache.backends.redis.RedisCache``): a sliding window kept in
+  a sorted set and updated by one Lua script, so check-and-add is a single atomic
+  round trip and uses the Redis clock.
+- Any other backend: a fixed window counter advanced with ``incr`` (``add`` on the
+  first hit of a window). LocMem ``incr`` runs under the cache lock, so concurrent
+  threads never lose an increment; its counters are per process.
+
+``incr(key, timeout)`` is the same atomic counter for callers with their own
+policies (OTP lockouts, honeypot log throttling). Cache errors fail open.
+
+Settings: ``RATE_LIMIT_ENABLED``, ``RATE_LIMIT_CACHE`` (cache alias) and
+``RATE_LIMIT_TRUSTED_PROXIES`` (proxies appending to ``X-Forwarded-For`` in front of
+the app; 0 = use ``REMOTE_ADDR``).
+"""
+from __future__ import annotations
+import functools
+import hashlib
+import logging
+import re
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Tuple, Union
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpRequest, HttpResponse, JsonResponse
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "rl:"
+MESSAGE = "Too many requests. Please try again later."
+CHECKED_ATTR = "_rate_limit_checked"
+
+_RATE = re.compile(r"^\s*(\d+)\s*/\s*(\d*)\s*([smhd])\s*$")
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+_SAFE_IDENT = re.compile(r"^[\w.:-]{1,64}$")
+
+_SLIDING_WINDOW = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count < limit then
+    redis.call('ZADD', KEYS[1], now, ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return {1, count + 1, 0}
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {0, count, tonumber(oldest[2]) + window - now}
+"""
+
+
+def parse_rate(rate: str) -> Tuple[int, int]:
+    """``"5/m"`` -> ``(5, 60)``; ``"10/15m"`` -> ``(10, 900)``."""
+    match = _RATE.match(rate or "")
+    if not match:
+        raise ValueError(f"Invalid rate {rate!r}; expected e.g. '5/m' or '100/15m'")
+    count, multiplier, unit = match.groups()
+    return int(count), int(multiplier or 1) * _UNITS[unit]
+
+
+@dataclass(frozen=True)
+class Decision:
+    allowed: bool
+    count: int
+    limit: int
+    retry_after: int  # seconds until a new request may pass (0 when allowed)
+
+
+def _cache():
+    return caches[getattr(settings, "RATE_LIMIT_CACHE", "default")]
+
+
+def _enabled() -> bool:
+    return bool(getattr(settings, "RATE_LIMIT_ENABLED", True))
+
+
+def _ident_key(scope: str, ident: str) -> str:
+    ident = str(ident)
+    if not _SAFE_IDENT.match(ident):
+        ident = hashlib.sha1(ident.encode("utf-8")).hexdigest()
+    return f"{CACHE_PREFIX}{scope}:{ident}"
+
+
+def _redis_client(cache, key: str):
+    from django.core.cache.backends.redis import RedisCache
+
+    if not isinstance(cache, RedisCache):
+        return None, key
+    full_key = cache.make_and_validate_key(key)
+    return cache._cache.get_client(full_key, write=True), full_key
+
+
+def incr(key: str, timeout: int, cache=None) -> int:
+    """Atomically add 1 to ``key`` (created with ``timeout`` seconds to live); the new count.
+
+    ``cache`` defaults to the ``RATE_LIMIT_CACHE`` alias.
+    """
+    cache = cache or _cache()
+    try:
+        return int(cache.incr(key))
+    except ValueError:
+        if cache.add(key, 1, timeout=timeout):
+            return 1
+        return int(cache.incr(key))
+
+
+def hit(scope: str, ident: str, rate: str) -> Decision:
+    """Count one request of ``ident`` against ``rate`` in ``scope``. Never raises."""
+    limit, window = parse_rate(rate)
+    if not _enabled():
+        return Decision(True, 0, limit, 0)
+    key = _ident_key(scope, ident)
+    try:
+        cache = _cache()
+        client, full_key = _redis_client(cache, key)
+        if client is not None:
+            allowed, count, retry_ms = client.eval(
+                _SLIDING_WINDOW, 1, full_key, window * 1000, limit, uuid.uuid4().hex
+            )
+            return Decision(bool(allowed), int(count), limit, -(-int(retry_ms) // 1000))
+        now = time.time()
+        bucket = int(now // window)
+        count = incr(f"{key}:{bucket}", timeout=window + 1)
+        retry_after = 0 if count <= limit else max(1, int((bucket + 1) * window - now + 0.999))
+        return Decision(count <= limit, count, limit, retry_after)
+    except Exception:
+        logger.exception("Rate limit check failed for %s; allowing the request", scope)
+        return Decision(True, 0, limit, 0)
+
+
+def client_ip(request: HttpRequest) -> str:
+    """Client address: ``REMOTE_ADDR``, or the ``X-Forwarded-For`` entry added by the
+    outermost of ``RATE_LIMIT_TRUSTED_PROXIES`` proxies (entries left of it are spoofable)."""
+    proxies = int(getattr(settings, "RATE_LIMIT_TRUSTED_PROXIES", 0) or 0)
+    if proxies > 0:
+        forwarded = [p.strip() for p in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",") if p.strip()]
+        if forwarded:
+            return forwarded[-min(proxies, len(forwarded))]
+    return request.META.get("REMOTE_ADDR") or "unknown"
+
+
+# -------- View rules --------
+
+KeyFunc = Callable[[HttpRequest], Optional[str]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    scope: str
+    rate: str
+    key: Union[str, KeyFunc] = "ip"
+    methods: Optional[Tuple[str, ...]] = ("POST",)  # None: every method
+
+    def applies(self, request: HttpRequest) -> bool:
+        return self.methods is None or request.method in self.methods
+
+    def ident(self, request: HttpRequest) -> Optional[str]:
+        if self.key == "ip":
+            return client_ip(request)
+        return self.key(request)  # type: ignore[operator]
+
+
+_methods: set = set()  # request methods any rule applies to (lets the middleware skip the rest)
+
+
+def watched_method(method: str) -> bool:
+    return "*" in _methods or method in _methods
+
+
+def rejection(request: HttpRequest, decision: Decision) -> HttpResponse:
+    accept = request.headers.get("Accept", "")
+    if request.headers.get("X-Requested-With") == "XMLHttpRequest" or "application/json" in accept:
+        response = JsonResponse({"ok": False, "error": MESSAGE}, status=429)
+    else:
+        response = HttpResponse(MESSAGE, status=429, content_type="text/plain; charset=utf-8")
+    response["Retry-After"] = str(max(1, decision.retry_after))
+    return response
+
+
+def enforce(request: HttpRequest, rules: Iterable[Rule]) -> Optional[HttpResponse]:
+    """Count ``request`` against ``rules``; the 429 response for the first one exceeded."""
+    setattr(request, CHECKED_ATTR, True)
+    for rule in rules:
+        if not rule.applies(request):
+            continue
+        ident = rule.ident(request)
+        if ident is None:
+            continue
+        decision = hit(rule.scope, ident, rule.rate)
+        if not decision.allowed:
+            logging.getLogger("security.ratelimit").warning(
+                "Rate limit exceeded: scope=%s count=%s limit=%s", rule.scope, decision.count, decision.limit
+            )
+            return rejection(request, decision)
+    return None
+
+
+def rules_for(view) -> Tuple[Rule, ...]:
+    return tuple(getattr(view, "rate_limits", ()) or ())
+
+
+def limit(
+    rate: str,
+    *,
+    key: Union[str, KeyFunc] = "ip",
+    methods: Optional[Iterable[str]] = ("POST",),
+    scope: Optional[str] = None,
+):
+    """Rate-limit a view: ``@rate_limit_service.limit("5/m")``.
+
+    ``key`` is ``"ip"`` or ``callable(request) -> str | None`` (None: not limited);
+    ``methods=None`` limits every method. Stacked decorators add rules; the outermost
+    wrapper (or the middleware) checks them all, once per request.
+    """
+    parse_rate(rate)  # fail at import time on a typo
+    method_tuple = None if methods is None else tuple(m.upper() for m in methods)
+    _methods.update(method_tuple or ("*",))
+
+    def decorator(view):
+        rule = Rule(scope or f"{view.__module__}.{view.__qualname__}", rate, key, method_tuple)
+        rules = rules_for(view) + (rule,)
+
+        if iscoroutinefunction(view):
+            @functools.wraps(view)
+            async def wrapped(request, *args, **kwargs):
+                if not getattr(request, CHECKED_ATTR, False):
+                    response = await sync_to_async(enforce)(request, rules)
+                    if response is not None:
+                        return response
+                return await view(request, *args, **kwargs)
+        else:
+            @functools.wraps(view)
+            def wrapped(request, *args, **kwargs):
+                if not getattr(request, CHECKED_ATTR, False):
+                    response = enforce(request, rules)
+                    if response is not None:
+                        return response
+                return view(request, *args, **kwargs)
+
+        wrapped.rate_limits = rules
+        return wrapped
+
+    return decorator
@@ -0,0 +1,219 @@
+"""
+Indexed live search for the dashboard list views.
+
+Views build their filter with ``search_q(Model, q, fields)`` instead of OR-ing
+``icontains`` lookups by hand; the JSON they return is unchanged. Semantics stay
+"case-insensitive substring in any of the fields", served by an index:
+
+- SQLite: one FTS5 table per model (``<db_table>_fts``, trigram tokenizer). For the
+  integer-keyed tables its rowid is the source primary key; ``Client`` (UUID key)
+  stores the key in an UNINDEXED ``source_pk`` column instead, because the implicit
+  rowid of a table without an INTEGER PRIMARY KEY can change on ``VACUUM``
+  (migration 0017). Kept in sync by the save/delete receivers below;
+  ``bulk_create``/``QuerySet.update()`` bypass them, so run ``rebuild_search_index``
+  after bulk loads.
+- PostgreSQL: GIN ``gin_trgm_ops`` indexes on ``UPPER(col::text)`` (migration 0013),
+  which is exactly the expression Django emits for ``icontains``, so the plain
+  lookups become index scans.
+- Anything else, or ``SEARCH_BACKEND=like``: plain ``icontains``.
+
+Trigrams need three characters. Shorter queries fall back to ``icontains``, except
+digit-only queries which match phone numbers by prefix. Phone-like input
+("98765 43210", "+91-98765") is matched against the ``phone`` column by its digits;
+every other column sees the query as typed, so "2024-01" still finds "2024-01".
+"""
+from __future__ import annotations
+import logging
+import re
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_save, pre_delete
+
+from apps.dashboard import models
+
+logger = logging.getLogger(__name__)
+
+MIN_TRIGRAM_CHARS = 3
+PHONE_FIELD = "phone"
+KEY_COLUMN = "source_pk"
+_PHONE_LIKE = re.compile(r"^[\d\s()+\-.]+$")
+
+# Searchable columns per model. Migration 0013 mirrors this list; keep them in step.
+SEARCH_FIELDS: Dict[type, Tuple[str, ...]] = {
+    **{getattr(models, f"Table{i}"): ("name", "city", "phone") for i in range(1, 11) if i != 6},
+    models.Table6: ("name", "city", "phone", "email"),
+    models.Client: ("full_name", "phone", "email", "location"),
+}
+
+_fts_ready: Dict[str, bool] = {}
+
+
+def fts_table(Model) -> str:
+    return f"{Model._meta.db_table}_fts"
+
+
+def _keyed(Model) -> bool:
+    """True when the FTS rows carry the primary key in ``KEY_COLUMN`` rather than as rowid."""
+    return Model._meta.pk.get_internal_type() not in ("AutoField", "BigAutoField")
+
+
+# -------- Backend selection --------
+
+def backend() -> str:
+    """``"fts5"``, ``"trigram"`` or ``"like"`` for the default database."""
+    if str(getattr(settings, "SEARCH_BACKEND", "auto")).lower() == "like":
+        return "like"
+    if connection.vendor == "postgresql":
+        return "trigram"
+    if connection.vendor == "sqlite" and _sqlite_fts_ready():
+        return "fts5"
+    return "like"
+
+
+def _sqlite_fts_ready() -> bool:
+    name = str(connection.settings_dict.get("NAME"))
+    ready = _fts_ready.get(name)
+    if ready is None:
+        try:
+            existing = set(connection.introspection.table_names())
+            ready = all(fts_table(M) in existing for M in SEARCH_FIELDS)
+        except Exception:
+            ready = False
+        _fts_ready[name] = ready
+    return ready
+
+
+# -------- Query building --------
+
+def normalise(q: str) -> str:
+    return (q or "").strip()
+
+
+def phone_digits(q: str) -> Optional[str]:
+    """The digits of phone-like input ("+91-98765 43210"), else ``None``."""
+    if _PHONE_LIKE.match(q) and re.search(r"\d", q):
+        return re.sub(r"\D", "", q)
+    return None
+
+
+def search_q(Model, q: str, fields: Optional[Iterable[str]] = None) -> Q:
+    """Filter matching ``q`` in any of ``fields`` (default: all registered fields)."""
+    fields = tuple(fields or SEARCH_FIELDS[Model])
+    term = normalise(q)
+    if not term:
+        return Q()
+    digits = phone_digits(term)
+    if digits and len(digits) < MIN_TRIGRAM_CHARS and PHONE_FIELD in fields and digits == term:
+        return Q(phone__startswith=digits)
+    # (field, term) pairs: only the phone column is matched by digits.
+    terms = [(f, digits if digits and f == PHONE_FIELD else term) for f in fields]
+    if (
+        all(len(t) >= MIN_TRIGRAM_CHARS for _, t in terms)
+        and backend() == "fts5"
+        and set(fields) <= set(SEARCH_FIELDS.get(Model, ()))
+    ):
+        return Q(pk__in=_fts_subquery(Model, terms))
+    cond = Q()
+    for f, t in terms:
+        cond |= Q(**{f"{f}__icontains": t})
+    return cond
+
+
+def _fts_subquery(Model, terms) -> RawSQL:
+    by_term: Dict[str, list] = {}
+    for f, t in terms:
+        by_term.setdefault(t, []).append(f)
+    match = " OR ".join(
+        "{%s} : %s" % (" ".join(fs), '"' + t.replace('"', '""') + '"') for t, fs in by_term.items()
+    )
+    qn = connection.ops.quote_name
+    fts = qn(fts_table(Model))
+    if _keyed(Model):
+        return RawSQL(f"SELECT {qn(KEY_COLUMN)} FROM {fts} WHERE {fts} MATCH %s", [match])
+    return RawSQL(f"SELECT rowid FROM {fts} WHERE {fts} MATCH %s", [match])
+
+
+# -------- SQLite index maintenance --------
+
+def _source_key(instance):
+    """The FTS row key for ``instance``: its rowid-aliased pk, or the db form of a UUID pk."""
+    return type(instance)._meta.pk.get_db_prep_value(instance.pk, connection)
+
+
+def _key_column(Model) -> str:
+    return KEY_COLUMN if _keyed(Model) else "rowid"
+
+
+def index_instance(instance) -> None:
+    Model = type(instance)
+    fields = SEARCH_FIELDS[Model]
+    key = _source_key(instance)
+    if key is None:
+        return
+    qn = connection.ops.quote_name
+    fts = qn(fts_table(Model))
+    key_col = qn(_key_column(Model))
+    values = [str(getattr(instance, f, "") or "") for f in fields]
+    with connection.cursor() as cur:
+        cur.execute(f"DELETE FROM {fts} WHERE {key_col} = %s", [key])
+        cur.execute(
+            f"INSERT INTO {fts} ({key_col}, {', '.join(qn(f) for f in fields)}) "
+            f"VALUES (%s, {', '.join(['%s'] * len(fields))})",
+            [key, *values],
+        )
+
+
+def unindex_instance(instance) -> None:
+    key = _source_key(instance)
+    if key is None:
+        return
+    Model = type(instance)
+    qn = connection.ops.quote_name
+    with connection.cursor() as cur:
+        cur.execute(f"DELETE FROM {qn(fts_table(Model))} WHERE {qn(_key_column(Model))} = %s", [key])
+
+
+def rebuild(Model=None) -> int:
+    """Repopulate the FTS tables from their source tables; returns rows indexed."""
+    if backend() != "fts5":
+        return 0
+    qn = connection.ops.quote_name
+    total = 0
+    with connection.cursor() as cur:
+        for M in ([Model] if Model else list(SEARCH_FIELDS)):
+            cols = ", ".join(qn(M._meta.get_field(f).column) for f in SEARCH_FIELDS[M])
+            fts = qn(fts_table(M))
+            cur.execute(f"DELETE FROM {fts}")
+            cur.execute(
+                f"INSERT INTO {fts} ({qn(_key_column(M))}, {', '.join(qn(f) for f in SEARCH_FIELDS[M])}) "
+                f"SELECT {qn(M._meta.pk.column)}, {cols} FROM {qn(M._meta.db_table)}"
+            )
+            total += max(cur.rowcount, 0)
+    return total
+
+
+def _on_saved(sender, instance, raw=False, **_kwargs):
+    if raw or backend() != "fts5":
+        return
+    try:
+        index_instance(instance)
+    except Exception:
+        logger.exception("Failed to index %s %s for search", sender.__name__, instance.pk)
+
+
+def _on_deleting(sender, instance, **_kwargs):
+    if backend() != "fts5":
+        return
+    try:
+        unindex_instance(instance)
+    except Exception:
+        logger.exception("Failed to unindex %s %s for search", sender.__name__, instance.pk)
+
+
+for _Model in SEARCH_FIELDS:
+    post_save.connect(_on_saved, sender=_Model, dispatch_uid=f"search_service_saved_{_Model.__name__}")
+    pre_delete.connect(_on_deleting, sender=_Model, dispatch_uid=f"search_service_deleting_{_Model.__name__}")
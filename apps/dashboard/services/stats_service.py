@@ -0,0 +1,131 @@
+"""
+Overview row counts for the dashboard and settings/system-info.
+
+- ``compute_counts()`` fetches every table count plus the ActivityLog and Client
+  counts in one ``UNION ALL`` round trip.
+- ``get_counts()`` serves them from the shared cache (one ``get_many``). Each count
+  lives under its own key so create/delete paths can ``incr``/``decr`` atomically.
+- Counters are adjusted after commit by post_save(created)/post_delete receivers on
+  Table1..Table10 and Client, and by the audit pipeline for ActivityLog. ``bulk_create`` and
+  ``QuerySet.delete()`` bypass the receivers; callers using them should call
+  ``adjust()`` themselves, and ``reconcile()`` (management command
+  ``reconcile_stats`` or the Celery task) corrects any drift.
+"""
+from __future__ import annotations
+import logging
+from typing import Dict, Optional, Union
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models.signals import post_delete, post_save
+
+from apps.dashboard import models
+
+logger = logging.getLogger(__name__)
+
+TABLE_IDS = list(range(1, 11))
+LOGS_KEY = "logs"
+CLIENTS_KEY = "clients"
+CACHE_PREFIX = "stats:count:"
+ALL_KEYS = TABLE_IDS + [LOGS_KEY, CLIENTS_KEY]
+_NAMED_MODELS = {LOGS_KEY: models.ActivityLog, CLIENTS_KEY: models.Client}
+
+
+def _model_for(key) -> type:
+    return _NAMED_MODELS.get(key) or getattr(models, f"Table{key}")
+
+
+def _cache_key(key) -> str:
+    return f"{CACHE_PREFIX}{key}"
+
+
+# -------- Reads --------
+
+def compute_counts() -> Dict:
+    """Count every overview table in a single query."""
+    qn = connection.ops.quote_name
+    # Labels and table names come from model metadata only, never from input.
+    sql = " UNION ALL ".join(
+        f"SELECT '{key}', COUNT(*) FROM {qn(_model_for(key)._meta.db_table)}"
+        for key in ALL_KEYS
+    )
+    with connection.cursor() as cur:
+        cur.execute(sql)
+        rows = cur.fetchall()
+    out: Dict = {}
+    for label, count in rows:
+        key = label if label in _NAMED_MODELS else int(label)
+        out[key] = int(count or 0)
+    return out
+
+
+def get_counts() -> Dict:
+    """Return ``{1: n, ..., 10: n, "logs": n, "clients": n}`` from cache, rebuilding on a miss."""
+    try:
+        cached = cache.get_many([_cache_key(k) for k in ALL_KEYS])
+    except Exception:
+        cached = {}
+    if len(cached) == len(ALL_KEYS):
+        return {k: int(cached[_cache_key(k)]) for k in ALL_KEYS}
+    return reconcile()
+
+
+def reconcile() -> Dict:
+    """Recompute all counts from the database and overwrite the cached snapshot."""
+    counts = compute_counts()
+    try:
+        cache.set_many({_cache_key(k): v for k, v in counts.items()}, timeout=None)
+    except Exception:
+        logger.exception("Failed to store stats snapshot")
+    return counts
+
+
+# -------- Incremental maintenance --------
+
+def adjust(key, delta: int) -> None:
+    """Apply ``delta`` to one cached count (table id, ``"logs"`` or ``"clients"``). Missing keys are left
+    for the next read to rebuild, so a cold cache never holds a partial count."""
+    if not delta:
+        return
+    try:
+        if delta > 0:
+            cache.incr(_cache_key(key), delta)
+        else:
+            cache.decr(_cache_key(key), -delta)
+    except ValueError:
+        pass
+    except Exception:
+        logger.exception("Failed to adjust stats counter %s", key)
+
+
+def adjust_on_commit(key, delta: int) -> None:
+    transaction.on_commit(lambda: adjust(key, delta))
+
+
+def _counter_key(sender) -> Optional[Union[int, str]]:
+    if sender is models.Client:
+        return CLIENTS_KEY
+    name = getattr(sender, "__name__", "")
+    if name.startswith("Table"):
+        try:
+            return int(name[5:])
+        except ValueError:
+            return None
+    return None
+
+
+def _on_saved(sender, instance, created, raw=False, **_kwargs):
+    if created and not raw:
+        adjust_on_commit(_counter_key(sender), 1)
+
+
+def _on_deleted(sender, instance, **_kwargs):
+    adjust_on_commit(_counter_key(sender), -1)
+
+
+for _tid in TABLE_IDS:
+    _Model = getattr(models, f"Table{_tid}")
+    post_save.connect(_on_saved, sender=_Model, dispatch_uid=f"stats_service_saved_{_tid}")
+    post_delete.connect(_on_deleted, sender=_Model, dispatch_uid=f"stats_service_deleted_{_tid}")
+post_save.connect(_on_saved, sender=models.Client, dispatch_uid="stats_service_saved_clients")
+post_delete.connect(_on_deleted, sender=models.Client, dispatch_uid="stats_service_deleted_clients")
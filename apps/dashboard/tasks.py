@@ -0,0 +1,70 @@
+"""
+Celery tasks for the dashboard app.
+
+Celery is optional: when it is not installed the task names resolve to ``None``
+and callers fall back to doing the work inline.
+"""
+from __future__ import annotations
+from typing import Any, Dict, List
+
+try:  # optional dependency
+    from celery import shared_task  # type: ignore
+except Exception:  # safe fallback if Celery is not installed
+    shared_task = None  # type: ignore
+
+
+def _write_activity_logs(events: List[Dict[str, Any]]) -> int:
+    """Persist a batch of serialized ActivityLog events (see audit_service.flush)."""
+    from apps.dashboard.services import audit_service
+
+    batch = audit_service.deserialize_events(events)
+    audit_service.write_events(batch)
+    return len(batch)
+
+
+write_activity_logs = (
+    shared_task(name="dashboard.write_activity_logs", ignore_result=True)(_write_activity_logs)
+    if shared_task is not None
+    else None
+)
+
+
+def _reconcile_stats() -> dict:
+    """Periodic drift correction for the cached overview counts (see stats_service)."""
+    from apps.dashboard.services import stats_service
+
+    return {str(k): v for k, v in stats_service.reconcile().items()}
+
+
+reconcile_stats = (
+    shared_task(name="dashboard.reconcile_stats", ignore_result=True)(_reconcile_stats)
+    if shared_task is not None
+    else None
+)
+
+
+def _run_export_job(job_id: str) -> None:
+    """Build a queued export file (see export_job_service.submit)."""
+    from apps.dashboard.services import export_job_service
+
+    export_job_service.run(job_id)
+
+
+run_export_job = (
+    shared_task(name="dashboard.run_export_job", ignore_result=True)(_run_export_job)
+    if shared_task is not None
+    else None
+)
+
+
+def _purge_export_jobs() -> int:
+    from apps.dashboard.services import export_job_service
+
+    return export_job_service.purge_expired()
+
+
+purge_export_jobs = (
+    shared_task(name="dashboard.purge_export_jobs", ignore_result=True)(_purge_export_jobs)
+    if shared_task is not None
+    else None
+)
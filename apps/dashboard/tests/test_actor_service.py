@@ -0,0 +1,52 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.dashboard.services import actor_service
+
+
+class ActorServiceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        actor_service.invalidate_fallback_actor()
+        User = get_user_model()
+        self.staff = User.objects.create_user(username="staff", password="pass1234")
+        self.root = User.objects.create_superuser("root", "root@example.com", "pass1234")
+
+    def test_fallback_is_cached(self):
+        self.assertEqual(actor_service.fallback_actor_id(), self.root.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(actor_service.fallback_actor_id(), self.root.pk)
+
+    def test_user_change_invalidates_fallback(self):
+        self.assertEqual(actor_service.fallback_actor_id(), self.root.pk)
+        self.root.delete()
+        self.assertEqual(actor_service.fallback_actor_id(), self.staff.pk)
+
+    def test_sign_ins_and_unrelated_saves_keep_the_cache(self):
+        self.assertEqual(actor_service.fallback_actor_id(), self.root.pk)
+        update_last_login(None, self.root)
+        update_last_login(None, self.staff)
+        self.staff.first_name = "Staff"
+        self.staff.save()
+        with self.assertNumQueries(0):
+            self.assertEqual(actor_service.fallback_actor_id(), self.root.pk)
+
+    def test_superuser_changes_invalidate_fallback(self):
+        self.assertEqual(actor_service.fallback_actor_id(), self.root.pk)
+        self.root.is_superuser = False
+        self.root.save()
+        self.assertEqual(actor_service.fallback_actor_id(), self.staff.pk)
+        self.root.is_superuser = True
+        self.root.save(update_fields=["is_superuser"])
+        self.assertEqual(actor_service.fallback_actor_id(), self.root.pk)
+
+    def test_request_actor_wins_over_fallback(self):
+        token = actor_service.set_current_actor(self.staff)
+        try:
+            with self.assertNumQueries(0):
+                self.assertEqual(actor_service.resolve_actor_id(), self.staff.pk)
+        finally:
+            actor_service.reset_current_actor(token)
+        self.assertEqual(actor_service.resolve_actor_id(), self.root.pk)
@@ -0,0 +1,53 @@
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.dashboard import models
+
+
+@override_settings(ACTIVITYLOG_WRITE_MODE="sync")
+class ArtistApplicationsPageTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser("root", "root@example.com", "pass1234")
+        self.client.force_login(self.user)
+        for i in range(5):
+            models.Table6.objects.create(name=f"Rej {i}", city="Pune", phone=f"90000000{i:02d}", application_status="rejected")
+        self.pending = models.Table6.objects.create(name="Pen", city="Pune", phone="9111111111")
+
+    def test_page_no_longer_renders_full_rejected_list(self):
+        resp = self.client.get(reverse("dashboard:artist_applications"))
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.context["rejected_count"], 5)
+        self.assertNotIn("rejected_applications", resp.context)
+
+    def test_rejected_api_pages_by_cursor(self):
+        url = reverse("dashboard:artist_applications_rejected")
+        first = self.client.get(url, {"per_page": 3, "cursor": ""}).json()
+        self.assertEqual(len(first["results"]), 3)
+        self.assertTrue(first["has_next"])
+        self.assertEqual(first["results"][0]["cert_count"], 0)
+        second = self.client.get(url, {"per_page": 3, "cursor": first["next_cursor"]}).json()
+        self.assertEqual(len(second["results"]), 2)
+        self.assertFalse(second["has_next"])
+        names = [r["name"] for r in first["results"] + second["results"]]
+        self.assertEqual(sorted(names), [f"Rej {i}" for i in range(5)])
+
+    def test_certificates_api_lists_files(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        with self.settings(MEDIA_ROOT=media):
+            self._check_certificates()
+
+    def _check_certificates(self):
+        models.ArtistApplicationCertificate.objects.create(
+            application=self.pending, file=SimpleUploadedFile("c.png", b"x", content_type="image/png"),
+        )
+        data = self.client.get(reverse("dashboard:artist_application_certificates", args=[self.pending.pk])).json()
+        self.assertEqual(len(data["results"]), 1)
+        self.assertTrue(data["results"][0]["is_image"])
+        missing = self.client.get(reverse("dashboard:artist_application_certificates", args=[999999]))
+        self.assertEqual(missing.status_code, 404)
@@ -0,0 +1,66 @@
+import io
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.dashboard.models import Table3, Table5
+from apps.dashboard.services import artist_link_service, import_service
+
+
+class ArtistLinkTests(TestCase):
+    def setUp(self):
+        self.asha = Table3.objects.create(name="Asha", city="Pune", phone="9876543210")
+        self.ravi = Table3.objects.create(name="Ravi", city="Goa", phone="9876543211")
+
+    def test_saves_keep_links_derived_from_names(self):
+        service = Table5.objects.create(name="Asha", city="Pune", phone="9876543210")
+        orphan = Table5.objects.create(name="Meera", city="Pune", phone="9876543212")
+        self.assertEqual((service.artist_id, orphan.artist_id), (self.asha.pk, None))
+
+        meera = Table3.objects.create(name="Meera", city="Pune", phone="9876543212")
+        orphan.refresh_from_db()
+        self.assertEqual(orphan.artist_id, meera.pk)
+
+        self.asha.name = "Asha Rao"
+        self.asha.save()
+        service.refresh_from_db()
+        self.assertIsNone(service.artist_id)
+
+        meera.delete()
+        orphan.refresh_from_db()
+        self.assertIsNone(orphan.artist_id)
+
+    def test_backfill_command(self):
+        Table5.objects.create(name="Ravi", city="Goa", phone="9876543211")
+        Table5.objects.create(name="Asha", city="Pune", phone="9876543210")
+        Table5.objects.update(artist=None)
+        self.assertEqual(artist_link_service.stale_links().count(), 2)
+
+        out = io.StringIO()
+        call_command("link_artist_services", stdout=out)
+        self.assertIn("Dry-run: True", out.getvalue())
+        self.assertEqual(artist_link_service.stale_links().count(), 2)
+
+        call_command("link_artist_services", "--apply", "--batch-size", "1", stdout=io.StringIO())
+        self.assertFalse(artist_link_service.stale_links().exists())
+        self.assertEqual(set(Table5.objects.values_list("artist_id", flat=True)), {self.asha.pk, self.ravi.pk})
+
+    def test_import_relinks(self):
+        user = get_user_model().objects.create_superuser("root", "root@example.com", "pass1234")
+        data = b"name,city,phone\nRavi,Goa,9876543211\n"
+        import_service.run_import(5, import_service.iter_records(io.BytesIO(data), "csv"), user=user)
+        self.assertEqual(Table5.objects.get().artist_id, self.ravi.pk)
+
+    def test_browse_filter_is_one_query_on_the_link(self):
+        for i in range(30):
+            Table5.objects.create(name="Asha", city="Pune", phone=f"98765432{i:02d}")
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(reverse("client_portal:browse_artists"), {"service": "ash"})
+        self.assertEqual([a["name"] for a in resp.context["page_obj"].object_list], ["Asha"])
+        sql = [q["sql"] for q in ctx.captured_queries if Table5._meta.db_table in q["sql"]]
+        self.assertTrue(sql)
+        self.assertTrue(all("EXISTS" in s.upper() and "artist_id" in s for s in sql))
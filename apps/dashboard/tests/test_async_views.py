@@ -0,0 +1,75 @@
+import asyncio
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.client_portal import views as portal_views
+from apps.dashboard import views
+from apps.dashboard.models import Client, Table2
+from django_admin_project import health
+
+
+class AsyncReadViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_superuser("root", "root@example.com", "pass1234")
+        for i in range(3):
+            Table2.objects.create(name=f"Artist {i}", city="Pune", phone=f"98765432{i:02d}")
+
+    def get(self, url, **extra):
+        return async_to_sync(self.async_client.get)(url, **extra)
+
+    def test_views_are_coroutines(self):
+        for view in (
+            views.get_table_data, views.get_logs, views.clients_list_api, views.artist_applications_pending_count,
+            portal_views.client_api_can_apply, portal_views.client_api_profile, health.healthz, health.readinessz,
+        ):
+            self.assertTrue(asyncio.iscoroutinefunction(view), view.__name__)
+
+    def test_middleware_chain_stays_async(self):
+        with self.assertNoLogs("django.request", "DEBUG"):
+            ASGIHandler()
+
+    def test_table_data_auth_pagination_and_etag(self):
+        url = reverse("dashboard:get_table_data", args=[2])
+        self.assertEqual(self.get(url).status_code, 302)
+
+        self.async_client.force_login(self.user)
+        resp = self.get(url + "?per_page=2&page=9")
+        body = resp.json()
+        self.assertEqual((body["page"], body["num_pages"], body["total"]), (2, 2, 3))
+        self.assertEqual(len(body["results"]), 1)
+        self.assertEqual(self.get(url, headers={"If-None-Match": self.get(url)["ETag"]}).status_code, 304)
+        self.assertEqual(async_to_sync(self.async_client.post)(url).status_code, 405)
+
+        cursor = self.get(url + "?cursor=&per_page=2").json()
+        self.assertTrue(cursor["has_next"])
+
+    def test_logs_clients_and_pending_count(self):
+        self.assertEqual(self.get(reverse("dashboard:get_logs")).status_code, 401)
+        self.async_client.force_login(self.user)
+        self.assertTrue(self.get(reverse("dashboard:get_logs")).json()["success"])
+        Client.objects.create(full_name="Meera", phone="9876500000", password="x")
+        self.assertEqual(self.get(reverse("dashboard:clients_list") + "?q=meera").json()["total"], 1)
+        self.assertEqual(self.get(reverse("dashboard:artist_applications_pending_count")).json()["count"], 0)
+
+    @override_settings(FEATURE_CLIENT_AUTH=True)
+    def test_client_apis(self):
+        self.assertEqual(self.get(reverse("client_portal:client_api_profile")).status_code, 401)
+        client = Client.objects.create(full_name="Meera", phone="9876500000", password=make_password("Secret123!"))
+        session = self.async_client.session
+        session["client_id"] = str(client.client_id)
+        session.save()
+        self.async_client.cookies["sessionid"] = session.session_key
+        profile = self.get(reverse("client_portal:client_api_profile")).json()
+        self.assertEqual(profile["profile"]["phone"], "98****00")
+        self.assertTrue(self.get(reverse("client_portal:client_api_can_apply")).json()["ok"])
+
+    def test_health(self):
+        self.assertTrue(self.get(reverse("healthz")).json()["ok"])
+        self.assertTrue(self.get(reverse("readinessz")).json()["status"]["db"])
@@ -0,0 +1,109 @@
+import threading
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.dashboard import models
+from apps.dashboard.services import audit_service
+
+
+class AuditServiceTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.actor = User.objects.create_user(username="auditor", password="pass1234")
+
+    def _record(self, row_id=1):
+        audit_service.record(
+            table_name="User", action="CREATE", row_id=row_id, row_details={"name": "X"}, admin_user=self.actor
+        )
+
+    def test_sync_mode_writes_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self._record()
+        self.assertEqual(models.ActivityLog.objects.count(), 0)
+        for cb in callbacks:
+            cb()
+        self.assertEqual(models.ActivityLog.objects.count(), 1)
+
+    def test_rolled_back_write_is_not_audited(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                from django.db import transaction
+
+                with transaction.atomic():
+                    self._record()
+                    raise RuntimeError("rollback")
+            except RuntimeError:
+                pass
+        self.assertEqual(len(callbacks), 0)
+        self.assertEqual(models.ActivityLog.objects.count(), 0)
+
+    @override_settings(ACTIVITYLOG_WRITE_MODE="buffered", ACTIVITYLOG_BUFFER_SIZE=100, ACTIVITYLOG_FLUSH_INTERVAL=60)
+    def test_buffered_mode_bulk_inserts_on_flush(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(5):
+                self._record(row_id=i)
+        self.assertEqual(audit_service.pending(), 5)
+        self.assertEqual(models.ActivityLog.objects.count(), 0)
+        with self.assertNumQueries(3):  # one INSERT inside a savepoint
+            self.assertEqual(audit_service.flush(), 5)
+        self.assertEqual(models.ActivityLog.objects.count(), 5)
+
+    def test_failed_batch_is_rolled_back_before_the_row_by_row_retry(self):
+        events = [
+            {"table_name": "User", "action": "CREATE", "row_id": i, "row_details": {},
+             "admin_user_id": self.actor.pk, "timestamp": timezone.now()}
+            for i in range(3)
+        ]
+        bulk_create = models.ActivityLog.objects.bulk_create
+
+        def insert_one_then_fail(objs, **kwargs):
+            bulk_create(objs[:1])
+            raise RuntimeError("connection dropped")
+
+        with mock.patch.object(models.ActivityLog.objects, "bulk_create", insert_one_then_fail):
+            audit_service.write_events(events)
+        self.assertEqual(sorted(models.ActivityLog.objects.values_list("row_id", flat=True)), [0, 1, 2])
+
+    @override_settings(ACTIVITYLOG_WRITE_MODE="buffered", ACTIVITYLOG_BUFFER_SIZE=3, ACTIVITYLOG_FLUSH_INTERVAL=60)
+    def test_buffered_mode_flushes_when_full(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(3):
+                self._record(row_id=i)
+        self.assertEqual(audit_service.pending(), 0)
+        self.assertEqual(models.ActivityLog.objects.count(), 3)
+
+    def test_signal_suppression_scope(self):
+        self.assertFalse(audit_service.signal_audit_suppressed())
+        with audit_service.suppress_signal_audit():
+            self.assertTrue(audit_service.signal_audit_suppressed())
+        self.assertFalse(audit_service.signal_audit_suppressed())
+
+    def test_signal_suppression_decorator_is_safe_across_threads(self):
+        # One decorator instance shared by concurrent requests, as on a view.
+        barrier = threading.Barrier(2)
+        seen, errors = [], []
+
+        @audit_service.suppress_signal_audit()
+        def view():
+            barrier.wait(timeout=5)
+            seen.append(audit_service.signal_audit_suppressed())
+            barrier.wait(timeout=5)
+
+        def worker():
+            try:
+                view()
+                seen.append(audit_service.signal_audit_suppressed())
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(seen), [False, False, True, True])
+        self.assertFalse(audit_service.signal_audit_suppressed())
@@ -0,0 +1,44 @@
+import uuid
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from apps.dashboard.services import broadcast_service
+
+
+class _Layer:
+    def __init__(self):
+        self.sent = []
+
+    async def group_send(self, group, message):
+        self.sent.append((group, message))
+
+
+class BroadcastServiceTests(TestCase):
+    def setUp(self):
+        self.layer = _Layer()
+        patcher = mock.patch.object(broadcast_service, "get_channel_layer", return_value=self.layer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(BROADCAST_MODE="sync")
+    def test_send_waits_for_commit_and_is_json_safe(self):
+        rid = uuid.uuid4()
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            broadcast_service.send("notifications", {"type": "notify", "payload": {"id": rid}})
+        self.assertEqual(self.layer.sent, [])
+        for cb in callbacks:
+            cb()
+        self.assertEqual(self.layer.sent, [("notifications", {"type": "notify", "payload": {"id": str(rid)}})])
+
+    @override_settings(BROADCAST_MODE="background", BROADCAST_COALESCE_MS=200)
+    def test_background_mode_coalesces_per_group(self):
+        for n in range(3):
+            broadcast_service.enqueue("notifications", {"type": "notify", "payload": {"n": n}})
+        broadcast_service.enqueue("client.abc", {"type": "notify", "payload": {"n": 9}})
+        broadcast_service.flush()
+        groups = [g for g, _ in self.layer.sent]
+        self.assertEqual(sorted(groups), ["client.abc", "notifications"])
+        batch = dict(self.layer.sent)["notifications"]
+        self.assertEqual(batch["type"], broadcast_service.BATCH_TYPE)
+        self.assertEqual([m["payload"]["n"] for m in batch["messages"]], [0, 1, 2])
@@ -0,0 +1,30 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.dashboard.models import Client
+from apps.dashboard.services import client_session_service
+
+
+class ClientSessionServiceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client_obj = Client.objects.create(full_name="Asha", phone="9876543210", password="x")
+
+    def test_key_is_cached_after_first_lookup(self):
+        Client.objects.filter(pk=self.client_obj.pk).update(active_session_key="k1")
+        self.assertEqual(client_session_service.active_session_key(self.client_obj.pk), "k1")
+        with self.assertNumQueries(0):
+            self.assertEqual(client_session_service.active_session_key(str(self.client_obj.pk)), "k1")
+
+    def test_login_writes_through(self):
+        client_session_service.active_session_key(self.client_obj.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            client_session_service.set_active_session_key(self.client_obj.pk, "k2")
+        self.assertEqual(Client.objects.get(pk=self.client_obj.pk).active_session_key, "k2")
+        with self.assertNumQueries(0):
+            self.assertEqual(client_session_service.active_session_key(self.client_obj.pk), "k2")
+
+    def test_unknown_client_raises(self):
+        self.client_obj.delete()
+        with self.assertRaises(Client.DoesNotExist):
+            client_session_service.active_session_key(self.client_obj.pk)
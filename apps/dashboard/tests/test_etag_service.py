@@ -0,0 +1,59 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.dashboard.models import Client, Table2
+from apps.dashboard.services import audit_service, etag_service
+
+
+class ChangeCounterETagTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_superuser("root", "root@example.com", "pass1234")
+        self.client.force_login(self.user)
+        Table2.objects.create(name="Asha", city="Pune", phone="9876543210")
+
+    def _revalidate(self, url, table):
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        etag = first["ETag"]
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(second.status_code, 304)
+        self.assertFalse([q["sql"] for q in ctx.captured_queries if table in q["sql"]])
+        return etag
+
+    def test_table_data_not_modified_until_write(self):
+        url = reverse("dashboard:get_table_data", args=[2])
+        etag = self._revalidate(url, "dashboard_user")
+        self.assertNotEqual(self.client.get(url + "?page=2")["ETag"], etag)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Table2.objects.create(name="Ravi", city="Goa", phone="9876543211")
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_logs_endpoints(self):
+        for url in (reverse("dashboard:get_logs"), "/api/v1/logs/"):
+            etag = self._revalidate(url, "dashboard_activitylog")
+            with self.captureOnCommitCallbacks(execute=True):
+                audit_service.write_events([{
+                    "table_name": "Table2", "action": "CREATE", "row_id": 1, "row_details": {}, "admin_user": self.user,
+                }])
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_clients_list_bumped_by_client_save(self):
+        url = reverse("dashboard:clients_list")
+        etag = self._revalidate(url, "dashboard_client")
+        with self.captureOnCommitCallbacks(execute=True):
+            Client.objects.create(full_name="Meera", phone="9876500000", password="x")
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_counter_is_monotonic(self):
+        before, _ = etag_service.versions(["table:2"])
+        etag_service.bump("table:2")
+        after, changed = etag_service.versions(["table:2"])
+        self.assertEqual(after["table:2"], before["table:2"] + 1)
+        self.assertIsNotNone(changed)
@@ -0,0 +1,133 @@
+import threading
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.dashboard import models
+from apps.dashboard.consumers import NotificationsConsumer
+from apps.dashboard.services import audit_service, broadcast_service, event_service
+
+
+@override_settings(ACTIVITYLOG_WRITE_MODE="sync")
+class EventServiceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_superuser("root", "root@example.com", "pass1234")
+
+    def test_row_events_are_sequenced_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            models.Table3.objects.create(name="A", city="B", phone="1234567890")
+        self.assertEqual(event_service.current_seq(), 0)
+        for cb in callbacks:
+            cb()
+        events, latest, complete = event_service.events_since(0)
+        self.assertTrue(complete)
+        self.assertEqual(latest, 1)
+        self.assertEqual(events[0]["type"], "row")
+        self.assertEqual(events[0]["data"]["table_id"], 3)
+
+    def test_table6_change_publishes_pending_count(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            models.Table6.objects.create(name="A", city="B", phone="1234567890")
+        events, _, _ = event_service.events_since(0)
+        counts = [e["data"]["count"] for e in events if e["type"] == "pending_count"]
+        self.assertEqual(counts, [1])
+
+    def test_log_event_carries_written_row_id(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            audit_service.record(table_name="Table2", action="CREATE", row_id=5, row_details={}, admin_user=self.user)
+        log = models.ActivityLog.objects.get()
+        events, _, _ = event_service.events_since(0)
+        self.assertEqual([e["data"]["id"] for e in events if e["type"] == "log"], [log.pk])
+
+    @override_settings(BROADCAST_MODE="background", BROADCAST_COALESCE_MS=0)
+    def test_background_mode_sequences_on_the_sender_thread(self):
+        threads = []
+        next_seq = event_service._next_seq
+
+        def recording_next_seq():
+            threads.append(threading.current_thread())
+            return next_seq()
+
+        with mock.patch.object(event_service, "_next_seq", recording_next_seq), \
+                mock.patch.object(broadcast_service, "get_channel_layer", return_value=None):
+            event_service._deliver("row", {"table_id": 2})
+            broadcast_service.flush()
+        self.assertEqual([t.name for t in threads], ["broadcast-sender"])
+        events, latest, _ = event_service.events_since(0)
+        self.assertEqual((latest, [e["seq"] for e in events]), (1, [1]))
+
+    @override_settings(EVENTS_RESYNC_MAX=2)
+    def test_resync_endpoint_reports_large_gap(self):
+        for _ in range(3):
+            event_service._deliver("row", {"table_id": 2})
+        self.client.force_login(self.user)
+        body = self.client.get("/dashboard/api/events/", {"since": 0}).json()
+        self.assertEqual((body["seq"], body["complete"], body["events"]), (3, False, []))
+        body = self.client.get("/dashboard/api/events/", {"since": 2}).json()
+        self.assertEqual([e["seq"] for e in body["events"]], [3])
+
+    def test_presence_published_on_first_connect_and_last_disconnect(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            event_service.presence_changed(self.user, True)
+            event_service.presence_changed(self.user, True)
+            event_service.presence_changed(self.user, False)
+            event_service.presence_changed(self.user, False)
+        events, _, _ = event_service.events_since(0)
+        self.assertEqual([e["data"]["online"] for e in events], [True, False])
+
+    def test_topic_permissions(self):
+        other = get_user_model().objects.create_user("staff", password="pass1234")
+        self.assertTrue(event_service.can_subscribe("table:3", user=other))
+        self.assertTrue(event_service.can_subscribe(f"admin:{other.pk}", user=other))
+        self.assertFalse(event_service.can_subscribe(f"admin:{self.user.pk}", user=other))
+        self.assertFalse(event_service.can_subscribe("client:" + "a" * 32, user=other))
+        self.assertTrue(event_service.can_subscribe("client:" + "a" * 32, client_id="a" * 32))
+        self.assertFalse(event_service.can_subscribe("notifications", client_id="a" * 32))
+        self.assertFalse(event_service.can_subscribe("table:11", user=other))
+
+    def test_resync_filters_by_topic(self):
+        event_service._deliver("row", {"table_id": 2})
+        event_service._deliver("row", {"table_id": 3})
+        self.client.force_login(self.user)
+        body = self.client.get("/dashboard/api/events/", {"since": 0, "topics": "table:3"}).json()
+        self.assertEqual([e["topic"] for e in body["events"]], ["table:3"])
+
+    def test_resync_without_topics_is_limited_to_the_users_topics(self):
+        other = get_user_model().objects.create_user("staff", password="pass1234")
+        client_topic = "client:" + "a" * 32
+        for topic in ("notifications", f"admin:{self.user.pk}", f"admin:{other.pk}", client_topic):
+            event_service._deliver("log", {}, topic)
+        self.client.force_login(other)
+        body = self.client.get("/dashboard/api/events/", {"since": 0}).json()
+        self.assertEqual([e["topic"] for e in body["events"]], ["notifications", f"admin:{other.pk}"])
+        self.client.force_login(self.user)
+        body = self.client.get("/dashboard/api/events/", {"since": 0}).json()
+        self.assertEqual(
+            [e["topic"] for e in body["events"]], ["notifications", f"admin:{self.user.pk}", client_topic]
+        )
+
+    async def test_subscribed_socket_receives_only_its_topics(self):
+        communicator = WebsocketCommunicator(NotificationsConsumer.as_asgi(), "/ws/notifications/")
+        communicator.scope["user"] = self.user
+        await communicator.connect()
+        await communicator.receive_json_from()  # hello
+        await communicator.send_json_to({"action": "subscribe", "topics": ["table:4", "table:99"]})
+        reply = await communicator.receive_json_from()
+        self.assertEqual(reply["topics"], sorted(["notifications", f"admin:{self.user.pk}", "table:4"]))
+        await sync_to_async(event_service._deliver)("row", {"table_id": 5})
+        await sync_to_async(event_service._deliver)("row", {"table_id": 4})
+        self.assertEqual((await communicator.receive_json_from())["topic"], "table:4")
+        await communicator.disconnect()
+
+    async def test_socket_says_hello_with_latest_seq(self):
+        communicator = WebsocketCommunicator(NotificationsConsumer.as_asgi(), "/ws/notifications/")
+        communicator.scope["user"] = self.user
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        self.assertEqual(await communicator.receive_json_from(), {"type": "hello", "seq": 0})
+        await communicator.disconnect()
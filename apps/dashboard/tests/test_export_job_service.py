@@ -0,0 +1,92 @@
+import csv
+import io
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.dashboard.models import ExportJob, Table2
+from apps.dashboard.services import export_job_service
+
+
+class ExportJobTests(TestCase):
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        overrides = override_settings(MEDIA_ROOT=media, EXPORT_JOB_MODE="sync")
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.user = get_user_model().objects.create_superuser("root", "root@example.com", "pass1234")
+        self.client.force_login(self.user)
+        for i in range(3):
+            Table2.objects.create(name=f"Artist {i}", city="Pune", phone=f"98765432{i:02d}")
+
+    def _submit(self, **params):
+        with self.captureOnCommitCallbacks(execute=True):
+            resp = self.client.post(reverse("settings_app:export_job_create", args=["csv", 2]), params)
+        return resp
+
+    def test_job_builds_file_and_is_reused(self):
+        resp = self._submit(columns="name")
+        self.assertEqual(resp.status_code, 202)
+        job = ExportJob.objects.get(pk=resp.json()["job"]["job_id"])
+        self.assertEqual((job.status, job.total_rows, job.rows_written), ("done", 3, 3))
+        self.assertEqual(job.size, job.file.size)
+
+        again = self._submit(columns="name").json()["job"]
+        self.assertTrue(again["reused"])
+        self.assertEqual(again["job_id"], str(job.pk))
+        self.assertEqual(ExportJob.objects.count(), 1)
+        self.assertFalse(self._submit(columns="name,city").json()["job"]["reused"])
+
+    def test_jobs_are_scoped_to_their_owner(self):
+        job_id = self._submit(columns="name").json()["job"]["job_id"]
+        staff = get_user_model().objects.create_user("staff", password="pass1234")
+        self.client.force_login(staff)
+        for name in ("export_job_status", "export_job_download"):
+            self.assertEqual(self.client.get(reverse(f"settings_app:{name}", args=[job_id])).status_code, 404)
+        own = self._submit(columns="name").json()["job"]
+        self.assertFalse(own["reused"])
+        self.assertNotEqual(own["job_id"], job_id)
+
+        self.client.force_login(self.user)  # superusers see every job
+        url = reverse("settings_app:export_job_status", args=[own["job_id"]])
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_download_with_range_and_etag(self):
+        job_id = self._submit().json()["job"]["job_id"]
+        url = reverse("settings_app:export_job_download", args=[job_id])
+        full = self.client.get(url)
+        self.assertEqual(full.status_code, 200)
+        body = b"".join(full.streaming_content)
+        rows = list(csv.reader(io.StringIO(body.decode())))
+        self.assertEqual(len(rows), 4)
+
+        etag = full["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        part = self.client.get(url, HTTP_RANGE="bytes=10-", HTTP_IF_RANGE=etag)
+        self.assertEqual(part.status_code, 206)
+        self.assertEqual(part["Content-Range"], f"bytes 10-{len(body) - 1}/{len(body)}")
+        self.assertEqual(b"".join(part.streaming_content), body[10:])
+        stale = self.client.get(url, HTTP_RANGE="bytes=10-", HTTP_IF_RANGE='"old"')
+        self.assertEqual(stale.status_code, 200)
+        self.assertEqual(self.client.get(url, HTTP_RANGE=f"bytes={len(body)}-").status_code, 416)
+
+    def test_parse_range(self):
+        self.assertEqual(export_job_service.parse_range("bytes=0-9", 100), (0, 9))
+        self.assertEqual(export_job_service.parse_range("bytes=-10", 100), (90, 99))
+        self.assertEqual(export_job_service.parse_range("bytes=90-500", 100), (90, 99))
+        self.assertIsNone(export_job_service.parse_range("bytes=0-1,5-6", 100))
+        self.assertIsNone(export_job_service.parse_range("items=0-1", 100))
+        with self.assertRaises(export_job_service.RangeNotSatisfiable):
+            export_job_service.parse_range("bytes=100-", 100)
+
+    def test_purge_expired_removes_file(self):
+        job = ExportJob.objects.get(pk=self._submit().json()["job"]["job_id"])
+        storage, name = job.file.storage, job.file.name
+        ExportJob.objects.filter(pk=job.pk).update(expires_at=job.finished_at)
+        self.assertEqual(export_job_service.purge_expired(), 1)
+        self.assertFalse(storage.exists(name))
+        self.assertFalse(ExportJob.objects.exists())
@@ -0,0 +1,70 @@
+import csv
+import datetime
+import gzip
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.dashboard.models import Table2
+from apps.dashboard.services import export_service
+
+
+class ExportTableTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser("root", "root@example.com", "pass1234")
+        self.client.force_login(self.user)
+        self.rows = [Table2.objects.create(name=f"Artist {i}", city="Pune" if i % 2 else "Goa", phone=f"98765432{i:02d}")
+                     for i in range(5)]
+
+    def _get(self, fmt, **params):
+        return self.client.get(reverse("settings_app:export_table", args=[fmt, 2]), params)
+
+    def _body(self, resp):
+        return b"".join(resp.streaming_content)
+
+    def test_csv_default_columns(self):
+        resp = self._get("csv")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp["Content-Disposition"], "attachment; filename=table2.csv")
+        rows = list(csv.reader(io.StringIO(self._body(resp).decode())))
+        self.assertEqual(rows[0], list(export_service.DEFAULT_COLUMNS))
+        self.assertEqual(len(rows), 6)
+
+    def test_json_with_columns_and_filter(self):
+        resp = self._get("json", columns="unique_id,name", q="Pune")
+        data = json.loads(self._body(resp))
+        self.assertEqual({tuple(d) for d in data}, {("unique_id", "name")})
+        self.assertEqual([d["name"] for d in data], ["Artist 1", "Artist 3"])
+
+    def test_ndjson_gzip_is_chunked(self):
+        with self.settings(EXPORT_CHUNK_SIZE=2):
+            resp = self._get("ndjson", compress="gzip", columns="name")
+            body = gzip.decompress(self._body(resp)).decode()
+        self.assertEqual(resp["Content-Disposition"], "attachment; filename=table2.ndjson.gz")
+        self.assertEqual([json.loads(line)["name"] for line in body.splitlines()], [r.name for r in self.rows])
+
+    def test_date_range(self):
+        old = timezone.now() - datetime.timedelta(days=10)
+        Table2.objects.filter(pk=self.rows[0].pk).update(created_at=old)
+        today = timezone.localdate().isoformat()
+        data = json.loads(self._body(self._get("json", columns="unique_id", date_from=today, date_to=today)))
+        self.assertEqual(len(data), 4)
+        data = json.loads(self._body(self._get("json", columns="unique_id", date_to=old.date().isoformat())))
+        self.assertEqual(data, [{"unique_id": self.rows[0].pk}])
+
+    def test_invalid_requests(self):
+        self.assertEqual(self._get("xml").status_code, 400)
+        self.assertEqual(self._get("csv", columns="name,nope").status_code, 400)
+        self.assertEqual(self._get("csv", date_from="yesterday").status_code, 400)
+        resp = self.client.get(reverse("settings_app:export_table", args=["csv", 1]), {"columns": "password_hash"})
+        self.assertEqual(resp.status_code, 400)
+
+    def test_missing_optional_dependency(self):
+        if export_service.pyarrow is None:
+            self.assertEqual(self._get("parquet").status_code, 501)
+        if export_service.zstandard is None:
+            self.assertEqual(self._get("csv", compress="zstd").status_code, 501)
@@ -0,0 +1,74 @@
+import io
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.dashboard import models
+from apps.dashboard.services import import_service
+
+
+@override_settings(ACTIVITYLOG_WRITE_MODE="sync")
+class ImportServiceTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser("root", "root@example.com", "pass1234")
+
+    def test_csv_upsert_in_batches_with_one_log_per_batch(self):
+        existing = models.Table9.objects.create(name="Old", city="Pune", phone="9000000000")
+        data = (
+            "\ufeffunique_id,name,city,phone\n"
+            f"{existing.pk},New Name,Pune,9000000000\n"
+            ",Asha,Mumbai,9111111111\n"
+            ",Bad1,Mumbai,12\n"
+            ",Ravi,Delhi,9222222222\n"
+        ).encode()
+        with self.captureOnCommitCallbacks(execute=True):
+            result = import_service.run_import(
+                9, import_service.iter_records(io.BytesIO(data), "csv"), user=self.user, batch_size=2,
+            )
+        self.assertEqual((result.total, result.created, result.updated, result.failed), (4, 2, 1, 1))
+        self.assertEqual(result.errors[0]["line"], 4)
+        existing.refresh_from_db()
+        self.assertEqual(existing.name, "New Name")
+        self.assertEqual(models.ActivityLog.objects.filter(action="IMPORT").count(), result.batches)
+        self.assertEqual(result.batches, 2)
+
+    def test_ndjson_reports_bad_lines_and_dry_run_writes_nothing(self):
+        data = b'{"name": "Asha", "city": "Pune", "phone": "9111111111"}\nnot json\n[1]\n'
+        result = import_service.run_import(
+            4, import_service.iter_records(io.BytesIO(data), "ndjson"), user=self.user, dry_run=True,
+        )
+        self.assertEqual((result.created, result.failed), (1, 2))
+        self.assertFalse(models.Table4.objects.exists())
+
+    def test_unreadable_input_keeps_written_batches_and_reports_them(self):
+        data = b"name,city,phone\nAsha,Pune,9111111111\nRavi,Delhi,9222222222\nMeera,Goa,9333333333\n\xff\xfe,x,y\n"
+        self.client.force_login(self.user)
+        upload = SimpleUploadedFile("rows.csv", data)
+        with self.captureOnCommitCallbacks(execute=True):
+            resp = self.client.post(reverse("dashboard:table_import", args=[7]), {"file": upload})
+        self.assertEqual(resp.status_code, 200)
+        body = resp.json()
+        self.assertFalse(body["success"])
+        self.assertIn("Could not read file", body["error"])
+        self.assertEqual(body["created"], 3)
+        self.assertEqual(models.Table7.objects.count(), 3)
+
+    def test_api_and_command(self):
+        self.client.force_login(self.user)
+        upload = SimpleUploadedFile("rows.jsonl", b'{"name": "Asha", "city": "Pune", "phone": "9111111111"}\n')
+        resp = self.client.post(reverse("dashboard:table_import", args=[5]), {"file": upload}).json()
+        self.assertTrue(resp["success"])
+        self.assertEqual(resp["created"], 1)
+        self.assertEqual(self.client.post(reverse("dashboard:table_import", args=[1]), {}).status_code, 400)
+
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w") as fh:
+            fh.write("name,city,phone\nRavi,Delhi,9222222222\n")
+        call_command("import_table_rows", "5", path, "--user", "root", stdout=io.StringIO())
+        self.assertEqual(models.Table5.objects.count(), 2)
@@ -0,0 +1,76 @@
+import datetime
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.dashboard.models import ActivityLog, Client, ClientLog
+from apps.dashboard.services import log_archive_service
+
+
+class LogArchiveTests(TestCase):
+    def setUp(self):
+        archive = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, archive, ignore_errors=True)
+        overrides = override_settings(LOG_ARCHIVE_DIR=archive, ACTIVITYLOG_RETENTION_DAYS=30)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.user = get_user_model().objects.create_superuser("root", "root@example.com", "pass1234")
+        now = timezone.now()
+        self.old = [
+            self._log("Table2", "CREATE", now - datetime.timedelta(days=90), name="Asha Rao"),
+            self._log("Table3", "DELETE", now - datetime.timedelta(days=60), name="Ravi"),
+        ]
+        self.recent = self._log("Table2", "UPDATE", now - datetime.timedelta(days=1), name="Asha Rao")
+
+    def _log(self, table, action, ts, **details):
+        return ActivityLog.objects.create(
+            table_name=table, action=action, row_id=1, row_details=details, timestamp=ts, admin_user=self.user,
+        )
+
+    def test_archive_moves_old_rows_to_monthly_files(self):
+        summary = log_archive_service.archive("activity")
+        self.assertEqual(summary["rows"], 2)
+        self.assertEqual(list(ActivityLog.objects.values_list("pk", flat=True)), [self.recent.pk])
+        months = log_archive_service.archived_months("activity")
+        self.assertEqual(months, sorted({f"{log.timestamp:%Y-%m}" for log in self.old}))
+
+        found = log_archive_service.search_archives("activity", q="asha")
+        self.assertEqual([r["id"] for r in found], [self.old[0].pk])
+        self.assertEqual(found[0]["admin_user__username"], "root")
+        newest_first = log_archive_service.search_archives("activity")
+        self.assertEqual([r["id"] for r in newest_first], [self.old[1].pk, self.old[0].pk])
+        self.assertEqual(log_archive_service.search_archives("activity", action="DELETE")[0]["id"], self.old[1].pk)
+
+    def test_rearchiving_a_month_appends(self):
+        log_archive_service.archive("activity")
+        again = self._log("Table2", "CREATE", self.old[0].timestamp, name="Late")
+        log_archive_service.archive("activity")
+        ids = {r["id"] for r in log_archive_service.search_archives("activity")}
+        self.assertEqual(ids, {self.old[0].pk, self.old[1].pk, again.pk})
+
+    def test_dry_run_and_disabled_retention(self):
+        self.assertEqual(log_archive_service.archive("activity", dry_run=True)["rows"], 2)
+        self.assertEqual(ActivityLog.objects.count(), 3)
+        with self.settings(ACTIVITYLOG_RETENTION_DAYS=0):
+            self.assertEqual(log_archive_service.archive("activity")["rows"], 0)
+
+    def test_client_logs(self):
+        client = Client.objects.create(full_name="Meera", phone="9876500000", password="x")
+        log = ClientLog.objects.create(client=client, action="LOGIN")
+        ClientLog.objects.filter(pk=log.pk).update(timestamp=timezone.now() - datetime.timedelta(days=400))
+        self.assertEqual(log_archive_service.archive("client")["rows"], 1)
+        self.assertFalse(ClientLog.objects.exists())
+        self.assertEqual(log_archive_service.search_archives("client")[0]["log_id"], str(log.pk))
+
+    def test_archive_api(self):
+        log_archive_service.archive("activity")
+        self.client.force_login(self.user)
+        url = reverse("dashboard:logs_archive")
+        data = self.client.get(url, {"table_name": "Table3"}).json()
+        self.assertEqual([r["id"] for r in data["results"]], [self.old[1].pk])
+        self.assertEqual(self.client.get(url, {"date_from": "soon"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"kind": "nope"}).status_code, 400)
@@ -0,0 +1,63 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.dashboard import models
+from apps.dashboard.services import moderation_service
+
+
+@override_settings(ACTIVITYLOG_WRITE_MODE="sync")
+class BulkModerationTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser("root", "root@example.com", "pass1234")
+        self.client.force_login(self.user)
+        self.url = reverse("dashboard:artist_applications_bulk")
+        self.apps = [
+            models.Table6.objects.create(name=f"Artist {c}", city="Pune", phone=f"900000000{i}")
+            for i, c in enumerate("ABC")
+        ]
+        models.Table3.objects.create(name="Artist A", city="Pune", phone="9000000000")
+
+    def test_bulk_approve_reports_outcomes_and_copies_once(self):
+        ids = [a.pk for a in self.apps] + [999999]
+        with self.captureOnCommitCallbacks(execute=True):
+            resp = self.client.post(self.url, {"action": "approve", "ids": ",".join(map(str, ids))})
+        data = resp.json()
+        self.assertTrue(data["success"])
+        self.assertEqual([r["outcome"] for r in data["results"]], ["approved"] * 3 + ["not_found"])
+        self.assertEqual(models.Table6.objects.filter(application_status="approved").count(), 3)
+        self.assertEqual(models.Table3.objects.filter(name__startswith="Artist ").count(), 3)
+        self.assertEqual(models.ActivityLog.objects.filter(table_name="Artist Application").count(), 3)
+
+        again = self.client.post(self.url, {"action": "approve", "ids": [self.apps[0].pk]}).json()
+        self.assertEqual(again["results"], [{"id": self.apps[0].pk, "outcome": "unchanged"}])
+
+    def test_bulk_approve_links_services_to_new_artists(self):
+        service = models.Table5.objects.create(name="Artist B", city="Pune", phone="9000000001")
+        self.assertIsNone(service.artist_id)
+        self.client.post(self.url, {"action": "approve", "ids": [self.apps[1].pk]})
+        service.refresh_from_db()
+        self.assertEqual(service.artist_id, models.Table3.objects.get(name="Artist B").pk)
+
+    def test_allow_reapply_requires_rejected(self):
+        models.Client.objects.create(full_name="B", phone=self.apps[1].phone, password="x")
+        self.client.post(self.url, {"action": "reject", "ids": [self.apps[1].pk]})
+        data = self.client.post(
+            self.url, {"action": "allow_reapply", "ids": [self.apps[0].pk, self.apps[1].pk]},
+        ).json()
+        self.assertEqual([r["outcome"] for r in data["results"]], ["not_rejected", "reapply_allowed"])
+        self.assertTrue(models.Client.objects.get(phone=self.apps[1].phone).allow_reapply)
+
+    def test_filter_scope_and_validation(self):
+        data = self.client.post(
+            self.url, {"action": "reject", "all": "1", "status": "pending"},
+        ).json()
+        self.assertEqual(data["summary"], {"rejected": 3})
+        self.assertEqual(self.client.post(self.url, {"action": "nope", "ids": "1"}).status_code, 400)
+        self.assertEqual(self.client.post(self.url, {"action": "reject"}).status_code, 400)
+        for ids in (5, {"a": 1}):
+            resp = self.client.post(self.url, {"action": "reject", "ids": ids}, content_type="application/json")
+            self.assertEqual(resp.status_code, 400)
+        too_many = [self.apps[0].pk] * (moderation_service.MAX_BULK + 1)
+        resp = self.client.post(self.url, {"action": "reject", "ids": too_many}, content_type="application/json")
+        self.assertEqual(resp.status_code, 400)
@@ -0,0 +1,76 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.dashboard import models
+from apps.dashboard.services import pagination_service
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        # Same created_at for several rows exercises the pk tie-breaker
+        rows = models.Table2.objects.bulk_create(
+            [models.Table2(name=f"Row {i}", city="Pune", phone="1234567890") for i in range(7)]
+        )
+        models.Table2.objects.filter(pk__in=[r.pk for r in rows[:4]]).update(created_at=rows[0].created_at)
+        self.expected = list(models.Table2.objects.order_by("-created_at", "-unique_id").values_list("pk", flat=True))
+
+    def _walk(self, per_page):
+        seen, cursor = [], ""
+        while True:
+            page = pagination_service.keyset_page(
+                models.Table2.objects.all(), order_field="created_at", cursor=cursor, per_page=per_page
+            )
+            seen.extend(r.pk for r in page.object_list)
+            if not page.has_next:
+                return seen, page
+            cursor = page.next_cursor
+
+    def test_forward_walk_covers_every_row_once(self):
+        seen, _ = self._walk(3)
+        self.assertEqual(seen, self.expected)
+
+    def test_prev_cursor_returns_previous_page(self):
+        first = pagination_service.keyset_page(
+            models.Table2.objects.all(), order_field="created_at", cursor="", per_page=3
+        )
+        second = pagination_service.keyset_page(
+            models.Table2.objects.all(), order_field="created_at", cursor=first.next_cursor, per_page=3
+        )
+        back = pagination_service.keyset_page(
+            models.Table2.objects.all(), order_field="created_at", cursor=second.prev_cursor, per_page=3
+        )
+        self.assertEqual([r.pk for r in back.object_list], [r.pk for r in first.object_list])
+        self.assertFalse(back.has_prev)
+
+    def test_invalid_cursor_rejected(self):
+        with self.assertRaises(pagination_service.InvalidCursor):
+            pagination_service.decode_cursor("not-a-cursor")
+
+    def test_api_cursor_mode_skips_count(self):
+        user = get_user_model().objects.create_superuser("root", "root@example.com", "pass1234")
+        self.client.force_login(user)
+        resp = self.client.get("/dashboard/api/table/2/", {"cursor": "", "per_page": 5})
+        body = resp.json()
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual([r["unique_id"] for r in body["results"]], self.expected[:5])
+        self.assertTrue(body["has_next"])
+        self.assertNotIn("total", body)
+        resp = self.client.get("/dashboard/api/table/2/", {"cursor": body["next_cursor"], "count": "estimate"})
+        self.assertEqual(resp.json()["total"], 7)
+        self.assertEqual(self.client.get("/dashboard/api/table/2/", {"cursor": "bogus"}).status_code, 400)
+
+    def test_clients_api_estimates_from_the_clients_counter(self):
+        user = get_user_model().objects.create_superuser("root", "root@example.com", "pass1234")
+        self.client.force_login(user)
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(3):
+                models.Client.objects.create(full_name=f"C{i}", phone=f"987650000{i}", password="x", allow_reapply=i == 0)
+        url = "/dashboard/api/clients/"
+        body = self.client.get(url, {"cursor": "", "count": "estimate"}).json()
+        self.assertEqual((body["total"], body["total_estimated"]), (3, True))
+        models.Client.objects.bulk_create([models.Client(full_name="C3", phone="9876500003", password="x")])
+        self.assertEqual(self.client.get(url, {"cursor": "", "count": "estimate"}).json()["total"], 3)
+        self.assertEqual(self.client.get(url, {"cursor": "", "count": "exact"}).json()["total"], 4)
+        self.assertNotIn("total", self.client.get(url, {"cursor": "", "count": "estimate", "allow_reapply": "1"}).json())
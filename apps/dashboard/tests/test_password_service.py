@@ -0,0 +1,78 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.contrib.auth.hashers import get_hasher
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.dashboard.models import Client
+from apps.dashboard.services import password_service
+
+PASSWORD = "Secret123!"
+
+
+@override_settings(PASSWORD_HASH_WORKERS=0, PASSWORD_HASH_MAX_PENDING=2, FEATURE_CLIENT_AUTH=True)
+class PasswordServiceTests(TestCase):
+    def test_make_and_check_inline(self):
+        encoded = password_service.make(PASSWORD)
+        self.assertTrue(encoded.startswith("pbkdf2_sha256$"))
+        self.assertTrue(password_service.check(PASSWORD, encoded))
+        self.assertFalse(password_service.check("wrong", encoded))
+        self.assertFalse(password_service.check(PASSWORD, password_service.make(None)))
+
+    def test_make_and_check_in_pool(self):
+        try:
+            with self.settings(PASSWORD_HASH_WORKERS=1):
+                encoded = password_service.make(PASSWORD)
+                self.assertTrue(password_service.check(PASSWORD, encoded))
+                self.assertFalse(password_service.check("wrong", encoded))
+        finally:
+            password_service.shutdown()
+        self.assertEqual(password_service.in_flight(), 0)
+
+    def test_full_queue_fails_fast(self):
+        with mock.patch.object(password_service, "_in_flight", 2):
+            with self.assertRaises(password_service.PasswordHashingBusy):
+                password_service.make(PASSWORD)
+
+    def test_timed_out_hash_keeps_its_slot_until_it_finishes(self):
+        done = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            with self.settings(PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_TIMEOUT=0.05), \
+                    mock.patch.object(password_service, "_executor", return_value=pool):
+                with self.assertRaises(password_service.PasswordHashingBusy):
+                    password_service._run(done.wait)
+                self.assertEqual(password_service.in_flight(), 1)
+        finally:
+            done.set()
+            pool.shutdown(wait=True)
+        self.assertEqual(password_service.in_flight(), 0)
+
+    def test_login_upgrades_old_work_factor(self):
+        hasher = get_hasher("default")
+        old = hasher.encode(PASSWORD, hasher.salt(), iterations=1000)
+        client = Client.objects.create(full_name="Meera", phone="9876500000", password=old, status="Active")
+        resp = self.client.post(
+            reverse("client_portal:client_api_login"),
+            {"identifier": "9876500000", "password": PASSWORD},
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        )
+        self.assertTrue(resp.json()["ok"])
+        client.refresh_from_db()
+        self.assertNotEqual(client.password, old)
+        self.assertFalse(hasher.must_update(client.password))
+        self.assertTrue(password_service.check(PASSWORD, client.password))
+
+    def test_login_returns_503_when_busy(self):
+        Client.objects.create(full_name="Meera", phone="9876500000", password="pbkdf2_sha256$1000$s$x", status="Active")
+        with mock.patch.object(password_service, "_in_flight", 2):
+            resp = self.client.post(
+                reverse("client_portal:client_api_login"),
+                {"identifier": "9876500000", "password": PASSWORD},
+                HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+            )
+        self.assertEqual(resp.status_code, 503)
+        self.assertEqual(resp["Retry-After"], "5")
+        self.assertFalse(resp.json()["ok"])
@@ -0,0 +1,92 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from apps.dashboard.models import Table2
+from apps.dashboard.services import query_budget_service
+
+
+@override_settings(
+    QUERY_METRICS_FLUSH_INTERVAL=0, QUERY_BUDGET_DEFAULT=0, QUERY_REPEAT_THRESHOLD=5, QUERY_BUDGET_HEADERS=False,
+)
+class QueryBudgetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        query_budget_service._known_views.clear()
+        query_budget_service._pending.clear()
+        self.user = get_user_model().objects.create_superuser("root", "root@example.com", "pass1234")
+        self.client.force_login(self.user)
+        for i in range(6):
+            Table2.objects.create(name=f"Artist {i}", city="Pune", phone=f"98765432{i:02d}")
+
+    def test_shape_folds_literals_and_in_lists(self):
+        self.assertEqual(
+            query_budget_service.shape('SELECT  "t"."id" FROM "dashboard_table2" WHERE id IN (%s, %s, %s) LIMIT 21'),
+            'SELECT "t"."id" FROM "dashboard_table2" WHERE id IN (...) LIMIT ?',
+        )
+        self.assertEqual(
+            query_budget_service.shape("SELECT 1 FROM t WHERE name = 'a'"),
+            query_budget_service.shape("SELECT 2 FROM t WHERE name = 'b'"),
+        )
+
+    def test_repeated_shape_is_reported(self):
+        with query_budget_service.track() as stats:
+            for obj in Table2.objects.all():
+                Table2.objects.get(pk=obj.pk)
+        self.assertEqual(stats.count, 7)
+        request = RequestFactory().get("/x")
+        with self.assertLogs("performance.queries", "WARNING") as logs:
+            result = query_budget_service.finish(request, stats)
+        self.assertEqual(result["repeated"], 6)
+        self.assertIn('"event": "query_budget"', logs.output[0])
+
+    def test_budget_breach_header_log_and_metrics(self):
+        url = reverse("dashboard:get_table_data", args=[2])
+        self.assertNotIn("X-Query-Budget", self.client.get(url))
+        with self.settings(QUERY_BUDGETS={"dashboard:get_table_data": 1}):
+            with self.assertLogs("performance.queries", "WARNING"):
+                resp = self.client.get(url + "?page=2")
+        self.assertTrue(resp["X-Query-Budget"].startswith("exceeded; queries="))
+        self.assertIn("budget=1", resp["X-Query-Budget"])
+
+        body = self.client.get(reverse("metrics")).content.decode()
+        self.assertIn('flodo_requests_total{view="dashboard:get_table_data"} 2', body)
+        self.assertIn('flodo_budget_exceeded_total{view="dashboard:get_table_data"} 1', body)
+        self.assertIn("# TYPE flodo_queries_total counter", body)
+
+    def test_interleaved_flushes_keep_every_view(self):
+        real_cache = query_budget_service.cache
+
+        class InterleavingCache:
+            """Runs another worker's flush right after this worker's first cache read."""
+            interleaved = False
+
+            def __getattr__(self, name):
+                method = getattr(real_cache, name)
+                if name not in ("get", "add") or InterleavingCache.interleaved:
+                    return method
+
+                def first_read(*args, **kwargs):
+                    InterleavingCache.interleaved = True
+                    value = method(*args, **kwargs)
+                    with mock.patch.object(query_budget_service, "cache", real_cache), \
+                            mock.patch.object(query_budget_service, "_known_views", set()):
+                        query_budget_service.flush({("requests", "other"): 1})
+                    return value
+                return first_read
+
+        with mock.patch.object(query_budget_service, "cache", InterleavingCache()):
+            query_budget_service.flush({("requests", "mine"): 1})
+        query_budget_service._known_views.clear()  # a worker re-registering a view is a no-op
+        query_budget_service.flush({("requests", "mine"): 1})
+        self.assertEqual(query_budget_service.snapshot()["requests"], {"mine": 2, "other": 1})
+
+    def test_metrics_access(self):
+        self.client.logout()
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 403)
+        with self.settings(METRICS_TOKEN="s3cret"):
+            self.assertEqual(self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer nope").status_code, 403)
+            self.assertEqual(self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer s3cret").status_code, 200)
@@ -0,0 +1,79 @@
+import threading
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from apps.authentication import views as auth_views
+from apps.dashboard.services import rate_limit_service
+from django_admin_project import health
+
+
+class RateLimitServiceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_parse_rate(self):
+        self.assertEqual(rate_limit_service.parse_rate("5/m"), (5, 60))
+        self.assertEqual(rate_limit_service.parse_rate("100/15m"), (100, 900))
+        with self.assertRaises(ValueError):
+            rate_limit_service.parse_rate("5 per minute")
+
+    def test_fixed_window_rejects_over_limit(self):
+        decisions = [rate_limit_service.hit("t", "1.2.3.4", "3/m") for _ in range(4)]
+        self.assertEqual([d.allowed for d in decisions], [True, True, True, False])
+        self.assertGreater(decisions[-1].retry_after, 0)
+        self.assertTrue(rate_limit_service.hit("t", "5.6.7.8", "3/m").allowed)
+        with self.settings(RATE_LIMIT_ENABLED=False):
+            self.assertTrue(rate_limit_service.hit("t", "1.2.3.4", "3/m").allowed)
+
+    def test_incr_is_atomic_across_threads(self):
+        def worker():
+            for _ in range(50):
+                rate_limit_service.incr("rl:test:counter", timeout=60)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(cache.get("rl:test:counter"), 400)
+
+    def test_client_ip_trusts_only_configured_proxies(self):
+        request = RequestFactory().get("/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="6.6.6.6, 1.2.3.4")
+        self.assertEqual(rate_limit_service.client_ip(request), "10.0.0.1")
+        with self.settings(RATE_LIMIT_TRUSTED_PROXIES=1):
+            self.assertEqual(rate_limit_service.client_ip(request), "1.2.3.4")
+
+    @override_settings(FEATURE_CLIENT_AUTH=True)
+    def test_middleware_rejects_before_any_query(self):
+        url = reverse("client_portal:client_api_login")
+        payload = {"identifier": "9876500000", "password": "Secret123!"}
+        for _ in range(5):
+            self.assertEqual(self.client.post(url, payload, HTTP_X_REQUESTED_WITH="XMLHttpRequest").status_code, 401)
+        with self.assertNumQueries(0):
+            resp = self.client.post(url, payload, HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+        self.assertEqual(resp.status_code, 429)
+        self.assertFalse(resp.json()["ok"])
+        self.assertGreater(int(resp["Retry-After"]), 0)
+        # GETs are not counted
+        self.assertEqual(self.client.get(url).status_code, 405)
+
+    def test_decorator_enforces_without_middleware(self):
+        factory = RequestFactory()
+        statuses = {health.csp_report(factory.post("/csp-report/", "{}", content_type="application/json")).status_code
+                    for _ in range(60)}
+        self.assertEqual(statuses, {204})
+        self.assertEqual(health.csp_report(factory.post("/csp-report/")).status_code, 429)
+
+    def test_otp_attempts_are_counted_atomically(self):
+        user = User.objects.create_user("root", "root@example.com", "pass1234")
+        payload = auth_views._store_otp(user, attempts=3)
+        for _ in range(3):
+            self.assertEqual(auth_views._verify_otp(user, "wrong")[1], "invalid")
+        self.assertEqual(auth_views._verify_otp(user, payload["code"]), (False, "locked"))
+
+        payload = auth_views._store_otp(user, attempts=3)
+        self.assertEqual(auth_views._verify_otp(user, payload["code"]), (True, "ok"))
+        self.assertEqual(auth_views._verify_otp(user, payload["code"]), (False, "expired"))
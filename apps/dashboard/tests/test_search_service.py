@@ -0,0 +1,60 @@
+from django.db import connection
+from django.test import TestCase
+
+from apps.dashboard import models
+from apps.dashboard.services import search_service
+
+
+class SearchServiceTests(TestCase):
+    def setUp(self):
+        self.ravi = models.Table2.objects.create(name="Ravi Kumar", city="Pune", phone="9876543210")
+        self.asha = models.Table2.objects.create(name="Asha", city="Mumbai", phone="9123456780")
+
+    def _search(self, q, fields=("name", "city", "phone")):
+        qs = models.Table2.objects.filter(search_service.search_q(models.Table2, q, fields))
+        return sorted(qs.values_list("name", flat=True))
+
+    def test_backend_is_indexed_on_sqlite(self):
+        self.assertEqual(search_service.backend(), "fts5")
+
+    def test_substring_case_insensitive(self):
+        self.assertEqual(self._search("UNE"), ["Ravi Kumar"])
+        self.assertEqual(self._search("umba"), ["Asha"])
+
+    def test_field_restriction(self):
+        self.assertEqual(self._search("pune", fields=("name",)), [])
+
+    def test_phone_digits(self):
+        self.assertEqual(self._search("98765 43210"), ["Ravi Kumar"])
+        self.assertEqual(self._search("91"), ["Asha"])  # short digit query: prefix match
+
+    def test_digit_folding_only_applies_to_phone(self):
+        models.Table2.objects.create(name="Batch 2024-01", city="Pune", phone="9000000000")
+        models.Table2.objects.create(name="Batch 202401", city="Pune", phone="9000000001")
+        self.assertEqual(self._search("2024-01"), ["Batch 2024-01"])
+        self.assertEqual(self._search("2024-01", fields=("name",)), ["Batch 2024-01"])
+        self.assertEqual(self._search("+91-2345"), ["Asha"])
+
+    def test_index_follows_update_and_delete(self):
+        self.ravi.city = "Nagpur"
+        self.ravi.save()
+        self.assertEqual(self._search("pune"), [])
+        self.assertEqual(self._search("nagp"), ["Ravi Kumar"])
+        self.ravi.delete()
+        self.assertEqual(self._search("nagp"), [])
+
+    def test_client_uuid_rows(self):
+        client = models.Client.objects.create(full_name="Meera", phone="+919000000001", password="x", location="Goa")
+        cond = search_service.search_q(models.Client, "meer")
+        self.assertEqual(list(models.Client.objects.filter(cond).values_list("full_name", flat=True)), ["Meera"])
+        client.delete()
+        self.assertFalse(models.Client.objects.filter(cond).exists())
+        self.assertEqual(search_service.rebuild(models.Client), 0)
+
+    def test_client_rows_survive_rowid_renumbering(self):
+        models.Client.objects.create(full_name="Meera", phone="9000000001", password="x")
+        models.Client.objects.create(full_name="Nisha", phone="9000000002", password="x")
+        with connection.cursor() as cur:  # what VACUUM may do to a table without an INTEGER PRIMARY KEY
+            cur.execute("UPDATE dashboard_client SET rowid = 1000 - rowid")
+        cond = search_service.search_q(models.Client, "meer")
+        self.assertEqual(list(models.Client.objects.filter(cond).values_list("full_name", flat=True)), ["Meera"])
@@ -0,0 +1,36 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.dashboard import models
+from apps.dashboard.services import stats_service
+
+
+class StatsServiceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_compute_counts_single_query(self):
+        models.Table2.objects.create(name="A", city="B", phone="1")
+        with self.assertNumQueries(1):
+            counts = stats_service.compute_counts()
+        self.assertEqual(counts[2], 1)
+        self.assertEqual(counts[3], 0)
+        self.assertIn(stats_service.LOGS_KEY, counts)
+
+    def test_snapshot_served_from_cache_and_adjusted_on_commit(self):
+        stats_service.get_counts()
+        with self.assertNumQueries(0):
+            self.assertEqual(stats_service.get_counts()[4], 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            row = models.Table4.objects.create(name="A", city="B", phone="1")
+        self.assertEqual(stats_service.get_counts()[4], 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            row.delete()
+        self.assertEqual(stats_service.get_counts()[4], 0)
+
+    def test_reconcile_fixes_drift(self):
+        stats_service.get_counts()
+        models.Table5.objects.bulk_create([models.Table5(name="A", city="B", phone="1")])
+        self.assertEqual(stats_service.get_counts()[5], 0)
+        self.assertEqual(stats_service.reconcile()[5], 1)
+        self.assertEqual(stats_service.get_counts()[5], 1)
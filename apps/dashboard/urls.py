@@ -8,15 +8,21 @@ urlpatterns = [
     path("tables/", views.tables_view, name="tables"),
     path("artist-applications/", views.artist_applications_view, name="artist_applications"),
     path("api/artist-applications/pending_count/", views.artist_applications_pending_count, name="artist_applications_pending_count"),
+    path("api/artist-applications/rejected/", views.artist_applications_rejected_api, name="artist_applications_rejected"),
+    path("api/artist-applications/bulk/", views.artist_applications_bulk_api, name="artist_applications_bulk"),
+    path("api/artist-applications/<int:app_id>/certificates/", views.artist_application_certificates_api, name="artist_application_certificates"),
     path("artist-applications/<int:app_id>/approve/", views.artist_application_approve_view, name="artist_application_approve"),
     path("artist-applications/<int:app_id>/reject/", views.artist_application_reject_view, name="artist_application_reject"),
     # Allow reapply (strictly for rejected application only) and per-client override
     path("artist-applications/<int:app_id>/allow-reapply/", views.artist_application_allow_reapply_view, name="artist_application_allow_reapply"),
     path("api/table/<int:table_id>/", views.get_table_data, name="get_table_data"),
     path("api/table/<int:table_id>/row/", views.table_crud_api, name="create_row"),
+    path("api/table/<int:table_id>/import/", views.table_import_api, name="table_import"),
     path("api/table/<int:table_id>/row/<int:row_id>/", views.table_crud_api, name="row_ops"),
     path("api/table/config/", views.update_table_config, name="update_table_config"),
     path("api/logs/", views.get_logs, name="get_logs"),
+    path("api/logs/archive/", views.logs_archive_api, name="logs_archive"),
+    path("api/events/", views.events_since_api, name="events_since"),
     # Admin Management routes
     path("Admin_management/", views.admin_mgmt_view, name="admin_mgmt"),
     path("api/admins/", views.admin_list_create_api, name="admin_list_create"),
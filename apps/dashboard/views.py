@@ -1,6 +1,7 @@
 from typing import Dict, Any, Type
 import json  # added: to serialize label map for templates
 import re
+import time
 from datetime import timedelta  # added: for recent highlight window
 from django.conf import settings  # added: feature flags
 from django.contrib.auth.decorators import login_required
@@ -10,18 +11,30 @@ from django.db.models import Q  # added: for combined OR filtering across multip
 from django.forms.models import model_to_dict
 from django.http import JsonResponse, HttpRequest, HttpResponseForbidden
 from django.shortcuts import render, redirect
+from django.urls import reverse
 from django.views.decorators.csrf import csrf_protect, ensure_csrf_cookie, csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.utils import timezone  # reused: timezone-aware now()
+from django.utils.dateparse import parse_date
 from django.contrib.auth.models import User  # added: manage Django users for Admin Management
-from django.contrib.auth.hashers import make_password  # added: secure password hashing
-from asgiref.sync import async_to_sync  # added: Channels sync bridge for broadcasting
-from channels.layers import get_channel_layer  # added: obtain channel layer (Redis)
 
+from asgiref.sync import sync_to_async
+from . import decorators  # login_required / require_http_methods for async views
 from . import models
-from apps.settings_app.models import AppSettings
+from apps.settings_app.services import settings_service
 from apps.authentication.models import AdminProfile, SuperAdmin  # added: use AdminProfile for roles
 from apps.dashboard.services import admin_service  # added: centralize admin business logic
+from apps.dashboard.services import audit_service  # write-behind ActivityLog pipeline
+from apps.dashboard.services import stats_service  # cached overview counts
+from apps.dashboard.services import pagination_service  # opt-in keyset (cursor) pagination
+from apps.dashboard.services import search_service  # indexed live search (FTS5 / pg_trgm)
+from apps.dashboard.services import event_service  # sequenced push events + resync
+from apps.dashboard.services import broadcast_service  # after-commit, off-thread channel-layer sends
+from apps.dashboard.services import moderation_service  # bulk approve / reject / allow-reapply
+from apps.dashboard.services import import_service  # batched CSV / NDJSON row import
+from apps.dashboard.services import log_archive_service  # log retention / archive search
+from apps.dashboard.services import etag_service  # change-counter ETags for the polled lists
+from apps.dashboard.services import password_service  # pooled, bounded password hashing
 from apps.dashboard.models import Client  # added: portal clients for Clients page
 
 TABLE_MODEL_MAP: Dict[int, Type[models.BaseTable]] = {i: getattr(models, f"Table{i}") for i in range(1, 11)}
@@ -41,6 +54,17 @@ def _humanize_table_name(db_table: str) -> str:
 
 TABLE_LABELS: Dict[int, str] = {i: _humanize_table_name(TABLE_MODEL_MAP[i]._meta.db_table) for i in range(1, 11)}
 
+# Column projections for the artist applications page: the card grid renders these
+# fields (templates/dashboard/artist_applications.html), the rejected section fewer.
+APPLICATION_CARD_FIELDS = (
+    "unique_id", "name", "city", "phone", "email", "created_at", "application_status",
+    "approved", "approved_at", "artist_application_id", "years_experience", "gender", "dob",
+    "profile_picture", "specialization", "instagram_url", "instagram_username",
+    "beauty_studio_location", "additional_notes", "reapply_reason", "verified_badge",
+    "supporting_details", "approval_admin__username", "client__full_name", "user__username",
+)
+REJECTED_ROW_FIELDS = ("unique_id", "name", "email", "phone", "city", "years_experience", "created_at")
+
 
 def _validate_payload(name: str, city: str, phone: str) -> tuple[bool, str]:
     name = (name or "").strip()
@@ -100,6 +124,13 @@ def _safe_table1_details(obj, password_changed: bool | None = None) -> dict:  #
     return d  # added
 
 
+def _hashing_busy() -> JsonResponse:
+    """503 + Retry-After when the password hashing queue is full (see password_service)."""
+    resp = JsonResponse({"success": False, "error": "Server busy. Please retry in a few seconds."}, status=503)
+    resp["Retry-After"] = "5"
+    return resp
+
+
 @login_required
 @ensure_csrf_cookie  # ensure CSRF cookie is present for subsequent AJAX POSTs
 @require_http_methods(["GET"])  # Overview dashboard: lightweight stats only (no heavy CRUD tables)
@@ -110,14 +141,15 @@ def dashboard_view(request: HttpRequest):
     # Build compact stats for an overview experience to keep dashboard light.
     # We reuse TABLE_MODEL_MAP to avoid any duplication and to keep changes minimal.
     table_ids = list(range(1, 11))  # list once to reuse in template
-    # Count rows for each table to surface quick stats; executed server-side for simplicity.
-    table_counts = {i: TABLE_MODEL_MAP[i].objects.count() for i in table_ids}  # per-table counts
+    # Counts come from the cached stats snapshot (one cache read; rebuilt in one query on miss).
+    counts = stats_service.get_counts()
+    table_counts = {i: counts.get(i, 0) for i in table_ids}  # per-table counts
     total_rows = sum(table_counts.values())  # overall total across all tables
     # Prepare a template-friendly list of dicts to avoid custom template filters
     # Include human-friendly label for each table id so templates can display labels instead of "Table N"  # added
     table_stats = [{"id": i, "count": table_counts[i], "label": TABLE_LABELS.get(i, f"Table {i}")} for i in table_ids]  # added
     # ActivityLog is shown only as a number here; detailed logs remain on their own flows.
-    recent_logs_count = models.ActivityLog.objects.count()  # unchanged: count only
+    recent_logs_count = counts.get(stats_service.LOGS_KEY, 0)  # count only
 
     # Optional default log filter for UI chips (e.g., ?logs_table=Client or Admin)  # added
     logs_table_filter = (request.GET.get("logs_table") or "").strip()
@@ -190,9 +222,12 @@ def tables_view(request: HttpRequest):
     return resp
 
 
-@login_required
-@require_http_methods(["GET"])  # pagination, search
-def get_table_data(request: HttpRequest, table_id: int):
+@decorators.login_required
+@decorators.require_http_methods(["GET"])  # pagination, search
+@etag_service.conditional(
+    lambda request, table_id: [etag_service.table(table_id)], lambda: settings_service.records_per_page(10),
+)
+async def get_table_data(request: HttpRequest, table_id: int):
     # Zero-impact: enforce super-admin only when feature flag is enabled
     if getattr(settings, "FEATURE_ENFORCE_ADMIN_API_PERMS", False):
         if not _is_super_admin(request.user):
@@ -209,7 +244,8 @@ def get_table_data(request: HttpRequest, table_id: int):
     q = request.GET.get("q", "").strip()
     qs = Model.objects.all().order_by("-created_at")  # unchanged ordering (preserve sorting)
     if q:  # added
-        cond = Q(name__icontains=q) | Q(city__icontains=q) | Q(phone__icontains=q)  # added: case-insensitive across text fields
+        # case-insensitive across text fields, index-backed (may probe the search schema once, hence sync)
+        cond = await sync_to_async(search_service.search_q)(Model, q, ("name", "city", "phone"))
         if q.isdigit():  # added: allow numeric match against primary key unique_id
             try:
                 cond = cond | Q(unique_id=int(q))  # added
@@ -218,25 +254,20 @@ def get_table_data(request: HttpRequest, table_id: int):
         qs = qs.filter(cond)  # added
 
     # Pagination (default from AppSettings if not provided)
-    default_pp = 10
-    try:
-        latest = AppSettings.objects.order_by("-updated_at").first()
-        if latest and int(latest.records_per_page) > 0:
-            default_pp = int(latest.records_per_page)
-    except Exception:
-        pass
+    default_pp = await sync_to_async(settings_service.records_per_page)(10)
     per_page = int(request.GET.get("per_page") or default_pp)
-    paginator = Paginator(qs, per_page)
-    page_obj = paginator.get_page(request.GET.get("page") or 1)
-
-    data = [model_to_dict(obj) for obj in page_obj.object_list]
-    return JsonResponse({
-        "success": True,
-        "results": data,
-        "page": page_obj.number,
-        "num_pages": paginator.num_pages,
-        "total": paginator.count,
-    })
+    # Opt-in keyset mode (?cursor=): no OFFSET scan and no COUNT(*) unless ?count= asks for one
+    if pagination_service.is_cursor_request(request):
+        try:
+            kp = await pagination_service.akeyset_page(
+                qs, order_field="created_at", cursor=request.GET.get("cursor"), per_page=per_page,
+                count=request.GET.get("count"), stats_key=table_id, filtered=bool(q),
+            )
+        except pagination_service.InvalidCursor as e:
+            return JsonResponse({"success": False, "error": str(e)}, status=400)
+        return JsonResponse(kp.envelope([model_to_dict(obj) for obj in kp.object_list]))
+    page = await pagination_service.aoffset_page(qs, per_page, request.GET.get("page") or 1)
+    return JsonResponse(page.envelope([model_to_dict(obj) for obj in page.object_list]))
 
 
 
@@ -273,7 +304,12 @@ def admin_mgmt_view(request: HttpRequest):
 @login_required
 @ensure_csrf_cookie  # send csrftoken cookie on GET list responses
 @require_http_methods(["GET", "POST"])  # list or create
+# "status" (online within 15 minutes of updated_at) ages without a write, hence the minute bucket.
+@etag_service.conditional(
+    [etag_service.table(1)], lambda: settings_service.records_per_page(20), lambda: int(time.time() // 60),
+)
 @transaction.atomic
+@audit_service.suppress_signal_audit()  # view writes its own audit rows
 def admin_list_create_api(request: HttpRequest):
     # In development, allow disabling strict super-admin enforcement via feature flag
     if getattr(settings, "FEATURE_ENFORCE_ADMIN_API_PERMS", False):
@@ -287,21 +323,26 @@ def admin_list_create_api(request: HttpRequest):
         # Performance: avoid N+1 on role_approvedby when iterating
         qs = Model.objects.select_related("role_approvedby").all().order_by("-created_at")
         if q:
-            qs = qs.filter(Q(name__icontains=q) | Q(city__icontains=q) | Q(phone__icontains=q))
+            qs = qs.filter(search_service.search_q(Model, q, ("name", "city", "phone")))
 
         # Optional pagination (non-breaking): only paginate when client requests it
         page_param = request.GET.get("page")
         per_page_param = request.GET.get("per_page")
         page_obj = None
-        if page_param or per_page_param:
+        keyset = None
+        if pagination_service.is_cursor_request(request):
+            try:
+                keyset = pagination_service.keyset_page(
+                    qs, order_field="created_at", cursor=request.GET.get("cursor"),
+                    per_page=int(per_page_param or 20), count=request.GET.get("count"),
+                    stats_key=1, filtered=bool(q),
+                )
+            except ValueError:  # bad cursor (InvalidCursor) or per_page
+                return JsonResponse({"success": False, "error": "Invalid cursor."}, status=400)
+            qs_iter = keyset.object_list
+        elif page_param or per_page_param:
             try:
-                default_pp = 20
-                try:
-                    latest = AppSettings.objects.order_by("-updated_at").first()
-                    if latest and int(latest.records_per_page) > 0:
-                        default_pp = int(latest.records_per_page)
-                except Exception:
-                    pass
+                default_pp = settings_service.records_per_page(20)
                 per_page = int(per_page_param or default_pp)
                 paginator = Paginator(qs, per_page)
                 page_number = int(page_param or 1)
@@ -342,6 +383,8 @@ def admin_list_create_api(request: HttpRequest):
                 "updated_at": obj.updated_at.isoformat() if getattr(obj, "updated_at", None) else None,
             })
 
+        if keyset is not None:
+            return JsonResponse(keyset.envelope(data))
         # If paginated, return DRF-like envelope for compatibility with existing client
         if page_obj is not None:
             return JsonResponse({
@@ -371,9 +414,11 @@ def admin_list_create_api(request: HttpRequest):
         )
     except ValueError as e:
         return JsonResponse({"success": False, "error": str(e)}, status=400)
+    except password_service.PasswordHashingBusy:
+        return _hashing_busy()
 
     try:
-        models.ActivityLog.objects.create(
+        audit_service.record(
             table_name=TABLE_LABELS.get(1, Model.__name__),
             action="CREATE",
             row_id=obj.unique_id,
@@ -384,22 +429,20 @@ def admin_list_create_api(request: HttpRequest):
         pass
     # Broadcast (non-blocking; failure is ignored)
     try:
-        layer = get_channel_layer()
-        if layer:
-            async_to_sync(layer.group_send)(
-                "notifications",
-                {
-                    "type": "notify",
-                    "payload": {
-                        "table_name": TABLE_LABELS.get(1, Model.__name__),
-                        "action": "CREATE",
-                        "row_id": obj.unique_id,
-                        "row_details": safe_details,
-                        "admin_user": request.user.username,
-                        "timestamp": timezone.now().isoformat(),
-                    },
+        broadcast_service.send(
+            "notifications",
+            {
+                "type": "notify",
+                "payload": {
+                    "table_name": TABLE_LABELS.get(1, Model.__name__),
+                    "action": "CREATE",
+                    "row_id": obj.unique_id,
+                    "row_details": safe_details,
+                    "admin_user": request.user.username,
+                    "timestamp": timezone.now().isoformat(),
                 },
-            )
+            },
+        )
     except Exception:
         pass
     return JsonResponse({
@@ -427,6 +470,7 @@ def admin_list_create_api(request: HttpRequest):
 @ensure_csrf_cookie  # send csrftoken cookie on GET detail (if any future GET) and consistent responses
 @require_http_methods(["PUT", "DELETE", "POST"])  # support _method override via POST
 @transaction.atomic
+@audit_service.suppress_signal_audit()  # view writes its own audit rows
 def admin_detail_api(request: HttpRequest, user_id: int):
     # In development, allow disabling strict super-admin enforcement via feature flag
     if getattr(settings, "FEATURE_ENFORCE_ADMIN_API_PERMS", False):
@@ -464,13 +508,15 @@ def admin_detail_api(request: HttpRequest, user_id: int):
                 return JsonResponse({"success": False, "error": "Password must be 12+ chars and include upper, lower, digit, and symbol."}, status=400)
             # Persist to Table1.password_hash using Django's hasher
             try:
-                u.password_hash = make_password(new_password)
+                u.password_hash = password_service.make(new_password)
                 u.save(update_fields=["password_hash", "updated_at"])  # updated_at auto-updates
+            except password_service.PasswordHashingBusy:
+                return _hashing_busy()
             except Exception:
                 return JsonResponse({"success": False, "error": "Failed to update password."}, status=500)
             # Activity log
             try:
-                models.ActivityLog.objects.create(
+                audit_service.record(
                     table_name=TABLE_LABELS.get(1, Model.__name__),
                     action="RESET_PASSWORD",
                     row_id=u.pk,
@@ -481,22 +527,20 @@ def admin_detail_api(request: HttpRequest, user_id: int):
                 pass
             # Broadcast
             try:
-                layer = get_channel_layer()
-                if layer:
-                    async_to_sync(layer.group_send)(
-                        "notifications",
-                        {
-                            "type": "notify",
-                            "payload": {
-                                "table_name": TABLE_LABELS.get(1, Model.__name__),
-                                "action": "RESET_PASSWORD",
-                                "row_id": u.pk,
-                                "row_details": _safe_table1_details(u),
-                                "admin_user": request.user.username,
-                                "timestamp": timezone.now().isoformat(),
-                            },
+                broadcast_service.send(
+                    "notifications",
+                    {
+                        "type": "notify",
+                        "payload": {
+                            "table_name": TABLE_LABELS.get(1, Model.__name__),
+                            "action": "RESET_PASSWORD",
+                            "row_id": u.pk,
+                            "row_details": _safe_table1_details(u),
+                            "admin_user": request.user.username,
+                            "timestamp": timezone.now().isoformat(),
                         },
-                    )
+                    },
+                )
             except Exception:
                 pass
             return JsonResponse({"success": True, "data": {"id": u.pk, "password_updated_at": timezone.now().isoformat()}})
@@ -504,7 +548,7 @@ def admin_detail_api(request: HttpRequest, user_id: int):
             # Persist pause via service and log safely
             safe_details = admin_service.pause_admin(obj=u)
             try:
-                models.ActivityLog.objects.create(
+                audit_service.record(
                     table_name=TABLE_LABELS.get(1, Model.__name__),
                     action="PAUSE",
                     row_id=u.pk,
@@ -515,22 +559,20 @@ def admin_detail_api(request: HttpRequest, user_id: int):
                 pass
             # Broadcast
             try:
-                layer = get_channel_layer()
-                if layer:
-                    async_to_sync(layer.group_send)(
-                        "notifications",
-                        {
-                            "type": "notify",
-                            "payload": {
-                                "table_name": TABLE_LABELS.get(1, Model.__name__),
-                                "action": "PAUSE",
-                                "row_id": u.pk,
-                                "row_details": safe_details,
-                                "admin_user": request.user.username,
-                                "timestamp": timezone.now().isoformat(),
-                            },
+                broadcast_service.send(
+                    "notifications",
+                    {
+                        "type": "notify",
+                        "payload": {
+                            "table_name": TABLE_LABELS.get(1, Model.__name__),
+                            "action": "PAUSE",
+                            "row_id": u.pk,
+                            "row_details": safe_details,
+                            "admin_user": request.user.username,
+                            "timestamp": timezone.now().isoformat(),
                         },
-                    )
+                    },
+                )
             except Exception:
                 pass
             return JsonResponse({"success": True, "data": {"id": u.pk, "is_active": u.is_active}})
@@ -548,7 +590,7 @@ def admin_detail_api(request: HttpRequest, user_id: int):
         except ValueError as e:
             return JsonResponse({"success": False, "error": str(e)}, status=400)
         try:
-            models.ActivityLog.objects.create(
+            audit_service.record(
                 table_name=TABLE_LABELS.get(1, Model.__name__),
                 action="UPDATE",
                 row_id=u.pk,
@@ -559,22 +601,20 @@ def admin_detail_api(request: HttpRequest, user_id: int):
             pass
         # Broadcast
         try:
-            layer = get_channel_layer()
-            if layer:
-                async_to_sync(layer.group_send)(
-                    "notifications",
-                    {
-                        "type": "notify",
-                        "payload": {
-                            "table_name": TABLE_LABELS.get(1, Model.__name__),
-                            "action": "UPDATE",
-                            "row_id": u.pk,
-                            "row_details": safe_details,
-                            "admin_user": request.user.username,
-                            "timestamp": timezone.now().isoformat(),
-                        },
+            broadcast_service.send(
+                "notifications",
+                {
+                    "type": "notify",
+                    "payload": {
+                        "table_name": TABLE_LABELS.get(1, Model.__name__),
+                        "action": "UPDATE",
+                        "row_id": u.pk,
+                        "row_details": safe_details,
+                        "admin_user": request.user.username,
+                        "timestamp": timezone.now().isoformat(),
                     },
-                )
+                },
+            )
         except Exception:
             pass
         return JsonResponse({"success": True, "data": {"id": u.pk, "password_updated_at": timezone.now().isoformat() if password_changed else None}})
@@ -584,7 +624,7 @@ def admin_detail_api(request: HttpRequest, user_id: int):
         uid = u.pk
         u.delete()
         try:
-            models.ActivityLog.objects.create(
+            audit_service.record(
                 table_name=TABLE_LABELS.get(1, Model.__name__),
                 action="DELETE",
                 row_id=uid,
@@ -595,22 +635,20 @@ def admin_detail_api(request: HttpRequest, user_id: int):
             pass
         # Broadcast
         try:
-            layer = get_channel_layer()
-            if layer:
-                async_to_sync(layer.group_send)(
-                    "notifications",
-                    {
-                        "type": "notify",
-                        "payload": {
-                            "table_name": TABLE_LABELS.get(1, Model.__name__),
-                            "action": "DELETE",
-                            "row_id": uid,
-                            "row_details": details,
-                            "admin_user": request.user.username,
-                            "timestamp": timezone.now().isoformat(),
-                        },
+            broadcast_service.send(
+                "notifications",
+                {
+                    "type": "notify",
+                    "payload": {
+                        "table_name": TABLE_LABELS.get(1, Model.__name__),
+                        "action": "DELETE",
+                        "row_id": uid,
+                        "row_details": details,
+                        "admin_user": request.user.username,
+                        "timestamp": timezone.now().isoformat(),
                     },
-                )
+                },
+            )
         except Exception:
             pass
         return JsonResponse({"success": True})
@@ -650,18 +688,17 @@ def artist_applications_view(request: HttpRequest):
         applications = applications.filter(application_status=status)
     city = (request.GET.get("city") or "").strip()
     if city:
-        applications = applications.filter(city__icontains=city)
+        applications = applications.filter(search_service.search_q(Model, city, ("city",)))
     q = (request.GET.get("q") or "").strip()
     if q:
-        from django.db.models import Q
-        applications = applications.filter(
-            Q(name__icontains=q) | Q(email__icontains=q) | Q(phone__icontains=q)
-        )
+        applications = applications.filter(search_service.search_q(Model, q, ("name", "email", "phone")))
 
+    # Cards need the certificate count only; the files themselves are fetched per
+    # application when a preview/details modal opens (artist_application_certificates_api).
     applications = (
         applications
-        .select_related("approval_admin")
-        .prefetch_related("certificates")
+        .select_related("approval_admin", "client", "user")
+        .only(*APPLICATION_CARD_FIELDS)
         .annotate(cert_count=Count("certificates"))
         .order_by("-created_at")
     )
@@ -675,15 +712,14 @@ def artist_applications_view(request: HttpRequest):
     # Lightweight counts for header chips
     total = paginator.count
 
-    # Separate rejected list (full, non-paginated) for the bottom section
-    rejected_qs = models.Table6.objects.filter(application_status="rejected").select_related("approval_admin").prefetch_related("certificates").annotate(cert_count=Count("certificates")).order_by("-created_at")
-    rejected_count = rejected_qs.count()
+    # Rejected section rows are loaded lazily from artist_applications_rejected_api;
+    # the header chip only needs the (indexed) count.
+    rejected_count = Model.objects.filter(application_status="rejected").count()
 
     ctx: Dict[str, Any] = {
         "applications": applications_page.object_list,
         "page_obj": applications_page,
         "total": total,
-        "rejected_applications": list(rejected_qs),
         "rejected_count": rejected_count,
         "table_label": TABLE_LABELS.get(6, "Artist Application"),
         "filters": {"status": status, "city": city, "q": q, "per_page": per_page},
@@ -692,8 +728,74 @@ def artist_applications_view(request: HttpRequest):
 
 
 @login_required
-@require_http_methods(["GET"])  # read-only
-def artist_applications_pending_count(request: HttpRequest):
+@require_http_methods(["GET"])  # rejected section, cursor-paginated
+def artist_applications_rejected_api(request: HttpRequest):
+    """Rejected applications for the "Rejected applicants" section, newest first.
+
+    Keyset pages of ``?per_page=`` rows (default 20); follow ``next_cursor`` via ``?cursor=``.
+    Rows carry the certificate count only.
+    """
+    if not _is_super_admin(request.user):
+        return JsonResponse({"success": False, "error": "Forbidden"}, status=403)
+    from django.db.models import Count
+    qs = (
+        models.Table6.objects.filter(application_status="rejected")
+        .only(*REJECTED_ROW_FIELDS)
+        .annotate(cert_count=Count("certificates"))
+    )
+    try:
+        kp = pagination_service.keyset_page(
+            qs, order_field="created_at", cursor=request.GET.get("cursor"),
+            per_page=int(request.GET.get("per_page") or 20), count=request.GET.get("count"),
+        )
+    except ValueError:  # bad cursor (InvalidCursor) or per_page
+        return JsonResponse({"success": False, "error": "Invalid cursor."}, status=400)
+    results = [{
+        "id": a.unique_id,
+        "name": a.name,
+        "email": a.email,
+        "phone": a.phone,
+        "city": a.city,
+        "years_experience": a.years_experience,
+        "cert_count": a.cert_count,
+        "created_at": a.created_at.isoformat() if a.created_at else None,
+        "allow_reapply_url": reverse("dashboard:artist_application_allow_reapply", args=[a.unique_id]),
+    } for a in kp.object_list]
+    return JsonResponse(kp.envelope(results))
+
+
+@login_required
+@require_http_methods(["GET"])  # per-application certificate files
+def artist_application_certificates_api(request: HttpRequest, app_id: int):
+    """Files attached to one application, loaded when its preview/details modal opens."""
+    if not _is_super_admin(request.user):
+        return JsonResponse({"success": False, "error": "Forbidden"}, status=403)
+    if not models.Table6.objects.filter(pk=app_id).exists():
+        return JsonResponse({"success": False, "error": "Application not found"}, status=404)
+    certs = (
+        models.ArtistApplicationCertificate.objects.filter(application_id=app_id)
+        .only("id", "file", "category", "description", "external_url")
+        .order_by("id")
+    )
+    results = []
+    for c in certs:
+        try:
+            url = c.file.url if c.file else (c.external_url or "")
+        except Exception:
+            url = c.external_url or ""
+        results.append({
+            "id": c.id,
+            "name": c.file.name if c.file else (c.description or ""),
+            "url": url,
+            "category": c.category,
+            "is_image": url.lower().split("?")[0].endswith((".png", ".jpg", ".jpeg", ".webp")),
+        })
+    return JsonResponse({"success": True, "results": results})
+
+
+@decorators.login_required
+@decorators.require_http_methods(["GET"])  # read-only
+async def artist_applications_pending_count(request: HttpRequest):
     """Return precise count of pending/under-review artist applications.
 
     This keeps the sidebar badge accurate without changing any existing UI or routes.
@@ -705,7 +807,7 @@ def artist_applications_pending_count(request: HttpRequest):
 
     Model = models.Table6
     try:
-        cnt = Model.objects.filter(application_status__in=["pending", "under_review"]).count()
+        cnt = await Model.objects.filter(application_status__in=["pending", "under_review"]).acount()
     except Exception:
         cnt = 0
     return JsonResponse({"success": True, "count": int(cnt)})
@@ -724,9 +826,10 @@ def clients_view(request: HttpRequest):
     return render(request, template_name, {})
 
 
-@login_required
-@require_http_methods(["GET"])  # list with pagination and search
-def clients_list_api(request: HttpRequest):
+@decorators.login_required
+@decorators.require_http_methods(["GET"])  # list with pagination and search
+@etag_service.conditional([etag_service.CLIENTS], lambda: settings_service.records_per_page(10))
+async def clients_list_api(request: HttpRequest):
     if getattr(settings, "FEATURE_ENFORCE_ADMIN_API_PERMS", False):
         if not _is_super_admin(request.user):
             return JsonResponse({"success": False, "error": "Forbidden"}, status=403)
@@ -734,29 +837,35 @@ def clients_list_api(request: HttpRequest):
     q = (request.GET.get("q") or "").strip()
     qs = Client.objects.all().order_by("-created_at")
     # Optional filter: allow_reapply=1 to fetch clients with override enabled (for count chip)
+    reapply_only = False
     try:
         if (request.GET.get("allow_reapply") or "").strip() in ("1", "true", "True"):
             qs = qs.filter(allow_reapply=True)
+            reapply_only = True
     except Exception:
         pass
     if q:
-        cond = Q(full_name__icontains=q) | Q(phone__icontains=q) | Q(email__icontains=q) | Q(location__icontains=q)
+        cond = await sync_to_async(search_service.search_q)(Client, q, ("full_name", "phone", "email", "location"))
         qs = qs.filter(cond)
 
     # Pagination (fallback to AppSettings.records_per_page)
-    default_pp = 10
-    try:
-        latest = AppSettings.objects.order_by("-updated_at").first()
-        if latest and int(latest.records_per_page) > 0:
-            default_pp = int(latest.records_per_page)
-    except Exception:
-        pass
+    default_pp = await sync_to_async(settings_service.records_per_page)(10)
     per_page = int(request.GET.get("per_page") or default_pp)
-    paginator = Paginator(qs, per_page)
-    page_obj = paginator.get_page(request.GET.get("page") or 1)
+    if pagination_service.is_cursor_request(request):
+        try:
+            page = await pagination_service.akeyset_page(
+                qs, order_field="created_at", cursor=request.GET.get("cursor"), per_page=per_page,
+                count=request.GET.get("count"), stats_key=stats_service.CLIENTS_KEY,
+                filtered=bool(q or reapply_only),
+            )
+        except pagination_service.InvalidCursor as e:
+            return JsonResponse({"success": False, "error": str(e)}, status=400)
+    else:
+        page = await pagination_service.aoffset_page(qs, per_page, request.GET.get("page") or 1)
+    rows = page.object_list
 
     results = []
-    for c in page_obj.object_list:
+    for c in rows:
         results.append({
             "client_id": str(c.client_id),
             "full_name": c.full_name,
@@ -767,13 +876,7 @@ def clients_list_api(request: HttpRequest):
             "allow_reapply": bool(getattr(c, "allow_reapply", False)),
             "created_at": c.created_at.isoformat() if c.created_at else None,
         })
-    return JsonResponse({
-        "success": True,
-        "results": results,
-        "page": page_obj.number,
-        "num_pages": paginator.num_pages,
-        "total": paginator.count,
-    })
+    return JsonResponse(page.envelope(results))
 
 
 @login_required
@@ -797,7 +900,8 @@ def artist_application_approve_view(request: HttpRequest, app_id: int):
         app.approved_at = _tz.now()
     except Exception:
         pass
-    app.save(update_fields=["approved", "application_status", "approval_admin", "approved_at", "updated_at"])
+    with audit_service.suppress_signal_audit():  # audited explicitly below
+        app.save(update_fields=["approved", "application_status", "approval_admin", "approved_at", "updated_at"])
 
     # Copy into Verified Artist (Table3) if not already present
     ModelVA = models.Table3
@@ -806,7 +910,7 @@ def artist_application_approve_view(request: HttpRequest, app_id: int):
 
     # Log and broadcast
     try:
-        models.ActivityLog.objects.create(
+        audit_service.record(
             table_name=TABLE_LABELS.get(6, "Artist Application"),
             action="UPDATE",
             row_id=app.pk,
@@ -822,22 +926,20 @@ def artist_application_approve_view(request: HttpRequest, app_id: int):
     except Exception:
         pass
     try:
-        layer = get_channel_layer()
-        if layer:
-            async_to_sync(layer.group_send)(
-                "notifications",
-                {
-                    "type": "notify",
-                    "payload": {
-                        "table_name": TABLE_LABELS.get(6, "Artist Application"),
-                        "action": "APPROVE",
-                        "row_id": app.pk,
-                        "row_details": {"name": app.name, "city": app.city, "phone": app.phone},
-                        "admin_user": request.user.username,
-                        "timestamp": timezone.now().isoformat(),
-                    },
+        broadcast_service.send(
+            "notifications",
+            {
+                "type": "notify",
+                "payload": {
+                    "table_name": TABLE_LABELS.get(6, "Artist Application"),
+                    "action": "APPROVE",
+                    "row_id": app.pk,
+                    "row_details": {"name": app.name, "city": app.city, "phone": app.phone},
+                    "admin_user": request.user.username,
+                    "timestamp": timezone.now().isoformat(),
                 },
-            )
+            },
+        )
     except Exception:
         pass
 
@@ -845,6 +947,48 @@ def artist_application_approve_view(request: HttpRequest, app_id: int):
     return redirect("dashboard:artist_applications")
 
 
+@login_required
+@csrf_protect
+@require_http_methods(["POST"])  # bulk approve / reject / allow-reapply
+def artist_applications_bulk_api(request: HttpRequest):
+    """Moderate many applications in one request (see ``moderation_service``).
+
+    Form or JSON body: ``action`` (approve | reject | allow_reapply) and either
+    ``ids`` (repeated, comma-separated or a JSON list) or the page filters
+    ``status``/``city``/``q`` with ``all=1``. Returns per-row outcomes.
+    """
+    if not _is_super_admin(request.user):
+        return JsonResponse({"success": False, "error": "Forbidden"}, status=403)
+    if (request.content_type or "").startswith("application/json"):
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError:
+            return JsonResponse({"success": False, "error": "Invalid JSON body."}, status=400)
+        if not isinstance(data, dict):
+            return JsonResponse({"success": False, "error": "Invalid JSON body."}, status=400)
+        ids = data.get("ids") or []
+        if isinstance(ids, str):
+            ids = ids.split(",")
+        elif not isinstance(ids, list):
+            return JsonResponse({"success": False, "error": "ids must be a list or a string."}, status=400)
+        get = lambda k: str(data.get(k) or "").strip()
+    else:
+        ids = [i for raw in request.POST.getlist("ids") for i in raw.split(",")]
+        get = lambda k: (request.POST.get(k) or "").strip()
+    action = get("action").lower()
+    if action not in moderation_service.ACTIONS:
+        return JsonResponse({"success": False, "error": "Unknown action."}, status=400)
+    if not ids and get("all") in ("1", "true", "True"):
+        ids = moderation_service.filtered_ids(status=get("status").lower(), city=get("city"), q=get("q"))
+    if not ids:
+        return JsonResponse({"success": False, "error": "No applications selected."}, status=400)
+    try:
+        out = moderation_service.bulk_moderate(action, ids, request.user)
+    except ValueError as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+    return JsonResponse({"success": True, **out})
+
+
 @login_required
 @csrf_protect
 @require_http_methods(["POST"])  # Strictly allow reapply for rejected application only
@@ -875,7 +1019,7 @@ def artist_application_allow_reapply_view(request: HttpRequest, app_id: int):
     # Audit log for each affected client
     for c in updated_clients:
         try:
-            models.ActivityLog.objects.create(
+            audit_service.record(
                 table_name=TABLE_LABELS.get(9, "Client"),
                 action="UPDATE",
                 row_id=c.pk if hasattr(c, "pk") else None,
@@ -886,21 +1030,19 @@ def artist_application_allow_reapply_view(request: HttpRequest, app_id: int):
             pass
     # Broadcast WS notification for each client so their session can refresh availability
     try:
-        layer = get_channel_layer()
-        if layer:
-            for c in updated_clients:
-                async_to_sync(layer.group_send)(
-                    "notifications",
-                    {
-                        "type": "notify",
-                        "payload": {
-                            "event": "reapply_toggle",
-                            "client_id": str(c.client_id),
-                            "allow": True,
-                            "timestamp": timezone.now().isoformat(),
-                        },
+        for c in updated_clients:
+            broadcast_service.send(
+                event_service.group_for(f"client:{c.client_id}"),  # only that client's sockets
+                {
+                    "type": "notify",
+                    "payload": {
+                        "event": "reapply_toggle",
+                        "client_id": str(c.client_id),
+                        "allow": True,
+                        "timestamp": timezone.now().isoformat(),
                     },
-                )
+                },
+            )
     except Exception:
         pass
     return redirect("dashboard:artist_applications")
@@ -925,7 +1067,7 @@ def client_allow_reapply_api(request: HttpRequest, client_id):
     c.save(update_fields=["allow_reapply", "updated_at"])
     # Audit log
     try:
-        models.ActivityLog.objects.create(
+        audit_service.record(
             table_name=TABLE_LABELS.get(9, "Client"),
             action="UPDATE",
             row_id=c.pk if hasattr(c, "pk") else None,
@@ -936,20 +1078,18 @@ def client_allow_reapply_api(request: HttpRequest, client_id):
         pass
     # Broadcast
     try:
-        layer = get_channel_layer()
-        if layer:
-            async_to_sync(layer.group_send)(
-                "notifications",
-                {
-                    "type": "notify",
-                    "payload": {
-                        "event": "reapply_toggle",
-                        "client_id": str(c.client_id),
-                        "allow": bool(allow),
-                        "timestamp": timezone.now().isoformat(),
-                    },
+        broadcast_service.send(
+            event_service.group_for(f"client:{c.client_id}"),  # only that client's sockets
+            {
+                "type": "notify",
+                "payload": {
+                    "event": "reapply_toggle",
+                    "client_id": str(c.client_id),
+                    "allow": bool(allow),
+                    "timestamp": timezone.now().isoformat(),
                 },
-            )
+            },
+        )
     except Exception:
         pass
     return JsonResponse({"success": True, "client_id": str(c.client_id), "allow_reapply": c.allow_reapply})
@@ -971,11 +1111,12 @@ def artist_application_reject_view(request: HttpRequest, app_id: int):
     app.approved = False
     app.application_status = "rejected"
     app.approval_admin = request.user
-    app.save(update_fields=["approved", "application_status", "approval_admin", "updated_at"])
+    with audit_service.suppress_signal_audit():  # audited explicitly below
+        app.save(update_fields=["approved", "application_status", "approval_admin", "updated_at"])
 
     # Log and broadcast
     try:
-        models.ActivityLog.objects.create(
+        audit_service.record(
             table_name=TABLE_LABELS.get(6, "Artist Application"),
             action="UPDATE",
             row_id=app.pk,
@@ -989,30 +1130,61 @@ def artist_application_reject_view(request: HttpRequest, app_id: int):
     except Exception:
         pass
     try:
-        layer = get_channel_layer()
-        if layer:
-            async_to_sync(layer.group_send)(
-                "notifications",
-                {
-                    "type": "notify",
-                    "payload": {
-                        "table_name": TABLE_LABELS.get(6, "Artist Application"),
-                        "action": "REJECT",
-                        "row_id": app.pk,
-                        "row_details": {"name": app.name},
-                        "admin_user": request.user.username,
-                        "timestamp": timezone.now().isoformat(),
-                    },
+        broadcast_service.send(
+            "notifications",
+            {
+                "type": "notify",
+                "payload": {
+                    "table_name": TABLE_LABELS.get(6, "Artist Application"),
+                    "action": "REJECT",
+                    "row_id": app.pk,
+                    "row_details": {"name": app.name},
+                    "admin_user": request.user.username,
+                    "timestamp": timezone.now().isoformat(),
                 },
-            )
+            },
+        )
     except Exception:
         pass
 
     return redirect("dashboard:artist_applications")
+
+
+@login_required
+@csrf_protect
+@require_http_methods(["POST"])  # bulk import / upsert (CSV, JSON Lines, NDJSON)
+def table_import_api(request: HttpRequest, table_id: int):
+    """Stream an uploaded ``file`` into Table<table_id> (2..10) via ``import_service``.
+
+    ``format`` (csv | jsonl | ndjson) defaults to the file extension; ``dry_run=1``
+    validates without writing. Progress is pushed as ``import_progress`` events on
+    the caller's ``admin:<id>`` topic; the response carries the final summary. If the
+    file stops being readable part-way, the batches before that point stay written and
+    the summary comes back with ``success: false`` and ``error``.
+    """
+    if getattr(settings, "FEATURE_ENFORCE_ADMIN_API_PERMS", False):
+        if not _is_super_admin(request.user):
+            return JsonResponse({"success": False, "error": "Forbidden"}, status=403)
+    if table_id not in import_service.TABLE_IDS:
+        return JsonResponse({"success": False, "error": "Invalid table id."}, status=400)
+    upload = request.FILES.get("file")
+    if upload is None:
+        return JsonResponse({"success": False, "error": "file is required."}, status=400)
+    fmt = (request.POST.get("format") or "").strip().lower() or import_service.guess_format(upload.name, upload.content_type)
+    if fmt not in import_service.FORMATS:
+        return JsonResponse({"success": False, "error": "Unsupported format."}, status=400)
+    dry_run = (request.POST.get("dry_run") or "").strip() in ("1", "true", "True")
+    result = import_service.run_import(
+        table_id, import_service.iter_records(upload, fmt), user=request.user, dry_run=dry_run,
+    )
+    return JsonResponse({"success": result.error is None, "dry_run": dry_run, **result.as_dict()})
+
+
 @login_required
 @csrf_protect
 @require_http_methods(["POST", "PUT", "DELETE"])  # CRUD via AJAX
 @transaction.atomic
+@audit_service.suppress_signal_audit()  # view writes its own audit rows
 def table_crud_api(request: HttpRequest, table_id: int, row_id: int | None = None):
     # Zero-impact: enforce super-admin only when feature flag is enabled
     if getattr(settings, "FEATURE_ENFORCE_ADMIN_API_PERMS", False):
@@ -1041,7 +1213,7 @@ def table_crud_api(request: HttpRequest, table_id: int, row_id: int | None = Non
         )
         # Log CREATE
         try:
-            models.ActivityLog.objects.create(
+            audit_service.record(
                 table_name=TABLE_LABELS.get(table_id, Model.__name__),  # added: log human label without changing DB schema
                 action="CREATE",
                 row_id=obj.pk,
@@ -1052,22 +1224,20 @@ def table_crud_api(request: HttpRequest, table_id: int, row_id: int | None = Non
             pass
         # Broadcast
         try:
-            layer = get_channel_layer()
-            if layer:
-                async_to_sync(layer.group_send)(
-                    "notifications",
-                    {
-                        "type": "notify",
-                        "payload": {
-                            "table_name": TABLE_LABELS.get(table_id, Model.__name__),
-                            "action": "CREATE",
-                            "row_id": obj.pk,
-                            "row_details": model_to_dict(obj),
-                            "admin_user": request.user.username,
-                            "timestamp": timezone.now().isoformat(),
-                        },
+            broadcast_service.send(
+                "notifications",
+                {
+                    "type": "notify",
+                    "payload": {
+                        "table_name": TABLE_LABELS.get(table_id, Model.__name__),
+                        "action": "CREATE",
+                        "row_id": obj.pk,
+                        "row_details": model_to_dict(obj),
+                        "admin_user": request.user.username,
+                        "timestamp": timezone.now().isoformat(),
                     },
-                )
+                },
+            )
         except Exception:
             pass
         return JsonResponse({"success": True, "data": model_to_dict(obj)})
@@ -1094,7 +1264,7 @@ def table_crud_api(request: HttpRequest, table_id: int, row_id: int | None = Non
         obj.save()
         # Log UPDATE
         try:
-            models.ActivityLog.objects.create(
+            audit_service.record(
                 table_name=TABLE_LABELS.get(table_id, Model.__name__),  # added
                 action="UPDATE",
                 row_id=obj.pk,
@@ -1105,22 +1275,20 @@ def table_crud_api(request: HttpRequest, table_id: int, row_id: int | None = Non
             pass
         # Broadcast
         try:
-            layer = get_channel_layer()
-            if layer:
-                async_to_sync(layer.group_send)(
-                    "notifications",
-                    {
-                        "type": "notify",
-                        "payload": {
-                            "table_name": TABLE_LABELS.get(table_id, Model.__name__),
-                            "action": "UPDATE",
-                            "row_id": obj.pk,
-                            "row_details": model_to_dict(obj),
-                            "admin_user": request.user.username,
-                            "timestamp": timezone.now().isoformat(),
-                        },
+            broadcast_service.send(
+                "notifications",
+                {
+                    "type": "notify",
+                    "payload": {
+                        "table_name": TABLE_LABELS.get(table_id, Model.__name__),
+                        "action": "UPDATE",
+                        "row_id": obj.pk,
+                        "row_details": model_to_dict(obj),
+                        "admin_user": request.user.username,
+                        "timestamp": timezone.now().isoformat(),
                     },
-                )
+                },
+            )
         except Exception:
             pass
         return JsonResponse({"success": True, "data": model_to_dict(obj)})
@@ -1131,7 +1299,7 @@ def table_crud_api(request: HttpRequest, table_id: int, row_id: int | None = Non
         pk = obj.pk
         obj.delete()
         try:
-            models.ActivityLog.objects.create(
+            audit_service.record(
                 table_name=TABLE_LABELS.get(table_id, Model.__name__),  # added
                 action="DELETE",
                 row_id=pk,
@@ -1142,22 +1310,20 @@ def table_crud_api(request: HttpRequest, table_id: int, row_id: int | None = Non
             pass
         # Broadcast
         try:
-            layer = get_channel_layer()
-            if layer:
-                async_to_sync(layer.group_send)(
-                    "notifications",
-                    {
-                        "type": "notify",
-                        "payload": {
-                            "table_name": TABLE_LABELS.get(table_id, Model.__name__),
-                            "action": "DELETE",
-                            "row_id": pk,
-                            "row_details": details,
-                            "admin_user": request.user.username,
-                            "timestamp": timezone.now().isoformat(),
-                        },
+            broadcast_service.send(
+                "notifications",
+                {
+                    "type": "notify",
+                    "payload": {
+                        "table_name": TABLE_LABELS.get(table_id, Model.__name__),
+                        "action": "DELETE",
+                        "row_id": pk,
+                        "row_details": details,
+                        "admin_user": request.user.username,
+                        "timestamp": timezone.now().isoformat(),
                     },
-                )
+                },
+            )
         except Exception:
             pass
         return JsonResponse({"success": True})
@@ -1187,16 +1353,34 @@ def update_table_config(request: HttpRequest):
     return JsonResponse({"success": True, "config": cfg})
 
 
-@require_http_methods(["GET"])  # logs
-def get_logs(request: HttpRequest):
+@decorators.require_http_methods(["GET"])  # logs
+@etag_service.conditional([etag_service.LOGS])
+async def get_logs(request: HttpRequest):
     # Return JSON 401 for unauthenticated AJAX callers to avoid 302 redirects breaking polling UIs
-    if not request.user.is_authenticated:
+    if not await decorators.is_authenticated(request):
         return JsonResponse({"success": False, "error": "Authentication required"}, status=401)
     per_page = int(request.GET.get("per_page") or 20)
     page = int(request.GET.get("page") or 1)
     qs = models.ActivityLog.objects.select_related("admin_user").all()
-    paginator = Paginator(qs, per_page)
-    page_obj = paginator.get_page(page)
+    # Optional exact filters, served by the (table_name, timestamp) / (action, ...) indexes
+    table_name = (request.GET.get("table_name") or "").strip()
+    action = (request.GET.get("action") or "").strip().upper()
+    if table_name:
+        qs = qs.filter(table_name=table_name)
+    if action:
+        qs = qs.filter(action=action)
+    if pagination_service.is_cursor_request(request):
+        try:
+            result = await pagination_service.akeyset_page(
+                qs, order_field="timestamp", cursor=request.GET.get("cursor"), per_page=per_page,
+                count=request.GET.get("count"), stats_key=stats_service.LOGS_KEY,
+                filtered=bool(table_name or action),
+            )
+        except pagination_service.InvalidCursor as e:
+            return JsonResponse({"success": False, "error": str(e)}, status=400)
+    else:
+        result = await pagination_service.aoffset_page(qs, per_page, page)
+    rows = result.object_list
     data = [
         {
             "id": x.pk,
@@ -1212,12 +1396,75 @@ def get_logs(request: HttpRequest):
             "timestamp": x.timestamp.isoformat(),
             "admin_user": x.admin_user.username,
         }
-        for x in page_obj.object_list
+        for x in rows
     ]
+    return JsonResponse(result.envelope(data))
+
+
+@require_http_methods(["GET"])  # archived logs (read on demand)
+def logs_archive_api(request: HttpRequest):
+    """Search log rows moved out of the database by ``manage.py archive_logs``.
+
+    ``?kind=activity|client&q=&table_name=&action=&date_from=YYYY-MM-DD&date_to=YYYY-MM-DD&limit=``;
+    results are newest first. Only the archive months in the date range are read.
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({"success": False, "error": "Authentication required"}, status=401)
+    kind = request.GET.get("kind") or "activity"
+    if kind not in log_archive_service.KINDS:
+        return JsonResponse({"success": False, "error": "Unknown kind."}, status=400)
+    try:
+        date_from = _parse_day(request.GET.get("date_from"))
+        date_to = _parse_day(request.GET.get("date_to"))
+        limit = int(request.GET.get("limit") or 100)
+    except ValueError:
+        return JsonResponse({"success": False, "error": "Invalid date or limit."}, status=400)
+    results = log_archive_service.search_archives(
+        kind,
+        q=request.GET.get("q") or "",
+        table_name=(request.GET.get("table_name") or "").strip(),
+        action=(request.GET.get("action") or "").strip().upper(),
+        date_from=date_from,
+        date_to=date_to,
+        limit=limit,
+    )
     return JsonResponse({
         "success": True,
-        "results": data,
-        "page": page_obj.number,
-        "num_pages": paginator.num_pages,
-        "total": paginator.count,
+        "results": results,
+        "months": log_archive_service.archived_months(kind),
     })
+
+
+def _parse_day(raw):
+    """``YYYY-MM-DD`` -> date; empty -> None; anything else raises ValueError."""
+    if not raw:
+        return None
+    day = parse_date(raw)
+    if day is None:
+        raise ValueError(raw)
+    return day
+
+
+@require_http_methods(["GET"])  # push-event resync
+def events_since_api(request: HttpRequest):
+    """Replay push events after ``?since=<seq>`` for a reconnecting socket,
+    limited to ``?topics=a,b`` (the socket's subscriptions) or, without it, to every
+    topic the user may subscribe to.
+
+    ``complete`` is false when the gap is too large or entries expired; the client
+    should then reload its views instead of applying the partial list.
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({"success": False, "error": "Authentication required"}, status=401)
+    try:
+        since = int(request.GET.get("since") or 0)
+    except (TypeError, ValueError):
+        return JsonResponse({"success": False, "error": "Invalid since."}, status=400)
+    if request.GET.get("topics"):
+        wanted = [t.strip().lower() for t in request.GET["topics"].split(",")]
+        topics = [t for t in wanted if event_service.can_subscribe(t, user=request.user)]
+    else:
+        topics = event_service.subscribable_topics(request.user)
+    events, latest, complete = event_service.events_since(since, topics)
+    events = [e for e in events if event_service.can_subscribe(e.get("topic"), user=request.user)]
+    return JsonResponse({"success": True, "events": events, "seq": latest, "complete": complete})
@@ -5,3 +5,7 @@ class SettingsAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.settings_app"
     verbose_name = "Settings"
+
+    def ready(self):
+        # AppSettings receivers that invalidate the cached settings snapshot.
+        from .services import settings_service  # noqa: F401
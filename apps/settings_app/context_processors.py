@@ -1,13 +1,14 @@
-from .models import AppSettings
 from django.conf import settings
 
+from .services import settings_service
+
 def app_settings(request):
-    # Provide app settings to all templates
+    # Provide app settings to all templates (cached snapshot: no query per render)
     try:
-        s = AppSettings.objects.select_related("updated_by").order_by("-updated_at").first()
+        s = settings_service.get()
         return {
-            "APP_NAME": s.app_name if s else "Admin Dashboard",
-            "APP_RECORDS_PER_PAGE": (s.records_per_page if s else 10),
+            "APP_NAME": s.app_name,
+            "APP_RECORDS_PER_PAGE": s.per_page(10),
             # Expose GA id to templates for optional GA snippet
             "GA_GTAG_ID": getattr(settings, "GOOGLE_ANALYTICS_GTAG_PROPERTY_ID", ""),
         }
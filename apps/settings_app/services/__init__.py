@@ -0,0 +1 @@
+# Package marker for apps.settings_app.services
@@ -0,0 +1,123 @@
+"""
+Cached, read-only view of the current ``AppSettings`` row.
+
+The template context processor and every paginated view read settings through
+``get()`` instead of ``AppSettings.objects.order_by("-updated_at").first()``.
+
+- The snapshot is held in process memory, tagged with the version it was loaded at.
+- A version token lives in the shared cache. Reads compare it (one cache ``get``, no
+  query) and reload from the database only when it has changed.
+- ``AppSettings`` post_save/post_delete bump the version after commit, so every
+  process picks up the change on its next read.
+
+Settings edit forms still load the model instance directly.
+"""
+from __future__ import annotations
+import logging
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.settings_app.models import AppSettings
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "appsettings:version"
+DEFAULT_APP_NAME = "Admin Dashboard"
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    app_name: str = DEFAULT_APP_NAME
+    timezone: str = "UTC"
+    records_per_page: Optional[int] = None  # None: no AppSettings row yet
+    enable_notifications: bool = True
+
+    def per_page(self, default: int) -> int:
+        """Configured page size, or ``default`` when unset or not positive."""
+        try:
+            if self.records_per_page is not None and int(self.records_per_page) > 0:
+                return int(self.records_per_page)
+        except (TypeError, ValueError):
+            pass
+        return default
+
+
+_lock = threading.Lock()
+_local: Optional[SettingsSnapshot] = None
+_local_version: Optional[str] = None
+
+
+def _shared_version() -> Optional[str]:
+    try:
+        version = cache.get(VERSION_KEY)
+        if version is None:
+            cache.add(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+            version = cache.get(VERSION_KEY)
+        return version
+    except Exception:
+        return None
+
+
+def load() -> SettingsSnapshot:
+    """Read the latest ``AppSettings`` row from the database."""
+    row = AppSettings.objects.order_by("-updated_at").first()
+    if row is None:
+        return SettingsSnapshot()
+    return SettingsSnapshot(
+        app_name=row.app_name or DEFAULT_APP_NAME,
+        timezone=row.timezone or "UTC",
+        records_per_page=row.records_per_page,
+        enable_notifications=bool(row.enable_notifications),
+    )
+
+
+def get() -> SettingsSnapshot:
+    """Current settings; a database query only after a change or on a cold process."""
+    global _local, _local_version
+    version = _shared_version()
+    with _lock:
+        if _local is not None and (version is None or version == _local_version):
+            # version None: shared cache unavailable, keep serving the last snapshot.
+            return _local
+    try:
+        snapshot = load()
+    except Exception:
+        logger.exception("Failed to load AppSettings")
+        return _local or SettingsSnapshot()
+    with _lock:
+        _local = snapshot
+        _local_version = version
+    return snapshot
+
+
+def records_per_page(default: int) -> int:
+    try:
+        return get().per_page(default)
+    except Exception:
+        return default
+
+
+def invalidate() -> None:
+    """Drop this process's snapshot and move every process to a new version."""
+    global _local, _local_version
+    with _lock:
+        _local = None
+        _local_version = None
+    try:
+        cache.set(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    except Exception:
+        logger.exception("Failed to bump AppSettings version")
+
+
+@receiver(post_save, sender=AppSettings, dispatch_uid="settings_service_saved")
+@receiver(post_delete, sender=AppSettings, dispatch_uid="settings_service_deleted")
+def _on_settings_changed(sender, instance, **_kwargs):
+    # After commit: a reader between save and commit would otherwise cache the old row.
+    transaction.on_commit(invalidate)
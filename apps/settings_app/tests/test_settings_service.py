@@ -0,0 +1,35 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.settings_app.models import AppSettings
+from apps.settings_app.services import settings_service
+
+
+class SettingsServiceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        settings_service.invalidate()
+        self.user = get_user_model().objects.create_superuser("root", "root@example.com", "pass1234")
+
+    def test_defaults_without_row(self):
+        s = settings_service.get()
+        self.assertEqual(s.app_name, "Admin Dashboard")
+        self.assertEqual(settings_service.records_per_page(20), 20)
+
+    def test_reads_are_served_from_memory(self):
+        AppSettings.objects.create(app_name="FloDo", records_per_page=25, updated_by=self.user)
+        settings_service.invalidate()
+        self.assertEqual(settings_service.get().app_name, "FloDo")
+        with self.assertNumQueries(0):
+            self.assertEqual(settings_service.records_per_page(10), 25)
+            self.assertEqual(settings_service.get().app_name, "FloDo")
+
+    def test_save_invalidates_after_commit(self):
+        row = AppSettings.objects.create(app_name="FloDo", records_per_page=25, updated_by=self.user)
+        settings_service.invalidate()
+        settings_service.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            row.records_per_page = 50
+            row.save()
+        self.assertEqual(settings_service.records_per_page(10), 50)
@@ -8,5 +8,8 @@ urlpatterns = [
     path("profile/", views.profile_update, name="profile"),
     path("app/", views.app_update, name="app"),
     path("export/<str:fmt>/<int:table_id>/", views.export_table, name="export_table"),
+    path("export/jobs/<str:fmt>/<int:table_id>/", views.export_job_create, name="export_job_create"),
+    path("export/jobs/<uuid:job_id>/", views.export_job_status, name="export_job_status"),
+    path("export/jobs/<uuid:job_id>/download/", views.export_job_download, name="export_job_download"),
     path("system-info/", views.system_info, name="system_info"),
 ]
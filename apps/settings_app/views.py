@@ -1,6 +1,3 @@
-import csv
-import io
-import json
 import os
 from django.conf import settings
 from django.contrib import messages
@@ -10,12 +7,13 @@ from django.contrib.auth.models import User
 from django.db import transaction
 from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import redirect, render
+from django.urls import reverse
 from django.views.decorators.csrf import csrf_protect
 from django.views.decorators.http import require_http_methods
 import django
 
-from apps.dashboard.models import ActivityLog
 from apps.dashboard import models as dash_models
+from apps.dashboard.services import export_job_service, export_service, stats_service
 from .forms import ProfileForm, AppSettingsForm
 from .models import AppSettings
 
@@ -77,60 +75,92 @@ def app_update(request):
 
 
 @login_required
-@require_http_methods(["GET"])  # export csv/json
+@require_http_methods(["GET"])  # export csv/json/ndjson/parquet/arrow
 def export_table(request, fmt: str, table_id: int):
-    if table_id < 1 or table_id > 10:
-        return JsonResponse({"success": False, "error": "Invalid table id."}, status=400)
-    Model = getattr(dash_models, f"Table{table_id}")
-
-    # Fixed field order (safe default) falls back when table has no rows
-    default_fields = ["unique_id", "name", "city", "phone", "created_at", "updated_at"]
-    qs = Model.objects.all().values(*default_fields).iterator(chunk_size=1000)
-
-    if fmt == "json":
-        def json_stream():
-            yield "["
-            first = True
-            for r in qs:
-                if not first:
-                    yield ","
-                first = False
-                yield json.dumps(r, default=str)
-            yield "]"
-
-        resp = StreamingHttpResponse(json_stream(), content_type="application/json; charset=utf-8")
-        resp["Content-Disposition"] = f"attachment; filename=table{table_id}.json"
-        return resp
+    # ?columns=a,b&q=...&date_from=YYYY-MM-DD&date_to=YYYY-MM-DD&compress=gzip|zstd
+    try:
+        spec = export_service.parse_spec(table_id, fmt, request.GET)
+    except export_service.ExportUnavailable as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=501)
+    except export_service.ExportError as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+
+    resp = StreamingHttpResponse(export_service.iter_export(spec), content_type=spec.content_type)
+    resp["Content-Disposition"] = f"attachment; filename={spec.filename}"
+    return resp
+
+
+@login_required
+@csrf_protect
+@require_http_methods(["POST"])  # queue a background export; same parameters as export_table
+def export_job_create(request, fmt: str, table_id: int):
+    params = request.POST if request.POST else request.GET
+    try:
+        spec = export_service.parse_spec(table_id, fmt, params)
+    except export_service.ExportUnavailable as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=501)
+    except export_service.ExportError as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+    with transaction.atomic():
+        job, reused = export_job_service.submit(spec, request.user)
+    data = _export_job_payload(job)
+    data["reused"] = reused
+    return JsonResponse({"success": True, "job": data}, status=200 if job.status == "done" else 202)
 
-    if fmt == "csv":
-        class Echo:
-            def write(self, value):
-                return value
-
-        pseudo_buffer = Echo()
-        writer = None
-
-        def row_iter():
-            nonlocal writer
-            header_written = False
-            for r in qs:
-                if writer is None:
-                    fields = list(r.keys()) or default_fields
-                    writer = csv.DictWriter(pseudo_buffer, fieldnames=fields)
-                if not header_written:
-                    header_written = True
-                    yield writer.writeheader() or ""
-                yield writer.writerow({k: str(v) for k, v in r.items()}) or ""
-            # Handle empty table: still output header
-            if not header_written:
-                writer = csv.DictWriter(pseudo_buffer, fieldnames=default_fields)
-                yield writer.writeheader() or ""
-
-        resp = StreamingHttpResponse(row_iter(), content_type="text/csv; charset=utf-8")
-        resp["Content-Disposition"] = f"attachment; filename=table{table_id}.csv"
+
+@login_required
+@require_http_methods(["GET"])  # export job status (progress also arrives as export_job events)
+def export_job_status(request, job_id):
+    job = export_job_service.visible_to(request.user).filter(pk=job_id).first()
+    if job is None:
+        return JsonResponse({"success": False, "error": "Not found."}, status=404)
+    return JsonResponse({"success": True, "job": _export_job_payload(job)})
+
+
+@login_required
+@require_http_methods(["GET", "HEAD"])  # finished export file; supports Range/If-Range and ETag
+def export_job_download(request, job_id):
+    job = export_job_service.visible_to(request.user).filter(pk=job_id).first()
+    if job is None:
+        return JsonResponse({"success": False, "error": "Not found."}, status=404)
+    if job.status != "done" or not job.file:
+        return JsonResponse({"success": False, "error": f"Export is {job.status}."}, status=409)
+    if not export_job_service.file_exists(job):
+        return JsonResponse({"success": False, "error": "Export file is gone."}, status=410)
+    etag = f'"{job.etag}"'
+    if etag in [t.strip() for t in request.headers.get("If-None-Match", "").split(",")]:
+        resp = HttpResponse(status=304)
+        resp["ETag"] = etag
         return resp
 
-    return JsonResponse({"success": False, "error": "Unsupported format."}, status=400)
+    size = job.size or 0
+    byte_range = None
+    if request.headers.get("If-Range", etag) == etag:  # a stale validator gets the whole file
+        try:
+            byte_range = export_job_service.parse_range(request.headers.get("Range", ""), size)
+        except export_job_service.RangeNotSatisfiable:
+            resp = HttpResponse(status=416)
+            resp["Content-Range"] = f"bytes */{size}"
+            return resp
+    start, end = byte_range or (0, size - 1)
+    length = max(0, end - start + 1)
+    body = [] if request.method == "HEAD" else export_job_service.iter_file(job, start, length)
+    resp = StreamingHttpResponse(body, content_type=job.content_type or "application/octet-stream")
+    if byte_range is not None:
+        resp.status_code = 206
+        resp["Content-Range"] = f"bytes {start}-{end}/{size}"
+    resp["Content-Length"] = str(length)
+    resp["Accept-Ranges"] = "bytes"
+    resp["ETag"] = etag
+    resp["Content-Disposition"] = f"attachment; filename={job.filename}"
+    return resp
+
+
+def _export_job_payload(job):
+    data = export_job_service.as_dict(job)
+    data["status_url"] = reverse("settings_app:export_job_status", args=[job.pk])
+    data["download_url"] = reverse("settings_app:export_job_download", args=[job.pk]) if job.status == "done" else None
+    return data
 
 
 @login_required
@@ -139,11 +169,13 @@ def system_info(request):
     # Database size for SQLite
     db_path = settings.DATABASES["default"]["NAME"]
     size_bytes = os.path.getsize(db_path) if os.path.exists(db_path) else 0
-    total_records = sum(getattr(dash_models, f"Table{i}").objects.count() for i in range(1, 11))
+    # Same cached snapshot as the dashboard overview (no per-table COUNT(*) scans)
+    counts = stats_service.get_counts()
+    total_records = sum(counts.get(i, 0) for i in stats_service.TABLE_IDS)
     data = {
         "django_version": django.get_version(),
         "database_size_bytes": size_bytes,
         "total_records": total_records,
-        "logs_count": ActivityLog.objects.count(),
+        "logs_count": counts.get(stats_service.LOGS_KEY, 0),
     }
     return JsonResponse({"success": True, "data": data})
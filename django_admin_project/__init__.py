@@ -1,2 +1,7 @@
 # __init__.py
-# This file marks the directory as a Python package. No runtime logic required.
+# Marks the directory as a Python package and loads the optional Celery app so
+# @shared_task functions bind to it. Celery is not required to run the site.
+try:
+    from .celery import app as celery_app  # noqa: F401
+except Exception:
+    celery_app = None
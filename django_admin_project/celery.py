@@ -0,0 +1,26 @@
+"""
+Celery application for django_admin_project.
+
+Only used when Celery is installed and a broker is configured (CELERY_BROKER_URL,
+defaulting to REDIS_URL). Start a worker with:
+
+    celery -A django_admin_project worker -l info
+"""
+import os
+
+from celery import Celery
+from celery.signals import worker_shutdown
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_admin_project.settings")
+
+app = Celery("django_admin_project")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
+
+
+@worker_shutdown.connect
+def _flush_activity_logs(**_kwargs):
+    # Drain the in-process ActivityLog buffer before the worker exits.
+    from apps.dashboard.services import audit_service
+
+    audit_service.flush()
@@ -4,31 +4,25 @@ from django.core.cache import caches  # Added: for lightweight rate-limit of CSP
 from django.conf import settings
 import json  # Added: parse JSON bodies for CSP reports
 import logging  # Added: log CSP violations server-side
+import hmac
+from asgiref.sync import sync_to_async
+from apps.dashboard.services import query_budget_service, rate_limit_service
 
-# Added: safe optional ratelimit decorator import (no-op fallback if not installed)
-try:
-    from ratelimit.decorators import ratelimit as rl_decorator  # type: ignore
-except Exception:  # pragma: no cover - safe fallback
-    def rl_decorator(*args, **kwargs):
-        def _wrap(f):
-            return f
-        return _wrap
 
-
-def healthz(request):
+async def healthz(request):
     """Lightweight liveness probe: process is up, Django can handle a request."""
     return JsonResponse({"ok": True})
 
 
-def readinessz(request):
+async def readinessz(request):
     """Readiness probe: checks DB connectivity and cache if configured.
 
     Always returns JSON and never raises uncaught exceptions to avoid crashing health checks.
     """
     status = {"db": False, "cache": None}
-    # DB check
+    # DB check (connections are sync-only; run where the ORM runs)
     try:
-        connection.ensure_connection()
+        await sync_to_async(connection.ensure_connection)()
         status["db"] = True
     except Exception:
         status["db"] = False
@@ -37,8 +31,8 @@ def readinessz(request):
     try:
         if getattr(settings, "REDIS_CACHE_URL", ""):
             cache = caches["default"]
-            cache.set("__readiness_probe__", "1", timeout=5)
-            val = cache.get("__readiness_probe__")
+            await cache.aset("__readiness_probe__", "1", timeout=5)
+            val = await cache.aget("__readiness_probe__")
             status["cache"] = bool(val == "1")
         else:
             status["cache"] = None
@@ -49,11 +43,25 @@ def readinessz(request):
     return JsonResponse({"ok": http_status == 200, "status": status}, status=http_status)
 
 
+def metrics(request):
+    """Prometheus text metrics (per-view query counters, see query_budget_service).
+
+    Open to staff sessions, or to scrapers sending ``Authorization: Bearer <METRICS_TOKEN>``.
+    """
+    token = getattr(settings, "METRICS_TOKEN", "")
+    auth = request.META.get("HTTP_AUTHORIZATION", "")
+    allowed = bool(token) and hmac.compare_digest(auth, f"Bearer {token}")
+    user = getattr(request, "user", None)
+    if not allowed and not (user is not None and user.is_authenticated and user.is_staff):
+        return HttpResponse(status=403)
+    return HttpResponse(query_budget_service.render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 # Added: CSP report endpoint (report-only). Logs violation reports to logger and Sentry (if configured).
 # Notes:
 # - Kept minimal and safe. Does not block; returns 204 No Content.
 # - Rate-limited to avoid abuse.
-@rl_decorator(key="ip", rate="60/m", block=True)
+@rate_limit_service.limit("60/m", methods=None)  # per IP, any method
 def csp_report(request):
     """Accept CSP violation reports in report-only mode.
 
@@ -81,7 +89,7 @@ def csp_report(request):
             "referrer": (report or {}).get("referrer"),
         }
         # Added: include source IP and path (no other PII)
-        ip = (request.META.get("HTTP_X_FORWARDED_FOR", "").split(",")[0] or request.META.get("REMOTE_ADDR") or "?")
+        ip = rate_limit_service.client_ip(request)
         payload.update({"ip": ip, "path": request.path})
         # Added: log to application logger
         logging.getLogger("security.csp").warning("CSP report: %s", payload)
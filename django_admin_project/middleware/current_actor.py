@@ -0,0 +1,46 @@
+"""
+CurrentActorMiddleware
+
+Publishes request.user in a context variable for the duration of the request so
+code without access to the request (model signal receivers, portal logging) can
+attribute ActivityLog rows without extra queries. See
+apps.dashboard.services.actor_service.
+
+request.user stays lazy: it is only evaluated if something actually logs.
+"""
+from __future__ import annotations
+from typing import Callable
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpRequest, HttpResponse
+
+from apps.dashboard.services import actor_service
+
+
+class CurrentActorMiddleware:
+    """Placement: after AuthenticationMiddleware. Sync and async (a context variable
+    set here is visible to the sync_to_async threads of async views)."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = actor_service.set_current_actor(getattr(request, "user", None))
+        try:
+            return self.get_response(request)
+        finally:
+            actor_service.reset_current_actor(token)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        token = actor_service.set_current_actor(getattr(request, "user", None))
+        try:
+            return await self.get_response(request)
+        finally:
+            actor_service.reset_current_actor(token)
@@ -3,51 +3,53 @@ OneSessionPerUserMiddleware
 
 Enforces a single active session per Client (portal user).
 - If a request carries a session client_id whose session key does not match
-  the Client.active_session_key in DB, the middleware force-logs out the user.
+  the Client.active_session_key, the middleware force-logs out the user. The key
+  is read through client_session_service (shared cache, DB only on a miss).
 - Public/anonymous routes, static/media, and Super-Admin routes are skipped.
 
 Safe, reversible, and guarded with try/except to avoid breaking requests.
+Written as a request hook (MiddlewareMixin) so async views stay async; the
+session read runs in the hook's sync_to_async call.
 """
 from __future__ import annotations
-from typing import Callable
+from typing import Optional
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect
 from django.conf import settings
+from django.utils.deprecation import MiddlewareMixin
 
 # Import Client model from apps.dashboard
 try:
     from apps.dashboard.models import Client  # type: ignore
+    from apps.dashboard.services import client_session_service
 except Exception:  # pragma: no cover
     Client = None  # type: ignore
 
 
-class OneSessionPerUserMiddleware:
+class OneSessionPerUserMiddleware(MiddlewareMixin):
     """Middleware to ensure only the stored active session key remains valid.
 
     Placement: after SessionMiddleware & AuthenticationMiddleware is fine.
     """
 
-    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
-        self.get_response = get_response
-
-    def __call__(self, request: HttpRequest) -> HttpResponse:
+    def process_request(self, request: HttpRequest) -> Optional[HttpResponse]:
         try:
             # Fast-path: if Client model unavailable or no session support, bypass
             if Client is None:
-                return self.get_response(request)
+                return None
 
             # Skip for static/media and admin routes to avoid loops
             path = request.path or "/"
             if path.startswith("/static/") or path.startswith("/media/"):
-                return self.get_response(request)
+                return None
             # Skip Super-Admin and API routes outside portal
             if path.startswith("/Super-Admin/") or path.startswith("/admin/"):
-                return self.get_response(request)
+                return None
 
             # Read portal client_id from session (set in client_portal views)
             cid = request.session.get("client_id")
             if not cid:
-                return self.get_response(request)
+                return None
 
             # Read current session key and enforce match against DB
             current_key = request.session.session_key
@@ -57,11 +59,11 @@ class OneSessionPerUserMiddleware:
                     request.session.save()
                     current_key = request.session.session_key
                 except Exception:
-                    return self.get_response(request)
+                    return None
 
-            # Look up client and compare with stored active_session_key
+            # Compare with the stored active_session_key (cached; DB only on a miss)
             try:
-                client = Client.objects.only("active_session_key").get(client_id=cid)
+                active_key = client_session_service.active_session_key(cid)
             except Client.DoesNotExist:
                 # Unknown client in session -> flush session
                 try:
@@ -72,7 +74,7 @@ class OneSessionPerUserMiddleware:
                 # Added: include reason so UI can show a user-friendly toast
                 return redirect("client_portal:client_auth")  # No reason for unknown client
 
-            if client.active_session_key and client.active_session_key != current_key:
+            if active_key and active_key != current_key:
                 # Active session changed elsewhere: invalidate this stale session
                 try:
                     request.session.flush()
@@ -88,4 +90,4 @@ class OneSessionPerUserMiddleware:
             # Never break the request due to middleware errors
             pass
 
-        return self.get_response(request)
+        return None
@@ -0,0 +1,58 @@
+"""
+QueryBudgetMiddleware
+
+Counts the SQL statements and DB time of every request through
+``query_budget_service.track()`` (production-safe: no ``DEBUG`` needed), flags
+repeated statement shapes (N+1 loops) and per-view budget breaches. See
+apps.dashboard.services.query_budget_service for budgets, logging and the
+``/metrics`` counters.
+
+Breaches add ``X-Query-Budget: exceeded; queries=<n>; budget=<b>[; repeated=<r>]``
+to the response; with ``QUERY_BUDGET_HEADERS`` every response carries it plus a
+``Server-Timing`` db entry. Queries run while a streaming body is consumed happen
+after the middleware returns and are not counted.
+"""
+from __future__ import annotations
+from typing import Callable
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from apps.dashboard.services import query_budget_service
+
+
+class QueryBudgetMiddleware:
+    """Placement: near the top, so session/auth queries are included. Sync and async."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if self.async_mode:
+            return self.__acall__(request)
+        with query_budget_service.track() as stats:
+            response = self.get_response(request)
+        return self._report(request, response, stats)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        with query_budget_service.track() as stats:
+            response = await self.get_response(request)
+        return self._report(request, response, stats)
+
+    def _report(self, request: HttpRequest, response: HttpResponse, stats) -> HttpResponse:
+        try:
+            result = query_budget_service.finish(request, stats, response.status_code)
+            if result["exceeded"] or result["repeated"] or getattr(settings, "QUERY_BUDGET_HEADERS", False):
+                response["X-Query-Budget"] = query_budget_service.header_value(result)
+                if getattr(settings, "QUERY_BUDGET_HEADERS", False):
+                    response["Server-Timing"] = f'db;dur={result["db_ms"]};desc="{result["queries"]} queries"'
+        except Exception:
+            # Instrumentation never breaks a response.
+            pass
+        return response
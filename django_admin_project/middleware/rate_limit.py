@@ -0,0 +1,58 @@
+"""
+RateLimitMiddleware
+
+Enforces the ``@rate_limit_service.limit(...)`` rules of the view a request resolves
+to, before the session, auth and one-session middlewares touch the database, so a
+rejected login or signup costs neither a query nor a password hash. Requests whose
+method no rule watches (GET pages, usually) skip URL resolution entirely. See
+apps.dashboard.services.rate_limit_service.
+"""
+from __future__ import annotations
+from typing import Callable
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.http import HttpRequest, HttpResponse
+from django.urls import Resolver404, resolve
+
+from apps.dashboard.services import rate_limit_service
+
+
+class RateLimitMiddleware:
+    """Placement: right after SecurityMiddleware. Sync and async."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if self.async_mode:
+            return self.__acall__(request)
+        rules = self._rules(request)
+        if rules:
+            response = rate_limit_service.enforce(request, rules)
+            if response is not None:
+                return response
+        return self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        rules = self._rules(request)
+        if rules:
+            # Cache round trips (Redis) stay off the event loop.
+            response = await sync_to_async(rate_limit_service.enforce)(request, rules)
+            if response is not None:
+                return response
+        return await self.get_response(request)
+
+    @staticmethod
+    def _rules(request: HttpRequest):
+        if not rate_limit_service.watched_method(request.method):
+            return ()
+        try:
+            match = resolve(request.path_info, getattr(request, "urlconf", None))
+        except Resolver404:
+            return ()
+        return rate_limit_service.rules_for(match.func)
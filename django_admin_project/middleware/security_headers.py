@@ -5,14 +5,28 @@ Adds report-only CSP and modern security headers without changing runtime behavi
 """
 from __future__ import annotations
 from typing import Callable
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 
 
 class SecurityHeadersMiddleware:
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response: Callable):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
 
     def __call__(self, request):
-        response = self.get_response(request)
+        if self.async_mode:
+            return self.__acall__(request)
+        return self._add_headers(self.get_response(request))
+
+    async def __acall__(self, request):
+        return self._add_headers(await self.get_response(request))
+
+    def _add_headers(self, response):
         # Core headers (idempotent; overwrite if present)
         response["X-Frame-Options"] = "DENY"
         response["X-Content-Type-Options"] = "nosniff"
@@ -0,0 +1,38 @@
+"""
+StaticFilesMiddleware
+
+WhiteNoiseMiddleware (6.x) is sync-only, and a single sync-only middleware makes
+Django run the whole request, async views included, through async_to_sync on the
+one sync thread. This subclass adds an async path: non-static requests go straight
+to the next handler, and only static hits touch the filesystem, off the event loop.
+"""
+from __future__ import annotations
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """Drop-in for ``whitenoise.middleware.WhiteNoiseMiddleware``; same settings."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file, thread_sensitive=False)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve, thread_sensitive=False)(static_file, request)
+        return await self.get_response(request)
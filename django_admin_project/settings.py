@@ -5,7 +5,7 @@ settings toggled via environment variables. Each line is commented for clarity.
 """
 from pathlib import Path  # Path utility for filesystem paths
 import os  # OS utilities for environment variables
-import uuid  # For generating a unique server boot identifier
+import json  # Parse JSON-valued environment settings
 import importlib.util  # For optional middleware detection
 from dotenv import load_dotenv  # Load .env files for environment configuration
 
@@ -69,16 +69,25 @@ if SENTRY_DSN:
 # Middleware stack including WhiteNoise for static files in production.
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # @rate_limit_service.limit rules, enforced before sessions/auth touch the DB
+    "django_admin_project.middleware.rate_limit.RateLimitMiddleware",
+    # Per-request query counts, N+1 detection and query budgets (works with DEBUG=False)
+    "django_admin_project.middleware.query_budget.QueryBudgetMiddleware",
     "django.middleware.gzip.GZipMiddleware",  # Add Gzip compression
-    "whitenoise.middleware.WhiteNoiseMiddleware",  # Serve static files efficiently
+    # Serve static files efficiently (WhiteNoise with an async path, see middleware/static_files.py)
+    "django_admin_project.middleware.static_files.StaticFilesMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     # Ensure Django admin login redirects to admin index when 'next' is absent
     "apps.authentication.middleware.AdminLoginNextParamMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    # Publish request.user for signal receivers / audit attribution (no queries)
+    "django_admin_project.middleware.current_actor.CurrentActorMiddleware",
     # Added: enforce single active session per portal client
     "django_admin_project.middleware.one_session.OneSessionPerUserMiddleware",
+    # Signed cookie identity for anonymous portal visitors (apps/client_portal/visitor.py)
+    "apps.client_portal.middleware.VisitorCookieMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     # Custom middleware to invalidate sessions after server restarts
@@ -186,6 +195,91 @@ else:
         }
     }
 
+# ---------------------------------------------------------------------------
+# Push events over /ws/notifications/ (apps/dashboard/services/event_service.py)
+# ---------------------------------------------------------------------------
+# Replay window for /dashboard/api/events/?since=<seq> after a socket reconnect
+EVENTS_RETENTION_SECONDS = int(os.getenv("EVENTS_RETENTION_SECONDS", "600"))
+EVENTS_RESYNC_MAX = int(os.getenv("EVENTS_RESYNC_MAX", "500"))
+# Channel-layer sends (apps/dashboard/services/broadcast_service.py): "background" hands
+# committed messages to a sender thread that coalesces them per group; "sync" sends from
+# the request thread after commit (required by the in-memory layer).
+BROADCAST_MODE = os.getenv("BROADCAST_MODE", "sync" if USE_INMEMORY_CHANNEL_LAYER else "background").lower()
+BROADCAST_COALESCE_MS = int(os.getenv("BROADCAST_COALESCE_MS", "50"))
+
+# Rows per transaction for bulk imports (apps/dashboard/services/import_service.py)
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+
+# Rows serialized per chunk by table exports (apps/dashboard/services/export_service.py)
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "2000"))
+
+# Background export jobs (apps/dashboard/services/export_job_service.py)
+# sync: build inline after commit; thread: daemon thread; celery: dashboard.run_export_job
+EXPORT_JOB_MODE = os.getenv("EXPORT_JOB_MODE", "thread").lower()
+EXPORT_JOB_TTL = int(os.getenv("EXPORT_JOB_TTL", "3600"))  # identical exports reuse the file this long
+EXPORT_STORAGE = os.getenv("EXPORT_STORAGE", "")  # dotted storage class; default storage (MEDIA_ROOT) if empty
+
+# Password hashing pool (apps/dashboard/services/password_service.py): processes (0 = inline),
+# hashes running/queued before logins fail fast with 503, and the queue wait limit in seconds
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", str(max(1, PASSWORD_HASH_WORKERS) * 8)))
+PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", "10"))
+
+# ---------------------------------------------------------------------------
+# Live search (apps/dashboard/services/search_service.py)
+# ---------------------------------------------------------------------------
+# auto: FTS5 trigram tables on SQLite, pg_trgm indexes on PostgreSQL; like: plain icontains
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "auto").lower()
+
+# ---------------------------------------------------------------------------
+# ActivityLog write pipeline (apps/dashboard/services/audit_service.py)
+# ---------------------------------------------------------------------------
+# sync: insert after commit; buffered: bulk_create on size/age; celery: hand batches
+# to the Celery worker. Development keeps "sync" so logs appear immediately.
+ACTIVITYLOG_WRITE_MODE = os.getenv("ACTIVITYLOG_WRITE_MODE", "sync" if DEBUG else "buffered").lower()
+ACTIVITYLOG_BUFFER_SIZE = int(os.getenv("ACTIVITYLOG_BUFFER_SIZE", "200"))
+ACTIVITYLOG_FLUSH_INTERVAL = float(os.getenv("ACTIVITYLOG_FLUSH_INTERVAL", "2.0"))
+
+# Log retention (apps/dashboard/services/log_archive_service.py, manage.py archive_logs).
+# Older rows move to gzip NDJSON files under LOG_ARCHIVE_DIR; 0 keeps them forever.
+ACTIVITYLOG_RETENTION_DAYS = int(os.getenv("ACTIVITYLOG_RETENTION_DAYS", "180"))
+CLIENTLOG_RETENTION_DAYS = int(os.getenv("CLIENTLOG_RETENTION_DAYS", "365"))
+LOG_ARCHIVE_DIR = Path(os.getenv("LOG_ARCHIVE_DIR", str(BASE_DIR / "archive")))
+
+# Public portal data cache (apps/dashboard/services/fragment_cache_service.py). Entries are
+# fresh for PORTAL_CACHE_TTL seconds or until a tagged table changes, then served stale for up
+# to PORTAL_CACHE_STALE more seconds while one request rebuilds them. 0 disables the cache.
+PORTAL_CACHE_TTL = int(os.getenv("PORTAL_CACHE_TTL", "60"))
+PORTAL_CACHE_STALE = int(os.getenv("PORTAL_CACHE_STALE", "300"))
+
+# Query budgets (apps/dashboard/services/query_budget_service.py). QUERY_BUDGETS is a JSON
+# object of URL name -> max queries, e.g. {"dashboard:get_table_data": 10}; other views use
+# QUERY_BUDGET_DEFAULT (0 = no budget). A request repeating one SQL shape
+# QUERY_REPEAT_THRESHOLD times is reported as an N+1. Counters are served at /metrics,
+# to staff users or to requests bearing METRICS_TOKEN.
+QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT", "50"))
+QUERY_BUDGETS = json.loads(os.getenv("QUERY_BUDGETS", "{}") or "{}")
+QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", "10"))
+QUERY_BUDGET_HEADERS = os.getenv("QUERY_BUDGET_HEADERS", "True" if DEBUG else "False").lower() in ("1", "true", "yes")
+QUERY_METRICS_FLUSH_INTERVAL = float(os.getenv("QUERY_METRICS_FLUSH_INTERVAL", "10"))
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# Celery (optional; only used when installed, e.g. ACTIVITYLOG_WRITE_MODE=celery)
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", REDIS_URL)
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_BEAT_SCHEDULE = {
+    # Correct drift in the cached overview counts (apps/dashboard/services/stats_service.py)
+    "dashboard-reconcile-stats": {
+        "task": "dashboard.reconcile_stats",
+        "schedule": float(os.getenv("STATS_RECONCILE_INTERVAL", "900")),
+    },
+    # Remove expired export job files (apps/dashboard/services/export_job_service.py)
+    "dashboard-purge-export-jobs": {
+        "task": "dashboard.purge_export_jobs",
+        "schedule": float(os.getenv("EXPORT_JOB_PURGE_INTERVAL", "3600")),
+    },
+}
+
 # Password validation: use Django's recommended validators.
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -257,15 +351,34 @@ EMAIL_TIMEOUT = int(os.getenv("EMAIL_TIMEOUT", "10"))
 # ---------------------------------------------------------------------------
 # Session configuration
 # ---------------------------------------------------------------------------
-# Use database-backed sessions explicitly (Django default, but set for clarity)
-SESSION_ENGINE = "django.contrib.sessions.backends.db"
+# Session engine with write coalescing and lazy expiry touch (apps/authentication/session_store.py).
+# SESSION_BACKEND picks the storage underneath: db | cached_db | cache. cached_db/cache keep
+# session reads off the database; they need a shared cache (REDIS_URL), so without one the
+# default stays db.
+SESSION_ENGINE = "apps.authentication.session_store"
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "cached_db" if REDIS_CACHE_URL else "db").lower()
+# Active sessions are re-saved (expiry pushed out) at most once per interval
+SESSION_TOUCH_INTERVAL = int(os.getenv("SESSION_TOUCH_INTERVAL", "3600"))
 
 # Expire session cookie when browser closes (defense-in-depth for shared machines)
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
 
-# Unique ID that changes on every server process start; used to invalidate old sessions
-# NOTE: This is evaluated at import time (i.e., on each server start/reload)
-SERVER_BOOT_ID = os.getenv("SERVER_BOOT_ID") or str(uuid.uuid4())
+# Rate limits (apps/dashboard/services/rate_limit_service.py): sliding windows on Redis,
+# atomic fixed windows on other caches. Proxies in front of the app that append to
+# X-Forwarded-For (0 = trust only REMOTE_ADDR).
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "True").lower() in ("1", "true", "yes")
+RATE_LIMIT_CACHE = os.getenv("RATE_LIMIT_CACHE", "default")
+RATE_LIMIT_TRUSTED_PROXIES = int(os.getenv("RATE_LIMIT_TRUSTED_PROXIES", "0"))
+
+# Anonymous portal visitors are identified by a signed cookie (apps/client_portal/visitor.py),
+# so public pages never create sessions
+VISITOR_COOKIE_NAME = os.getenv("VISITOR_COOKIE_NAME", "flodo_vid")
+VISITOR_COOKIE_AGE = int(os.getenv("VISITOR_COOKIE_AGE", str(365 * 24 * 3600)))
+
+# Sessions stamped before the cluster-wide deployment epoch are logged out
+# (apps/authentication/deployment_epoch.py; bump with `manage.py bump_deployment_epoch`).
+# Each process re-reads the epoch at most this often, in seconds.
+DEPLOYMENT_EPOCH_TTL = float(os.getenv("DEPLOYMENT_EPOCH_TTL", "10"))
 
 # ---------------------------------------------------------------------------
 # Phase 1: Zero-impact cookie security flags and headers (transparent defaults)
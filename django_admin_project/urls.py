@@ -43,6 +43,7 @@ urlpatterns = [
     path("healthz", health_views.healthz, name="healthz"),
     path("readinessz", health_views.readinessz, name="readinessz"),
     path("csp-report/", health_views.csp_report, name="csp_report"),  # Added: CSP report endpoint (report-only)
+    path("metrics", health_views.metrics, name="metrics"),  # Prometheus query-budget counters
     # (Employees Administration routes have been removed)
 ]
 
@@ -206,6 +206,17 @@ window.updateAriaStatus = function(msg){
 // Optional WebSocket to keep dashboard charts live using existing notifications WS
   window.initDashboardStatsWS = function(){
   try {
+    // Prefer the shared push socket (notifications.js): refresh charts on row deltas only
+    if (window.flodoEvents && window.flodoEvents.subscribe){
+      if (window.__dashStatsBound) return;
+      window.__dashStatsBound = true;
+      window.flodoEvents.subscribe(['table:1','table:2','table:3','table:4','table:5','table:6','table:7','table:8','table:9','table:10']);
+      window.addEventListener('flodo:event', function(e){
+        var t = e.detail && e.detail.type;
+        if ((t === 'row' || t === 'resync') && typeof window.refreshDashboardCharts === 'function') window.refreshDashboardCharts();
+      });
+      return;
+    }
     if (window.__dashWS && (window.__dashWS.readyState === 0 || window.__dashWS.readyState === 1)) return;
     var proto = (window.location.protocol === 'https:') ? 'wss://' : 'ws://';
     var url = proto + window.location.host + '/ws/notifications/';
@@ -266,7 +277,15 @@ window.updateAriaStatus = function(msg){
       if (location && /\/Super-Admin\/artist-applications\/?(\?|$)/.test(location.pathname+location.search)) { refresh(); }
     } catch(_){ }
   }
-  function start(){ refresh(); maybeClearOnPage(); try { if (window.__aaBadgeTimer) clearInterval(window.__aaBadgeTimer); window.__aaBadgeTimer = setInterval(refresh, POLL_MS); } catch(_){ } }
+  // Push: pending_count events carry the new count; poll only while the socket is down
+  try { window.flodoEvents && window.flodoEvents.subscribe && window.flodoEvents.subscribe(['applications']); } catch(_){ }
+  window.addEventListener('flodo:event', function(e){
+    var ev = e.detail || {};
+    if (ev.type === 'pending_count' && ev.data && typeof ev.data.count === 'number') render(ev.data.count);
+    else if (ev.type === 'resync') refresh();
+  });
+  function poll(){ if (window.flodoEvents && window.flodoEvents.live) return; refresh(); }
+  function start(){ refresh(); maybeClearOnPage(); try { if (window.__aaBadgeTimer) clearInterval(window.__aaBadgeTimer); window.__aaBadgeTimer = setInterval(poll, POLL_MS); } catch(_){ } }
   if (document.readyState === 'loading') document.addEventListener('DOMContentLoaded', start); else start();
 })();
 
@@ -537,8 +556,17 @@ window.initDashboardDonuts = function(){
         }
       } catch(_){ }
       refresh();
+      // Push: refresh on presence changes or admin row edits; poll only while the socket is down
+      if (!window.__onlineAdminsPushBound){
+        window.__onlineAdminsPushBound = true;
+        try { window.flodoEvents && window.flodoEvents.subscribe && window.flodoEvents.subscribe(['table:1']); } catch(_){ }
+        window.addEventListener('flodo:event', function(e){
+          var ev = e.detail || {};
+          if (ev.type === 'presence' || ev.type === 'resync' || (ev.type === 'row' && ev.data && ev.data.table_id === 1)) refresh();
+        });
+      }
       if (window.__onlineAdminsTimer) { clearInterval(window.__onlineAdminsTimer); }
-      window.__onlineAdminsTimer = setInterval(refresh, 8000);
+      window.__onlineAdminsTimer = setInterval(function(){ if (window.flodoEvents && window.flodoEvents.live) return; refresh(); }, 8000);
       // collapse on mobile button
       var btn = document.getElementById('toggleRightSidebar'); if (btn){ btn.addEventListener('click', function(){ var a = qs('right-sidebar'); if (a) a.classList.toggle('hidden'); }); }
     } catch(_){ }
@@ -675,6 +703,11 @@ window.loadTables = async function(){
             var tid = sel ? parseInt(sel.value, 10) : 1;
             var pausedUntil = (typeof window.__tablesPauseUntil !== 'undefined') ? window.__tablesPauseUntil : 0;
             if (Date.now() <= (pausedUntil || 0)) { return; }
+            if (window.flodoEvents && window.flodoEvents.live) { // row events drive refreshes
+              var d = window.__pushDirty;
+              if (!d || !(d.tables.has(tid) || d.tables.has('*'))) { return; }
+              d.tables.clear();
+            }
             if (typeof refreshTable === 'function') { refreshTable(tid); }
           } catch(_) { }
         }, 120000);
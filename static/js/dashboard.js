@@ -35,8 +35,12 @@ function csrf(){
 }
 
 
-async function fetchTableData(tableId, page=1, q='') {
-  const url = `/dashboard/api/table/${tableId}/?page=${page}&per_page=10&q=${encodeURIComponent(q)}`;
+// Pass a cursor (use '' for the first page) to switch to keyset mode: no OFFSET/COUNT on the server,
+// next/prev pages via payload.next_cursor / payload.prev_cursor. Total comes from the cached estimate.
+async function fetchTableData(tableId, page=1, q='', cursor=null) {
+  const url = (cursor !== null && cursor !== undefined)
+    ? `/dashboard/api/table/${tableId}/?cursor=${encodeURIComponent(cursor)}&count=estimate&per_page=10&q=${encodeURIComponent(q)}`
+    : `/dashboard/api/table/${tableId}/?page=${page}&per_page=10&q=${encodeURIComponent(q)}`;
   const res = await fetch(url, { credentials: 'same-origin', headers: { 'X-Requested-With': 'XMLHttpRequest' } });
   if (res.status === 403) return { success: false, error: 'Forbidden' };
   return res.json();
@@ -232,7 +236,18 @@ function updateTableDisplay(tableId, payload){
   // Per-row ADD removed; use the top add form
 
   const pag = document.getElementById(`pagination-${tableId}`);
-  if (pag) pag.textContent = `Page ${payload.page} of ${payload.num_pages} — Total ${payload.total}`;
+  if (pag) {
+    if ('next_cursor' in payload) {
+      // Keyset mode: no page numbers; keep cursors on the element for pagers
+      pag.dataset.nextCursor = payload.next_cursor || '';
+      pag.dataset.prevCursor = payload.prev_cursor || '';
+      pag.textContent = (typeof payload.total === 'number')
+        ? `Showing ${(payload.results || []).length} — Total ${payload.total}`
+        : `Showing ${(payload.results || []).length}${payload.has_next ? ' — more available' : ''}`;
+    } else {
+      pag.textContent = `Page ${payload.page} of ${payload.num_pages} — Total ${payload.total}`;
+    }
+  }
 }
 
 async function createTableRow(tableId, rowData){
@@ -277,9 +292,18 @@ async function deleteTableRow(tableId, rowId){
   return res.json();
 }
 
+// Receive row events for tables this page has shown (topics are bounded, so they are never dropped)
+function watchTable(tableId){
+  const topic = `table:${tableId}`;
+  const bus = window.flodoEvents = window.flodoEvents || { live: false, seq: null, topics: [] };
+  if (typeof bus.subscribe === 'function') bus.subscribe([topic]);
+  else if ((bus.topics = bus.topics || []).indexOf(topic) === -1) bus.topics.push(topic);
+}
+
 async function refreshTable(tableId){
+  watchTable(tableId);
   const q = document.getElementById(`search-${tableId}`)?.value || '';
-  const payload = await fetchTableData(tableId, 1, q);
+  const payload = await fetchTableData(tableId, 1, q, '');
   if (payload.success) updateTableDisplay(tableId, payload);
 }
 
@@ -411,6 +435,7 @@ async function refreshLogs(){
   } catch(_) { tableFilter = ''; }
   const qp = new URLSearchParams();
   qp.set('per_page', '10');
+  qp.set('cursor', '');  // keyset mode: first page without COUNT(*)
   if (tableFilter) qp.set('table_name', tableFilter);
   const res = await fetch(`/dashboard/api/logs/?${qp.toString()}`, { headers: { 'X-Requested-With': 'XMLHttpRequest' }, credentials: 'same-origin' });
   const payload = await res.json();
@@ -757,18 +782,31 @@ document.addEventListener('click', function(e){  // added
   window.__refreshTablesInFlight = false;
   window.__refreshLogsInFlight = false;
 
+  // While the push socket is live, refresh only what row/log events marked dirty
+  const dirty = window.__pushDirty = { tables: new Set(), logs: false };
+  window.addEventListener('flodo:event', function(e){
+    const ev = e.detail || {};
+    if (ev.type === 'row' && ev.data) dirty.tables.add(ev.data.table_id);
+    else if (ev.type === 'log' || ev.type === 'activity_log') dirty.logs = true;
+    else if (ev.type === 'resync') { dirty.tables.add('*'); dirty.logs = true; }
+  });
+
   function tickAuto(){
     try {
       if (isPaused()) return;
       var sel = document.getElementById('tablePicker');
       var tid = sel ? parseInt(sel.value, 10) : 1;
+      const live = !!(window.flodoEvents && window.flodoEvents.live);
+      const tableDirty = dirty.tables.has(tid) || dirty.tables.has('*');
       // Refresh current table
-      if (!window.__refreshTablesInFlight && typeof window.refreshTable === 'function'){
+      if ((!live || tableDirty) && !window.__refreshTablesInFlight && typeof window.refreshTable === 'function'){
+        dirty.tables.clear();
         window.__refreshTablesInFlight = true;
         Promise.resolve(window.refreshTable(tid)).catch(()=>{}).finally(()=>{ window.__refreshTablesInFlight = false; });
       }
       // Refresh logs
-      if (!window.__refreshLogsInFlight && typeof window.refreshLogs === 'function'){
+      if ((!live || dirty.logs) && !window.__refreshLogsInFlight && typeof window.refreshLogs === 'function'){
+        dirty.logs = false;
         window.__refreshLogsInFlight = true;
         Promise.resolve(window.refreshLogs()).catch(()=>{}).finally(()=>{ window.__refreshLogsInFlight = false; });
       }
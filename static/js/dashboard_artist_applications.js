@@ -174,6 +174,61 @@
     highlightCertItem(modal, i);
   }
 
+  // ---------- Certificate files (fetched per application when a modal opens)
+  function certNode(c, variant){
+    const box = document.createElement('div');
+    box.className = variant === 'thumbs'
+      ? 'border border-gray-200 dark:border-gray-800 rounded p-2 text-xs'
+      : 'border border-gray-200 dark:border-gray-800 rounded-lg p-3';
+    const name = document.createElement('div');
+    name.className = variant === 'thumbs' ? 'truncate mb-1' : 'text-xs text-gray-500 truncate mb-2';
+    name.textContent = c.name || '';
+    box.appendChild(name);
+    if (c.is_image){
+      const img = document.createElement('img');
+      img.src = c.url;
+      img.alt = variant === 'thumbs' ? 'File' : 'Certificate';
+      img.className = variant === 'thumbs'
+        ? 'w-full h-28 object-cover rounded bg-gray-50 dark:bg-gray-800'
+        : 'w-full h-[65vh] md:h-[70vh] object-contain rounded bg-gray-50 dark:bg-gray-800';
+      box.appendChild(img);
+    } else if (c.url){
+      const a = document.createElement('a');
+      a.href = c.url;
+      a.target = '_blank';
+      a.textContent = 'Open';
+      a.className = variant === 'thumbs'
+        ? 'inline-flex items-center px-2 py-1 rounded bg-blue-600 text-white hover:bg-blue-700'
+        : 'inline-flex items-center px-3 py-1.5 rounded bg-blue-600 text-white text-xs hover:bg-blue-700';
+      box.appendChild(a);
+    }
+    return box;
+  }
+
+  function loadCertLists(modal){
+    const lists = Array.prototype.slice.call(modal.querySelectorAll('[data-cert-list]:not([data-loaded])'));
+    return Promise.all(lists.map(function(list){
+      const url = list.getAttribute('data-cert-url');
+      if (!url) return null;
+      return fetch(url, { headers: { 'X-Requested-With': 'XMLHttpRequest' } })
+        .then(function(res){ if (res.ok) return res.json(); throw new Error('Request failed'); })
+        .then(function(data){
+          const variant = list.getAttribute('data-cert-list');
+          const items = (data && data.results) || [];
+          list.innerHTML = '';
+          if (!items.length && variant === 'thumbs'){
+            const empty = document.createElement('div');
+            empty.className = 'col-span-2 text-sm text-gray-500';
+            empty.textContent = 'No files';
+            list.appendChild(empty);
+          }
+          items.forEach(function(c){ list.appendChild(certNode(c, variant)); });
+          list.setAttribute('data-loaded', '1');
+        })
+        .catch(function(){ /* leave placeholder; retried on next open */ });
+    }));
+  }
+
   function openModal(el) {
     // Move modal to document.body to avoid being clipped or positioned relative to transformed ancestors
     try {
@@ -265,7 +320,8 @@
       e.preventDefault();
       const id = openBtn.getAttribute('data-modal-open');
       const modal = document.getElementById(id);
-      if (modal) openModal(modal);
+      // Certificate files are fetched on first open, then the modal (and its navigation) initialises
+      if (modal) loadCertLists(modal).then(function(){ openModal(modal); });
       return;
     }
 
@@ -590,6 +646,79 @@
     } catch(_) { }
   }
 
+  // ---------- Rejected applicants: cursor-paginated rows, loaded when the section scrolls into view
+  function rejectedRow(a, csrf){
+    const tr = document.createElement('tr');
+    const cell = function(text, cls){
+      const td = document.createElement('td');
+      td.className = 'px-3 py-2' + (cls ? ' ' + cls : '');
+      td.textContent = (text === null || text === undefined || text === '' || text === 0) ? '—' : String(text);
+      tr.appendChild(td);
+      return td;
+    };
+    cell(a.name, 'font-medium text-gray-900 dark:text-gray-100');
+    cell(a.email);
+    cell(a.phone);
+    cell(a.city);
+    cell(a.years_experience);
+    cell(a.cert_count ? a.cert_count + ' file(s)' : '');
+    cell(a.created_at ? new Date(a.created_at).toLocaleString() : '');
+    const td = document.createElement('td');
+    td.className = 'px-3 py-2';
+    const form = document.createElement('form');
+    form.method = 'post';
+    form.action = a.allow_reapply_url;
+    form.className = 'inline';
+    form.innerHTML = '<input type="hidden" name="csrfmiddlewaretoken">'
+      + '<button type="submit" class="inline-flex items-center gap-1 px-2.5 py-1 rounded-full text-xs border bg-amber-50 text-amber-700 border-amber-200 hover:bg-amber-100 dark:bg-amber-900/20 dark:text-amber-300 dark:border-amber-800">Allow Reapply</button>';
+    form.querySelector('input').value = csrf;
+    form.addEventListener('submit', function(ev){ if (!confirm('Allow this rejected applicant to reapply?')) ev.preventDefault(); });
+    td.appendChild(form);
+    tr.appendChild(td);
+    return tr;
+  }
+
+  (function bindRejected(){
+    const tbody = document.getElementById('rejected-tbody');
+    const more = document.getElementById('rejected-more');
+    if (!tbody || tbody.getAttribute('data-bound')) return;
+    tbody.setAttribute('data-bound', '1');
+    let cursor = '';
+    let loading = false;
+    function load(){
+      if (loading) return;
+      loading = true;
+      const url = new URL(tbody.getAttribute('data-url'), window.location.href);
+      url.searchParams.set('cursor', cursor);
+      fetch(url.toString(), { headers: { 'X-Requested-With': 'XMLHttpRequest' } })
+        .then(function(res){ if (res.ok) return res.json(); throw new Error('Request failed'); })
+        .then(function(data){
+          const ph = tbody.querySelector('[data-rejected-placeholder]');
+          const rows = (data && data.results) || [];
+          if (ph && rows.length) ph.remove();
+          else if (ph) ph.firstElementChild.textContent = 'No applications found.';
+          const csrf = (document.querySelector('input[name="csrfmiddlewaretoken"]') || {}).value || '';
+          rows.forEach(function(a){ tbody.appendChild(rejectedRow(a, csrf)); });
+          cursor = data.next_cursor || '';
+          if (more) more.classList.toggle('hidden', !data.has_next);
+        })
+        .catch(function(){
+          const ph = tbody.querySelector('[data-rejected-placeholder]');
+          if (ph) ph.firstElementChild.textContent = 'Could not load rejected applications.';
+        })
+        .finally(function(){ loading = false; });
+    }
+    if (more) more.addEventListener('click', function(e){ e.preventDefault(); load(); });
+    if ('IntersectionObserver' in window){
+      const io = new IntersectionObserver(function(entries){
+        if (entries.some(function(en){ return en.isIntersecting; })){ io.disconnect(); load(); }
+      }, { rootMargin: '200px' });
+      io.observe(tbody);
+    } else {
+      load();
+    }
+  })();
+
   // Kick in enhancements after DOM is ready
   if (document.readyState === 'loading'){
     document.addEventListener('DOMContentLoaded', function(){ showInitialSkeleton(); renderAppSummary(); updateTabCounts(); activateSidebar(); });
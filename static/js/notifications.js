@@ -58,7 +58,7 @@
   async function fetchRecent(perPage){
     try{
       const nocache = Date.now();
-      const res = await fetch(`/dashboard/api/logs/?per_page=${perPage||10}&_=${nocache}`, {
+      const res = await fetch(`/dashboard/api/logs/?per_page=${perPage||10}&cursor=&_=${nocache}`, {
         headers: { 'X-Requested-With': 'XMLHttpRequest' },
         credentials: 'same-origin',
         cache: 'no-store'
@@ -355,6 +355,7 @@
     if (isPaused()) { dlog('tick skipped: paused'); return; }
     if (window.__notifInFlight) { dlog('tick skipped: in-flight'); return; }
     window.__notifInFlight = true;
+    if (window.flodoEvents) window.flodoEvents.dirty = false;
     try {
       const raw = await fetchRecent(10);
       const items = dedupeItems(raw);
@@ -545,7 +546,13 @@ function __initNotifications(){
 
   // Initial tick and interval with pause and race guards
   tick().catch(()=>{}).finally(()=>{ try { window.__notifInFlight = false; } catch(_){} });
-  setInterval(function(){ Promise.resolve(tick()).finally(()=>{ /* flag cleared in tick finally */ }); }, POLL_MS);
+  // Polling is the fallback only: skip while the push socket is live (log events call bumpNotificationsNow)
+  setInterval(function(){
+    const bus = window.flodoEvents;
+    // Live socket: only catch up on pushed logs whose bump was skipped while paused
+    if (bus && bus.live && (!bus.dirty || isPaused())) return;
+    Promise.resolve(tick()).finally(()=>{ /* flag cleared in tick finally */ });
+  }, POLL_MS);
 }
 
 if (!window.__notif_inited) {
@@ -561,7 +568,16 @@ if (!window.__notif_inited) {
 }
 })();
 
-// --- Real-time Notifications via WebSocket (additive; falls back to polling) ---
+// --- Real-time push events via WebSocket (polling is only the fallback) ---
+// Server envelopes: { type: 'log'|'row'|'pending_count'|'presence', topic, seq, ts, data }, plus
+// { type: 'hello', seq } on connect and legacy { type: 'activity_log', data }.
+// The socket starts on the 'notifications' topic (logs, presence); pages add what they render with
+// window.flodoEvents.subscribe(['table:3', 'applications'], [topicsToDrop]). Subscriptions are
+// replayed after every reconnect.
+// Each event is re-dispatched as window 'flodo:event' (detail = envelope). window.flodoEvents.live
+// is true while the socket is up; pollers check it and stand down. After a reconnect the missed
+// range is replayed from /dashboard/api/events/?since=<seq>&topics=...; when the server cannot
+// replay it (gap too large/expired) a { type: 'resync' } event tells listeners to reload their views.
 (function(){
   try {
     // Prevent double init
@@ -573,10 +589,79 @@ if (!window.__notif_inited) {
 
     const proto = (location.protocol === 'https:') ? 'wss' : 'ws';
     const endpoint = `${proto}://${location.host}/ws/notifications/`;
+    const bus = window.flodoEvents = window.flodoEvents || { live: false, seq: null };
+    bus.topics = bus.topics || [];  // scripts loaded earlier may have queued topics here
+    const seen = [];  // recent seqs: live delivery and replay can overlap
+
+    bus.subscribe = function(add, remove){
+      add = (add || []).filter(t => bus.topics.indexOf(t) === -1);
+      remove = (remove || []).filter(t => bus.topics.indexOf(t) !== -1 && add.indexOf(t) === -1);
+      bus.topics = bus.topics.filter(t => remove.indexOf(t) === -1).concat(add);
+      send({ action: 'unsubscribe', topics: remove });
+      send({ action: 'subscribe', topics: add });
+    };
+
+    function send(msg){
+      try { if (msg.topics.length && ws && ws.readyState === 1) ws.send(JSON.stringify(msg)); } catch(_){ }
+    }
 
     let ws = null;
     let reconnectDelay = 1000; // backoff starts at 1s
     const maxDelay = 20000; // cap at 20s
+    let resyncing = false;
+
+    function emit(ev){
+      try { window.dispatchEvent(new CustomEvent('flodo:event', { detail: ev })); } catch(_){ }
+      if (ev.type === 'log' || ev.type === 'activity_log' || ev.type === 'resync'){
+        bus.dirty = true;
+        try { window.__notif_latest_ts = (ev.data && ev.data.timestamp) || new Date().toISOString(); } catch(_){ }
+        if (typeof window.bumpNotificationsNow === 'function') window.bumpNotificationsNow();
+      }
+    }
+
+    async function resync(since){
+      if (resyncing) return;
+      resyncing = true;
+      try {
+        const topics = ['notifications'].concat(bus.topics).join(',');
+        const res = await fetch(`/dashboard/api/events/?since=${encodeURIComponent(since)}&topics=${encodeURIComponent(topics)}`, {
+          headers: { 'X-Requested-With': 'XMLHttpRequest' }, credentials: 'same-origin', cache: 'no-store'
+        });
+        const j = await res.json();
+        if (!j || !j.success) return;
+        if (j.complete){
+          (j.events || []).forEach(accept);
+        } else {
+          emit({ type: 'resync' });
+        }
+        bus.seq = Math.max(bus.seq || 0, j.seq || 0);
+      } catch(e){ dlog('resync failed', e); }
+      finally { resyncing = false; }
+    }
+
+    function accept(msg){
+      if (typeof msg.seq === 'number'){
+        if (seen.indexOf(msg.seq) !== -1) return;
+        seen.push(msg.seq);
+        if (seen.length > 200) seen.shift();
+        bus.seq = Math.max(bus.seq || 0, msg.seq);
+      }
+      emit(msg);
+    }
+
+    function handle(msg){
+      if (!msg || !msg.type) return;
+      if (msg.type === 'hello'){
+        bus.live = true;
+        send({ action: 'subscribe', topics: bus.topics.slice() });
+        // Seqs are global across topics, so gaps are normal; only replay what a reconnect missed
+        if (bus.seq === null) bus.seq = msg.seq || 0; // first connect: page state came from HTTP
+        else if ((msg.seq || 0) > bus.seq) resync(bus.seq);
+        return;
+      }
+      if (msg.type === 'subscribed') return;
+      accept(msg);
+    }
 
     function scheduleReconnect(){
       const delay = reconnectDelay;
@@ -596,27 +681,21 @@ if (!window.__notif_inited) {
         };
 
         ws.onmessage = function(evt){
-          try {
-            const msg = JSON.parse(evt.data || '{}');
-            if (msg && msg.type === 'activity_log'){
-              // Hint unseen computation and trigger a gentle refresh
-              try { window.__notif_latest_ts = (msg.data && msg.data.timestamp) || new Date().toISOString(); } catch(_){ }
-              if (typeof window.bumpNotificationsNow === 'function') {
-                window.bumpNotificationsNow();
-              }
-            }
-          } catch(e){ dlog('onmessage parse error', e); }
+          try { handle(JSON.parse(evt.data || '{}')); }
+          catch(e){ dlog('onmessage parse error', e); }
         };
 
         ws.onerror = function(e){ dlog('ws error', e); };
 
         ws.onclose = function(){
           dlog('closed');
-          // Allow polling to continue; attempt to reconnect in background
+          // Pollers resume while the socket is down; reconnect in background
+          bus.live = false;
           scheduleReconnect();
         };
       } catch(e){
         dlog('connect error', e);
+        bus.live = false;
         scheduleReconnect();
       }
     }
@@ -625,4 +704,3 @@ if (!window.__notif_inited) {
     setTimeout(connect, 250);
   } catch(_){ /* no-op: polling remains active */ }
 })();
-
@@ -404,7 +404,8 @@ Security-conscious: no inline eval, no third-party origins beyond existing Tailw
         if (dot) dot.classList.remove('hidden');
         // Reapply toggle real-time handler: check availability and navigate if permitted
         try {
-          if (msg && msg.payload && msg.payload.event === 'reapply_toggle'){
+          var p = msg && (msg.payload || msg.data);  // consumer forwards legacy payloads as data
+          if (p && p.event === 'reapply_toggle'){
             fetch('/portal/api/can-apply/', { credentials: 'same-origin' })
               .then(function(r){ return r.ok ? r.json() : Promise.reject(); })
               .then(function(data){